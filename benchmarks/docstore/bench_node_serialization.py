@@ -0,0 +1,85 @@
+import json
+import tempfile
+import time
+from typing import Callable, List
+
+from llama_index.schema import NodeRelationship, RelatedNodeInfo, TextNode
+from llama_index.storage.docstore.utils import doc_to_json, json_to_doc
+from llama_index.storage.kvstore import simple_kvstore
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+
+
+def generate_nodes(num_nodes: int, text_len: int = 1000) -> List[TextNode]:
+    """Generate nodes resembling the output of a node parser."""
+    return [
+        TextNode(
+            text=f"node {i} " + "lorem ipsum " * (text_len // 12),
+            id_=f"node_{i}",
+            metadata={"file_name": f"file_{i // 10}.txt", "page_label": str(i)},
+            relationships={
+                NodeRelationship.SOURCE: RelatedNodeInfo(node_id=f"doc_{i // 10}"),
+                NodeRelationship.PREVIOUS: RelatedNodeInfo(node_id=f"node_{i - 1}"),
+                NodeRelationship.NEXT: RelatedNodeInfo(node_id=f"node_{i + 1}"),
+            },
+        )
+        for i in range(num_nodes)
+    ]
+
+
+def timeit(fn: Callable[[], object], num_runs: int = 3) -> float:
+    """Best wall time of a few runs."""
+    best = float("inf")
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_node_deserialization(num_nodes_list: List[int] = [1_000, 10_000]) -> None:
+    """Benchmark loading nodes with and without pydantic validation."""
+    print("Benchmarking node deserialization\n---------------------------")
+    for num_nodes in num_nodes_list:
+        # round trip through JSON, as nodes loaded from a persisted store
+        jsons = json.loads(
+            json.dumps([doc_to_json(node) for node in generate_nodes(num_nodes)])
+        )
+        validated_secs = timeit(lambda: [json_to_doc(json) for json in jsons])
+        trusted_secs = timeit(
+            lambda: [json_to_doc(json, validate=False) for json in jsons]
+        )
+        print(
+            f"{num_nodes} nodes: "
+            f"validated {num_nodes / validated_secs:.0f} nodes/sec, "
+            f"trusted {num_nodes / trusted_secs:.0f} nodes/sec "
+            f"({validated_secs / trusted_secs:.1f}x)"
+        )
+
+
+def bench_kvstore_codec(num_nodes_list: List[int] = [10_000, 50_000]) -> None:
+    """Benchmark persisting and loading a SimpleKVStore with json and orjson."""
+    print("\nBenchmarking SimpleKVStore codec\n---------------------------")
+    codecs = [False, True] if simple_kvstore.ORJSON_INSTALLED else [False]
+    for num_nodes in num_nodes_list:
+        kvstore = SimpleKVStore()
+        kvstore.put_all(
+            [(node.node_id, doc_to_json(node)) for node in generate_nodes(num_nodes)]
+        )
+        for use_orjson in codecs:
+            simple_kvstore.ORJSON_INSTALLED = use_orjson
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                persist_path = f"{tmp_dir}/docstore.json"
+                persist_secs = timeit(lambda: kvstore.persist(persist_path))
+                load_secs = timeit(
+                    lambda: SimpleKVStore.from_persist_path(persist_path)
+                )
+            print(
+                f"{num_nodes} nodes, {'orjson' if use_orjson else 'json'}: "
+                f"persist {num_nodes / persist_secs:.0f} nodes/sec, "
+                f"load {num_nodes / load_secs:.0f} nodes/sec"
+            )
+
+
+if __name__ == "__main__":
+    bench_node_deserialization()
+    bench_kvstore_codec()
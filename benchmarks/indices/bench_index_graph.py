@@ -0,0 +1,93 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+from llama_index.data_structs.data_structs import IndexGraph
+from llama_index.schema import BaseNode, TextNode
+
+
+class UncachedIndexGraph(IndexGraph):
+    """IndexGraph rebuilding the node id to index map on every lookup."""
+
+    def get_index(self, node: BaseNode) -> int:
+        return {node_id: index for index, node_id in self.all_nodes.items()}[
+            node.node_id
+        ]
+
+    def get_children(self, parent_node: Optional[BaseNode]) -> Dict[int, str]:
+        if parent_node is None:
+            return self.root_nodes
+        node_id_to_index = {node_id: index for index, node_id in self.all_nodes.items()}
+        return {
+            node_id_to_index[child_id]: child_id
+            for child_id in self.node_id_to_children_ids[parent_node.node_id]
+        }
+
+
+def build_tree(
+    index_graph: IndexGraph, num_leaves: int, num_children: int = 10
+) -> Dict[str, BaseNode]:
+    """Build a tree bottom-up like the tree index builder does."""
+    nodes: Dict[str, BaseNode] = {}
+    cur_nodes: List[BaseNode] = []
+    for i in range(num_leaves):
+        leaf = TextNode(text=f"leaf {i}", id_=f"leaf_{i}")
+        index_graph.insert(leaf)
+        nodes[leaf.node_id] = leaf
+        cur_nodes.append(leaf)
+
+    level = 0
+    while len(cur_nodes) > num_children:
+        new_nodes: Dict[int, str] = {}
+        parents: List[BaseNode] = []
+        for i in range(0, len(cur_nodes), num_children):
+            parent = TextNode(text="summary", id_=f"summary_{level}_{i}")
+            index_graph.insert(parent, children_nodes=cur_nodes[i : i + num_children])
+            new_nodes[index_graph.get_index(parent)] = parent.node_id
+            nodes[parent.node_id] = parent
+            parents.append(parent)
+        index_graph.root_nodes = new_nodes
+        cur_nodes = parents
+        level += 1
+    return nodes
+
+
+def traverse_tree(index_graph: IndexGraph, nodes: Dict[str, BaseNode]) -> int:
+    """Visit every node top-down through get_children, return the leaf count."""
+    num_leaves = 0
+    stack: List[Tuple[int, str]] = list(index_graph.get_children(None).items())
+    while stack:
+        _, node_id = stack.pop()
+        children = index_graph.get_children(nodes[node_id])
+        if not children:
+            num_leaves += 1
+        stack.extend(children.items())
+    return num_leaves
+
+
+def bench_index_graph(
+    num_leaves_list: List[int] = [1_000, 10_000, 100_000],
+    max_uncached_leaves: int = 10_000,
+) -> None:
+    """Benchmark building and traversing a tree index graph."""
+    print("Benchmarking IndexGraph\n---------------------------")
+    for num_leaves in num_leaves_list:
+        graph_classes = [IndexGraph]
+        if num_leaves <= max_uncached_leaves:
+            graph_classes.append(UncachedIndexGraph)
+        for graph_cls in graph_classes:
+            index_graph = graph_cls()
+            start = time.perf_counter()
+            nodes = build_tree(index_graph, num_leaves)
+            build_secs = time.perf_counter() - start
+
+            start = time.perf_counter()
+            assert traverse_tree(index_graph, nodes) == num_leaves
+            traverse_secs = time.perf_counter() - start
+            print(
+                f"{graph_cls.__name__}, {num_leaves} leaves: "
+                f"build {build_secs:.3f}s, traverse {traverse_secs:.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    bench_index_graph()
@@ -0,0 +1,66 @@
+import os
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from llama_index.indices.service_context import ServiceContext
+from llama_index.indices.vector_store.base import VectorStoreIndex
+from llama_index.readers.file.base import SimpleDirectoryReader
+from llama_index.readers.file.incremental import IncrementalDirectoryLoader
+from llama_index.token_counter.mock_embed_model import MockEmbedding
+
+
+def write_files(input_dir: Path, num_files: int, num_words: int) -> None:
+    for i in range(num_files):
+        (input_dir / f"file_{i}.txt").write_text(
+            f"file {i} " + "lorem ipsum " * (num_words // 2)
+        )
+
+
+def change_files(input_dir: Path, num_changed: int) -> None:
+    for i in range(num_changed):
+        path = input_dir / f"file_{i}.txt"
+        path.write_text("changed " + path.read_text())
+        mtime = time.time() + 10
+        os.utime(path, (mtime, mtime))
+
+
+def bench_incremental_sync(
+    num_files: int = 500, num_words: int = 4000, num_changed: int = 3
+) -> None:
+    """Benchmark nightly syncs of a directory where few or no files changed."""
+    print("Benchmarking incremental directory sync\n---------------------------")
+    service_context = ServiceContext.from_defaults(
+        llm=None, embed_model=MockEmbedding(embed_dim=8)
+    )
+    with TemporaryDirectory() as tmp_dir:
+        input_dir = Path(tmp_dir)
+        write_files(input_dir, num_files, num_words)
+        index = VectorStoreIndex([], service_context=service_context)
+        loader = IncrementalDirectoryLoader(tmp_dir)
+        loader.sync(index)
+
+        def reload() -> None:
+            documents = SimpleDirectoryReader(tmp_dir, filename_as_id=True).load_data()
+            index.refresh_ref_docs(documents)
+
+        for name, num_files_changed in [("no", 0), (str(num_changed), num_changed)]:
+            change_files(input_dir, num_files_changed)
+            start = time.perf_counter()
+            reload()
+            reload_secs = time.perf_counter() - start
+
+            change_files(input_dir, num_files_changed)
+            start = time.perf_counter()
+            loader.sync(index)
+            sync_secs = time.perf_counter() - start
+            print(
+                f"{num_files} files, {name} changed: "
+                f"reload and refresh_ref_docs {reload_secs * 1000:.1f} ms, "
+                f"incremental sync {sync_secs * 1000:.1f} ms "
+                f"({reload_secs / sync_secs:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    bench_incremental_sync()
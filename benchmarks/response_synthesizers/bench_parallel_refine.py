@@ -0,0 +1,70 @@
+import asyncio
+import time
+from typing import Any
+
+from llama_index.indices.prompt_helper import PromptHelper
+from llama_index.indices.service_context import ServiceContext
+from llama_index.llms.base import (
+    CompletionResponse,
+    CompletionResponseGen,
+    LLMMetadata,
+    llm_completion_callback,
+)
+from llama_index.llms.custom import CustomLLM
+from llama_index.response_synthesizers import CompactAndRefine, ParallelRefine
+from llama_index.token_counter.mock_embed_model import MockEmbedding
+
+LATENCY = 0.05
+
+
+class LatencyLLM(CustomLLM):
+    """LLM answering with a short text after a fixed latency."""
+
+    @property
+    def metadata(self) -> LLMMetadata:
+        return LLMMetadata(context_window=4096, num_output=256)
+
+    @llm_completion_callback()
+    def complete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        time.sleep(LATENCY)
+        return CompletionResponse(text="a short answer to the query")
+
+    @llm_completion_callback()
+    async def acomplete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        await asyncio.sleep(LATENCY)
+        return CompletionResponse(text="a short answer to the query")
+
+    @llm_completion_callback()
+    def stream_complete(self, prompt: str, **kwargs: Any) -> CompletionResponseGen:
+        raise NotImplementedError
+
+
+def bench_parallel_refine(num_chunks: int = 16, num_words: int = 2000) -> None:
+    """Benchmark the latency of refining an answer across many context windows."""
+    print("Benchmarking parallel refine\n----------------------------")
+    service_context = ServiceContext.from_defaults(
+        llm=LatencyLLM(),
+        embed_model=MockEmbedding(embed_dim=8),
+        prompt_helper=PromptHelper(context_window=4096, num_output=256),
+    )
+    # each text chunk fills about one context window
+    text_chunks = [
+        f"chunk {i} " + "lorem ipsum " * num_words for i in range(num_chunks)
+    ]
+
+    for synthesizer in (
+        CompactAndRefine(service_context=service_context),
+        ParallelRefine(service_context=service_context),
+        ParallelRefine(service_context=service_context, use_merge_tree=True),
+    ):
+        name = type(synthesizer).__name__
+        if getattr(synthesizer, "_use_merge_tree", False):
+            name += " (merge tree)"
+        start = time.perf_counter()
+        asyncio.run(synthesizer.aget_response("query", text_chunks))
+        duration = time.perf_counter() - start
+        print(f"{name}: {duration:.3f}s")
+
+
+if __name__ == "__main__":
+    bench_parallel_refine()
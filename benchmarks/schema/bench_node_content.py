@@ -0,0 +1,85 @@
+import time
+from typing import Callable, List
+
+from llama_index.schema import MetadataMode, TextNode
+
+# get_content calls per retrieved node in a query, e.g. fusion dedup,
+# LLM reranking, prompt packing and response synthesis
+QUERY_CALLS = [
+    MetadataMode.EMBED,
+    MetadataMode.LLM,
+    MetadataMode.LLM,
+    MetadataMode.LLM,
+    MetadataMode.ALL,
+]
+
+
+def generate_nodes(num_nodes: int, num_metadata_keys: int = 8) -> List[TextNode]:
+    return [
+        TextNode(
+            text=f"node {i} " + "lorem ipsum " * 80,
+            metadata={f"key_{j}": f"value {i} {j}" for j in range(num_metadata_keys)},
+            excluded_llm_metadata_keys=["key_0", "key_1"],
+            excluded_embed_metadata_keys=["key_2"],
+        )
+        for i in range(num_nodes)
+    ]
+
+
+def uncached_get_content(node: TextNode, metadata_mode: MetadataMode) -> str:
+    """Render node content without caching, as TextNode.get_content used to."""
+    usable_metadata_keys = set(node.metadata.keys())
+    if metadata_mode == MetadataMode.LLM:
+        usable_metadata_keys -= set(node.excluded_llm_metadata_keys)
+    elif metadata_mode == MetadataMode.EMBED:
+        usable_metadata_keys -= set(node.excluded_embed_metadata_keys)
+    metadata_str = node.metadata_seperator.join(
+        [
+            node.metadata_template.format(key=key, value=str(value))
+            for key, value in node.metadata.items()
+            if key in usable_metadata_keys
+        ]
+    ).strip()
+    if not metadata_str:
+        return node.text
+    return node.text_template.format(
+        content=node.text, metadata_str=metadata_str
+    ).strip()
+
+
+def bench_query(
+    nodes: List[TextNode],
+    get_content: Callable[[TextNode, MetadataMode], str],
+    num_queries: int,
+) -> float:
+    """Run the get_content calls of several queries, return secs per query."""
+    start = time.perf_counter()
+    for _ in range(num_queries):
+        for metadata_mode in QUERY_CALLS:
+            for node in nodes:
+                get_content(node, metadata_mode)
+    return (time.perf_counter() - start) / num_queries
+
+
+def bench_node_content(
+    top_ks: List[int] = [10, 100, 1000], num_queries: int = 50
+) -> None:
+    """Benchmark rendering the content of retrieved nodes per query."""
+    print("Benchmarking node content rendering\n---------------------------")
+    for top_k in top_ks:
+        nodes = generate_nodes(top_k)
+        uncached_secs = bench_query(nodes, uncached_get_content, num_queries)
+        cached_secs = bench_query(
+            nodes,
+            lambda node, metadata_mode: node.get_content(metadata_mode),
+            num_queries,
+        )
+        print(
+            f"top_k={top_k}: uncached {uncached_secs * 1000:.2f} ms/query, "
+            f"cached {cached_secs * 1000:.2f} ms/query "
+            f"({uncached_secs / cached_secs:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    bench_node_content()
@@ -0,0 +1,75 @@
+import random
+import time
+from typing import Callable, List
+
+from llama_index.text_splitter import SentenceSplitter
+from llama_index.utils import globals_helper
+
+
+def generate_document(num_words: int = 100_000) -> str:
+    """Generate a document with sentences, clauses and paragraphs."""
+    rng = random.Random(42)  # Make this reproducible
+    words = [
+        "the",
+        "quick",
+        "brown",
+        "fox",
+        "jumps",
+        "over",
+        "lazy",
+        "dog,",
+        "and",
+        "then;",
+        "it",
+        "runs",
+        "away.",
+    ]
+    parts = []
+    for _ in range(num_words):
+        parts.append(rng.choice(words))
+        if rng.random() < 0.005:
+            parts.append("\n\n\n")
+    return " ".join(parts)
+
+
+class CountingTokenizer:
+    """Wraps a tokenizer and counts the characters it was asked to tokenize."""
+
+    def __init__(self, tokenizer: Callable[[str], List]) -> None:
+        self._tokenizer = tokenizer
+        self.num_chars = 0
+
+    def __call__(self, text: str) -> List:
+        self.num_chars += len(text)
+        return self._tokenizer(text)
+
+
+def bench_sentence_splitter(
+    num_words_list: List[int] = [10_000, 100_000, 500_000],
+    chunk_sizes: List[int] = [128, 512, 1024],
+    chunk_overlap: int = 20,
+) -> None:
+    """Benchmark SentenceSplitter throughput on large documents."""
+    print("Benchmarking SentenceSplitter\n---------------------------")
+    for num_words in num_words_list:
+        text = generate_document(num_words=num_words)
+        for chunk_size in chunk_sizes:
+            tokenizer = CountingTokenizer(globals_helper.tokenizer)
+            splitter = SentenceSplitter(
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap,
+                tokenizer=tokenizer,
+            )
+            time1 = time.time()
+            chunks = splitter.split_text(text)
+            time2 = time.time()
+            print(
+                f"{num_words} words, chunk_size={chunk_size}: "
+                f"{len(chunks)} chunks in {time2 - time1:.2f} seconds "
+                f"({len(chunks) / (time2 - time1):.1f} chunks/sec), "
+                f"tokenized {tokenizer.num_chars / len(text):.2f}x the document"
+            )
+
+
+if __name__ == "__main__":
+    bench_sentence_splitter()
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from functools import partial
+from typing import Any, List
+
+from llama_index.async_utils import AsyncExecutor
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class MockProvider:
+    """Provider rejecting requests above a number of concurrent requests."""
+
+    def __init__(self, max_concurrent: int, latency: float) -> None:
+        self.max_concurrent = max_concurrent
+        self.latency = latency
+        self.num_in_flight = 0
+
+    async def acomplete(self, prompt: str) -> str:
+        if self.num_in_flight >= self.max_concurrent:
+            raise RateLimitError("Too many concurrent requests.")
+        self.num_in_flight += 1
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.num_in_flight -= 1
+        return prompt
+
+
+async def _agather_unbounded(provider: MockProvider, num_requests: int) -> List[Any]:
+    tasks = [provider.acomplete(str(i)) for i in range(num_requests)]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def bench_async_executor(
+    num_requests: int = 500, max_concurrent: int = 32, latency: float = 0.02
+) -> None:
+    """Benchmark a fan-out of LLM calls against a provider with a concurrency cap."""
+    print("Benchmarking async executor\n---------------------------")
+    provider = MockProvider(max_concurrent, latency)
+
+    start = time.perf_counter()
+    results = asyncio.run(_agather_unbounded(provider, num_requests))
+    duration = time.perf_counter() - start
+    num_failed = sum(isinstance(result, Exception) for result in results)
+    print(
+        f"asyncio.gather: {duration:.3f}s, "
+        f"{num_failed}/{num_requests} requests failed"
+    )
+
+    executor = AsyncExecutor(max_in_flight=max_concurrent)
+    start = time.perf_counter()
+    tasks = [partial(provider.acomplete, str(i)) for i in range(num_requests)]
+    results = asyncio.run(executor.gather(tasks))
+    duration = time.perf_counter() - start
+    print(f"AsyncExecutor: {duration:.3f}s, 0/{len(results)} requests failed")
+
+
+if __name__ == "__main__":
+    bench_async_executor()
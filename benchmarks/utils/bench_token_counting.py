@@ -0,0 +1,103 @@
+import random
+import time
+from typing import Any, Callable, Dict
+
+from llama_index.callbacks import TokenCountingHandler
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.indices.prompt_helper import PromptHelper
+from llama_index.prompts.default_prompts import DEFAULT_TEXT_QA_PROMPT
+from llama_index.text_splitter import TokenTextSplitter
+from llama_index.utils import TokenizerService, globals_helper
+
+
+def generate_text(num_words: int, seed: int = 42) -> str:
+    rng = random.Random(seed)  # Make this reproducible
+    words = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog.\n"]
+    return " ".join(rng.choice(words) for _ in range(num_words))
+
+
+def timeit(fn: Callable[[], object], num_runs: int) -> float:
+    """Return secs per run."""
+    start = time.perf_counter()
+    for _ in range(num_runs):
+        fn()
+    return (time.perf_counter() - start) / num_runs
+
+
+def report(name: str, uncached_secs: float, cached_secs: float) -> None:
+    print(
+        f"{name}: uncached {uncached_secs * 1000:.2f} ms, "
+        f"cached {cached_secs * 1000:.2f} ms ({uncached_secs / cached_secs:.1f}x)"
+    )
+
+
+def bench_token_counting(num_runs: int = 20) -> None:
+    tokenizer = globals_helper.tokenizer
+    # a service without a cache tokenizes every text, as before
+    uncached = TokenizerService(tokenizer, cache_size=0)
+    print("Benchmarking token counting\n---------------------------")
+
+    # every response synthesis call counts the tokens of the empty prompt
+    prompt_helper = PromptHelper(tokenizer=tokenizer)
+    uncached_prompt_helper = PromptHelper(tokenizer=uncached)
+    report(
+        "available context size x100",
+        timeit(
+            lambda: [
+                uncached_prompt_helper._get_available_context_size(
+                    DEFAULT_TEXT_QA_PROMPT
+                )
+                for _ in range(100)
+            ],
+            num_runs,
+        ),
+        timeit(
+            lambda: [
+                prompt_helper._get_available_context_size(DEFAULT_TEXT_QA_PROMPT)
+                for _ in range(100)
+            ],
+            num_runs,
+        ),
+    )
+
+    # the splitter counts each split when splitting and again when merging,
+    # a fresh cache per run only saves the counts within a run
+    document = generate_text(20_000)
+    report(
+        "split 20k word document",
+        timeit(
+            lambda: TokenTextSplitter(chunk_size=256, tokenizer=uncached).split_text(
+                document
+            ),
+            num_runs,
+        ),
+        timeit(
+            lambda: TokenTextSplitter(
+                chunk_size=256, tokenizer=TokenizerService(tokenizer)
+            ).split_text(document),
+            num_runs,
+        ),
+    )
+
+    # embedding token counts of re-embedded chunks
+    chunks = [generate_text(200, seed=i % 100) for i in range(1000)]
+    payload: Dict[str, Any] = {EventPayload.CHUNKS: chunks}
+    report(
+        "count tokens of 1000 embedded chunks",
+        timeit(
+            lambda: TokenCountingHandler(tokenizer=uncached).on_event_end(
+                CBEventType.EMBEDDING, payload=payload
+            ),
+            num_runs,
+        ),
+        timeit(
+            lambda: TokenCountingHandler().on_event_end(
+                CBEventType.EMBEDDING, payload=payload
+            ),
+            num_runs,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    bench_token_counting()
@@ -0,0 +1,37 @@
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from llama_index.indices.query.embedding_utils import get_top_k_mmr_embeddings
+
+
+def bench_mmr(
+    num_candidates: List[int] = [1_000, 10_000],
+    embedding_length: int = 1536,
+    similarity_top_k: int = 10,
+    fetch_k: Optional[int] = 100,
+    num_queries: int = 10,
+) -> None:
+    """Benchmark MMR over candidate pools of different sizes."""
+    print("Benchmarking get_top_k_mmr_embeddings\n---------------------------")
+    rng = np.random.default_rng(42)  # Make this reproducible
+    for num in num_candidates:
+        embeddings = rng.normal(size=(num, embedding_length)).tolist()
+        queries = rng.normal(size=(num_queries, embedding_length)).tolist()
+
+        for pool_size in [None, fetch_k]:
+            time1 = time.time()
+            for query in queries:
+                get_top_k_mmr_embeddings(
+                    query,
+                    embeddings,
+                    similarity_top_k=similarity_top_k,
+                    fetch_k=pool_size,
+                )
+            query_ms = (time.time() - time1) / num_queries * 1000
+            print(f"{num} candidates, fetch_k={pool_size}: {query_ms:.2f} ms/query")
+
+
+if __name__ == "__main__":
+    bench_mmr()
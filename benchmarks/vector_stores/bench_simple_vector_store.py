@@ -23,14 +23,18 @@ def generate_nodes(
 
 
 def bench_simple_vector_store(
-    num_vectors: List[int] = [10, 50, 100, 500, 1000]
+    num_vectors: List[int] = [10, 50, 100, 500, 1000],
+    use_matrix: bool = False,
 ) -> None:
     """Benchmark simple vector store."""
-    print("Benchmarking SimpleVectorStore\n---------------------------")
+    print(
+        f"Benchmarking SimpleVectorStore (use_matrix={use_matrix})"
+        "\n---------------------------"
+    )
     for num_vector in num_vectors:
         nodes = generate_nodes(num_vectors=num_vector)
 
-        vector_store = SimpleVectorStore()
+        vector_store = SimpleVectorStore(use_matrix=use_matrix)
 
         time1 = time.time()
         vector_store.add(nodes=nodes)
@@ -56,3 +60,4 @@ vectors with {mode} mode took {time2 - time1} seconds"""
 
 if __name__ == "__main__":
     bench_simple_vector_store()
+    bench_simple_vector_store(use_matrix=True)
@@ -0,0 +1,75 @@
+import time
+from typing import List
+
+import numpy as np
+
+from llama_index.vector_stores.simple import EmbeddingMatrix, IVFIndex
+
+
+def generate_embeddings(
+    num_vectors: int = 100_000,
+    embedding_length: int = 256,
+    num_topics: int = 200,
+) -> np.ndarray:
+    """Generate clustered embeddings, loosely mimicking real text embeddings."""
+    rng = np.random.default_rng(42)  # Make this reproducible
+    topics = rng.normal(size=(num_topics, embedding_length))
+    assignments = rng.integers(num_topics, size=num_vectors)
+    noise = rng.normal(scale=0.8, size=(num_vectors, embedding_length))
+    return (topics[assignments] + noise).astype(np.float32)
+
+
+def bench_ivf_recall(
+    num_vectors: int = 100_000,
+    nlist: int = 256,
+    nprobes: List[int] = [1, 4, 8, 16, 32],
+    num_queries: int = 100,
+    similarity_top_k: int = 10,
+) -> None:
+    """Benchmark IVF search recall and latency against exact search."""
+    print(
+        f"Benchmarking IVFIndex ({num_vectors} vectors, nlist={nlist})"
+        "\n---------------------------"
+    )
+    embeddings = generate_embeddings(num_vectors=num_vectors)
+    node_ids = [str(i) for i in range(num_vectors)]
+
+    matrix = EmbeddingMatrix(capacity=num_vectors)
+    time1 = time.time()
+    matrix.add_many(node_ids, embeddings)
+    matrix.set_ivf_index(IVFIndex(nlist=nlist))
+    time2 = time.time()
+    print(f"Adding and training took {time2 - time1:.2f} seconds")
+
+    rng = np.random.default_rng(0)
+    queries = embeddings[rng.choice(num_vectors, num_queries, replace=False)]
+    queries = queries + rng.normal(scale=0.5, size=queries.shape)
+
+    time1 = time.time()
+    exact_ids = [
+        set(matrix.top_k(query, similarity_top_k, exact=True)[1]) for query in queries
+    ]
+    exact_ms = (time.time() - time1) / num_queries * 1000
+    print(f"exact: recall@{similarity_top_k}=1.000, {exact_ms:.2f} ms/query")
+
+    for nprobe in nprobes:
+        time1 = time.time()
+        ivf_ids = [
+            set(matrix.top_k(query, similarity_top_k, nprobe=nprobe)[1])
+            for query in queries
+        ]
+        ivf_ms = (time.time() - time1) / num_queries * 1000
+        recall = np.mean(
+            [
+                len(ivf & exact) / similarity_top_k
+                for ivf, exact in zip(ivf_ids, exact_ids)
+            ]
+        )
+        print(
+            f"nprobe={nprobe}: recall@{similarity_top_k}={recall:.3f}, "
+            f"{ivf_ms:.2f} ms/query"
+        )
+
+
+if __name__ == "__main__":
+    bench_ivf_recall()
@@ -1,11 +1,16 @@
 import asyncio
+import contextvars
 import json
 import logging
+import time
 from abc import abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from threading import Thread
 from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast, get_args
 
 from llama_index.agent.types import BaseAgent
+from llama_index.async_utils import AsyncExecutor
 from llama_index.callbacks import (
     CallbackManager,
     CBEventType,
@@ -113,6 +118,37 @@ async def acall_function(
     )
 
 
+def get_timeout_function_message(
+    tool_call: OpenAIToolCall, timeout: float
+) -> Tuple[ChatMessage, ToolOutput]:
+    """Get the function message of a tool call which timed out."""
+    # validations to get passed mypy
+    assert tool_call.id is not None
+    assert tool_call.function is not None
+    assert tool_call.function.name is not None
+    assert tool_call.function.arguments is not None
+
+    name = tool_call.function.name
+    content = f"Error: function {name} timed out after {timeout} seconds."
+    logger.warning(content)
+    return (
+        ChatMessage(
+            content=content,
+            role=MessageRole.TOOL,
+            additional_kwargs={
+                "name": name,
+                "tool_call_id": tool_call.id,
+            },
+        ),
+        ToolOutput(
+            content=content,
+            tool_name=name,
+            raw_input={"kwargs": json.loads(tool_call.function.arguments)},
+            raw_output=None,
+        ),
+    )
+
+
 def resolve_tool_choice(tool_choice: Union[str, dict] = "auto") -> Union[str, dict]:
     """Resolve tool choice.
 
@@ -133,10 +169,16 @@ class BaseOpenAIAgent(BaseAgent):
         verbose: bool,
         max_function_calls: int,
         callback_manager: Optional[CallbackManager],
+        parallel_tool_calls: bool = True,
+        tool_call_timeout: Optional[float] = None,
     ):
+        if tool_call_timeout is not None and tool_call_timeout <= 0:
+            raise ValueError("tool_call_timeout must be positive.")
         self._llm = llm
         self._verbose = verbose
         self._max_function_calls = max_function_calls
+        self._parallel_tool_calls = parallel_tool_calls
+        self._tool_call_timeout = tool_call_timeout
         self.prefix_messages = prefix_messages
         self.memory = memory
         self.callback_manager = callback_manager or self._llm.callback_manager
@@ -227,7 +269,9 @@ class BaseOpenAIAgent(BaseAgent):
         # return response stream
         return chat_stream_response
 
-    def _call_function(self, tools: List[BaseTool], tool_call: OpenAIToolCall) -> None:
+    def _run_function(
+        self, tools: List[BaseTool], tool_call: OpenAIToolCall
+    ) -> Tuple[ChatMessage, ToolOutput]:
         function_call = tool_call.function
         # validations to get passed mypy
         assert function_call is not None
@@ -247,12 +291,11 @@ class BaseOpenAIAgent(BaseAgent):
                 tools, tool_call, verbose=self._verbose
             )
             event.on_end(payload={EventPayload.FUNCTION_OUTPUT: str(tool_output)})
-        self.sources.append(tool_output)
-        self.memory.put(function_message)
+        return function_message, tool_output
 
-    async def _acall_function(
+    async def _arun_function(
         self, tools: List[BaseTool], tool_call: OpenAIToolCall
-    ) -> None:
+    ) -> Tuple[ChatMessage, ToolOutput]:
         function_call = tool_call.function
         # validations to get passed mypy
         assert function_call is not None
@@ -272,8 +315,130 @@ class BaseOpenAIAgent(BaseAgent):
                 tools, tool_call, verbose=self._verbose
             )
             event.on_end(payload={EventPayload.FUNCTION_OUTPUT: str(tool_output)})
-        self.sources.append(tool_output)
-        self.memory.put(function_message)
+        return function_message, tool_output
+
+    async def _arun_function_with_timeout(
+        self, tools: List[BaseTool], tool_call: OpenAIToolCall
+    ) -> Tuple[ChatMessage, ToolOutput]:
+        if self._tool_call_timeout is None:
+            return await self._arun_function(tools, tool_call)
+        try:
+            return await asyncio.wait_for(
+                self._arun_function(tools, tool_call), self._tool_call_timeout
+            )
+        except asyncio.TimeoutError:
+            return get_timeout_function_message(tool_call, self._tool_call_timeout)
+
+    def _put_function_messages(
+        self, function_messages: List[Tuple[ChatMessage, ToolOutput]]
+    ) -> None:
+        """Put function messages in memory, in the order of their tool calls."""
+        for function_message, tool_output in function_messages:
+            self.sources.append(tool_output)
+            self.memory.put(function_message)
+
+    def _call_function(self, tools: List[BaseTool], tool_call: OpenAIToolCall) -> None:
+        self._call_functions(tools, [tool_call])
+
+    async def _acall_function(
+        self, tools: List[BaseTool], tool_call: OpenAIToolCall
+    ) -> None:
+        await self._acall_functions(tools, [tool_call])
+
+    def _submit_function(
+        self,
+        executor: ThreadPoolExecutor,
+        tools: List[BaseTool],
+        tool_call: OpenAIToolCall,
+    ) -> "Future[Tuple[ChatMessage, ToolOutput]]":
+        # run the call in a copy of the context, to keep callback traces
+        context = contextvars.copy_context()
+        return executor.submit(
+            lambda: context.run(self._run_function, tools, tool_call)
+        )
+
+    def _wait_function(
+        self,
+        tool_call: OpenAIToolCall,
+        future: "Future[Tuple[ChatMessage, ToolOutput]]",
+        start: float,
+    ) -> Tuple[ChatMessage, ToolOutput]:
+        if self._tool_call_timeout is None:
+            return future.result()
+        timeout = max(0.0, start + self._tool_call_timeout - time.monotonic())
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            return get_timeout_function_message(tool_call, self._tool_call_timeout)
+
+    def _call_functions(
+        self, tools: List[BaseTool], tool_calls: List[OpenAIToolCall]
+    ) -> None:
+        """Call the functions of tool calls, concurrently in threads."""
+        if self._tool_call_timeout is None and (
+            len(tool_calls) == 1 or not self._parallel_tool_calls
+        ):
+            for tool_call in tool_calls:
+                self._put_function_messages([self._run_function(tools, tool_call)])
+            return
+
+        # a thread per call, so that calls which time out don't block the others
+        executor = ThreadPoolExecutor(max_workers=len(tool_calls))
+        try:
+            if self._parallel_tool_calls:
+                start = time.monotonic()
+                futures = [
+                    self._submit_function(executor, tools, tool_call)
+                    for tool_call in tool_calls
+                ]
+                function_messages = [
+                    self._wait_function(tool_call, future, start)
+                    for tool_call, future in zip(tool_calls, futures)
+                ]
+            else:
+                function_messages = []
+                for tool_call in tool_calls:
+                    start = time.monotonic()
+                    future = self._submit_function(executor, tools, tool_call)
+                    function_messages.append(
+                        self._wait_function(tool_call, future, start)
+                    )
+        finally:
+            # don't wait for functions which timed out
+            executor.shutdown(wait=False)
+        self._put_function_messages(function_messages)
+
+    async def _acall_functions(
+        self, tools: List[BaseTool], tool_calls: List[OpenAIToolCall]
+    ) -> None:
+        """Call the functions of tool calls concurrently."""
+        if self._parallel_tool_calls:
+            # cancels the other calls if one of them fails
+            function_messages = await AsyncExecutor(max_in_flight=None).gather(
+                [
+                    self._arun_function_with_timeout(tools, tool_call)
+                    for tool_call in tool_calls
+                ]
+            )
+        else:
+            function_messages = [
+                await self._arun_function_with_timeout(tools, tool_call)
+                for tool_call in tool_calls
+            ]
+        self._put_function_messages(function_messages)
+
+    def _validate_tool_calls(
+        self, tool_calls: List[OpenAIToolCall]
+    ) -> List[OpenAIToolCall]:
+        for tool_call in tool_calls:
+            # Some validation
+            if not isinstance(tool_call, get_args(OpenAIToolCall)):
+                raise ValueError("Invalid tool_call object")
+
+            if tool_call.type != "function":
+                raise ValueError("Invalid tool type. Unsupported by OpenAI")
+        return tool_calls
 
     def _get_llm_chat_kwargs(
         self, openai_tools: List[dict], tool_choice: Union[str, dict] = "auto"
@@ -334,20 +499,13 @@ class BaseOpenAIAgent(BaseAgent):
             # iterate through all the tool calls
             logger.debug(f"Continue to tool calls: {self.latest_tool_calls}")
             if self.latest_tool_calls is not None:
-                for tool_call in self.latest_tool_calls:
-                    # Some validation
-                    if not isinstance(tool_call, get_args(OpenAIToolCall)):
-                        raise ValueError("Invalid tool_call object")
-
-                    if tool_call.type != "function":
-                        raise ValueError("Invalid tool type. Unsupported by OpenAI")
-                    # TODO: maybe execute this with multi-threading
-                    self._call_function(tools, tool_call)
-                    # change function call to the default value, if a custom function was given
-                    # as an argument (none and auto are predefined by OpenAI)
-                    if current_tool_choice not in ("auto", "none"):
-                        current_tool_choice = "auto"
-                    n_function_calls += 1
+                tool_calls = self._validate_tool_calls(self.latest_tool_calls)
+                self._call_functions(tools, tool_calls)
+                # change function call to the default value, if a custom function was given
+                # as an argument (none and auto are predefined by OpenAI)
+                if current_tool_choice not in ("auto", "none"):
+                    current_tool_choice = "auto"
+                n_function_calls += len(tool_calls)
 
         return agent_chat_response
 
@@ -376,21 +534,13 @@ class BaseOpenAIAgent(BaseAgent):
                 break
             # iterate through all the tool calls
             if self.latest_tool_calls is not None:
-                for tool_call in self.latest_tool_calls:
-                    # Some validation
-                    if not isinstance(tool_call, get_args(OpenAIToolCall)):
-                        raise ValueError("Invalid tool_call object")
-
-                    if tool_call.type != "function":
-                        raise ValueError("Invalid tool type. Unsupported by OpenAI")
-
-                    # TODO: maybe execute this with multi-threading
-                    await self._acall_function(tools, tool_call)
-                    # change function call to the default value, if a custom function was given
-                    # as an argument (none and auto are predefined by OpenAI)
-                    if current_tool_choice not in ("auto", "none"):
-                        current_tool_choice = "auto"
-                    n_function_calls += 1
+                tool_calls = self._validate_tool_calls(self.latest_tool_calls)
+                await self._acall_functions(tools, tool_calls)
+                # change function call to the default value, if a custom function was given
+                # as an argument (none and auto are predefined by OpenAI)
+                if current_tool_choice not in ("auto", "none"):
+                    current_tool_choice = "auto"
+                n_function_calls += len(tool_calls)
 
         return agent_chat_response
 
@@ -486,7 +636,12 @@ class OpenAIAgent(BaseOpenAIAgent):
         callback_manager (Optional[CallbackManager]): Callback manager to use.
             Defaults to None.
         tool_retriever (ObjectRetriever[BaseTool]): Object retriever to retrieve tools.
-
+        parallel_tool_calls (bool): Whether to run the tool calls of a message
+            concurrently, in threads in sync mode. The function messages are
+            added to memory in the order of the tool calls. Defaults to True.
+        tool_call_timeout (Optional[float]): Timeout of each tool call, in
+            seconds. A tool call which times out gets an error message as output.
+            Defaults to None.
 
     """
 
@@ -500,6 +655,8 @@ class OpenAIAgent(BaseOpenAIAgent):
         max_function_calls: int = DEFAULT_MAX_FUNCTION_CALLS,
         callback_manager: Optional[CallbackManager] = None,
         tool_retriever: Optional[ObjectRetriever[BaseTool]] = None,
+        parallel_tool_calls: bool = True,
+        tool_call_timeout: Optional[float] = None,
     ) -> None:
         super().__init__(
             llm=llm,
@@ -508,6 +665,8 @@ class OpenAIAgent(BaseOpenAIAgent):
             verbose=verbose,
             max_function_calls=max_function_calls,
             callback_manager=callback_manager,
+            parallel_tool_calls=parallel_tool_calls,
+            tool_call_timeout=tool_call_timeout,
         )
         if len(tools) > 0 and tool_retriever is not None:
             raise ValueError("Cannot specify both tools and tool_retriever")
@@ -534,6 +693,8 @@ class OpenAIAgent(BaseOpenAIAgent):
         callback_manager: Optional[CallbackManager] = None,
         system_prompt: Optional[str] = None,
         prefix_messages: Optional[List[ChatMessage]] = None,
+        parallel_tool_calls: bool = True,
+        tool_call_timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> "OpenAIAgent":
         """Create an OpenAIAgent from a list of tools.
@@ -578,6 +739,8 @@ class OpenAIAgent(BaseOpenAIAgent):
             verbose=verbose,
             max_function_calls=max_function_calls,
             callback_manager=callback_manager,
+            parallel_tool_calls=parallel_tool_calls,
+            tool_call_timeout=tool_call_timeout,
         )
 
     def get_tools(self, message: str) -> List[BaseTool]:
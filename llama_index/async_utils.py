@@ -1,17 +1,303 @@
 """Async utils."""
 import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from contextvars import ContextVar
 from itertools import zip_longest
-from typing import Any, Coroutine, Iterable, List
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_IN_FLIGHT = 16
+DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_MAX_RETRY_DELAY = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+class _Slot:
+    """Slot of a running task in the semaphore of an executor.
+
+    The slot is given back while the task waits for nested tasks on the same
+    executor, and taken again once they are done.
+    """
+
+    def __init__(self, semaphore: asyncio.Semaphore) -> None:
+        self.semaphore = semaphore
+        self.held = True
+        self.closed = False
+        self.num_nested = 0
+
+    def release_for_nested(self) -> None:
+        """Give the slot back while a nested task runs."""
+        self.num_nested += 1
+        if self.held:
+            self.held = False
+            self.semaphore.release()
+
+    async def areacquire_after_nested(self) -> None:
+        """Take the slot again once no nested task is running."""
+        self.num_nested -= 1
+        if self.num_nested > 0 or self.held or self.closed:
+            return
+        await self.semaphore.acquire()
+        if self.num_nested > 0 or self.held or self.closed:
+            # a nested task started, or the slot was taken, in the meantime
+            self.semaphore.release()
+        else:
+            self.held = True
+
+    def close(self) -> None:
+        """Give the slot back when the task is done."""
+        self.closed = True
+        if self.held:
+            self.held = False
+            self.semaphore.release()
+
+
+# slots held by the current task in the executors running it
+_held_slots: ContextVar[Dict["AsyncExecutor", _Slot]] = ContextVar(
+    "held_slots", default={}
+)
+
+
+class RateLimiter:
+    """Token bucket rate limiter.
+
+    Allows `requests_per_second` requests on average, with bursts of up to
+    `max_burst` requests. Share one rate limiter between the executors calling
+    the same provider, e.g. the service contexts of one LLM API key.
+
+    Args:
+        requests_per_second (float): Rate at which tokens are added to the bucket.
+        max_burst (Optional[int]): Capacity of the bucket. Defaults to
+            `requests_per_second`, rounded up.
+    """
+
+    def __init__(
+        self, requests_per_second: float, max_burst: Optional[int] = None
+    ) -> None:
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive.")
+        self.requests_per_second = requests_per_second
+        self.max_burst = max_burst or max(1, int(requests_per_second + 0.999))
+        self._tokens = float(self.max_burst)
+        self._last_refill = time.monotonic()
+        # the bucket can be shared by event loops running in different threads
+        self._lock = threading.Lock()
+
+    def _try_acquire(self, num_tokens: float) -> float:
+        """Take tokens from the bucket, or get the time to wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_burst,
+                self._tokens + (now - self._last_refill) * self.requests_per_second,
+            )
+            self._last_refill = now
+            if self._tokens >= num_tokens:
+                self._tokens -= num_tokens
+                return 0.0
+            return (num_tokens - self._tokens) / self.requests_per_second
+
+    async def acquire(self, num_tokens: float = 1.0) -> None:
+        """Wait until tokens are available, and take them from the bucket."""
+        if num_tokens > self.max_burst:
+            raise ValueError(f"Cannot acquire more than {self.max_burst} tokens.")
+        while True:
+            wait_time = self._try_acquire(num_tokens)
+            if wait_time <= 0:
+                return
+            await asyncio.sleep(wait_time)
+
+
+class AsyncExecutor:
+    """Shared execution layer of async tasks.
+
+    Runs async tasks with:
+    - at most `max_in_flight` tasks running at a time
+    - an optional rate limiter, shared by the executors calling a provider
+    - retries of failed tasks, with exponential backoff and full jitter
+    - cancellation of the remaining tasks of `gather` when one of them fails
+
+    A running task of the executor gives its slot back while it waits for the
+    tasks it runs on the same executor, so that nested fan-outs (e.g. a sub
+    question query engine running tree summarize) stay within `max_in_flight`
+    and cannot deadlock.
+
+    Args:
+        max_in_flight (Optional[int]): Maximum number of tasks running at a time.
+            Unlimited if None.
+        rate_limiter (Optional[RateLimiter]): Rate limiter of the tasks.
+        max_retries (int): Maximum number of retries of a failed task. Only
+            tasks given as async functions, not coroutines, can be retried.
+        retry_delay (float): Base delay of the exponential backoff, in seconds.
+        max_retry_delay (float): Maximum delay between retries, in seconds.
+        retry_on (Tuple[Type[BaseException], ...]): Exceptions to retry on.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = DEFAULT_MAX_IN_FLIGHT,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_retries: int = 0,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        max_retry_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    ) -> None:
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        if max_retries < 0:
+            raise ValueError("max_retries must be non-negative.")
+        self.max_in_flight = max_in_flight
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.retry_on = retry_on
+        # asyncio semaphores are bound to the event loop they are used in
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._semaphores_lock = threading.Lock()
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """Get the semaphore of the running event loop."""
+        if self.max_in_flight is None:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._semaphores_lock:
+            semaphore = self._semaphores.get(loop, None)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_in_flight)
+                self._semaphores[loop] = semaphore
+        return semaphore
+
+    def _get_retry_delay(self, attempt: int) -> float:
+        """Get the delay before a retry, with full jitter."""
+        return random.uniform(
+            0, min(self.max_retry_delay, self.retry_delay * 2**attempt)
+        )
+
+    async def _acall(self, task: Union[Coroutine, Callable[[], Awaitable[T]]]) -> T:
+        """Run a task, retrying it if it is an async function."""
+        if not callable(task):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            return await task
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            try:
+                return await task()
+            except self.retry_on as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._get_retry_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Task failed with {e!r}, retrying in {delay:.2f}s "
+                    f"(retry {attempt} of {self.max_retries})."
+                )
+                await asyncio.sleep(delay)
+
+    async def arun_task(self, task: Union[Coroutine, Callable[[], Awaitable[T]]]) -> T:
+        """Run a task within the limits of the executor.
+
+        Args:
+            task (Union[Coroutine, Callable[[], Awaitable]]): A coroutine, or an
+                async function without arguments (e.g. a `functools.partial`),
+                which is called again on retries.
+        """
+        semaphore = self._get_semaphore()
+        if semaphore is None:
+            return await self._acall(task)
+
+        held_slots = _held_slots.get()
+        parent_slot = held_slots.get(self, None)
+        if parent_slot is not None and parent_slot.semaphore is not semaphore:
+            # the parent task runs in another event loop
+            parent_slot = None
+        if parent_slot is not None:
+            parent_slot.release_for_nested()
+        try:
+            await semaphore.acquire()
+            slot = _Slot(semaphore)
+            token = _held_slots.set({**held_slots, self: slot})
+            try:
+                return await self._acall(task)
+            finally:
+                _held_slots.reset(token)
+                slot.close()
+        finally:
+            if parent_slot is not None:
+                await parent_slot.areacquire_after_nested()
+
+    async def arun(
+        self, async_fn: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """Call an async function within the limits of the executor."""
+        return await self.arun_task(lambda: async_fn(*args, **kwargs))
+
+    async def gather(
+        self, tasks: Iterable[Union[Coroutine, Callable[[], Awaitable[Any]]]]
+    ) -> List[Any]:
+        """Run tasks concurrently within the limits of the executor.
+
+        The results are in the order of the tasks. If a task fails, the other
+        tasks are cancelled and the exception is raised.
+        """
+        futures = [asyncio.ensure_future(self.arun_task(task)) for task in tasks]
+        try:
+            return list(await asyncio.gather(*futures))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            # wait for the cancelled tasks to finish their cleanup
+            await asyncio.gather(*futures, return_exceptions=True)
+            raise
 
 
 def run_async_tasks(
-    tasks: List[Coroutine],
+    tasks: Sequence[Union[Coroutine, Callable[[], Awaitable[Any]]]],
     show_progress: bool = False,
     progress_bar_desc: str = "Running async tasks",
+    executor: Optional[AsyncExecutor] = None,
 ) -> List[Any]:
-    """Run a list of async tasks."""
-    tasks_to_execute: List[Any] = tasks
+    """Run a list of async tasks.
+
+    Args:
+        tasks (Sequence[Union[Coroutine, Callable[[], Awaitable]]]): Coroutines,
+            or async functions without arguments if an executor is given.
+        show_progress (bool): Whether to show a progress bar.
+        progress_bar_desc (str): Description of the progress bar.
+        executor (Optional[AsyncExecutor]): Executor limiting the concurrency
+            and the rate of the tasks. The tasks all run at once if None.
+    """
     if show_progress:
+        tasks_to_execute: List[Any] = (
+            list(tasks)
+            if executor is None
+            else [executor.arun_task(task) for task in tasks]
+        )
         try:
             import nest_asyncio
             from tqdm.asyncio import tqdm
@@ -33,7 +319,9 @@ def run_async_tasks(
             pass
 
     async def _gather() -> List[Any]:
-        return await asyncio.gather(*tasks_to_execute)
+        if executor is not None:
+            return await executor.gather(tasks)
+        return await asyncio.gather(*cast(Sequence[Coroutine], tasks))
 
     outputs: List[Any] = asyncio.run(_gather())
     return outputs
@@ -19,6 +19,7 @@ class CBEventType(str, Enum):
         CHUNKING: Logs for the before and after of text splitting.
         NODE_PARSING: Logs for the documents and the nodes that they are parsed into.
         EMBEDDING: Logs for the number of texts embedded.
+        EMBEDDING_CACHE: Logs for the cache hits and misses of an embedding lookup.
         LLM: Logs for the template and response of LLM calls.
         QUERY: Keeps track of the start and end of each query.
         RETRIEVE: Logs for the nodes retrieved for a query.
@@ -30,6 +31,7 @@ class CBEventType(str, Enum):
     CHUNKING = "chunking"
     NODE_PARSING = "node_parsing"
     EMBEDDING = "embedding"
+    EMBEDDING_CACHE = "embedding_cache"
     LLM = "llm"
     QUERY = "query"
     RETRIEVE = "retrieve"
@@ -66,10 +68,17 @@ class EventPayload(str, Enum):
     SYSTEM_PROMPT = "system_prompt"  # system prompt used in LLM call
     QUERY_WRAPPER_PROMPT = "query_wrapper_prompt"  # query wrapper prompt used in LLM
     EXCEPTION = "exception"  # exception raised in an event
+    CACHE_HITS = "cache_hits"  # number of lookups served from a cache
+    CACHE_MISSES = "cache_misses"  # number of lookups not served from a cache
 
 
 # events that will never have children events
-LEAF_EVENTS = (CBEventType.CHUNKING, CBEventType.LLM, CBEventType.EMBEDDING)
+LEAF_EVENTS = (
+    CBEventType.CHUNKING,
+    CBEventType.LLM,
+    CBEventType.EMBEDDING,
+    CBEventType.EMBEDDING_CACHE,
+)
 
 
 @dataclass
@@ -3,7 +3,7 @@ from typing import Any, Callable, Dict, List, Optional, cast
 
 from llama_index.callbacks.base_handler import BaseCallbackHandler
 from llama_index.callbacks.schema import CBEventType, EventPayload
-from llama_index.utils import globals_helper
+from llama_index.utils import count_tokens, count_tokens_many, globals_helper
 
 
 @dataclass
@@ -31,9 +31,9 @@ def get_llm_token_counts(
         return TokenCountingEvent(
             event_id=event_id,
             prompt=prompt,
-            prompt_token_count=len(tokenizer(prompt)),
+            prompt_token_count=count_tokens(prompt, tokenizer),
             completion=completion,
-            completion_token_count=len(tokenizer(completion)),
+            completion_token_count=count_tokens(completion, tokenizer),
         )
 
     elif EventPayload.MESSAGES in payload:
@@ -44,9 +44,9 @@ def get_llm_token_counts(
         return TokenCountingEvent(
             event_id=event_id,
             prompt=messages_str,
-            prompt_token_count=len(tokenizer(messages_str)),
+            prompt_token_count=count_tokens(messages_str, tokenizer),
             completion=response,
-            completion_token_count=len(tokenizer(response)),
+            completion_token_count=count_tokens(response, tokenizer),
         )
     else:
         raise ValueError(
@@ -137,12 +137,14 @@ class TokenCountingHandler(BaseCallbackHandler):
             and payload is not None
         ):
             total_chunk_tokens = 0
-            for chunk in payload.get(EventPayload.CHUNKS, []):
+            chunks = payload.get(EventPayload.CHUNKS, [])
+            chunk_token_counts = count_tokens_many(chunks, self.tokenizer)
+            for chunk, chunk_token_count in zip(chunks, chunk_token_counts):
                 self.embedding_token_counts.append(
                     TokenCountingEvent(
                         event_id=event_id,
                         prompt=chunk,
-                        prompt_token_count=len(self.tokenizer(chunk)),
+                        prompt_token_count=chunk_token_count,
                         completion="",
                         completion_token_count=0,
                     )
@@ -9,7 +9,7 @@ from abc import abstractmethod
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Sequence, Set
 
-from dataclasses_json import DataClassJsonMixin
+from dataclasses_json import DataClassJsonMixin, Exclude, config
 
 from llama_index.data_structs.struct_type import IndexStructType
 from llama_index.schema import BaseNode, TextNode
@@ -45,10 +45,36 @@ class IndexGraph(IndexStruct):
     all_nodes: Dict[int, str] = field(default_factory=dict)
     root_nodes: Dict[int, str] = field(default_factory=dict)
     node_id_to_children_ids: Dict[str, List[str]] = field(default_factory=dict)
+    # reverse of all_nodes, kept in sync by the insert methods and rebuilt on load
+    _node_id_to_index: Dict[str, int] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+        metadata=config(exclude=Exclude.ALWAYS),
+    )
+
+    def __post_init__(self) -> None:
+        self._rebuild_node_id_to_index()
+
+    def _rebuild_node_id_to_index(self) -> None:
+        self._node_id_to_index = {
+            node_id: index for index, node_id in self.all_nodes.items()
+        }
+
+    def _get_node_index(self, node_id: str) -> int:
+        index = self._node_id_to_index.get(node_id, None)
+        if index is None or self.all_nodes.get(index, None) != node_id:
+            # all_nodes was modified directly
+            self._rebuild_node_id_to_index()
+            index = self._node_id_to_index[node_id]
+        return index
 
     @property
     def node_id_to_index(self) -> Dict[str, int]:
         """Map from node id to index."""
+        # all_nodes may have been modified directly, and callers may modify the
+        # returned map, so build a new one
         return {node_id: index for index, node_id in self.all_nodes.items()}
 
     @property
@@ -58,7 +84,7 @@ class IndexGraph(IndexStruct):
 
     def get_index(self, node: BaseNode) -> int:
         """Get index of node."""
-        return self.node_id_to_index[node.node_id]
+        return self._get_node_index(node.node_id)
 
     def insert(
         self,
@@ -71,6 +97,7 @@ class IndexGraph(IndexStruct):
         node_id = node.node_id
 
         self.all_nodes[index] = node_id
+        self._node_id_to_index[node_id] = index
 
         if children_nodes is None:
             children_nodes = []
@@ -85,7 +112,7 @@ class IndexGraph(IndexStruct):
             parent_id = parent_node.node_id
             children_ids = self.node_id_to_children_ids[parent_id]
             return {
-                self.node_id_to_index[child_id]: child_id for child_id in children_ids
+                self._get_node_index(child_id): child_id for child_id in children_ids
             }
 
     def insert_under_parent(
@@ -105,6 +132,7 @@ class IndexGraph(IndexStruct):
             self.node_id_to_children_ids[parent_node.node_id].append(node.node_id)
 
         self.all_nodes[new_index] = node.node_id
+        self._node_id_to_index[node.node_id] = new_index
 
     @classmethod
     def get_type(cls) -> IndexStructType:
@@ -7,6 +7,12 @@ from llama_index.embeddings.adapter import (
 from llama_index.embeddings.azure_openai import AzureOpenAIEmbedding
 from llama_index.embeddings.base import SimilarityMode
 from llama_index.embeddings.bedrock import BedrockEmbedding
+from llama_index.embeddings.cache import (
+    CachedEmbedding,
+    InMemoryEmbeddingCache,
+    KVStoreEmbeddingCache,
+    SQLiteEmbeddingCache,
+)
 from llama_index.embeddings.clarifai import ClarifaiEmbedding
 from llama_index.embeddings.clip import ClipEmbedding
 from llama_index.embeddings.cohereai import CohereEmbedding
@@ -36,6 +42,7 @@ from llama_index.embeddings.voyageai import VoyageEmbedding
 __all__ = [
     "AdapterEmbeddingModel",
     "BedrockEmbedding",
+    "CachedEmbedding",
     "ClarifaiEmbedding",
     "ClipEmbedding",
     "CohereEmbedding",
@@ -45,7 +52,9 @@ __all__ = [
     "GradientEmbedding",
     "HuggingFaceInferenceAPIEmbedding",
     "HuggingFaceEmbedding",
+    "InMemoryEmbeddingCache",
     "InstructorEmbedding",
+    "KVStoreEmbeddingCache",
     "LangchainEmbedding",
     "LinearAdapterEmbeddingModel",
     "LLMRailsEmbedding",
@@ -55,6 +64,7 @@ __all__ = [
     "Pooling",
     "GooglePaLMEmbedding",
     "SimilarityMode",
+    "SQLiteEmbeddingCache",
     "TextEmbeddingsInference",
     "resolve_embed_model",
     # Deprecated, kept for backwards compatibility
@@ -1,9 +1,11 @@
 """Base embeddings file."""
 
 import asyncio
+import random
 from abc import abstractmethod
+from collections import deque
 from enum import Enum
-from typing import Callable, Coroutine, List, Optional, Tuple
+from typing import Callable, List, Optional, Tuple, cast
 
 import numpy as np
 
@@ -11,12 +13,18 @@ from llama_index.bridge.pydantic import Field, validator
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.schema import BaseComponent
-from llama_index.utils import get_tqdm_iterable
+from llama_index.utils import count_tokens, get_tqdm_iterable
 
 # TODO: change to numpy array
 Embedding = List[float]
 
 DEFAULT_EMBED_BATCH_SIZE = 10
+DEFAULT_EMBED_MAX_CONCURRENCY = 8
+
+# retries of rate limited batches in async batch embedding calls
+EMBED_MAX_RETRIES = 6
+EMBED_MIN_BACKOFF_SECS = 1.0
+EMBED_MAX_BACKOFF_SECS = 60.0
 
 
 class SimilarityMode(str, Enum):
@@ -27,6 +35,16 @@ class SimilarityMode(str, Enum):
     EUCLIDEAN = "euclidean"
 
 
+def _is_rate_limit_error(e: BaseException) -> bool:
+    """Whether an exception raised by an embedding provider is a rate limit."""
+    if "RateLimit" in type(e).__name__:
+        return True
+    status_code = getattr(e, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(e, "response", None), "status_code", None)
+    return status_code == 429
+
+
 def mean_agg(embeddings: List[Embedding]) -> Embedding:
     """Mean aggregation for embeddings."""
     return list(np.array(embeddings).mean(axis=0))
@@ -59,6 +77,22 @@ class BaseEmbedding(BaseComponent):
         default=DEFAULT_EMBED_BATCH_SIZE,
         description="The batch size for embedding calls.",
     )
+    embed_max_concurrency: Optional[int] = Field(
+        default=DEFAULT_EMBED_MAX_CONCURRENCY,
+        description=(
+            "The maximum number of concurrent batches in async batch embedding "
+            "calls. None for no limit."
+        ),
+        gt=0,
+    )
+    embed_batch_token_budget: Optional[int] = Field(
+        default=None,
+        description=(
+            "If set, async batch embedding calls also cap the number of tokens "
+            "per batch."
+        ),
+        gt=0,
+    )
     callback_manager: CallbackManager = Field(
         default_factory=lambda: CallbackManager([]), exclude=True
     )
@@ -130,6 +164,72 @@ class BaseEmbedding(BaseComponent):
             )
         return query_embedding
 
+    def _get_query_embeddings(self, queries: List[str]) -> List[Embedding]:
+        """
+        Embed the input sequence of queries synchronously.
+
+        Subclasses can implement this method if batch queries are supported.
+        """
+        # Default implementation just loops over _get_query_embedding
+        return [self._get_query_embedding(query) for query in queries]
+
+    async def _aget_query_embeddings(self, queries: List[str]) -> List[Embedding]:
+        """
+        Embed the input sequence of queries asynchronously.
+
+        Subclasses can implement this method if batch queries are supported.
+        """
+        return await asyncio.gather(
+            *[self._aget_query_embedding(query) for query in queries]
+        )
+
+    def get_query_embedding_batch(
+        self, queries: List[str], show_progress: bool = False
+    ) -> List[Embedding]:
+        """Get a list of query embeddings, with batching."""
+        result_embeddings: List[Embedding] = []
+        queue_with_progress = get_tqdm_iterable(
+            range(0, len(queries), self.embed_batch_size),
+            show_progress,
+            "Generating query embeddings",
+        )
+        for start in queue_with_progress:
+            cur_batch = queries[start : start + self.embed_batch_size]
+            with self.callback_manager.event(
+                CBEventType.EMBEDDING,
+                payload={EventPayload.SERIALIZED: self.to_dict()},
+            ) as event:
+                embeddings = self._get_query_embeddings(cur_batch)
+                result_embeddings.extend(embeddings)
+                event.on_end(
+                    payload={
+                        EventPayload.CHUNKS: cur_batch,
+                        EventPayload.EMBEDDINGS: embeddings,
+                    },
+                )
+
+        return result_embeddings
+
+    async def aget_query_embedding_batch(self, queries: List[str]) -> List[Embedding]:
+        """Asynchronously get a list of query embeddings, with batching."""
+        result_embeddings: List[Embedding] = []
+        for start in range(0, len(queries), self.embed_batch_size):
+            cur_batch = queries[start : start + self.embed_batch_size]
+            with self.callback_manager.event(
+                CBEventType.EMBEDDING,
+                payload={EventPayload.SERIALIZED: self.to_dict()},
+            ) as event:
+                embeddings = await self._aget_query_embeddings(cur_batch)
+                result_embeddings.extend(embeddings)
+                event.on_end(
+                    payload={
+                        EventPayload.CHUNKS: cur_batch,
+                        EventPayload.EMBEDDINGS: embeddings,
+                    },
+                )
+
+        return result_embeddings
+
     def get_agg_embedding_from_queries(
         self,
         queries: List[str],
@@ -259,62 +359,134 @@ class BaseEmbedding(BaseComponent):
 
         return result_embeddings
 
+    def _get_text_batch_ranges(self, texts: List[str]) -> List[Tuple[int, int]]:
+        """Split texts into (start, end) batches.
+
+        Batches hold at most `embed_batch_size` texts and, if set, at most
+        `embed_batch_token_budget` tokens. A text over the token budget gets
+        a batch of its own.
+
+        """
+        if self.embed_batch_token_budget is None:
+            return [
+                (start, min(start + self.embed_batch_size, len(texts)))
+                for start in range(0, len(texts), self.embed_batch_size)
+            ]
+
+        ranges = []
+        start, num_tokens = 0, 0
+        for idx, text in enumerate(texts):
+            text_tokens = count_tokens(text)
+            if idx > start and (
+                idx - start == self.embed_batch_size
+                or num_tokens + text_tokens > self.embed_batch_token_budget
+            ):
+                ranges.append((start, idx))
+                start, num_tokens = idx, 0
+            num_tokens += text_tokens
+        if start < len(texts):
+            ranges.append((start, len(texts)))
+        return ranges
+
     async def aget_text_embedding_batch(
         self, texts: List[str], show_progress: bool = False
     ) -> List[Embedding]:
-        """Asynchronously get a list of text embeddings, with batching."""
-        cur_batch: List[str] = []
-        callback_payloads: List[Tuple[str, List[str]]] = []
-        result_embeddings: List[Embedding] = []
-        embeddings_coroutines: List[Coroutine] = []
-        for idx, text in enumerate(texts):
-            cur_batch.append(text)
-            if idx == len(texts) - 1 or len(cur_batch) == self.embed_batch_size:
-                # flush
-                event_id = self.callback_manager.on_event_start(
-                    CBEventType.EMBEDDING,
-                    payload={EventPayload.SERIALIZED: self.to_dict()},
-                )
-                callback_payloads.append((event_id, cur_batch))
-                embeddings_coroutines.append(self._aget_text_embeddings(cur_batch))
-                cur_batch = []
+        """Asynchronously get a list of text embeddings, with batching.
 
-        # flatten the results of asyncio.gather, which is a list of embeddings lists
-        nested_embeddings = []
+        At most `embed_max_concurrency` batches are in flight at once. When the
+        provider rate limits a batch, the batch size is halved, no worker sends
+        another batch until an exponential backoff has passed, and the batch
+        is then retried. The batch size grows back by one text per successful
+        batch. Results are always returned in the order of `texts`.
+
+        """
+        result_embeddings: List[Optional[Embedding]] = [None] * len(texts)
+        pending = deque(self._get_text_batch_ranges(texts))
+        # shared across workers, shrunk on rate limits
+        batch_size = self.embed_batch_size
+        # shared across workers, no batch is sent before this loop time
+        loop = asyncio.get_running_loop()
+        resume_at = 0.0
+
+        progress_bar = None
         if show_progress:
             try:
                 from tqdm.auto import tqdm
 
-                nested_embeddings = [
-                    await f
-                    for f in tqdm(
-                        asyncio.as_completed(embeddings_coroutines),
-                        total=len(embeddings_coroutines),
-                        desc="Generating embeddings",
-                    )
-                ]
+                progress_bar = tqdm(total=len(texts), desc="Generating embeddings")
             except ImportError:
-                nested_embeddings = await asyncio.gather(*embeddings_coroutines)
-        else:
-            nested_embeddings = await asyncio.gather(*embeddings_coroutines)
-
-        result_embeddings = [
-            embedding for embeddings in nested_embeddings for embedding in embeddings
-        ]
-
-        for (event_id, text_batch), embeddings in zip(
-            callback_payloads, nested_embeddings
-        ):
-            self.callback_manager.on_event_end(
-                CBEventType.EMBEDDING,
-                payload={
-                    EventPayload.CHUNKS: text_batch,
-                    EventPayload.EMBEDDINGS: embeddings,
-                },
-                event_id=event_id,
-            )
+                pass
+
+        async def _worker() -> None:
+            nonlocal batch_size, resume_at
+            num_retries = 0
+            while pending:
+                delay = resume_at - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    # the backoff may have been extended meanwhile
+                    continue
+                start, end = pending.popleft()
+                if end - start > batch_size:
+                    pending.appendleft((start + batch_size, end))
+                    end = start + batch_size
+                cur_batch = texts[start:end]
 
-        return result_embeddings
+                event_id = self.callback_manager.on_event_start(
+                    CBEventType.EMBEDDING,
+                    payload={EventPayload.SERIALIZED: self.to_dict()},
+                )
+                try:
+                    embeddings = await self._aget_text_embeddings(cur_batch)
+                except Exception as e:
+                    self.callback_manager.on_event_end(
+                        CBEventType.EMBEDDING,
+                        payload={EventPayload.EXCEPTION: e},
+                        event_id=event_id,
+                    )
+                    if not _is_rate_limit_error(e) or num_retries >= EMBED_MAX_RETRIES:
+                        raise
+                    # retry the batch, and the ones after it, in smaller batches
+                    pending.appendleft((start, end))
+                    batch_size = max(1, min(batch_size, end - start) // 2)
+                    backoff_secs = min(
+                        EMBED_MIN_BACKOFF_SECS * 2**num_retries,
+                        EMBED_MAX_BACKOFF_SECS,
+                    )
+                    num_retries += 1
+                    resume_at = max(
+                        resume_at,
+                        loop.time() + backoff_secs * random.uniform(0.5, 1.5),
+                    )
+                    continue
+
+                num_retries = 0
+                batch_size = min(batch_size + 1, self.embed_batch_size)
+                result_embeddings[start:end] = embeddings
+                self.callback_manager.on_event_end(
+                    CBEventType.EMBEDDING,
+                    payload={
+                        EventPayload.CHUNKS: cur_batch,
+                        EventPayload.EMBEDDINGS: embeddings,
+                    },
+                    event_id=event_id,
+                )
+                if progress_bar is not None:
+                    progress_bar.update(len(cur_batch))
+
+        num_workers = min(self.embed_max_concurrency or len(pending), len(pending))
+        workers = [asyncio.ensure_future(_worker()) for _ in range(num_workers)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            raise
+        finally:
+            if progress_bar is not None:
+                progress_bar.close()
+
+        return cast(List[Embedding], result_embeddings)
 
     def similarity(
         self,
@@ -0,0 +1,434 @@
+"""Embedding cache.
+
+Wraps any embedding model with a content-addressed cache, so that texts that
+were already embedded are never sent to the embedding provider again.
+
+"""
+
+import hashlib
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from llama_index.bridge.pydantic import PrivateAttr
+from llama_index.callbacks import CallbackManager
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.embeddings.base import BaseEmbedding, Embedding
+
+if TYPE_CHECKING:
+    from llama_index.storage.kvstore.types import BaseKVStore
+
+DEFAULT_CACHE_SIZE = 100_000
+DEFAULT_CACHE_COLLECTION = "embedding_cache"
+DEFAULT_SQLITE_TABLE = "embeddings"
+# stay well below SQLite's limit on the number of query parameters
+SQLITE_MAX_VARIABLES = 500
+
+TEXT_MODE = "text"
+QUERY_MODE = "query"
+
+
+class BaseEmbeddingCache(ABC):
+    """Base embedding cache, mapping cache keys to embeddings."""
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Embedding]]:
+        """Get the cached embeddings of the keys, None for missing keys."""
+
+    @abstractmethod
+    def put_many(self, items: Sequence[Tuple[str, Embedding]]) -> None:
+        """Cache (key, embedding) pairs."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+
+
+class InMemoryEmbeddingCache(BaseEmbeddingCache):
+    """In-memory LRU embedding cache.
+
+    Embeddings are copied in and out of the cache, so that callers modifying
+    an embedding do not modify the cached one.
+
+    Args:
+        max_size (int): maximum number of cached embeddings. The least
+            recently used embeddings are evicted first.
+
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self._max_size = max_size
+        self._cache: "OrderedDict[str, Embedding]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Embedding]]:
+        embeddings: List[Optional[Embedding]] = []
+        with self._lock:
+            for key in keys:
+                embedding = self._cache.get(key, None)
+                if embedding is not None:
+                    self._cache.move_to_end(key)
+                    embedding = list(embedding)
+                embeddings.append(embedding)
+        return embeddings
+
+    def put_many(self, items: Sequence[Tuple[str, Embedding]]) -> None:
+        with self._lock:
+            for key, embedding in items:
+                self._cache[key] = list(embedding)
+                self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class SQLiteEmbeddingCache(BaseEmbeddingCache):
+    """On-disk embedding cache backed by SQLite.
+
+    Embeddings are stored as float64 blobs, so they round-trip exactly.
+
+    Args:
+        database (str): path of the SQLite database file, created if missing.
+            Use ":memory:" for a throwaway cache.
+        table_name (str): name of the cache table.
+
+    """
+
+    def __init__(self, database: str, table_name: str = DEFAULT_SQLITE_TABLE) -> None:
+        self._table_name = table_name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(database, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table_name} "
+                "(key TEXT PRIMARY KEY, embedding BLOB NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                f"SELECT COUNT(*) FROM {self._table_name}"
+            ).fetchone()
+        return count
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Embedding]]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                batch = keys[start : start + SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, embedding FROM {self._table_name} "
+                    f"WHERE key IN ({placeholders})",
+                    list(batch),
+                )
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float64).tolist()
+        return [found.get(key, None) for key in keys]
+
+    def put_many(self, items: Sequence[Tuple[str, Embedding]]) -> None:
+        rows = [
+            (key, np.asarray(embedding, dtype=np.float64).tobytes())
+            for key, embedding in items
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {self._table_name} (key, embedding) "
+                "VALUES (?, ?)",
+                rows,
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self._table_name}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class KVStoreEmbeddingCache(BaseEmbeddingCache):
+    """Embedding cache backed by any key-value store.
+
+    Args:
+        kvstore (BaseKVStore): key-value store, e.g. a Redis or Mongo kvstore
+            shared between workers.
+        collection (str): collection holding the cached embeddings.
+
+    """
+
+    def __init__(
+        self, kvstore: "BaseKVStore", collection: str = DEFAULT_CACHE_COLLECTION
+    ) -> None:
+        self._kvstore = kvstore
+        self._collection = collection
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Embedding]]:
+        vals = self._kvstore.get_many(keys, collection=self._collection)
+        return [val["embedding"] if val is not None else None for val in vals]
+
+    def put_many(self, items: Sequence[Tuple[str, Embedding]]) -> None:
+        self._kvstore.put_all(
+            [(key, {"embedding": list(embedding)}) for key, embedding in items],
+            collection=self._collection,
+        )
+
+    def clear(self) -> None:
+        keys = list(self._kvstore.get_all(collection=self._collection))
+        self._kvstore.delete_many(keys, collection=self._collection)
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding model wrapper with a content-addressed embedding cache.
+
+    Embeddings are cached under (namespace, mode, sha256 of the text), where
+    the mode distinguishes query from text embeddings. Only texts missing from
+    the cache are sent to the wrapped model, each distinct text once per call.
+    Repeats of a missing text within a call are counted as duplicates, not as
+    cache hits. Every lookup emits an EMBEDDING_CACHE callback event with the
+    number of cache hits and misses.
+
+    Args:
+        embed_model (BaseEmbedding): embedding model to wrap.
+        cache (Optional[BaseEmbeddingCache]): cache backend. Defaults to an
+            InMemoryEmbeddingCache.
+        namespace (Optional[str]): namespace of the cache keys. Defaults to the
+            model name of `embed_model`; set it when models with the same name
+            produce different embeddings.
+        embed_batch_size (Optional[int]): batch size for embedding the cache
+            misses. Defaults to the batch size of `embed_model`.
+        callback_manager (Optional[CallbackManager]): Callback manager.
+
+    """
+
+    _embed_model: BaseEmbedding = PrivateAttr()
+    _cache: BaseEmbeddingCache = PrivateAttr()
+    _namespace: str = PrivateAttr()
+    _cache_hits: int = PrivateAttr(default=0)
+    _cache_misses: int = PrivateAttr(default=0)
+    _cache_duplicates: int = PrivateAttr(default=0)
+    _counters_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def __init__(
+        self,
+        embed_model: BaseEmbedding,
+        cache: Optional[BaseEmbeddingCache] = None,
+        namespace: Optional[str] = None,
+        embed_batch_size: Optional[int] = None,
+        callback_manager: Optional[CallbackManager] = None,
+    ) -> None:
+        self._embed_model = embed_model
+        self._cache = cache or InMemoryEmbeddingCache()
+        self._namespace = namespace or embed_model.model_name
+        super().__init__(
+            model_name=embed_model.model_name,
+            embed_batch_size=embed_batch_size or embed_model.embed_batch_size,
+            embed_max_concurrency=embed_model.embed_max_concurrency,
+            embed_batch_token_budget=embed_model.embed_batch_token_budget,
+            callback_manager=callback_manager or embed_model.callback_manager,
+        )
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    @property
+    def embed_model(self) -> BaseEmbedding:
+        """Get the wrapped embedding model."""
+        return self._embed_model
+
+    @property
+    def cache(self) -> BaseEmbeddingCache:
+        """Get the cache backend."""
+        return self._cache
+
+    @property
+    def cache_hits(self) -> int:
+        """Total number of texts served from the cache."""
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Total number of texts sent to the wrapped model."""
+        return self._cache_misses
+
+    @property
+    def cache_duplicates(self) -> int:
+        """Total number of missing texts repeated within a call, embedded once."""
+        return self._cache_duplicates
+
+    def get_cache_key(self, text: str, mode: str) -> str:
+        """Get the cache key of a text embedded in the given mode."""
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self._namespace}/{mode}/{text_hash}"
+
+    def _lookup(
+        self, texts: List[str], mode: str
+    ) -> Tuple[List[str], List[Optional[Embedding]], List[str]]:
+        """Look up texts in the cache.
+
+        Returns the cache keys, the cached embeddings (None for misses) and
+        the distinct texts that missed.
+
+        """
+        with self.callback_manager.event(
+            CBEventType.EMBEDDING_CACHE,
+            payload={EventPayload.SERIALIZED: self.to_dict()},
+        ) as event:
+            keys = [self.get_cache_key(text, mode) for text in texts]
+            cached = self._cache.get_many(keys)
+            missing = list(
+                dict.fromkeys(
+                    text for text, embedding in zip(texts, cached) if embedding is None
+                )
+            )
+            num_hits = sum(embedding is not None for embedding in cached)
+            num_duplicates = len(texts) - num_hits - len(missing)
+            with self._counters_lock:
+                self._cache_hits += num_hits
+                self._cache_misses += len(missing)
+                self._cache_duplicates += num_duplicates
+            event.on_end(
+                payload={
+                    EventPayload.CACHE_HITS: num_hits,
+                    EventPayload.CACHE_MISSES: len(missing),
+                }
+            )
+        return keys, cached, missing
+
+    def _merge(
+        self,
+        texts: List[str],
+        keys: List[str],
+        cached: List[Optional[Embedding]],
+        missing: List[str],
+        missing_embeddings: List[Embedding],
+    ) -> List[Embedding]:
+        """Cache the embeddings of the missed texts and merge all embeddings."""
+        missing_map = dict(zip(missing, missing_embeddings))
+        embeddings = []
+        new_items = {}
+        for text, key, embedding in zip(texts, keys, cached):
+            if embedding is None:
+                embedding = missing_map[text]
+                new_items[key] = embedding
+            embeddings.append(embedding)
+        self._cache.put_many(list(new_items.items()))
+        return embeddings
+
+    def _get_with_cache(
+        self,
+        texts: List[str],
+        mode: str,
+        embed_fn: Callable[[List[str]], List[Embedding]],
+    ) -> List[Embedding]:
+        keys, cached, missing = self._lookup(texts, mode)
+        missing_embeddings = embed_fn(missing) if missing else []
+        return self._merge(texts, keys, cached, missing, missing_embeddings)
+
+    async def _aget_with_cache(
+        self,
+        texts: List[str],
+        mode: str,
+        embed_fn: Callable[[List[str]], Awaitable[List[Embedding]]],
+    ) -> List[Embedding]:
+        keys, cached, missing = self._lookup(texts, mode)
+        missing_embeddings = await embed_fn(missing) if missing else []
+        return self._merge(texts, keys, cached, missing, missing_embeddings)
+
+    def get_query_embedding(self, query: str) -> Embedding:
+        embed_fn = super().get_query_embedding
+        return self._get_with_cache(
+            [query], QUERY_MODE, lambda queries: [embed_fn(queries[0])]
+        )[0]
+
+    async def aget_query_embedding(self, query: str) -> Embedding:
+        embed_fn = super().aget_query_embedding
+
+        async def _embed(queries: List[str]) -> List[Embedding]:
+            return [await embed_fn(queries[0])]
+
+        return (await self._aget_with_cache([query], QUERY_MODE, _embed))[0]
+
+    def get_query_embedding_batch(
+        self, queries: List[str], show_progress: bool = False
+    ) -> List[Embedding]:
+        embed_fn = super().get_query_embedding_batch
+        return self._get_with_cache(
+            queries,
+            QUERY_MODE,
+            lambda missing: embed_fn(missing, show_progress=show_progress),
+        )
+
+    async def aget_query_embedding_batch(self, queries: List[str]) -> List[Embedding]:
+        return await self._aget_with_cache(
+            queries, QUERY_MODE, super().aget_query_embedding_batch
+        )
+
+    def get_text_embedding(self, text: str) -> Embedding:
+        embed_fn = super().get_text_embedding
+        return self._get_with_cache(
+            [text], TEXT_MODE, lambda texts: [embed_fn(texts[0])]
+        )[0]
+
+    async def aget_text_embedding(self, text: str) -> Embedding:
+        embed_fn = super().aget_text_embedding
+
+        async def _embed(texts: List[str]) -> List[Embedding]:
+            return [await embed_fn(texts[0])]
+
+        return (await self._aget_with_cache([text], TEXT_MODE, _embed))[0]
+
+    def get_text_embedding_batch(
+        self, texts: List[str], show_progress: bool = False
+    ) -> List[Embedding]:
+        embed_fn = super().get_text_embedding_batch
+        return self._get_with_cache(
+            texts,
+            TEXT_MODE,
+            lambda missing: embed_fn(missing, show_progress=show_progress),
+        )
+
+    async def aget_text_embedding_batch(
+        self, texts: List[str], show_progress: bool = False
+    ) -> List[Embedding]:
+        embed_fn = super().aget_text_embedding_batch
+        return await self._aget_with_cache(
+            texts,
+            TEXT_MODE,
+            lambda missing: embed_fn(missing, show_progress=show_progress),
+        )
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        return self._embed_model._get_query_embedding(query)
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        return await self._embed_model._aget_query_embedding(query)
+
+    def _get_query_embeddings(self, queries: List[str]) -> List[Embedding]:
+        return self._embed_model._get_query_embeddings(queries)
+
+    async def _aget_query_embeddings(self, queries: List[str]) -> List[Embedding]:
+        return await self._embed_model._aget_query_embeddings(queries)
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._embed_model._get_text_embedding(text)
+
+    async def _aget_text_embedding(self, text: str) -> Embedding:
+        return await self._embed_model._aget_text_embedding(text)
+
+    def _get_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        return self._embed_model._get_text_embeddings(texts)
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[Embedding]:
+        return await self._embed_model._aget_text_embeddings(texts)
@@ -316,6 +316,24 @@ class OpenAIEmbedding(BaseEmbedding):
             **self.additional_kwargs,
         )
 
+    def _get_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Get query embeddings in a single request."""
+        return get_embeddings(
+            self._client,
+            queries,
+            engine=self._query_engine,
+            **self.additional_kwargs,
+        )
+
+    async def _aget_query_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Asynchronously get query embeddings in a single request."""
+        return await aget_embeddings(
+            self._aclient,
+            queries,
+            engine=self._query_engine,
+            **self.additional_kwargs,
+        )
+
     def _get_text_embedding(self, text: str) -> List[float]:
         """Get text embedding."""
         return get_embedding(
@@ -1,5 +1,6 @@
+import asyncio
 from abc import abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from llama_index.indices.query.schema import QueryBundle, QueryType
 from llama_index.indices.service_context import ServiceContext
@@ -38,6 +39,31 @@ class BaseRetriever(PromptMixin):
             str_or_query_bundle = QueryBundle(str_or_query_bundle)
         return await self._aretrieve(str_or_query_bundle)
 
+    def retrieve_batch(
+        self, str_or_query_bundles: Sequence[QueryType]
+    ) -> List[List[NodeWithScore]]:
+        """Retrieve nodes for a batch of queries.
+
+        Args:
+            str_or_query_bundles (Sequence[QueryType]): query strings or
+                QueryBundle objects.
+
+        """
+        query_bundles = [
+            QueryBundle(query) if isinstance(query, str) else query
+            for query in str_or_query_bundles
+        ]
+        return self._retrieve_batch(query_bundles)
+
+    async def aretrieve_batch(
+        self, str_or_query_bundles: Sequence[QueryType]
+    ) -> List[List[NodeWithScore]]:
+        query_bundles = [
+            QueryBundle(query) if isinstance(query, str) else query
+            for query in str_or_query_bundles
+        ]
+        return await self._aretrieve_batch(query_bundles)
+
     @abstractmethod
     def _retrieve(self, query_bundle: QueryBundle) -> List[NodeWithScore]:
         """Retrieve nodes given query.
@@ -56,6 +82,29 @@ class BaseRetriever(PromptMixin):
         """
         return self._retrieve(query_bundle)
 
+    def _retrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        """Retrieve nodes for a batch of queries.
+
+        Can be overridden by retrievers that support batched retrieval.
+        By default, queries are retrieved one at a time.
+
+        """
+        return [self._retrieve(query_bundle) for query_bundle in query_bundles]
+
+    async def _aretrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        """Asynchronously retrieve nodes for a batch of queries.
+
+        By default, queries are retrieved concurrently.
+
+        """
+        return await asyncio.gather(
+            *[self._aretrieve(query_bundle) for query_bundle in query_bundles]
+        )
+
     def get_service_context(self) -> Optional[ServiceContext]:
         """Attempts to resolve a service context.
         Short-circuits at self.service_context, self._service_context,
@@ -20,7 +20,7 @@ from llama_index.prompts.prompt_utils import get_empty_prompt_txt
 from llama_index.schema import BaseComponent
 from llama_index.text_splitter import TokenTextSplitter
 from llama_index.text_splitter.utils import truncate_text
-from llama_index.utils import globals_helper
+from llama_index.utils import count_tokens, globals_helper
 
 DEFAULT_PADDING = 5
 DEFAULT_CHUNK_OVERLAP_RATIO = 0.1
@@ -144,7 +144,7 @@ class PromptHelper(BaseComponent):
         - Available context size is further clamped to be non-negative.
         """
         empty_prompt_txt = get_empty_prompt_txt(prompt)
-        num_empty_prompt_tokens = len(self._tokenizer(empty_prompt_txt))
+        num_empty_prompt_tokens = count_tokens(empty_prompt_txt, self._tokenizer)
         context_size_tokens = (
             self.context_window - num_empty_prompt_tokens - self.num_output
         )
@@ -1,7 +1,6 @@
 """Embedding utils for queries."""
 import heapq
-import math
-from typing import Any, Callable, List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple, cast
 
 import numpy as np
 
@@ -97,6 +96,12 @@ def get_top_k_embeddings_learner(
     return result_similarities, result_ids
 
 
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize the rows of a matrix, leaving zero rows as zeros."""
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.where(norms == 0, 1.0, norms)
+
+
 def get_top_k_mmr_embeddings(
     query_embedding: List[float],
     embeddings: List[List[float]],
@@ -105,6 +110,7 @@ def get_top_k_mmr_embeddings(
     embedding_ids: Optional[List] = None,
     similarity_cutoff: Optional[float] = None,
     mmr_threshold: Optional[float] = None,
+    fetch_k: Optional[int] = None,
 ) -> Tuple[List[float], List]:
     """Get top nodes by similarity to the query,
     discount by their similarity to previous results.
@@ -112,55 +118,81 @@ def get_top_k_mmr_embeddings(
     A mmr_threshold of 0 will strongly avoid similarity to previous results.
     A mmr_threshold of 1 will check similarity the query and ignore previous results.
 
+    Each candidate is discounted by its highest similarity to any previous
+    result, tracked in a running max-overlap vector. With the default (cosine)
+    similarity all similarities are computed with matrix operations.
+
+    Args:
+        fetch_k (Optional[int]): if set, only the `fetch_k` embeddings most
+            similar to the query are considered for diversification.
+
     """
     threshold = mmr_threshold or 0.5
-    similarity_fn = similarity_fn or default_similarity_fn
 
     if embedding_ids is None or embedding_ids == []:
         embedding_ids = list(range(len(embeddings)))
-    full_embed_map = dict(zip(embedding_ids, range(len(embedding_ids))))
-    embed_map = full_embed_map.copy()
-    embed_similarity = {}
-    score: float = -math.inf
-    high_score_id = None
-
-    for i, emb in enumerate(embeddings):
-        similarity = similarity_fn(query_embedding, emb)
-        embed_similarity[embedding_ids[i]] = similarity
-        if similarity * threshold > score:
-            high_score_id = embedding_ids[i]
-            score = similarity * threshold
-
-    results: List[Tuple[Any, Any]] = []
-
-    embedding_length = len(embeddings or [])
-    similarity_top_k_count = similarity_top_k or embedding_length
-    while len(results) < min(similarity_top_k_count, embedding_length):
-        # Calculate the similarity score the for the leading one.
-        results.append((score, high_score_id))
-
-        # Reset so a new high scoring result can be found
-        del embed_map[high_score_id]
-        recent_embedding_id = high_score_id
-        score = -math.inf
-
-        # Iterate through results to find high score
-        for embed_id in embed_map:
-            overlap_with_recent = similarity_fn(
-                embeddings[embed_map[embed_id]],
-                embeddings[full_embed_map[recent_embedding_id]],
+    if len(embeddings) == 0:
+        return [], []
+
+    vectorized = similarity_fn is None or similarity_fn is default_similarity_fn
+    if vectorized:
+        embeddings_np = _normalize_rows(np.asarray(embeddings, dtype=np.float64))
+        query_embedding_np = _normalize_rows(
+            np.asarray(query_embedding, dtype=np.float64)
+        )
+        query_similarities = embeddings_np @ query_embedding_np
+    else:
+        custom_similarity_fn = cast(Callable[..., float], similarity_fn)
+        query_similarities = np.array(
+            [custom_similarity_fn(query_embedding, emb) for emb in embeddings],
+            dtype=np.float64,
+        )
+
+    candidates = np.arange(len(embeddings))
+    if fetch_k is not None and fetch_k < len(candidates):
+        # keep the original order of the pool so ties resolve as without fetch_k
+        candidates = np.sort(
+            np.argpartition(-query_similarities, fetch_k - 1)[:fetch_k]
+        )
+
+    if vectorized:
+        pool_np = embeddings_np[candidates]
+
+        def overlap_fn(recent: int) -> np.ndarray:
+            return pool_np @ pool_np[recent]
+
+    else:
+
+        def overlap_fn(recent: int) -> np.ndarray:
+            return np.array(
+                [
+                    custom_similarity_fn(embeddings[i], embeddings[candidates[recent]])
+                    for i in candidates
+                ],
+                dtype=np.float64,
             )
-            if (
-                threshold * embed_similarity[embed_id]
-                - ((1 - threshold) * overlap_with_recent)
-                > score
-            ):
-                score = threshold * embed_similarity[embed_id] - (
-                    (1 - threshold) * overlap_with_recent
-                )
-                high_score_id = embed_id
-
-    result_similarities = [s for s, _ in results]
-    result_ids = [n for _, n in results]
+
+    candidate_similarities = query_similarities[candidates]
+
+    similarity_top_k_count = min(similarity_top_k or len(embeddings), len(candidates))
+    selected = np.zeros(len(candidates), dtype=bool)
+    max_overlap: Optional[np.ndarray] = None
+    result_similarities: List[float] = []
+    result_ids: List = []
+    for _ in range(similarity_top_k_count):
+        scores = threshold * candidate_similarities
+        if max_overlap is not None:
+            scores = scores - (1 - threshold) * max_overlap
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+
+        result_similarities.append(float(scores[best]))
+        result_ids.append(embedding_ids[candidates[best]])
+        selected[best] = True
+
+        overlap = overlap_fn(best)
+        max_overlap = (
+            overlap if max_overlap is None else np.maximum(max_overlap, overlap)
+        )
 
     return result_similarities, result_ids
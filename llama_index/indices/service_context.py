@@ -1,8 +1,9 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 import llama_index
+from llama_index.async_utils import AsyncExecutor
 from llama_index.bridge.pydantic import BaseModel
 from llama_index.callbacks.base import CallbackManager
 from llama_index.embeddings.base import BaseEmbedding
@@ -72,6 +73,7 @@ class ServiceContext:
     - node_parser: NodeParser
     - llama_logger: LlamaLogger (deprecated)
     - callback_manager: CallbackManager
+    - async_executor: AsyncExecutor
 
     """
 
@@ -81,6 +83,7 @@ class ServiceContext:
     node_parser: NodeParser
     llama_logger: LlamaLogger
     callback_manager: CallbackManager
+    async_executor: AsyncExecutor = field(default_factory=AsyncExecutor)
 
     @classmethod
     def from_defaults(
@@ -92,6 +95,7 @@ class ServiceContext:
         node_parser: Optional[NodeParser] = None,
         llama_logger: Optional[LlamaLogger] = None,
         callback_manager: Optional[CallbackManager] = None,
+        async_executor: Optional[AsyncExecutor] = None,
         system_prompt: Optional[str] = None,
         query_wrapper_prompt: Optional[BasePromptTemplate] = None,
         # pydantic program mode (used if output_cls is specified)
@@ -121,6 +125,8 @@ class ServiceContext:
             llama_logger (Optional[LlamaLogger]): LlamaLogger (deprecated)
             chunk_size (Optional[int]): chunk_size
             callback_manager (Optional[CallbackManager]): CallbackManager
+            async_executor (Optional[AsyncExecutor]): Executor of concurrent
+                async LLM calls, limiting their concurrency and rate
             system_prompt (Optional[str]): System-wide prompt to be prepended
                 to all input prompts, used to guide system "decision making"
             query_wrapper_prompt (Optional[BasePromptTemplate]): A format to wrap
@@ -145,6 +151,7 @@ class ServiceContext:
                 node_parser=node_parser,
                 llama_logger=llama_logger,
                 callback_manager=callback_manager,
+                async_executor=async_executor,
                 chunk_size=chunk_size,
                 chunk_size_limit=chunk_size_limit,
             )
@@ -181,6 +188,7 @@ class ServiceContext:
         )
 
         llama_logger = llama_logger or LlamaLogger()
+        async_executor = async_executor or AsyncExecutor()
 
         return cls(
             llm_predictor=llm_predictor,
@@ -189,6 +197,7 @@ class ServiceContext:
             node_parser=node_parser,
             llama_logger=llama_logger,  # deprecated
             callback_manager=callback_manager,
+            async_executor=async_executor,
         )
 
     @classmethod
@@ -202,6 +211,7 @@ class ServiceContext:
         node_parser: Optional[NodeParser] = None,
         llama_logger: Optional[LlamaLogger] = None,
         callback_manager: Optional[CallbackManager] = None,
+        async_executor: Optional[AsyncExecutor] = None,
         system_prompt: Optional[str] = None,
         query_wrapper_prompt: Optional[BasePromptTemplate] = None,
         # node parser kwargs
@@ -260,6 +270,7 @@ class ServiceContext:
             )
 
         llama_logger = llama_logger or service_context.llama_logger
+        async_executor = async_executor or service_context.async_executor
 
         return cls(
             llm_predictor=llm_predictor,
@@ -268,6 +279,7 @@ class ServiceContext:
             node_parser=node_parser,
             llama_logger=llama_logger,  # deprecated
             callback_manager=callback_manager,
+            async_executor=async_executor,
         )
 
     @property
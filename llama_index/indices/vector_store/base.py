@@ -4,7 +4,7 @@ An index that that is built on top of an existing vector store.
 
 """
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from llama_index.async_utils import run_async_tasks
 from llama_index.data_structs.data_structs import IndexDict
@@ -12,13 +12,18 @@ from llama_index.indices.base import BaseIndex
 from llama_index.indices.base_retriever import BaseRetriever
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.utils import async_embed_nodes, embed_nodes
-from llama_index.schema import BaseNode, ImageNode, IndexNode
+from llama_index.schema import BaseNode, Document, ImageNode, IndexNode
 from llama_index.storage.docstore.types import RefDocInfo
 from llama_index.storage.storage_context import StorageContext
+from llama_index.utils import get_tqdm_iterable, iter_batch
 from llama_index.vector_stores.types import VectorStore
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_STREAMING_WINDOW_SIZE = 64
+# document hash marking a document of a window that is being written
+_UNCOMMITTED_DOC_HASH = ""
+
 
 class VectorStoreIndex(BaseIndex[IndexDict]):
     """Vector Store Index.
@@ -72,6 +77,128 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
             nodes=[], service_context=service_context, storage_context=storage_context
         )
 
+    @classmethod
+    def from_document_stream(
+        cls,
+        documents: Iterable[Document],
+        storage_context: Optional[StorageContext] = None,
+        service_context: Optional[ServiceContext] = None,
+        window_size: int = DEFAULT_STREAMING_WINDOW_SIZE,
+        persist_dir: Optional[str] = None,
+        show_progress: bool = False,
+        **kwargs: Any,
+    ) -> "VectorStoreIndex":
+        """Create index from a stream of documents, with bounded memory.
+
+        See `insert_document_stream`. To resume an interrupted build, load the
+        index from `persist_dir` and call `insert_document_stream` with the
+        same documents.
+
+        Args:
+            documents (Iterable[Document]): documents to build the index from,
+                e.g. a generator reading them lazily.
+            window_size (int): number of documents per window.
+            persist_dir (Optional[str]): if set, the storage context is
+                persisted to this directory after every window.
+
+        """
+        index = cls(
+            nodes=[],
+            storage_context=storage_context,
+            service_context=service_context,
+            show_progress=show_progress,
+            **kwargs,
+        )
+        index.insert_document_stream(
+            documents,
+            window_size=window_size,
+            persist_dir=persist_dir,
+            show_progress=show_progress,
+        )
+        return index
+
+    def insert_document_stream(
+        self,
+        documents: Iterable[Document],
+        window_size: int = DEFAULT_STREAMING_WINDOW_SIZE,
+        persist_dir: Optional[str] = None,
+        show_progress: bool = False,
+        **insert_kwargs: Any,
+    ) -> None:
+        """Insert a stream of documents, one window at a time.
+
+        Documents are read `window_size` at a time; each window is chunked,
+        embedded and written to the vector store and docstore before the next
+        one is read, so at most one window of documents and nodes is held in
+        memory.
+
+        Before a window is written, its documents are marked as uncommitted in
+        the docstore. The window is committed by recording the hashes of its
+        documents (and persisting to `persist_dir`, if set). Calling this again
+        with the same documents resumes after the last committed window:
+        documents committed with the same hash are skipped, changed documents
+        are re-inserted, and nodes of a partially written window are deleted
+        before the window is redone. New documents have nothing to delete.
+
+        Args:
+            documents (Iterable[Document]): documents to insert.
+            window_size (int): number of documents per window.
+            persist_dir (Optional[str]): if set, the storage context is
+                persisted to this directory after every window.
+            show_progress (bool): show a progress bar over the documents.
+
+        """
+        documents_iter = get_tqdm_iterable(
+            documents, show_progress, "Ingesting documents"
+        )
+        num_windows, num_nodes, num_skipped = 0, 0, 0
+        for window in iter_batch(documents_iter, window_size):
+            window_docs = []
+            for doc in window:
+                doc_hash = self._docstore.get_document_hash(doc.get_doc_id())
+                if doc_hash == doc.hash:
+                    num_skipped += 1
+                    continue
+                if doc_hash is not None:
+                    # changed, or partially written by an interrupted run
+                    self.delete_ref_doc(doc.get_doc_id(), delete_from_docstore=True)
+                window_docs.append(doc)
+            if not window_docs:
+                continue
+
+            for doc in window_docs:
+                self._docstore.set_document_hash(
+                    doc.get_doc_id(), _UNCOMMITTED_DOC_HASH
+                )
+            with self._service_context.callback_manager.as_trace("insert"):
+                nodes = self._service_context.node_parser.get_nodes_from_documents(
+                    window_docs
+                )
+                if self._use_async:
+                    run_async_tasks(
+                        [
+                            self._async_add_nodes_to_index(
+                                self._index_struct, nodes, **insert_kwargs
+                            )
+                        ]
+                    )
+                else:
+                    self._add_nodes_to_index(self._index_struct, nodes, **insert_kwargs)
+                self._storage_context.index_store.add_index_struct(self._index_struct)
+
+                # commit the window
+                for doc in window_docs:
+                    self._docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+                if persist_dir is not None:
+                    self._storage_context.persist(persist_dir=persist_dir)
+
+            num_windows += 1
+            num_nodes += len(nodes)
+            logger.info(
+                f"> Committed window {num_windows}: {len(window_docs)} documents, "
+                f"{num_nodes} nodes so far ({num_skipped} documents skipped)"
+            )
+
     @property
     def vector_store(self) -> VectorStore:
         return self._vector_store
@@ -134,6 +261,35 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
             results.append(result)
         return results
 
+    def _add_nodes_to_index_struct(
+        self,
+        index_struct: IndexDict,
+        nodes: Sequence[BaseNode],
+        new_ids: List[str],
+    ) -> List[BaseNode]:
+        """Add nodes to the index struct.
+
+        Returns the nodes (without embeddings) that need to be added to the
+        document store, so they can be written in one batch.
+        """
+        docstore_nodes: List[BaseNode] = []
+        for node, new_id in zip(nodes, new_ids):
+            # NOTE: if the vector store doesn't store text, we need to add the
+            # nodes to the index struct and document store. If it does, we only
+            # need to add image and index nodes.
+            if (
+                not self._vector_store.stores_text
+                or self._store_nodes_override
+                or isinstance(node, (ImageNode, IndexNode))
+            ):
+                # NOTE: remove embedding from node to avoid duplication
+                node_without_embedding = node.copy()
+                node_without_embedding.embedding = None
+
+                index_struct.add_node(node_without_embedding, text_id=new_id)
+                docstore_nodes.append(node_without_embedding)
+        return docstore_nodes
+
     async def _async_add_nodes_to_index(
         self,
         index_struct: IndexDict,
@@ -148,31 +304,8 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
         nodes = await self._aget_node_with_embedding(nodes, show_progress)
         new_ids = await self._vector_store.async_add(nodes, **insert_kwargs)
 
-        # if the vector store doesn't store text, we need to add the nodes to the
-        # index struct and document store
-        if not self._vector_store.stores_text or self._store_nodes_override:
-            for node, new_id in zip(nodes, new_ids):
-                # NOTE: remove embedding from node to avoid duplication
-                node_without_embedding = node.copy()
-                node_without_embedding.embedding = None
-
-                index_struct.add_node(node_without_embedding, text_id=new_id)
-                self._docstore.add_documents(
-                    [node_without_embedding], allow_update=True
-                )
-        else:
-            # NOTE: if the vector store keeps text,
-            # we only need to add image and index nodes
-            for node, new_id in zip(nodes, new_ids):
-                if isinstance(node, (ImageNode, IndexNode)):
-                    # NOTE: remove embedding from node to avoid duplication
-                    node_without_embedding = node.copy()
-                    node_without_embedding.embedding = None
-
-                    index_struct.add_node(node_without_embedding, text_id=new_id)
-                    self._docstore.add_documents(
-                        [node_without_embedding], allow_update=True
-                    )
+        docstore_nodes = self._add_nodes_to_index_struct(index_struct, nodes, new_ids)
+        await self._docstore.aadd_documents(docstore_nodes, allow_update=True)
 
     def _add_nodes_to_index(
         self,
@@ -188,31 +321,8 @@ class VectorStoreIndex(BaseIndex[IndexDict]):
         nodes = self._get_node_with_embedding(nodes, show_progress)
         new_ids = self._vector_store.add(nodes, **insert_kwargs)
 
-        if not self._vector_store.stores_text or self._store_nodes_override:
-            # NOTE: if the vector store doesn't store text,
-            # we need to add the nodes to the index struct and document store
-            for node, new_id in zip(nodes, new_ids):
-                # NOTE: remove embedding from node to avoid duplication
-                node_without_embedding = node.copy()
-                node_without_embedding.embedding = None
-
-                index_struct.add_node(node_without_embedding, text_id=new_id)
-                self._docstore.add_documents(
-                    [node_without_embedding], allow_update=True
-                )
-        else:
-            # NOTE: if the vector store keeps text,
-            # we only need to add image and index nodes
-            for node, new_id in zip(nodes, new_ids):
-                if isinstance(node, (ImageNode, IndexNode)):
-                    # NOTE: remove embedding from node to avoid duplication
-                    node_without_embedding = node.copy()
-                    node_without_embedding.embedding = None
-
-                    index_struct.add_node(node_without_embedding, text_id=new_id)
-                    self._docstore.add_documents(
-                        [node_without_embedding], allow_update=True
-                    )
+        docstore_nodes = self._add_nodes_to_index_struct(index_struct, nodes, new_ids)
+        self._docstore.add_documents(docstore_nodes, allow_update=True)
 
     def _build_index_from_nodes(
         self,
@@ -5,11 +5,12 @@ from typing import Any, Dict, List, Optional
 
 from llama_index.constants import DEFAULT_SIMILARITY_TOP_K
 from llama_index.data_structs.data_structs import IndexDict
+from llama_index.embeddings.base import Embedding, mean_agg
 from llama_index.indices.base_retriever import BaseRetriever
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.indices.utils import log_vector_store_query_result
 from llama_index.indices.vector_store.base import VectorStoreIndex
-from llama_index.schema import NodeWithScore, ObjectType
+from llama_index.schema import BaseNode, NodeWithScore, ObjectType
 from llama_index.vector_stores.types import (
     MetadataFilters,
     VectorStoreQuery,
@@ -98,6 +99,74 @@ class VectorIndexRetriever(BaseRetriever):
 
         return await self._aget_nodes_with_embeddings(query_bundle)
 
+    def _retrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        if self._vector_store.is_embedding_query:
+            embed_model = self._service_context.embed_model
+            embedding_strs = self._get_missing_embedding_strs(query_bundles)
+            all_strs = [text for strs in embedding_strs.values() for text in strs]
+            self._set_agg_embeddings(
+                query_bundles,
+                embedding_strs,
+                embed_model.get_query_embedding_batch(all_strs),
+            )
+        queries = [
+            self._build_vector_store_query(query_bundle)
+            for query_bundle in query_bundles
+        ]
+        query_results = self._vector_store.query_batch(queries, **self._kwargs)
+        return [
+            self._build_node_list_from_query_result(query_result)
+            for query_result in query_results
+        ]
+
+    async def _aretrieve_batch(
+        self, query_bundles: List[QueryBundle]
+    ) -> List[List[NodeWithScore]]:
+        if self._vector_store.is_embedding_query:
+            embed_model = self._service_context.embed_model
+            embedding_strs = self._get_missing_embedding_strs(query_bundles)
+            all_strs = [text for strs in embedding_strs.values() for text in strs]
+            self._set_agg_embeddings(
+                query_bundles,
+                embedding_strs,
+                await embed_model.aget_query_embedding_batch(all_strs),
+            )
+        queries = [
+            self._build_vector_store_query(query_bundle)
+            for query_bundle in query_bundles
+        ]
+        query_results = await self._vector_store.aquery_batch(queries, **self._kwargs)
+        return [
+            await self._abuild_node_list_from_query_result(query_result)
+            for query_result in query_results
+        ]
+
+    def _get_missing_embedding_strs(
+        self, query_bundles: List[QueryBundle]
+    ) -> Dict[int, List[str]]:
+        """Get the strings to embed for each query bundle without an embedding."""
+        return {
+            idx: query_bundle.embedding_strs
+            for idx, query_bundle in enumerate(query_bundles)
+            if query_bundle.embedding is None and len(query_bundle.embedding_strs) > 0
+        }
+
+    def _set_agg_embeddings(
+        self,
+        query_bundles: List[QueryBundle],
+        embedding_strs: Dict[int, List[str]],
+        embeddings: List[Embedding],
+    ) -> None:
+        """Set the (mean-aggregated) embedding of each query bundle."""
+        offset = 0
+        for idx, strs in embedding_strs.items():
+            query_bundles[idx].embedding = mean_agg(
+                embeddings[offset : offset + len(strs)]
+            )
+            offset += len(strs)
+
     def _build_vector_store_query(
         self, query_bundle_with_embeddings: QueryBundle
     ) -> VectorStoreQuery:
@@ -113,31 +182,39 @@ class VectorIndexRetriever(BaseRetriever):
             sparse_top_k=self._sparse_top_k,
         )
 
+    def _get_query_result_node_ids(
+        self, query_result: VectorStoreQueryResult
+    ) -> List[str]:
+        """Get the docstore node ids of a query result without nodes."""
+        if query_result.ids is None:
+            raise ValueError(
+                "Vector store query result should return at "
+                "least one of nodes or ids."
+            )
+        assert isinstance(self._index.index_struct, IndexDict)
+        return [self._index.index_struct.nodes_dict[idx] for idx in query_result.ids]
+
+    def _should_fetch_node_from_docstore(self, node: BaseNode) -> bool:
+        """Whether a node returned by the vector store is incomplete."""
+        source_node = node.source_node
+        return (not self._vector_store.stores_text) or (
+            source_node is not None and source_node.node_type != ObjectType.TEXT
+        )
+
     def _build_node_list_from_query_result(
         self, query_result: VectorStoreQueryResult
     ) -> List[NodeWithScore]:
         if query_result.nodes is None:
             # NOTE: vector store does not keep text and returns node indices.
             # Need to recover all nodes from docstore
-            if query_result.ids is None:
-                raise ValueError(
-                    "Vector store query result should return at "
-                    "least one of nodes or ids."
-                )
-            assert isinstance(self._index.index_struct, IndexDict)
-            node_ids = [
-                self._index.index_struct.nodes_dict[idx] for idx in query_result.ids
-            ]
+            node_ids = self._get_query_result_node_ids(query_result)
             nodes = self._docstore.get_nodes(node_ids)
             query_result.nodes = nodes
         else:
             # NOTE: vector store keeps text, returns nodes.
             # Only need to recover image or index nodes from docstore
             for i in range(len(query_result.nodes)):
-                source_node = query_result.nodes[i].source_node
-                if (not self._vector_store.stores_text) or (
-                    source_node is not None and source_node.node_type != ObjectType.TEXT
-                ):
+                if self._should_fetch_node_from_docstore(query_result.nodes[i]):
                     node_id = query_result.nodes[i].node_id
                     if self._docstore.document_exists(node_id):
                         query_result.nodes[
@@ -146,6 +223,36 @@ class VectorIndexRetriever(BaseRetriever):
                             node_id
                         )
 
+        return self._convert_nodes_to_scored_nodes(query_result)
+
+    async def _abuild_node_list_from_query_result(
+        self, query_result: VectorStoreQueryResult
+    ) -> List[NodeWithScore]:
+        if query_result.nodes is None:
+            # NOTE: vector store does not keep text and returns node indices.
+            # Need to recover all nodes from docstore
+            node_ids = self._get_query_result_node_ids(query_result)
+            nodes = await self._docstore.aget_nodes(node_ids)
+            query_result.nodes = nodes
+        else:
+            # NOTE: vector store keeps text, returns nodes.
+            # Only need to recover image or index nodes from docstore
+            for i in range(len(query_result.nodes)):
+                if self._should_fetch_node_from_docstore(query_result.nodes[i]):
+                    node_id = query_result.nodes[i].node_id
+                    if await self._docstore.adocument_exists(node_id):
+                        query_result.nodes[
+                            i
+                        ] = await self._docstore.aget_node(  # type: ignore[index]
+                            node_id
+                        )
+
+        return self._convert_nodes_to_scored_nodes(query_result)
+
+    def _convert_nodes_to_scored_nodes(
+        self, query_result: VectorStoreQueryResult
+    ) -> List[NodeWithScore]:
+        assert query_result.nodes is not None
         log_vector_store_query_result(query_result)
 
         node_with_scores: List[NodeWithScore] = []
@@ -169,4 +276,4 @@ class VectorIndexRetriever(BaseRetriever):
     ) -> List[NodeWithScore]:
         query = self._build_vector_store_query(query_bundle_with_embeddings)
         query_result = await self._vector_store.aquery(query, **self._kwargs)
-        return self._build_node_list_from_query_result(query_result)
+        return await self._abuild_node_list_from_query_result(query_result)
@@ -1,4 +1,5 @@
 from llama_index.memory.chat_memory_buffer import ChatMemoryBuffer
+from llama_index.memory.chat_summary_memory_buffer import ChatSummaryMemoryBuffer
 from llama_index.memory.types import BaseMemory
 
-__all__ = ["BaseMemory", "ChatMemoryBuffer"]
+__all__ = ["BaseMemory", "ChatMemoryBuffer", "ChatSummaryMemoryBuffer"]
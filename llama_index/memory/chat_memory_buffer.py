@@ -1,16 +1,20 @@
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
-from llama_index.bridge.pydantic import Field, root_validator
+from llama_index.bridge.pydantic import Field, PrivateAttr, root_validator
 from llama_index.llms.base import LLM, ChatMessage, MessageRole
 from llama_index.memory.types import BaseMemory
-from llama_index.utils import GlobalsHelper
+from llama_index.utils import GlobalsHelper, count_tokens
 
 DEFUALT_TOKEN_LIMIT_RATIO = 0.75
 DEFAULT_TOKEN_LIMIT = 3000
 
 
 class ChatMemoryBuffer(BaseMemory):
-    """Simple buffer for storing chat history."""
+    """Simple buffer for storing chat history.
+
+    Token counts are cached per message, so each message is tokenized once
+    rather than on every `get`.
+    """
 
     token_limit: int
     tokenizer_fn: Callable[[str], List] = Field(
@@ -20,6 +24,11 @@ class ChatMemoryBuffer(BaseMemory):
     )
     chat_history: List[ChatMessage] = Field(default_factory=list)
 
+    # id of message -> (message, content, token count)
+    _token_counts: Dict[int, Tuple[ChatMessage, Any, int]] = PrivateAttr(
+        default_factory=dict
+    )
+
     def __getstate__(self) -> Dict[str, Any]:
         state = self.dict()
         # Remove the unpicklable entry
@@ -27,9 +36,7 @@ class ChatMemoryBuffer(BaseMemory):
         return state
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
-        super().__init__(
-            token_limit=state["token_limit"], chat_history=state["chat_history"]
-        )
+        super().__init__(**state)
 
     @root_validator(pre=True)
     def validate_memory(cls, values: dict) -> dict:
@@ -82,32 +89,67 @@ class ChatMemoryBuffer(BaseMemory):
     def from_dict(cls, json_dict: dict) -> "ChatMemoryBuffer":
         return cls.parse_obj(json_dict)
 
-    def get(self, initial_token_count: int = 0, **kwargs: Any) -> List[ChatMessage]:
-        """Get chat history."""
-        message_count = len(self.chat_history)
-        message_str = " ".join(
-            [str(m.content) for m in self.chat_history[-message_count:]]
-        )
-        token_count = initial_token_count + len(self.tokenizer_fn(message_str))
-
-        while token_count > self.token_limit and message_count > 1:
-            message_count -= 1
-            if self.chat_history[-message_count].role == MessageRole.ASSISTANT:
+    def _count_tokens(self, text: str) -> int:
+        return count_tokens(text, self.tokenizer_fn)
+
+    def _get_message_token_count(self, message: ChatMessage) -> int:
+        """Get the token count of a message, tokenizing it only if it is new."""
+        entry = self._token_counts.get(id(message), None)
+        if entry is None or entry[0] is not message or entry[1] is not message.content:
+            token_count = self._count_tokens(str(message.content))
+            entry = (message, message.content, token_count)
+            self._token_counts[id(message)] = entry
+        return entry[2]
+
+    def _get_token_counts(self) -> List[int]:
+        """Get the token count of each message in the chat history.
+
+        Messages can be added to or removed from `chat_history` directly, so
+        entries of messages no longer in the history are dropped here.
+        """
+        token_counts = [
+            self._get_message_token_count(message) for message in self.chat_history
+        ]
+        if len(self._token_counts) > len(self.chat_history):
+            message_ids = {id(message) for message in self.chat_history}
+            self._token_counts = {
+                message_id: entry
+                for message_id, entry in self._token_counts.items()
+                if message_id in message_ids
+            }
+        return token_counts
+
+    def _get_start_index(
+        self, token_counts: List[int], token_limit: int, initial_token_count: int = 0
+    ) -> int:
+        """Get the index of the first message to keep within the token limit.
+
+        Returns the length of the chat history if no message fits.
+        """
+        num_messages = len(token_counts)
+        token_count = initial_token_count + sum(token_counts)
+        start = 0
+        while token_count > token_limit and start < num_messages - 1:
+            token_count -= token_counts[start]
+            start += 1
+            if self.chat_history[start].role == MessageRole.ASSISTANT:
                 # we cannot have an assistant message at the start of the chat history
                 # if after removal of the first, we have an assistant message,
                 # we need to remove the assistant message too
-                message_count -= 1
-
-            message_str = " ".join(
-                [str(m.content) for m in self.chat_history[-message_count:]]
-            )
-            token_count = initial_token_count + len(self.tokenizer_fn(message_str))
+                token_count -= token_counts[start]
+                start += 1
 
         # catch one message longer than token limit
-        if token_count > self.token_limit:
-            return []
+        if token_count > token_limit:
+            return num_messages
+        return start
 
-        return self.chat_history[-message_count:]
+    def get(self, initial_token_count: int = 0, **kwargs: Any) -> List[ChatMessage]:
+        """Get chat history."""
+        start = self._get_start_index(
+            self._get_token_counts(), self.token_limit, initial_token_count
+        )
+        return self.chat_history[start:]
 
     def get_all(self) -> List[ChatMessage]:
         """Get all chat history."""
@@ -116,6 +158,7 @@ class ChatMemoryBuffer(BaseMemory):
     def put(self, message: ChatMessage) -> None:
         """Put chat history."""
         self.chat_history.append(message)
+        self._get_message_token_count(message)
 
     def set(self, messages: List[ChatMessage]) -> None:
         """Set chat history."""
@@ -123,4 +166,5 @@ class ChatMemoryBuffer(BaseMemory):
 
     def reset(self) -> None:
         """Reset chat history."""
+        self._token_counts.clear()
         return self.chat_history.clear()
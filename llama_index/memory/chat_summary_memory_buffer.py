@@ -0,0 +1,158 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+from llama_index.bridge.pydantic import Field, PrivateAttr
+from llama_index.llms.base import LLM, ChatMessage, MessageRole
+from llama_index.memory.chat_memory_buffer import (
+    DEFAULT_TOKEN_LIMIT,
+    DEFUALT_TOKEN_LIMIT_RATIO,
+    ChatMemoryBuffer,
+)
+from llama_index.utils import GlobalsHelper
+
+DEFAULT_RETAINED_TOKEN_RATIO = 0.5
+DEFAULT_SUMMARIZE_PROMPT = (
+    "Summarize the conversation below in a few sentences, building on the "
+    "previous summary if there is one. Keep names, facts and decisions that "
+    "later messages may refer to.\n\n"
+    "Previous summary:\n{summary}\n\n"
+    "Conversation:\n{messages}\n\n"
+    "Summary:"
+)
+SUMMARY_MESSAGE_PREFIX = "Summary of the earlier conversation: "
+
+
+class ChatSummaryMemoryBuffer(ChatMemoryBuffer):
+    """Chat memory with a bounded token footprint for long-lived sessions.
+
+    Once the chat history exceeds `token_limit`, the oldest messages are evicted
+    until it fits in `retained_token_ratio` of the limit, so eviction does not
+    happen on every new message. With an `llm`, evicted messages are folded
+    into a running summary that `get` returns as a system message before the
+    remaining history. Without one, evicted messages are dropped.
+
+    Token counts are cached per message, so nothing is tokenized twice.
+    """
+
+    llm: Optional[LLM] = Field(default=None, exclude=True)
+    summarize_prompt: str = DEFAULT_SUMMARIZE_PROMPT
+    retained_token_ratio: float = DEFAULT_RETAINED_TOKEN_RATIO
+    summary: Optional[str] = None
+
+    # (summary message content, token count)
+    _summary_token_count: Tuple[Optional[str], int] = PrivateAttr(default=(None, 0))
+
+    @classmethod
+    def from_defaults(
+        cls,
+        chat_history: Optional[List[ChatMessage]] = None,
+        llm: Optional[LLM] = None,
+        token_limit: Optional[int] = None,
+        tokenizer_fn: Optional[Callable[[str], List]] = None,
+        summarize: bool = True,
+        retained_token_ratio: float = DEFAULT_RETAINED_TOKEN_RATIO,
+    ) -> "ChatSummaryMemoryBuffer":
+        """Create a chat summary memory buffer from an LLM.
+
+        Args:
+            chat_history (Optional[List[ChatMessage]]): initial chat history
+            llm (Optional[LLM]): LLM to size the token limit and summarize with
+            token_limit (Optional[int]): maximum tokens of the returned history
+            tokenizer_fn (Optional[Callable[[str], List]]): tokenizer
+            summarize (bool): whether to summarize evicted messages with `llm`
+                instead of dropping them
+            retained_token_ratio (float): fraction of the token limit the
+                history is reduced to when it is exceeded
+
+        """
+        if llm is not None:
+            context_window = llm.metadata.context_window
+            token_limit = token_limit or int(context_window * DEFUALT_TOKEN_LIMIT_RATIO)
+        elif token_limit is None:
+            token_limit = DEFAULT_TOKEN_LIMIT
+
+        return cls(
+            token_limit=token_limit,
+            tokenizer_fn=tokenizer_fn or GlobalsHelper().tokenizer,
+            chat_history=chat_history or [],
+            llm=llm if summarize else None,
+            retained_token_ratio=retained_token_ratio,
+        )
+
+    def _get_summary_message(self) -> Optional[ChatMessage]:
+        if not self.summary:
+            return None
+        return ChatMessage(
+            role=MessageRole.SYSTEM, content=SUMMARY_MESSAGE_PREFIX + self.summary
+        )
+
+    def _get_summary_token_count(self) -> int:
+        summary_message = self._get_summary_message()
+        if summary_message is None:
+            return 0
+        content, token_count = self._summary_token_count
+        if content != summary_message.content:
+            content = summary_message.content
+            token_count = self._count_tokens(str(content))
+            self._summary_token_count = (content, token_count)
+        return token_count
+
+    def get(self, initial_token_count: int = 0, **kwargs: Any) -> List[ChatMessage]:
+        """Get the summary of evicted messages and the remaining chat history."""
+        summary_message = self._get_summary_message()
+        summary_token_count = self._get_summary_token_count()
+        if (
+            summary_message is None
+            or initial_token_count + summary_token_count > self.token_limit
+        ):
+            return super().get(initial_token_count, **kwargs)
+        return [
+            summary_message,
+            *super().get(initial_token_count + summary_token_count, **kwargs),
+        ]
+
+    def put(self, message: ChatMessage) -> None:
+        """Put chat history, evicting the oldest messages over the token limit."""
+        super().put(message)
+
+        # a new summary can be longer than the previous one, so evict again
+        # until the history fits along with it
+        while True:
+            token_counts = self._get_token_counts()
+            summary_token_count = self._get_summary_token_count()
+            if sum(token_counts) + summary_token_count <= self.token_limit:
+                return
+
+            start = self._get_start_index(
+                token_counts,
+                int(self.token_limit * self.retained_token_ratio),
+                summary_token_count,
+            )
+            # always keep the latest message
+            start = min(start, len(self.chat_history) - 1)
+            if start == 0:
+                return
+            evicted_messages = self.chat_history[:start]
+            del self.chat_history[:start]
+            if self.llm is None:
+                return
+            self.summary = self._summarize(evicted_messages)
+
+    def _summarize(self, messages: List[ChatMessage]) -> str:
+        messages_str = "\n".join(
+            f"{message.role.value}: {message.content}" for message in messages
+        )
+        prompt = self.summarize_prompt.format(
+            summary=self.summary or "", messages=messages_str
+        )
+        assert self.llm is not None
+        return self.llm.complete(prompt).text.strip()
+
+    def set(self, messages: List[ChatMessage]) -> None:
+        """Set chat history, dropping the summary of the previous one."""
+        self.summary = None
+        super().set(messages)
+
+    def reset(self) -> None:
+        """Reset chat history and summary."""
+        self.summary = None
+        super().reset()
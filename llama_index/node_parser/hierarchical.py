@@ -1,13 +1,16 @@
 """Hierarchical node parser."""
 
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from llama_index.bridge.pydantic import Field
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.node_parser.extractors.metadata_extractors import MetadataExtractor
 from llama_index.node_parser.interface import NodeParser
-from llama_index.node_parser.node_utils import get_nodes_from_document
+from llama_index.node_parser.node_utils import (
+    get_nodes_from_document,
+    parallel_parse_documents,
+)
 from llama_index.schema import BaseNode, Document, NodeRelationship
 from llama_index.text_splitter import TextSplitter, get_default_text_splitter
 from llama_index.utils import get_tqdm_iterable
@@ -62,6 +65,9 @@ class HierarchicalNodeParser(NodeParser):
         text_splitter (Optional[TextSplitter]): text splitter
         include_metadata (bool): whether to include metadata in nodes
         include_prev_next_rel (bool): whether to include prev/next relationships
+        num_workers (Optional[int]): number of processes to parse documents with.
+            Callback events raised while parsing in the worker processes
+            (e.g. CHUNKING) are lost.
 
     """
 
@@ -90,6 +96,13 @@ class HierarchicalNodeParser(NodeParser):
     metadata_extractor: Optional[MetadataExtractor] = Field(
         default=None, description="Metadata extraction pipeline to apply to nodes."
     )
+    num_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of processes to parse documents with. "
+            "If None or 1, documents are parsed in the current process."
+        ),
+    )
     callback_manager: CallbackManager = Field(
         default_factory=CallbackManager, exclude=True
     )
@@ -104,6 +117,7 @@ class HierarchicalNodeParser(NodeParser):
         include_prev_next_rel: bool = True,
         callback_manager: Optional[CallbackManager] = None,
         metadata_extractor: Optional[MetadataExtractor] = None,
+        num_workers: Optional[int] = None,
     ) -> "HierarchicalNodeParser":
         callback_manager = callback_manager or CallbackManager([])
 
@@ -138,6 +152,7 @@ class HierarchicalNodeParser(NodeParser):
             include_prev_next_rel=include_prev_next_rel,
             callback_manager=callback_manager,
             metadata_extractor=metadata_extractor,
+            num_workers=num_workers,
         )
 
     @classmethod
@@ -194,6 +209,15 @@ class HierarchicalNodeParser(NodeParser):
 
         return sub_nodes + sub_sub_nodes
 
+    def _parse_documents(self, documents: Iterable[BaseNode]) -> List[BaseNode]:
+        """Parse documents into node hierarchies, one document at a time."""
+        all_nodes: List[BaseNode] = []
+        # TODO: a bit of a hack rn for tqdm
+        for doc in documents:
+            nodes_from_doc = self._recursively_get_nodes_from_nodes([doc], 0)
+            all_nodes.extend(nodes_from_doc)
+        return all_nodes
+
     def get_nodes_from_documents(
         self,
         documents: Sequence[Document],
@@ -209,15 +233,18 @@ class HierarchicalNodeParser(NodeParser):
         with self.callback_manager.event(
             CBEventType.NODE_PARSING, payload={EventPayload.DOCUMENTS: documents}
         ) as event:
-            all_nodes: List[BaseNode] = []
-            documents_with_progress = get_tqdm_iterable(
-                documents, show_progress, "Parsing documents into nodes"
-            )
-
-            # TODO: a bit of a hack rn for tqdm
-            for doc in documents_with_progress:
-                nodes_from_doc = self._recursively_get_nodes_from_nodes([doc], 0)
-                all_nodes.extend(nodes_from_doc)
+            if self.num_workers is not None and self.num_workers > 1:
+                all_nodes = parallel_parse_documents(
+                    self._parse_documents,
+                    documents,
+                    self.num_workers,
+                    show_progress=show_progress,
+                )
+            else:
+                documents_with_progress = get_tqdm_iterable(
+                    documents, show_progress, "Parsing documents into nodes"
+                )
+                all_nodes = self._parse_documents(documents_with_progress)
 
             if self.metadata_extractor is not None:
                 all_nodes = self.metadata_extractor.process_nodes(all_nodes)
@@ -1,9 +1,14 @@
 """General node utils."""
 
 
+import io
 import logging
-from typing import List, Optional
+import math
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
 
+from llama_index.bridge.pydantic import BaseModel
 from llama_index.schema import (
     BaseNode,
     Document,
@@ -14,10 +19,22 @@ from llama_index.schema import (
     TextNode,
 )
 from llama_index.text_splitter.types import MetadataAwareTextSplitter, SplitterType
-from llama_index.utils import truncate_text
+from llama_index.utils import (
+    get_tqdm_iterable,
+    get_worker_process_context,
+    truncate_text,
+)
 
 logger = logging.getLogger(__name__)
 
+# number of chunks handed to each worker when parsing in parallel
+CHUNKS_PER_WORKER = 4
+
+ParseFn = Callable[[Sequence[Document]], List[BaseNode]]
+
+# parse function of the current worker process, set by `_init_parse_worker`
+_worker_parse_fn: Optional[ParseFn] = None
+
 
 def build_nodes_from_splits(
     text_splits: List[str],
@@ -187,3 +204,110 @@ def get_nodes_from_node(
         include_prev_next_rel=include_prev_next_rel,
         ref_doc=ref_doc,
     )
+
+
+def _new_model(model_cls: Type[BaseModel]) -> BaseModel:
+    return model_cls.__new__(model_cls)
+
+
+def _set_model_state(model: BaseModel, state: Dict[str, Any]) -> None:
+    BaseModel.__setstate__(model, state)
+
+
+class _ParserPickler(pickle.Pickler):
+    """Pickler sending node parsers to worker processes with their full state.
+
+    `BaseComponent.__getstate__` drops tokenizers, `*_fn` callables and private
+    attributes, which the parsers and text splitters need to parse documents.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, BaseModel):
+            return (
+                _new_model,
+                (type(obj),),
+                BaseModel.__getstate__(obj),
+                None,
+                None,
+                _set_model_state,
+            )
+        return NotImplemented
+
+
+def _dumps_parse_fn(parse_fn: ParseFn) -> bytes:
+    buffer = io.BytesIO()
+    _ParserPickler(buffer).dump(parse_fn)
+    return buffer.getvalue()
+
+
+def _init_parse_worker(pickled_parse_fn: bytes) -> None:
+    global _worker_parse_fn
+    _worker_parse_fn = pickle.loads(pickled_parse_fn)
+
+
+def _parse_chunk(documents: Sequence[Document]) -> List[BaseNode]:
+    assert _worker_parse_fn is not None
+    return _worker_parse_fn(documents)
+
+
+def parallel_parse_documents(
+    parse_fn: ParseFn,
+    documents: Sequence[Document],
+    num_workers: int,
+    show_progress: bool = False,
+) -> List[BaseNode]:
+    """Parse documents into nodes with a process pool.
+
+    Documents are split into contiguous chunks that are parsed independently by
+    `parse_fn`, and the results are concatenated in input order, so the output is
+    the same as calling `parse_fn(documents)` as long as `parse_fn` handles each
+    document on its own.
+
+    Workers are started from a fork server where available, and spawned
+    otherwise, so `parse_fn` (usually a bound method of a node parser) is
+    pickled and sent to them. If it cannot be pickled, documents are parsed
+    serially instead. Callback events (e.g. CHUNKING) raised while parsing in
+    the workers are not sent back, so they are lost.
+
+    Args:
+        parse_fn (Callable): serially parses a sequence of documents into nodes
+        documents (Sequence[Document]): documents to parse
+        num_workers (int): number of worker processes
+        show_progress (bool): whether to show a progress bar over chunks
+
+    """
+    num_workers = min(num_workers, len(documents))
+    if num_workers <= 1:
+        return parse_fn(documents)
+
+    try:
+        pickled_parse_fn = _dumps_parse_fn(parse_fn)
+    except Exception as e:
+        logger.warning(
+            f"Cannot send the parser to worker processes ({e!r}), "
+            "parsing documents serially."
+        )
+        return parse_fn(documents)
+
+    chunk_size = math.ceil(len(documents) / (num_workers * CHUNKS_PER_WORKER))
+    chunks = [
+        documents[i : i + chunk_size] for i in range(0, len(documents), chunk_size)
+    ]
+
+    all_nodes: List[BaseNode] = []
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=get_worker_process_context(__name__),
+        initializer=_init_parse_worker,
+        initargs=(pickled_parse_fn,),
+    ) as executor:
+        # executor.map yields results in submission order
+        results = get_tqdm_iterable(
+            executor.map(_parse_chunk, chunks),
+            show_progress,
+            "Parsing documents into nodes",
+        )
+        for nodes in results:
+            all_nodes.extend(nodes)
+
+    return all_nodes
@@ -1,12 +1,15 @@
 """Simple node parser."""
-from typing import Callable, List, Optional, Sequence
+from typing import Callable, Iterable, List, Optional, Sequence
 
 from llama_index.bridge.pydantic import Field
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.node_parser.extractors.metadata_extractors import MetadataExtractor
 from llama_index.node_parser.interface import NodeParser
-from llama_index.node_parser.node_utils import build_nodes_from_splits
+from llama_index.node_parser.node_utils import (
+    build_nodes_from_splits,
+    parallel_parse_documents,
+)
 from llama_index.schema import BaseNode, Document
 from llama_index.text_splitter.utils import split_by_sentence_tokenizer
 from llama_index.utils import get_tqdm_iterable
@@ -26,6 +29,9 @@ class SentenceWindowNodeParser(NodeParser):
         sentence_splitter (Optional[Callable]): splits text into sentences
         include_metadata (bool): whether to include metadata in nodes
         include_prev_next_rel (bool): whether to include prev/next relationships
+        num_workers (Optional[int]): number of processes to parse documents with.
+            Callback events raised while parsing in the worker processes
+            (e.g. CHUNKING) are lost.
     """
 
     sentence_splitter: Callable[[str], List[str]] = Field(
@@ -54,6 +60,13 @@ class SentenceWindowNodeParser(NodeParser):
     metadata_extractor: Optional[MetadataExtractor] = Field(
         default=None, description="Metadata extraction pipeline to apply to nodes."
     )
+    num_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of processes to parse documents with. "
+            "If None or 1, documents are parsed in the current process."
+        ),
+    )
     callback_manager: CallbackManager = Field(
         default_factory=CallbackManager, exclude=True
     )
@@ -68,6 +81,7 @@ class SentenceWindowNodeParser(NodeParser):
         include_prev_next_rel: bool = True,
         callback_manager: Optional[CallbackManager] = None,
         metadata_extractor: Optional[MetadataExtractor] = None,
+        num_workers: Optional[int] = None,
     ) -> None:
         """Init params."""
         callback_manager = callback_manager or CallbackManager([])
@@ -81,6 +95,7 @@ class SentenceWindowNodeParser(NodeParser):
             include_prev_next_rel=include_prev_next_rel,
             callback_manager=callback_manager,
             metadata_extractor=metadata_extractor,
+            num_workers=num_workers,
         )
 
     @classmethod
@@ -103,6 +118,7 @@ class SentenceWindowNodeParser(NodeParser):
         include_prev_next_rel: bool = True,
         callback_manager: Optional[CallbackManager] = None,
         metadata_extractor: Optional[MetadataExtractor] = None,
+        num_workers: Optional[int] = None,
     ) -> "SentenceWindowNodeParser":
         callback_manager = callback_manager or CallbackManager([])
 
@@ -117,6 +133,7 @@ class SentenceWindowNodeParser(NodeParser):
             include_prev_next_rel=include_prev_next_rel,
             callback_manager=callback_manager,
             metadata_extractor=metadata_extractor,
+            num_workers=num_workers,
         )
 
     def get_nodes_from_documents(
@@ -134,15 +151,20 @@ class SentenceWindowNodeParser(NodeParser):
         with self.callback_manager.event(
             CBEventType.NODE_PARSING, payload={EventPayload.DOCUMENTS: documents}
         ) as event:
-            all_nodes: List[BaseNode] = []
-            documents_with_progress = get_tqdm_iterable(
-                documents, show_progress, "Parsing documents into nodes"
-            )
-
-            for document in documents_with_progress:
-                self.sentence_splitter(document.text)
-                nodes = self.build_window_nodes_from_documents([document])
-                all_nodes.extend(nodes)
+            if self.num_workers is not None and self.num_workers > 1:
+                all_nodes = parallel_parse_documents(
+                    self.build_window_nodes_from_documents,
+                    documents,
+                    self.num_workers,
+                    show_progress=show_progress,
+                )
+            else:
+                documents_with_progress = get_tqdm_iterable(
+                    documents, show_progress, "Parsing documents into nodes"
+                )
+                all_nodes = self.build_window_nodes_from_documents(
+                    documents_with_progress
+                )
 
             if self.metadata_extractor is not None:
                 all_nodes = self.metadata_extractor.process_nodes(all_nodes)
@@ -152,7 +174,7 @@ class SentenceWindowNodeParser(NodeParser):
         return all_nodes
 
     def build_window_nodes_from_documents(
-        self, documents: Sequence[Document]
+        self, documents: Iterable[Document]
     ) -> List[BaseNode]:
         """Build window nodes from documents."""
         all_nodes: List[BaseNode] = []
@@ -1,12 +1,15 @@
 """Simple node parser."""
-from typing import List, Optional, Sequence
+from typing import Iterable, List, Optional, Sequence
 
 from llama_index.bridge.pydantic import Field
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.node_parser.extractors.metadata_extractors import MetadataExtractor
 from llama_index.node_parser.interface import NodeParser
-from llama_index.node_parser.node_utils import get_nodes_from_document
+from llama_index.node_parser.node_utils import (
+    get_nodes_from_document,
+    parallel_parse_documents,
+)
 from llama_index.schema import BaseNode, Document
 from llama_index.text_splitter import SplitterType, get_default_text_splitter
 from llama_index.utils import get_tqdm_iterable
@@ -21,6 +24,9 @@ class SimpleNodeParser(NodeParser):
         text_splitter (Optional[TextSplitter]): text splitter
         include_metadata (bool): whether to include metadata in nodes
         include_prev_next_rel (bool): whether to include prev/next relationships
+        num_workers (Optional[int]): number of processes to parse documents with.
+            Callback events raised while parsing in the worker processes
+            (e.g. CHUNKING) are lost.
 
     """
 
@@ -36,6 +42,13 @@ class SimpleNodeParser(NodeParser):
     metadata_extractor: Optional[MetadataExtractor] = Field(
         default=None, description="Metadata extraction pipeline to apply to nodes."
     )
+    num_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "Number of processes to parse documents with. "
+            "If None or 1, documents are parsed in the current process."
+        ),
+    )
     callback_manager: CallbackManager = Field(
         default_factory=CallbackManager, exclude=True
     )
@@ -50,6 +63,7 @@ class SimpleNodeParser(NodeParser):
         include_prev_next_rel: bool = True,
         callback_manager: Optional[CallbackManager] = None,
         metadata_extractor: Optional[MetadataExtractor] = None,
+        num_workers: Optional[int] = None,
     ) -> "SimpleNodeParser":
         callback_manager = callback_manager or CallbackManager([])
 
@@ -64,6 +78,7 @@ class SimpleNodeParser(NodeParser):
             include_prev_next_rel=include_prev_next_rel,
             callback_manager=callback_manager,
             metadata_extractor=metadata_extractor,
+            num_workers=num_workers,
         )
 
     @classmethod
@@ -85,19 +100,18 @@ class SimpleNodeParser(NodeParser):
         with self.callback_manager.event(
             CBEventType.NODE_PARSING, payload={EventPayload.DOCUMENTS: documents}
         ) as event:
-            all_nodes: List[BaseNode] = []
-            documents_with_progress = get_tqdm_iterable(
-                documents, show_progress, "Parsing documents into nodes"
-            )
-
-            for document in documents_with_progress:
-                nodes = get_nodes_from_document(
-                    document,
-                    self.text_splitter,
-                    self.include_metadata,
-                    include_prev_next_rel=self.include_prev_next_rel,
+            if self.num_workers is not None and self.num_workers > 1:
+                all_nodes = parallel_parse_documents(
+                    self._parse_documents,
+                    documents,
+                    self.num_workers,
+                    show_progress=show_progress,
+                )
+            else:
+                documents_with_progress = get_tqdm_iterable(
+                    documents, show_progress, "Parsing documents into nodes"
                 )
-                all_nodes.extend(nodes)
+                all_nodes = self._parse_documents(documents_with_progress)
 
             if self.metadata_extractor is not None:
                 all_nodes = self.metadata_extractor.process_nodes(all_nodes)
@@ -105,3 +119,16 @@ class SimpleNodeParser(NodeParser):
             event.on_end(payload={EventPayload.NODES: all_nodes})
 
         return all_nodes
+
+    def _parse_documents(self, documents: Iterable[BaseNode]) -> List[BaseNode]:
+        """Parse documents into nodes, one document at a time."""
+        all_nodes: List[BaseNode] = []
+        for document in documents:
+            nodes = get_nodes_from_document(
+                document,
+                self.text_splitter,
+                self.include_metadata,
+                include_prev_next_rel=self.include_prev_next_rel,
+            )
+            all_nodes.extend(nodes)
+        return all_nodes
@@ -35,7 +35,7 @@ class LLMTextCompletionProgram(BasePydanticProgram[BaseModel]):
         cls,
         output_parser: PydanticOutputParser,
         prompt_template_str: Optional[str] = None,
-        prompt: Optional[PromptTemplate] = None,
+        prompt: Optional[BasePromptTemplate] = None,
         llm: Optional[LLM] = None,
         verbose: bool = False,
         **kwargs: Any,
@@ -49,7 +49,7 @@ class LLMTextCompletionProgram(BasePydanticProgram[BaseModel]):
             prompt = PromptTemplate(prompt_template_str)
         return cls(
             output_parser,
-            prompt=cast(PromptTemplate, prompt),
+            prompt=cast(BasePromptTemplate, prompt),
             llm=llm,
             verbose=verbose,
         )
@@ -5,7 +5,7 @@ from llama_index.bridge.pydantic import BaseModel
 from llama_index.llms.huggingface import HuggingFaceLLM
 from llama_index.llms.llama_cpp import LlamaCPP
 from llama_index.program.llm_prompt_program import BaseLLMFunctionProgram
-from llama_index.prompts.base import PromptTemplate
+from llama_index.prompts.base import BasePromptTemplate
 from llama_index.prompts.lmformatenforcer_utils import (
     activate_lm_format_enforcer,
     build_lm_format_enforcer_function,
@@ -62,7 +62,7 @@ class LMFormatEnforcerPydanticProgram(BaseLLMFunctionProgram):
         cls,
         output_cls: Type[BaseModel],
         prompt_template_str: Optional[str] = None,
-        prompt: Optional[PromptTemplate] = None,
+        prompt: Optional[BasePromptTemplate] = None,
         llm: Optional[Union["LlamaCPP", "HuggingFaceLLM"]] = None,
         **kwargs: Any,
     ) -> "BaseLLMFunctionProgram":
@@ -72,7 +72,7 @@ class LMFormatEnforcerPydanticProgram(BaseLLMFunctionProgram):
         if prompt is not None and prompt_template_str is not None:
             raise ValueError("Must provide either prompt or prompt_template_str.")
         if prompt is not None:
-            prompt_template_str = prompt.template
+            prompt_template_str = prompt.get_template()
         prompt_template_str = cast(str, prompt_template_str)
         return cls(
             output_cls,
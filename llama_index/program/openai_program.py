@@ -105,7 +105,7 @@ class OpenAIPydanticProgram(BaseLLMFunctionProgram[LLM]):
         cls,
         output_cls: Type[Model],
         prompt_template_str: Optional[str] = None,
-        prompt: Optional[PromptTemplate] = None,
+        prompt: Optional[BasePromptTemplate] = None,
         llm: Optional[LLM] = None,
         verbose: bool = False,
         allow_multiple: bool = False,
@@ -137,7 +137,7 @@ class OpenAIPydanticProgram(BaseLLMFunctionProgram[LLM]):
         return cls(
             output_cls=output_cls,
             llm=llm,
-            prompt=cast(PromptTemplate, prompt),
+            prompt=cast(BasePromptTemplate, prompt),
             tool_choice=tool_choice,
             allow_multiple=allow_multiple,
             verbose=verbose,
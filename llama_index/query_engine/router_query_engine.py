@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, List, Optional, Sequence
+from typing import AsyncGenerator, Callable, Generator, List, Optional, Sequence, cast
 
 from llama_index.async_utils import run_async_tasks
 from llama_index.bridge.pydantic import BaseModel
@@ -16,6 +16,7 @@ from llama_index.prompts.default_prompt_selectors import (
 from llama_index.prompts.mixin import PromptMixinType
 from llama_index.response.schema import (
     RESPONSE_TYPE,
+    AsyncStreamingResponse,
     PydanticResponse,
     Response,
     StreamingResponse,
@@ -39,7 +40,9 @@ def combine_responses(
     response_strs = []
     source_nodes = []
     for response in responses:
-        if isinstance(response, (StreamingResponse, PydanticResponse)):
+        if isinstance(
+            response, (StreamingResponse, AsyncStreamingResponse, PydanticResponse)
+        ):
             response_obj = response.get_response()
         else:
             response_obj = response
@@ -53,7 +56,9 @@ def combine_responses(
     elif isinstance(summary, BaseModel):
         return PydanticResponse(response=summary, source_nodes=source_nodes)
     else:
-        return StreamingResponse(response_gen=summary, source_nodes=source_nodes)
+        return StreamingResponse(
+            response_gen=cast(Generator, summary), source_nodes=source_nodes
+        )
 
 
 async def acombine_responses(
@@ -65,7 +70,9 @@ async def acombine_responses(
     response_strs = []
     source_nodes = []
     for response in responses:
-        if isinstance(response, (StreamingResponse, PydanticResponse)):
+        if isinstance(response, AsyncStreamingResponse):
+            response_obj = await response.aget_response()
+        elif isinstance(response, (StreamingResponse, PydanticResponse)):
             response_obj = response.get_response()
         else:
             response_obj = response
@@ -78,6 +85,10 @@ async def acombine_responses(
         return Response(response=summary, source_nodes=source_nodes)
     elif isinstance(summary, BaseModel):
         return PydanticResponse(response=summary, source_nodes=source_nodes)
+    elif isinstance(summary, AsyncGenerator):
+        return AsyncStreamingResponse(
+            async_response_gen=summary, source_nodes=source_nodes
+        )
     else:
         return StreamingResponse(response_gen=summary, source_nodes=source_nodes)
 
@@ -1,8 +1,7 @@
-import asyncio
 import logging
 from typing import List, Optional, Sequence, cast
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import AsyncExecutor, run_async_tasks
 from llama_index.bridge.pydantic import BaseModel, Field
 from llama_index.callbacks.base import CallbackManager
 from llama_index.callbacks.schema import CBEventType, EventPayload
@@ -51,6 +50,8 @@ class SubQuestionQueryEngine(BaseQueryEngine):
             Defaults to True
         use_async (bool): whether to execute the sub questions with asyncio.
             Defaults to True
+        async_executor (Optional[AsyncExecutor]): Executor of the sub questions
+            in async mode, limiting how many of them run at a time.
     """
 
     def __init__(
@@ -61,6 +62,7 @@ class SubQuestionQueryEngine(BaseQueryEngine):
         callback_manager: Optional[CallbackManager] = None,
         verbose: bool = True,
         use_async: bool = False,
+        async_executor: Optional[AsyncExecutor] = None,
     ) -> None:
         self._question_gen = question_gen
         self._response_synthesizer = response_synthesizer
@@ -70,6 +72,7 @@ class SubQuestionQueryEngine(BaseQueryEngine):
         }
         self._verbose = verbose
         self._use_async = use_async
+        self._async_executor = async_executor or AsyncExecutor()
         super().__init__(callback_manager)
 
     def _get_prompt_modules(self) -> PromptMixinType:
@@ -124,6 +127,9 @@ class SubQuestionQueryEngine(BaseQueryEngine):
             callback_manager=callback_manager,
             verbose=verbose,
             use_async=use_async,
+            async_executor=(
+                service_context.async_executor if service_context is not None else None
+            ),
         )
 
     def _query(self, query_bundle: QueryBundle) -> RESPONSE_TYPE:
@@ -143,7 +149,7 @@ class SubQuestionQueryEngine(BaseQueryEngine):
                     for ind, sub_q in enumerate(sub_questions)
                 ]
 
-                qa_pairs_all = run_async_tasks(tasks)
+                qa_pairs_all = run_async_tasks(tasks, executor=self._async_executor)
                 qa_pairs_all = cast(List[Optional[SubQuestionAnswerPair]], qa_pairs_all)
             else:
                 qa_pairs_all = [
@@ -185,7 +191,7 @@ class SubQuestionQueryEngine(BaseQueryEngine):
                 for ind, sub_q in enumerate(sub_questions)
             ]
 
-            qa_pairs_all = await asyncio.gather(*tasks)
+            qa_pairs_all = await self._async_executor.gather(tasks)
             qa_pairs_all = cast(List[Optional[SubQuestionAnswerPair]], qa_pairs_all)
 
             # filter out sub questions that failed
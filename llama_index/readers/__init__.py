@@ -24,6 +24,7 @@ from llama_index.readers.faiss import FaissReader
 from llama_index.readers.file.base import SimpleDirectoryReader
 from llama_index.readers.file.docs_reader import PDFReader
 from llama_index.readers.file.html_reader import HTMLTagReader
+from llama_index.readers.file.incremental import IncrementalDirectoryLoader
 from llama_index.readers.github_readers.github_repository_reader import (
     GithubRepositoryReader,
 )
@@ -59,6 +60,7 @@ __all__ = [
     "WikipediaReader",
     "YoutubeTranscriptReader",
     "SimpleDirectoryReader",
+    "IncrementalDirectoryLoader",
     "JSONReader",
     "SimpleMongoReader",
     "NotionPageReader",
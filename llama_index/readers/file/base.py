@@ -1,9 +1,13 @@
 """Simple reader that reads files of different formats from a directory."""
 import logging
 import os
+import pickle
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Generator, List, Optional, Type
+from typing import Callable, Deque, Dict, Generator, List, Optional, Tuple, Type
 
 from llama_index.readers.base import BaseReader
 from llama_index.readers.file.docs_reader import DocxReader, HWPReader, PDFReader
@@ -16,6 +20,7 @@ from llama_index.readers.file.slides_reader import PptxReader
 from llama_index.readers.file.tabular_reader import PandasCSVReader
 from llama_index.readers.file.video_audio_reader import VideoAudioReader
 from llama_index.schema import Document
+from llama_index.utils import get_worker_process_context
 
 DEFAULT_FILE_READER_CLS: Dict[str, Type[BaseReader]] = {
     ".hwp": HWPReader,
@@ -59,6 +64,22 @@ def default_file_metadata_func(file_path: str) -> Dict:
 
 logger = logging.getLogger(__name__)
 
+# number of files queued per worker when loading in parallel
+FILES_PER_WORKER = 2
+
+# reader of the current worker process, set by `_init_load_worker`
+_worker_reader: Optional["SimpleDirectoryReader"] = None
+
+
+def _init_load_worker(pickled_reader: bytes) -> None:
+    global _worker_reader
+    _worker_reader = pickle.loads(pickled_reader)
+
+
+def _load_file_in_worker(input_file: Path) -> List[Document]:
+    assert _worker_reader is not None
+    return _worker_reader.load_file(input_file)
+
 
 class SimpleDirectoryReader(BaseReader):
     """Simple directory reader.
@@ -90,6 +111,13 @@ class SimpleDirectoryReader(BaseReader):
         file_metadata (Optional[Callable[str, Dict]]): A function that takes
             in a filename and returns a Dict of metadata for the Document.
             Default is None.
+        num_workers (Optional[int]): Number of workers to load files with.
+            Files read by a file reader (e.g. PDFs) are loaded in worker
+            processes, plain text files in worker threads. Worker processes
+            need a picklable reader, i.e. picklable file readers and
+            `file_metadata`; otherwise all files are loaded in threads.
+            Documents are returned in the same order as when loading serially.
+            Default is None, loading files one at a time.
     """
 
     def __init__(
@@ -106,6 +134,7 @@ class SimpleDirectoryReader(BaseReader):
         file_extractor: Optional[Dict[str, BaseReader]] = None,
         num_files_limit: Optional[int] = None,
         file_metadata: Optional[Callable[[str], Dict]] = None,
+        num_workers: Optional[int] = None,
     ) -> None:
         """Initialize with parameters."""
         super().__init__()
@@ -144,6 +173,7 @@ class SimpleDirectoryReader(BaseReader):
         self.supported_suffix = list(DEFAULT_FILE_READER_CLS.keys())
         self.file_metadata = file_metadata or default_file_metadata_func
         self.filename_as_id = filename_as_id
+        self.num_workers = num_workers
 
     def is_hidden(self, path: Path) -> bool:
         return any(
@@ -207,63 +237,66 @@ class SimpleDirectoryReader(BaseReader):
 
         return new_input_files
 
-    def load_data(self) -> List[Document]:
-        """Load data from the input directory.
+    def _get_file_reader(self, input_file: Path) -> Optional[BaseReader]:
+        """Get the file reader of a file, or None if it is read as plain text."""
+        file_suffix = input_file.suffix.lower()
+        if (
+            file_suffix not in self.supported_suffix
+            and file_suffix not in self.file_extractor
+        ):
+            return None
+        if file_suffix not in self.file_extractor:
+            # instantiate file reader if not already
+            reader_cls = DEFAULT_FILE_READER_CLS[file_suffix]
+            self.file_extractor[file_suffix] = reader_cls()
+        return self.file_extractor[file_suffix]
+
+    def load_file(self, input_file: Path) -> List[Document]:
+        """Load the documents of a single file.
+
+        Args:
+            input_file (Path): Path to the file.
 
         Returns:
-            List[Document]: A list of documents.
+            List[Document]: The documents of the file, empty if the file reader
+                failed to load it.
         """
-        documents = []
-        for input_file in self.input_files:
-            metadata: Optional[dict] = None
-            if self.file_metadata is not None:
-                metadata = self.file_metadata(str(input_file))
-
-            file_suffix = input_file.suffix.lower()
-            if (
-                file_suffix in self.supported_suffix
-                or file_suffix in self.file_extractor
-            ):
-                # use file readers
-                if file_suffix not in self.file_extractor:
-                    # instantiate file reader if not already
-                    reader_cls = DEFAULT_FILE_READER_CLS[file_suffix]
-                    self.file_extractor[file_suffix] = reader_cls()
-                reader = self.file_extractor[file_suffix]
-
-                # load data -- catch all errors except for ImportError
-                try:
-                    docs = reader.load_data(input_file, extra_info=metadata)
-                except ImportError as e:
-                    # ensure that ImportError is raised so user knows
-                    # about missing dependencies
-                    raise ImportError(str(e))
-                except Exception as e:
-                    # otherwise, just skip the file and report the error
-                    print(
-                        f"Failed to load file {input_file} with error: {e}. Skipping...",
-                        flush=True,
-                    )
-                    continue
-
-                # iterate over docs if needed
-                if self.filename_as_id:
-                    for i, doc in enumerate(docs):
-                        doc.id_ = f"{input_file!s}_part_{i}"
-
-                documents.extend(docs)
-            else:
-                # do standard read
-                with open(input_file, errors=self.errors, encoding=self.encoding) as f:
-                    data = f.read()
-
-                doc = Document(text=data, metadata=metadata or {})
-                if self.filename_as_id:
-                    doc.id_ = str(input_file)
+        metadata: Optional[dict] = None
+        if self.file_metadata is not None:
+            metadata = self.file_metadata(str(input_file))
+
+        reader = self._get_file_reader(input_file)
+        if reader is not None:
+            # load data -- catch all errors except for ImportError
+            try:
+                docs = reader.load_data(input_file, extra_info=metadata)
+            except ImportError as e:
+                # ensure that ImportError is raised so user knows
+                # about missing dependencies
+                raise ImportError(str(e))
+            except Exception as e:
+                # otherwise, just skip the file and report the error
+                print(
+                    f"Failed to load file {input_file} with error: {e}. Skipping...",
+                    flush=True,
+                )
+                return []
+
+            # iterate over docs if needed
+            if self.filename_as_id:
+                for i, doc in enumerate(docs):
+                    doc.id_ = f"{input_file!s}_part_{i}"
+        else:
+            # do standard read
+            with open(input_file, errors=self.errors, encoding=self.encoding) as f:
+                data = f.read()
 
-                documents.append(doc)
+            doc = Document(text=data, metadata=metadata or {})
+            if self.filename_as_id:
+                doc.id_ = str(input_file)
+            docs = [doc]
 
-        for doc in documents:
+        for doc in docs:
             # Keep only metadata['file_path'] in both embedding and llm content
             # str, which contain extreme important context that about the chunks.
             # Dates is provided for convenience of postprocessor such as
@@ -283,4 +316,107 @@ class SimpleDirectoryReader(BaseReader):
                 ]
             )
 
-        return documents
+        return docs
+
+    def iter_file_documents(
+        self,
+    ) -> Generator[Tuple[Path, List[Document]], None, None]:
+        """Lazily load the documents of each input file.
+
+        Files are yielded in input order, with `num_workers` files loading in
+        parallel, like `iter_data`. Use it to track which documents come from
+        which file, e.g. to sync an index with a directory.
+
+        Returns:
+            Generator[Tuple[Path, List[Document]], None, None]: A generator of
+                (file path, documents of the file) pairs. The documents are
+                empty if the file reader failed to load the file.
+        """
+        num_workers = min(self.num_workers or 1, len(self.input_files))
+        if num_workers <= 1:
+            for input_file in self.input_files:
+                yield input_file, self.load_file(input_file)
+            return
+
+        # instantiate file readers before workers are started, so that they are
+        # sent to all worker processes
+        uses_reader = [
+            self._get_file_reader(input_file) is not None
+            for input_file in self.input_files
+        ]
+        pickled_reader: Optional[bytes] = None
+        if any(uses_reader):
+            try:
+                pickled_reader = pickle.dumps(self)
+            except Exception as e:
+                logger.warning(
+                    f"Cannot send the reader to worker processes ({e!r}), "
+                    "loading all files in threads."
+                )
+                uses_reader = [False] * len(self.input_files)
+
+        futures: Deque[Tuple[Path, Future]] = deque()
+        with ExitStack() as stack:
+            thread_executor: Optional[Executor] = None
+            process_executor: Optional[Executor] = None
+            if not all(uses_reader):
+                # plain text reads are I/O bound
+                thread_executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=num_workers)
+                )
+            if pickled_reader is not None:
+                # file readers are CPU bound
+                process_executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=num_workers,
+                        mp_context=get_worker_process_context(__name__),
+                        initializer=_init_load_worker,
+                        initargs=(pickled_reader,),
+                    )
+                )
+
+            try:
+                for input_file, file_uses_reader in zip(self.input_files, uses_reader):
+                    if file_uses_reader:
+                        assert process_executor is not None
+                        future = process_executor.submit(
+                            _load_file_in_worker, input_file
+                        )
+                    else:
+                        assert thread_executor is not None
+                        future = thread_executor.submit(self.load_file, input_file)
+                    futures.append((input_file, future))
+
+                    # bound the number of loaded documents waiting to be yielded
+                    if len(futures) >= num_workers * FILES_PER_WORKER:
+                        loaded_file, loaded_future = futures.popleft()
+                        yield loaded_file, loaded_future.result()
+
+                while futures:
+                    loaded_file, loaded_future = futures.popleft()
+                    yield loaded_file, loaded_future.result()
+            finally:
+                # don't load the remaining files if loading stopped early
+                for _, future in futures:
+                    future.cancel()
+
+    def iter_data(self) -> Generator[Document, None, None]:
+        """Lazily load data from the input directory.
+
+        Documents are yielded file by file in input order, as soon as their file
+        and all files before it are loaded, so they can be processed while the
+        remaining files are still loading.
+
+        Returns:
+            Generator[Document, None, None]: A generator of documents.
+        """
+        for _, documents in self.iter_file_documents():
+            yield from documents
+
+    def load_data(self) -> List[Document]:
+        """Load data from the input directory.
+
+        Returns:
+            List[Document]: A list of documents.
+        """
+        return list(self.iter_data())
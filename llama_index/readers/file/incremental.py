@@ -0,0 +1,193 @@
+"""Incrementally sync a directory into an index."""
+import hashlib
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from llama_index.readers.file.base import SimpleDirectoryReader
+from llama_index.storage.docstore.types import FileFingerprint
+
+if TYPE_CHECKING:
+    from llama_index.indices.base import BaseIndex
+
+# number of bytes read at a time when hashing files
+HASH_BLOCK_SIZE = 1024 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+def get_file_hash(file_path: str) -> str:
+    """Get the sha256 hash of the content of a file."""
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+@dataclass
+class DirectorySyncResult:
+    """Files changed by a directory sync."""
+
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    num_unchanged: int = 0
+
+
+class IncrementalDirectoryLoader:
+    """Incremental directory loader.
+
+    Syncs the files of a directory into an index, loading only the files that
+    changed since the last sync.
+
+    The mtime, size and content hash of every loaded file are kept in a file
+    manifest in the docstore of the index. Files with the same mtime and size
+    are skipped without being opened, files with new content are loaded with a
+    SimpleDirectoryReader and refreshed in the index with `refresh_ref_docs`,
+    and the documents of deleted files are removed with `delete_ref_doc`.
+    A sync then costs time proportional to the number of changed files, on top
+    of listing the directory.
+
+    Documents are loaded with `filename_as_id=True`, so that documents of the
+    same file keep their ids across syncs. Files which fail to load are not
+    added to the manifest and are retried on the next sync.
+
+    Args:
+        input_dir (str): Path to the directory.
+        reader_kwargs (Any): Keyword arguments of the SimpleDirectoryReader,
+            e.g. `recursive`, `required_exts` or `num_workers`.
+    """
+
+    def __init__(self, input_dir: str, **reader_kwargs: Any) -> None:
+        """Initialize with parameters."""
+        if not reader_kwargs.pop("filename_as_id", True):
+            raise ValueError("IncrementalDirectoryLoader requires filename_as_id.")
+        if "input_files" in reader_kwargs:
+            raise ValueError("IncrementalDirectoryLoader only supports input_dir.")
+
+        self.input_dir = input_dir
+        self.reader_kwargs = reader_kwargs
+
+    def _get_reader(self) -> Optional[SimpleDirectoryReader]:
+        """Get a reader of the current files, or None if there are none."""
+        if not os.path.isdir(self.input_dir):
+            raise ValueError(f"Directory {self.input_dir} does not exist.")
+        try:
+            return SimpleDirectoryReader(
+                input_dir=self.input_dir, filename_as_id=True, **self.reader_kwargs
+            )
+        except ValueError:
+            # no files (left) in the directory
+            return None
+
+    def _in_directory(self, file_path: str) -> bool:
+        """Whether a file of the manifest was loaded from this directory."""
+        input_dir_parts = Path(self.input_dir).parts
+        parts = Path(file_path).parts
+        if self.reader_kwargs.get("recursive", False):
+            return parts[: len(input_dir_parts)] == input_dir_parts
+        return parts[:-1] == input_dir_parts
+
+    def sync(self, index: "BaseIndex", **update_kwargs: Any) -> DirectorySyncResult:
+        """Sync the files of the directory into an index.
+
+        Args:
+            index (BaseIndex): Index to sync the directory into. Its docstore
+                keeps the file manifest.
+            update_kwargs (Any): Keyword arguments of `refresh_ref_docs`.
+
+        Returns:
+            DirectorySyncResult: The files added, updated and deleted.
+        """
+        docstore = index.docstore
+        manifest = docstore.get_file_manifest()
+        reader = self._get_reader()
+        input_files = reader.input_files if reader is not None else []
+        result = DirectorySyncResult()
+
+        new_fingerprints: Dict[str, FileFingerprint] = {}
+        changed_files: List[Path] = []
+        for input_file in input_files:
+            file_path = str(input_file)
+            # stat before reading, changes made while loading are seen next sync
+            stat = input_file.stat()
+            fingerprint = manifest.get(file_path, None)
+            if (
+                fingerprint is not None
+                and fingerprint.mtime == stat.st_mtime
+                and fingerprint.size == stat.st_size
+            ):
+                result.num_unchanged += 1
+                continue
+
+            file_hash = get_file_hash(file_path)
+            if fingerprint is not None and fingerprint.hash == file_hash:
+                # touched without changing its content
+                new_fingerprints[file_path] = FileFingerprint(
+                    mtime=stat.st_mtime,
+                    size=stat.st_size,
+                    hash=file_hash,
+                    doc_ids=fingerprint.doc_ids,
+                )
+                result.num_unchanged += 1
+                continue
+
+            new_fingerprints[file_path] = FileFingerprint(
+                mtime=stat.st_mtime, size=stat.st_size, hash=file_hash
+            )
+            changed_files.append(input_file)
+
+        # load only the changed files
+        if reader is not None and changed_files:
+            reader.input_files = changed_files
+            self._load_changed_files(
+                reader, index, manifest, new_fingerprints, result, **update_kwargs
+            )
+
+        input_file_paths = {str(input_file) for input_file in input_files}
+        for file_path, fingerprint in manifest.items():
+            if file_path in input_file_paths or not self._in_directory(file_path):
+                continue
+            result.deleted.append(file_path)
+            for doc_id in fingerprint.doc_ids:
+                index.delete_ref_doc(doc_id, delete_from_docstore=True)
+
+        # update the manifest last, an interrupted sync is redone next time
+        if new_fingerprints:
+            docstore.set_file_fingerprints(new_fingerprints)
+        if result.deleted:
+            docstore.delete_file_fingerprints(result.deleted)
+        return result
+
+    def _load_changed_files(
+        self,
+        reader: SimpleDirectoryReader,
+        index: "BaseIndex",
+        manifest: Dict[str, FileFingerprint],
+        new_fingerprints: Dict[str, FileFingerprint],
+        result: DirectorySyncResult,
+        **update_kwargs: Any,
+    ) -> None:
+        """Refresh the documents of the changed files of a reader in an index."""
+        for input_file, documents in reader.iter_file_documents():
+            file_path = str(input_file)
+            if not documents:
+                logger.warning(f"No documents loaded from {file_path}, skipping.")
+                del new_fingerprints[file_path]
+                continue
+
+            doc_ids = [document.get_doc_id() for document in documents]
+            fingerprint = manifest.get(file_path, None)
+            if fingerprint is None:
+                result.added.append(file_path)
+            else:
+                result.updated.append(file_path)
+                # e.g. pages removed from a PDF
+                for doc_id in set(fingerprint.doc_ids) - set(doc_ids):
+                    index.delete_ref_doc(doc_id, delete_from_docstore=True)
+
+            index.refresh_ref_docs(documents, **update_kwargs)
+            new_fingerprints[file_path].doc_ids = doc_ids
@@ -1,11 +1,12 @@
 """Response schema."""
 
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
 from llama_index.bridge.pydantic import BaseModel
 from llama_index.schema import NodeWithScore
-from llama_index.types import TokenGen
+from llama_index.types import TokenAsyncGen, TokenGen
 from llama_index.utils import truncate_text
 
 
@@ -139,4 +140,63 @@ class StreamingResponse:
         return "\n\n".join(texts)
 
 
-RESPONSE_TYPE = Union[Response, StreamingResponse, PydanticResponse]
+@dataclass
+class AsyncStreamingResponse:
+    """AsyncStreamingResponse object.
+
+    Returned if streaming=True when synthesizing asynchronously.
+
+    Attributes:
+        async_response_gen: The async response generator.
+
+    """
+
+    async_response_gen: TokenAsyncGen
+    source_nodes: List[NodeWithScore] = field(default_factory=list)
+    metadata: Optional[Dict[str, Any]] = None
+    response_txt: Optional[str] = None
+
+    def __str__(self) -> str:
+        """Convert to string representation."""
+        return self.response_txt or "None"
+
+    async def aget_response(self) -> Response:
+        """Get a standard response object."""
+        if self.response_txt is None and self.async_response_gen is not None:
+            response_txt = ""
+            async for text in self.async_response_gen:
+                response_txt += text
+            self.response_txt = response_txt
+        return Response(self.response_txt, self.source_nodes, self.metadata)
+
+    def get_response(self) -> Response:
+        """Get a standard response object outside of an event loop."""
+        return asyncio.run(self.aget_response())
+
+    async def aprint_response_stream(self) -> None:
+        """Print the response stream."""
+        if self.response_txt is None and self.async_response_gen is not None:
+            response_txt = ""
+            async for text in self.async_response_gen:
+                print(text, end="", flush=True)
+                response_txt += text
+            self.response_txt = response_txt
+        else:
+            print(self.response_txt)
+
+    def get_formatted_sources(self, length: int = 100, trim_text: int = True) -> str:
+        """Get formatted sources text."""
+        texts = []
+        for source_node in self.source_nodes:
+            fmt_text_chunk = source_node.node.get_content()
+            if trim_text:
+                fmt_text_chunk = truncate_text(fmt_text_chunk, length)
+            node_id = source_node.node.node_id or "None"
+            source_text = f"> Source (Node id: {node_id}): {fmt_text_chunk}"
+            texts.append(source_text)
+        return "\n\n".join(texts)
+
+
+RESPONSE_TYPE = Union[
+    Response, StreamingResponse, AsyncStreamingResponse, PydanticResponse
+]
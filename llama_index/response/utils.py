@@ -1,6 +1,6 @@
 """Utilities for response."""
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 
 def get_response_text(response_gen: Generator) -> str:
@@ -9,3 +9,11 @@ def get_response_text(response_gen: Generator) -> str:
     for response in response_gen:
         response_text += response
     return response_text
+
+
+async def aget_response_text(response_gen: AsyncGenerator) -> str:
+    """Get response text from an async response generator."""
+    response_text = ""
+    async for response in response_gen:
+        response_text += response
+    return response_text
@@ -5,6 +5,7 @@ from llama_index.response_synthesizers.base import BaseSynthesizer
 from llama_index.response_synthesizers.compact_and_refine import CompactAndRefine
 from llama_index.response_synthesizers.factory import get_response_synthesizer
 from llama_index.response_synthesizers.generation import Generation
+from llama_index.response_synthesizers.parallel_refine import ParallelRefine
 from llama_index.response_synthesizers.refine import Refine
 from llama_index.response_synthesizers.simple_summarize import SimpleSummarize
 from llama_index.response_synthesizers.tree_summarize import TreeSummarize
@@ -18,6 +19,7 @@ __all__ = [
     "TreeSummarize",
     "Generation",
     "CompactAndRefine",
+    "ParallelRefine",
     "Accumulate",
     "get_response_synthesizer",
 ]
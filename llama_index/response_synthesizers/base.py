@@ -9,7 +9,16 @@ Will support different modes, from 1) stuffing chunks into prompt,
 """
 import logging
 from abc import abstractmethod
-from typing import Any, Dict, Generator, List, Optional, Sequence, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from llama_index.bridge.pydantic import BaseModel
 from llama_index.callbacks.schema import CBEventType, EventPayload
@@ -18,6 +27,7 @@ from llama_index.indices.service_context import ServiceContext
 from llama_index.prompts.mixin import PromptMixin
 from llama_index.response.schema import (
     RESPONSE_TYPE,
+    AsyncStreamingResponse,
     PydanticResponse,
     Response,
     StreamingResponse,
@@ -119,6 +129,12 @@ class BaseSynthesizer(PromptMixin):
                 source_nodes=source_nodes,
                 metadata=response_metadata,
             )
+        if isinstance(response_str, AsyncGenerator):
+            return AsyncStreamingResponse(
+                response_str,
+                source_nodes=source_nodes,
+                metadata=response_metadata,
+            )
         if isinstance(response_str, self._output_cls):
             return PydanticResponse(
                 response_str, source_nodes=source_nodes, metadata=response_metadata
@@ -10,7 +10,6 @@ from llama_index.prompts.default_prompt_selectors import (
     DEFAULT_TREE_SUMMARIZE_PROMPT_SEL,
 )
 from llama_index.prompts.default_prompts import DEFAULT_SIMPLE_INPUT_PROMPT
-from llama_index.prompts.prompts import PromptTemplate
 from llama_index.response_synthesizers.accumulate import Accumulate
 from llama_index.response_synthesizers.base import BaseSynthesizer
 from llama_index.response_synthesizers.compact_and_accumulate import (
@@ -19,6 +18,7 @@ from llama_index.response_synthesizers.compact_and_accumulate import (
 from llama_index.response_synthesizers.compact_and_refine import CompactAndRefine
 from llama_index.response_synthesizers.generation import Generation
 from llama_index.response_synthesizers.no_text import NoText
+from llama_index.response_synthesizers.parallel_refine import ParallelRefine
 from llama_index.response_synthesizers.refine import Refine
 from llama_index.response_synthesizers.simple_summarize import SimpleSummarize
 from llama_index.response_synthesizers.tree_summarize import TreeSummarize
@@ -38,7 +38,9 @@ def get_response_synthesizer(
     streaming: bool = False,
     structured_answer_filtering: bool = False,
     output_cls: Optional[BaseModel] = None,
-    program_factory: Optional[Callable[[PromptTemplate], BasePydanticProgram]] = None,
+    program_factory: Optional[
+        Callable[[BasePromptTemplate], BasePydanticProgram]
+    ] = None,
     verbose: bool = False,
 ) -> BaseSynthesizer:
     """Get a response synthesizer."""
@@ -73,6 +75,17 @@ def get_response_synthesizer(
             program_factory=program_factory,
             verbose=verbose,
         )
+    elif response_mode == ResponseMode.PARALLEL_REFINE:
+        return ParallelRefine(
+            service_context=service_context,
+            text_qa_template=text_qa_template,
+            refine_template=refine_template,
+            output_cls=output_cls,
+            streaming=streaming,
+            structured_answer_filtering=structured_answer_filtering,
+            program_factory=program_factory,
+            verbose=verbose,
+        )
     elif response_mode == ResponseMode.TREE_SUMMARIZE:
         return TreeSummarize(
             service_context=service_context,
@@ -0,0 +1,371 @@
+import asyncio
+import logging
+import sys
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from llama_index.async_utils import run_async_tasks
+from llama_index.bridge.pydantic import BaseModel, ValidationError
+from llama_index.indices.service_context import ServiceContext
+from llama_index.indices.utils import truncate_text
+from llama_index.prompts.base import BasePromptTemplate
+from llama_index.response.utils import aget_response_text, get_response_text
+from llama_index.response_synthesizers.compact_and_refine import CompactAndRefine
+from llama_index.response_synthesizers.refine import StructuredRefineResponse
+from llama_index.types import RESPONSE_TEXT_TYPE, BasePydanticProgram
+from llama_index.utils import count_tokens_many
+
+logger = logging.getLogger(__name__)
+
+# the last LLM call of a synthesis, left to the caller so that it can be streamed:
+# either a final answer, or a prompt template with its prompt arguments and the
+# answer to keep if the query is not satisfied
+FinalCall = Union[str, Tuple[BasePromptTemplate, Dict[str, str], str]]
+
+
+class ParallelRefine(CompactAndRefine):
+    """Refine responses across compact text chunks, with concurrent LLM calls.
+
+    Compact and refine makes one LLM call per compact text chunk, one after the
+    other. Parallel refine instead:
+    1. answers the query over every compact text chunk concurrently
+    2. merges the answers by refining the first answer with the others, repacked
+       into as few refine prompts as possible, or with `use_merge_tree=True`, by
+       refining pairs of answers concurrently until a single answer is left.
+
+    While a refine call is in flight, the token counts of the remaining refine
+    contexts are computed in a background thread, so that the contexts are only
+    repacked when they no longer fit next to the refined answer.
+
+    The final LLM call is streamed when `streaming=True`, in both `get_response`
+    and `aget_response`.
+
+    Args:
+        use_merge_tree (bool): Whether to merge the answers as a tree of pairwise
+            refines, instead of a chain of refines.
+        max_concurrency (Optional[int]): Maximum number of concurrent LLM calls.
+            Unlimited by default.
+    """
+
+    def __init__(
+        self,
+        service_context: Optional[ServiceContext] = None,
+        text_qa_template: Optional[BasePromptTemplate] = None,
+        refine_template: Optional[BasePromptTemplate] = None,
+        output_cls: Optional[BaseModel] = None,
+        streaming: bool = False,
+        verbose: bool = False,
+        structured_answer_filtering: bool = False,
+        program_factory: Optional[
+            Callable[[BasePromptTemplate], BasePydanticProgram]
+        ] = None,
+        use_merge_tree: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        super().__init__(
+            service_context=service_context,
+            text_qa_template=text_qa_template,
+            refine_template=refine_template,
+            output_cls=output_cls,
+            streaming=streaming,
+            verbose=verbose,
+            structured_answer_filtering=structured_answer_filtering,
+            program_factory=program_factory,
+        )
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._use_merge_tree = use_merge_tree
+        self._max_concurrency = max_concurrency
+
+    def get_response(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        prev_response: Optional[RESPONSE_TEXT_TYPE] = None,
+        **response_kwargs: Any,
+    ) -> RESPONSE_TEXT_TYPE:
+        """Give response over chunks."""
+        if isinstance(prev_response, Generator):
+            prev_response = get_response_text(prev_response)
+
+        if not self._streaming:
+            response = run_async_tasks(
+                [
+                    self._aget_response_text(
+                        query_str, text_chunks, prev_response, **response_kwargs
+                    )
+                ]
+            )[0]
+            return self._parse_response(response)
+
+        final_call = run_async_tasks(
+            [
+                self._aget_final_call(
+                    query_str,
+                    text_chunks,
+                    prev_response,
+                    **response_kwargs,
+                )
+            ]
+        )[0]
+        if isinstance(final_call, str):
+            return self._parse_response(final_call)
+        template, prompt_args, _ = final_call
+        return self._service_context.llm_predictor.stream(
+            template, output_cls=self._output_cls, **prompt_args, **response_kwargs
+        )
+
+    async def aget_response(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        prev_response: Optional[RESPONSE_TEXT_TYPE] = None,
+        **response_kwargs: Any,
+    ) -> RESPONSE_TEXT_TYPE:
+        """Give response over chunks."""
+        if isinstance(prev_response, Generator):
+            prev_response = get_response_text(prev_response)
+        elif isinstance(prev_response, AsyncGenerator):
+            prev_response = await aget_response_text(prev_response)
+
+        if not self._streaming:
+            response = await self._aget_response_text(
+                query_str, text_chunks, prev_response, **response_kwargs
+            )
+            return self._parse_response(response)
+
+        final_call = await self._aget_final_call(
+            query_str,
+            text_chunks,
+            prev_response,
+            **response_kwargs,
+        )
+        if isinstance(final_call, str):
+            return self._parse_response(final_call)
+        template, prompt_args, _ = final_call
+        return await self._service_context.llm_predictor.astream(
+            template, output_cls=self._output_cls, **prompt_args, **response_kwargs
+        )
+
+    def _parse_response(self, response: str) -> RESPONSE_TEXT_TYPE:
+        """Parse a final answer into the output class, if any."""
+        if self._output_cls is not None:
+            return self._output_cls.parse_raw(response)
+        return response or "Empty Response"
+
+    def _new_semaphore(self) -> asyncio.Semaphore:
+        """Get a semaphore limiting the number of concurrent LLM calls."""
+        return asyncio.Semaphore(self._max_concurrency or sys.maxsize)
+
+    async def _aget_response_text(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        prev_response: Optional[RESPONSE_TEXT_TYPE],
+        **response_kwargs: Any,
+    ) -> str:
+        """Get the final answer, making the final LLM call."""
+        semaphore = self._new_semaphore()
+        final_call = await self._aget_final_call(
+            query_str,
+            text_chunks,
+            prev_response,
+            semaphore=semaphore,
+            **response_kwargs,
+        )
+        return await self._afinish(final_call, semaphore, **response_kwargs)
+
+    async def _afinish(
+        self,
+        final_call: FinalCall,
+        semaphore: asyncio.Semaphore,
+        **response_kwargs: Any,
+    ) -> str:
+        """Make a final LLM call, keeping the existing answer if unsatisfied."""
+        if isinstance(final_call, str):
+            return final_call
+        template, prompt_args, existing_answer = final_call
+        answer = await self._acall_program(
+            template, semaphore, **prompt_args, **response_kwargs
+        )
+        return existing_answer if answer is None else answer
+
+    async def _acall_program(
+        self,
+        template: BasePromptTemplate,
+        semaphore: asyncio.Semaphore,
+        **prompt_args: Any,
+    ) -> Optional[str]:
+        """Call the program of a template, None if the query is not satisfied."""
+        program: BasePydanticProgram = self._program_factory(template)
+        async with semaphore:
+            try:
+                structured_response = cast(
+                    StructuredRefineResponse,
+                    await self._service_context.async_executor.arun(
+                        program.acall, output_cls=self._output_cls, **prompt_args
+                    ),
+                )
+            except ValidationError as e:
+                logger.warning(
+                    f"Validation error on structured response: {e}", exc_info=True
+                )
+                return None
+        if not structured_response.query_satisfied:
+            return None
+        return structured_response.answer
+
+    async def _aget_final_call(
+        self,
+        query_str: str,
+        text_chunks: Sequence[str],
+        prev_response: Optional[RESPONSE_TEXT_TYPE],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **response_kwargs: Any,
+    ) -> FinalCall:
+        """Answer over all text chunks, up to the final LLM call."""
+        # created in the running event loop
+        semaphore = semaphore or self._new_semaphore()
+        compact_texts = self._make_compact_text_chunks(query_str, text_chunks)
+        text_qa_template = self._text_qa_template.partial_format(query_str=query_str)
+        if len(compact_texts) == 1 and prev_response is None:
+            return text_qa_template, {"context_str": compact_texts[0]}, ""
+
+        if self._verbose:
+            print(f"> Answering over {len(compact_texts)} text chunks concurrently")
+        first_answers = await asyncio.gather(
+            *[
+                self._acall_program(
+                    text_qa_template,
+                    semaphore,
+                    context_str=text_chunk,
+                    **response_kwargs,
+                )
+                for text_chunk in compact_texts
+            ]
+        )
+        answers = [answer for answer in first_answers if answer]
+        if prev_response is not None:
+            answers.insert(0, str(prev_response))
+        if not answers:
+            return ""
+
+        if self._use_merge_tree:
+            while len(answers) > 2:
+                answers = await self._amerge_pairs(
+                    query_str, answers, semaphore, **response_kwargs
+                )
+        return await self._arefine_chain(
+            query_str, answers[0], answers[1:], semaphore, **response_kwargs
+        )
+
+    async def _amerge_pairs(
+        self,
+        query_str: str,
+        answers: List[str],
+        semaphore: asyncio.Semaphore,
+        **response_kwargs: Any,
+    ) -> List[str]:
+        """Refine each pair of answers into one answer, concurrently."""
+
+        async def _amerge_pair(existing_answer: str, answer: str) -> str:
+            final_call = await self._arefine_chain(
+                query_str, existing_answer, [answer], semaphore, **response_kwargs
+            )
+            return await self._afinish(final_call, semaphore, **response_kwargs)
+
+        merged_answers = await asyncio.gather(
+            *[
+                _amerge_pair(answers[i], answers[i + 1])
+                for i in range(0, len(answers) - 1, 2)
+            ]
+        )
+        if len(answers) % 2 == 1:
+            merged_answers.append(answers[-1])
+        return merged_answers
+
+    def _get_refine_template(
+        self, query_str: str, existing_answer: str
+    ) -> Tuple[BasePromptTemplate, int]:
+        """Get the refine template of an answer and its available chunk size."""
+        refine_template = self._refine_template.partial_format(
+            query_str=query_str, existing_answer=existing_answer
+        )
+        avail_chunk_size = (
+            self._service_context.prompt_helper._get_available_chunk_size(
+                refine_template
+            )
+        )
+        return refine_template, avail_chunk_size
+
+    def _count_text_chunk_tokens(self, text_chunks: Sequence[str]) -> List[int]:
+        """Count the tokens of text chunks with the tokenizer of the prompt helper."""
+        return count_tokens_many(
+            text_chunks, self._service_context.prompt_helper._tokenizer
+        )
+
+    async def _arefine_chain(
+        self,
+        query_str: str,
+        existing_answer: str,
+        answers: Sequence[str],
+        semaphore: asyncio.Semaphore,
+        **response_kwargs: Any,
+    ) -> FinalCall:
+        """Refine an answer with other answers, up to the final LLM call."""
+        if not answers:
+            return existing_answer
+
+        refine_template, avail_chunk_size = self._get_refine_template(
+            query_str, existing_answer
+        )
+        if avail_chunk_size < 0:
+            # the refine template is too big, keep the existing answer
+            return existing_answer
+        text_chunks = self._service_context.prompt_helper.repack(
+            refine_template, text_chunks=answers
+        )
+
+        loop = asyncio.get_running_loop()
+        while len(text_chunks) > 1:
+            text_chunk, text_chunks = text_chunks[0], text_chunks[1:]
+            fmt_text_chunk = truncate_text(text_chunk, 50)
+            logger.debug(f"> Refine context: {fmt_text_chunk}")
+            if self._verbose:
+                print(f"> Refine context: {fmt_text_chunk}")
+
+            # count the tokens of the remaining chunks while the LLM call runs
+            token_counts_future = loop.run_in_executor(
+                None, self._count_text_chunk_tokens, text_chunks
+            )
+            answer = await self._acall_program(
+                refine_template, semaphore, context_msg=text_chunk, **response_kwargs
+            )
+            token_counts = await token_counts_future
+            if answer is None:
+                continue
+
+            existing_answer = answer
+            refine_template, avail_chunk_size = self._get_refine_template(
+                query_str, existing_answer
+            )
+            if avail_chunk_size < 0:
+                return existing_answer
+            if max(token_counts) > avail_chunk_size:
+                # the refined answer grew, the remaining chunks no longer fit
+                text_chunks = self._service_context.prompt_helper.repack(
+                    refine_template, text_chunks=text_chunks
+                )
+
+        return refine_template, {"context_msg": text_chunks[0]}, existing_answer
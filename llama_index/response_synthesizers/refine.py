@@ -1,17 +1,26 @@
 import logging
-from typing import Any, Callable, Generator, Optional, Sequence, Type, cast
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Optional,
+    Sequence,
+    Type,
+    cast,
+)
 
 from llama_index.bridge.pydantic import BaseModel, Field, ValidationError
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.utils import truncate_text
 from llama_index.llm_predictor.base import BaseLLMPredictor
-from llama_index.prompts.base import BasePromptTemplate, PromptTemplate
+from llama_index.prompts.base import BasePromptTemplate
 from llama_index.prompts.default_prompt_selectors import (
     DEFAULT_REFINE_PROMPT_SEL,
     DEFAULT_TEXT_QA_PROMPT_SEL,
 )
 from llama_index.prompts.mixin import PromptDictType
-from llama_index.response.utils import get_response_text
+from llama_index.response.utils import aget_response_text, get_response_text
 from llama_index.response_synthesizers.base import BaseSynthesizer
 from llama_index.types import RESPONSE_TEXT_TYPE, BasePydanticProgram
 
@@ -142,7 +151,9 @@ class Refine(BaseSynthesizer):
             response = cast(Generator, response)
         return response
 
-    def _default_program_factory(self, prompt: PromptTemplate) -> BasePydanticProgram:
+    def _default_program_factory(
+        self, prompt: BasePromptTemplate
+    ) -> BasePydanticProgram:
         if self._structured_answer_filtering:
             from llama_index.program.utils import get_program_for_llm
 
@@ -322,7 +333,7 @@ class Refine(BaseSynthesizer):
             else:
                 response = response or "Empty Response"
         else:
-            response = cast(Generator, response)
+            response = cast(AsyncGenerator, response)
         return response
 
     async def _arefine_response_single(
@@ -336,6 +347,8 @@ class Refine(BaseSynthesizer):
         # TODO: consolidate with logic in response/schema.py
         if isinstance(response, Generator):
             response = get_response_text(response)
+        elif isinstance(response, AsyncGenerator):
+            response = await aget_response_text(response)
 
         fmt_text_chunk = truncate_text(text_chunk, 50)
         logger.debug(f"> Refine context: {fmt_text_chunk}")
@@ -385,7 +398,20 @@ class Refine(BaseSynthesizer):
                         f"Validation error on structured response: {e}", exc_info=True
                     )
             else:
-                raise ValueError("Streaming not supported for async")
+                # TODO: structured response not supported for streaming
+                if isinstance(response, AsyncGenerator):
+                    response = await aget_response_text(response)
+
+                refine_template = self._refine_template.partial_format(
+                    query_str=query_str, existing_answer=response
+                )
+
+                response = await self._service_context.llm_predictor.astream(
+                    refine_template,
+                    context_msg=cur_text_chunk,
+                    output_cls=self._output_cls,
+                    **response_kwargs,
+                )
 
             if query_satisfied:
                 refine_template = self._refine_template.partial_format(
@@ -428,7 +454,12 @@ class Refine(BaseSynthesizer):
                         f"Validation error on structured response: {e}", exc_info=True
                     )
             elif response is None and self._streaming:
-                raise ValueError("Streaming not supported for async")
+                response = await self._service_context.llm_predictor.astream(
+                    text_qa_template,
+                    context_str=cur_text_chunk,
+                    output_cls=self._output_cls,
+                    **response_kwargs,
+                )
             else:
                 response = await self._arefine_response_single(
                     cast(RESPONSE_TEXT_TYPE, response),
@@ -441,5 +472,5 @@ class Refine(BaseSynthesizer):
         if isinstance(response, str):
             response = response or "Empty Response"
         else:
-            response = cast(Generator, response)
+            response = cast(AsyncGenerator, response)
         return response
@@ -1,4 +1,4 @@
-import asyncio
+from functools import partial
 from typing import Any, List, Optional, Sequence
 
 from llama_index.async_utils import run_async_tasks
@@ -23,6 +23,9 @@ class TreeSummarize(BaseSynthesizer):
     1. we repack the text chunks so that each chunk fills the context window of the LLM
     2. if there is only one chunk, we give the final response
     3. otherwise, we summarize each chunk and recursively summarize the summaries.
+
+    Chunks are summarized concurrently in async mode, within the limits of the
+    async executor of the service context.
     """
 
     def __init__(
@@ -91,7 +94,8 @@ class TreeSummarize(BaseSynthesizer):
         else:
             # summarize each chunk
             tasks = [
-                self._service_context.llm_predictor.apredict(
+                partial(
+                    self._service_context.llm_predictor.apredict,
                     summary_template,
                     output_cls=self._output_cls,
                     context_str=text_chunk,
@@ -100,7 +104,9 @@ class TreeSummarize(BaseSynthesizer):
                 for text_chunk in text_chunks
             ]
 
-            summaries: List[str] = await asyncio.gather(*tasks)
+            summaries: List[str] = await self._service_context.async_executor.gather(
+                tasks
+            )
 
             # recursively summarize the summaries
             return await self.aget_response(
@@ -151,7 +157,8 @@ class TreeSummarize(BaseSynthesizer):
             # summarize each chunk
             if self._use_async:
                 tasks = [
-                    self._service_context.llm_predictor.apredict(
+                    partial(
+                        self._service_context.llm_predictor.apredict,
                         summary_template,
                         output_cls=self._output_cls,
                         context_str=text_chunk,
@@ -160,7 +167,9 @@ class TreeSummarize(BaseSynthesizer):
                     for text_chunk in text_chunks
                 ]
 
-                summaries: List[str] = run_async_tasks(tasks)
+                summaries: List[str] = run_async_tasks(
+                    tasks, executor=self._service_context.async_executor
+                )
             else:
                 summaries = [
                     self._service_context.llm_predictor.predict(
@@ -22,6 +22,14 @@ class ResponseMode(str, Enum):
     This mode is faster than refine since we make fewer calls to the LLM.
     """
 
+    PARALLEL_REFINE = "parallel_refine"
+    """
+    Parallel refine mode first combine text chunks into larger consolidated chunks, \
+    like compact mode, then answers the query over all of them concurrently and \
+    refines the first answer with the other answers.
+    This mode has a lower latency than compact, at the cost of more LLM calls.
+    """
+
     SIMPLE_SUMMARIZE = "simple_summarize"
     """
     Merge all text chunks into one, and make a LLM call.
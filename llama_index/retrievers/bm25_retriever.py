@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, List, Optional, cast
+from typing import Callable, List, Optional
 
 from llama_index.constants import DEFAULT_SIMILARITY_TOP_K
 from llama_index.indices.base_retriever import BaseRetriever
@@ -48,7 +48,7 @@ class BM25Retriever(BaseRetriever):
             docstore = index.docstore
 
         if docstore is not None:
-            nodes = cast(List[BaseNode], list(docstore.docs.values()))
+            nodes = list(docstore.iter_docs())
 
         assert (
             nodes is not None
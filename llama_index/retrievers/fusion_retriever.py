@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
-from llama_index.async_utils import run_async_tasks
+from llama_index.async_utils import AsyncExecutor, run_async_tasks
 from llama_index.constants import DEFAULT_SIMILARITY_TOP_K
 from llama_index.indices.query.schema import QueryBundle
 from llama_index.llms.utils import LLMType, resolve_llm
@@ -35,6 +35,7 @@ class QueryFusionRetriever(BaseRetriever):
         num_queries: int = 4,
         use_async: bool = True,
         verbose: bool = False,
+        async_executor: Optional[AsyncExecutor] = None,
     ) -> None:
         self.num_queries = num_queries
         self.query_gen_prompt = query_gen_prompt or QUERY_GEN_PROMPT
@@ -45,6 +46,7 @@ class QueryFusionRetriever(BaseRetriever):
 
         self._retrievers = retrievers
         self._llm = resolve_llm(llm)
+        self._async_executor = async_executor or AsyncExecutor()
 
     def _get_queries(self, original_query: str) -> List[str]:
         prompt_str = self.query_gen_prompt.format(
@@ -118,7 +120,7 @@ class QueryFusionRetriever(BaseRetriever):
                 tasks.append(retriever.aretrieve(query))
                 task_queries.append(query)
 
-        task_results = run_async_tasks(tasks)
+        task_results = run_async_tasks(tasks, executor=self._async_executor)
 
         results = {}
         for i, (query, query_result) in enumerate(zip(task_queries, task_results)):
@@ -135,7 +137,7 @@ class QueryFusionRetriever(BaseRetriever):
                 tasks.append(retriever.aretrieve(query))
                 task_queries.append(query)
 
-        task_results = await asyncio.gather(*tasks)
+        task_results = await self._async_executor.gather(tasks)
 
         results = {}
         for i, (query, query_result) in enumerate(zip(task_queries, task_results)):
@@ -147,9 +149,11 @@ class QueryFusionRetriever(BaseRetriever):
         self, queries: List[str]
     ) -> Dict[Tuple[str, int], List[NodeWithScore]]:
         results = {}
-        for query in queries:
-            for i, retriever in enumerate(self._retrievers):
-                results[(query, i)] = retriever.retrieve(query)
+        for i, retriever in enumerate(self._retrievers):
+            # retrieve all generated queries at once so that retrievers that
+            # support batching can embed and score them together
+            for query, query_result in zip(queries, retriever.retrieve_batch(queries)):
+                results[(query, i)] = query_result
 
         return results
 
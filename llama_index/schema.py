@@ -3,14 +3,15 @@ import json
 import textwrap
 import uuid
 from abc import abstractmethod
+from dataclasses import dataclass
 from enum import Enum, auto
 from hashlib import sha256
 from io import BytesIO
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Self
 
-from llama_index.bridge.pydantic import BaseModel, Field, root_validator
+from llama_index.bridge.pydantic import BaseModel, Field, PrivateAttr, root_validator
 from llama_index.utils import SAMPLE_TEXT, truncate_text
 
 if TYPE_CHECKING:
@@ -302,6 +303,24 @@ class BaseNode(BaseComponent):
         )
 
 
+# metadata values which cannot change in place, so that a rendered metadata
+# string can be reused while the node holds the same value objects
+_IMMUTABLE_METADATA_TYPES = (str, int, float, bool, type(None))
+
+
+@dataclass
+class _RenderedMetadata:
+    """Metadata string of a node for one metadata mode, and what it was built from."""
+
+    metadata_items: List[Tuple[str, Any]]
+    excluded_keys: List[str]
+    metadata_template: str
+    metadata_seperator: str
+    metadata_str: str
+    # (text, text_template, content) of the last `get_content` call
+    content: Optional[Tuple[str, str, str]] = None
+
+
 class TextNode(BaseNode):
     text: str = Field(default="", description="Text content of the node.")
     start_char_idx: Optional[int] = Field(
@@ -329,6 +348,11 @@ class TextNode(BaseNode):
         description="Separator between metadata fields when converting to string.",
     )
 
+    # rendered metadata and content per metadata mode, see `_get_rendered_metadata`
+    _rendered_metadata: Dict[MetadataMode, _RenderedMetadata] = PrivateAttr(
+        default_factory=dict
+    )
+
     @classmethod
     def class_name(cls) -> str:
         return "TextNode"
@@ -351,36 +375,104 @@ class TextNode(BaseNode):
 
     def get_content(self, metadata_mode: MetadataMode = MetadataMode.NONE) -> str:
         """Get object content."""
-        metadata_str = self.get_metadata_str(mode=metadata_mode).strip()
-        if not metadata_str:
+        if metadata_mode == MetadataMode.NONE:
             return self.text
 
-        return self.text_template.format(
-            content=self.text, metadata_str=metadata_str
-        ).strip()
+        rendered = self._get_rendered_metadata(metadata_mode)
+        if rendered.content is not None:
+            text, text_template, content = rendered.content
+            if text is self.text and text_template is self.text_template:
+                return content
+
+        metadata_str = rendered.metadata_str.strip()
+        if not metadata_str:
+            content = self.text
+        else:
+            content = self.text_template.format(
+                content=self.text, metadata_str=metadata_str
+            ).strip()
+        rendered.content = (self.text, self.text_template, content)
+        return content
 
     def get_metadata_str(self, mode: MetadataMode = MetadataMode.ALL) -> str:
         """Metadata info string."""
         if mode == MetadataMode.NONE:
             return ""
+        return self._get_rendered_metadata(mode).metadata_str
 
-        usable_metadata_keys = set(self.metadata.keys())
+    def _get_excluded_metadata_keys(self, mode: MetadataMode) -> List[str]:
         if mode == MetadataMode.LLM:
-            for key in self.excluded_llm_metadata_keys:
-                if key in usable_metadata_keys:
-                    usable_metadata_keys.remove(key)
+            return self.excluded_llm_metadata_keys
         elif mode == MetadataMode.EMBED:
-            for key in self.excluded_embed_metadata_keys:
-                if key in usable_metadata_keys:
-                    usable_metadata_keys.remove(key)
+            return self.excluded_embed_metadata_keys
+        return []
+
+    def _get_rendered_metadata(self, mode: MetadataMode) -> _RenderedMetadata:
+        """Get the metadata string for a mode, rendering it only if it changed.
 
-        return self.metadata_seperator.join(
+        A cached string is reused while the metadata holds the same keys and
+        value objects, and the templates and excluded keys are unchanged. Since
+        mutable values can change in place, the string is only cached when all
+        metadata values are immutable scalars.
+
+        """
+        try:
+            rendered_metadata = self._rendered_metadata
+        except AttributeError:
+            # private attributes are dropped when pickling
+            rendered_metadata = self._rendered_metadata = {}
+
+        excluded_keys = self._get_excluded_metadata_keys(mode)
+        rendered = rendered_metadata.get(mode, None)
+        if rendered is not None and self._is_rendered_metadata_valid(
+            rendered, excluded_keys
+        ):
+            return rendered
+
+        metadata_items = list(self.metadata.items())
+        usable_metadata_keys = set(self.metadata.keys())
+        for key in excluded_keys:
+            if key in usable_metadata_keys:
+                usable_metadata_keys.remove(key)
+
+        metadata_str = self.metadata_seperator.join(
             [
                 self.metadata_template.format(key=key, value=str(value))
-                for key, value in self.metadata.items()
+                for key, value in metadata_items
                 if key in usable_metadata_keys
             ]
         )
+        rendered = _RenderedMetadata(
+            metadata_items=metadata_items,
+            excluded_keys=list(excluded_keys),
+            metadata_template=self.metadata_template,
+            metadata_seperator=self.metadata_seperator,
+            metadata_str=metadata_str,
+        )
+        if all(
+            isinstance(value, _IMMUTABLE_METADATA_TYPES) for _, value in metadata_items
+        ):
+            rendered_metadata[mode] = rendered
+        else:
+            rendered_metadata.pop(mode, None)
+        return rendered
+
+    def _is_rendered_metadata_valid(
+        self, rendered: _RenderedMetadata, excluded_keys: List[str]
+    ) -> bool:
+        if (
+            rendered.metadata_template != self.metadata_template
+            or rendered.metadata_seperator != self.metadata_seperator
+            or rendered.excluded_keys != excluded_keys
+            or len(rendered.metadata_items) != len(self.metadata)
+        ):
+            return False
+        for (key, value), (current_key, current_value) in zip(
+            rendered.metadata_items, self.metadata.items()
+        ):
+            if key != current_key or value is not current_value:
+                return False
+        return True
 
     def set_content(self, value: str) -> None:
         """Set the content of the node."""
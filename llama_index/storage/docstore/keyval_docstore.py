@@ -1,11 +1,28 @@
 """Document store."""
 
-from typing import Dict, Optional, Sequence
+import asyncio
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from llama_index.schema import BaseNode, TextNode
-from llama_index.storage.docstore.types import BaseDocumentStore, RefDocInfo
+from llama_index.storage.docstore.types import (
+    BaseDocumentStore,
+    FileFingerprint,
+    RefDocInfo,
+)
 from llama_index.storage.docstore.utils import doc_to_json, json_to_doc
-from llama_index.storage.kvstore.types import BaseKVStore
+from llama_index.storage.kvstore.types import DEFAULT_BATCH_SIZE, BaseKVStore
 
 DEFAULT_NAMESPACE = "docstore"
 
@@ -35,6 +52,10 @@ class KVDocumentStore(BaseDocumentStore):
     Args:
         kvstore (BaseKVStore): key-value store
         namespace (str): namespace for the docstore
+        node_cache_size (Optional[int]): number of deserialized nodes to keep
+            in a least recently used cache. Cached nodes are shared between
+            callers and must not be modified. Writes that bypass this
+            docstore are not seen by the cache. Disabled by default.
 
     """
 
@@ -42,6 +63,7 @@ class KVDocumentStore(BaseDocumentStore):
         self,
         kvstore: BaseKVStore,
         namespace: Optional[str] = None,
+        node_cache_size: Optional[int] = None,
     ) -> None:
         """Init a KVDocumentStore."""
         self._kvstore = kvstore
@@ -49,6 +71,42 @@ class KVDocumentStore(BaseDocumentStore):
         self._node_collection = f"{self._namespace}/data"
         self._ref_doc_collection = f"{self._namespace}/ref_doc_info"
         self._metadata_collection = f"{self._namespace}/metadata"
+        self._file_manifest_collection = f"{self._namespace}/file_manifest"
+        self._node_cache_size = node_cache_size
+        self._node_cache: "OrderedDict[str, BaseNode]" = OrderedDict()
+
+    def _get_cached_node(self, node_id: str) -> Optional[BaseNode]:
+        if not self._node_cache_size:
+            return None
+        node = self._node_cache.get(node_id, None)
+        if node is not None:
+            self._node_cache.move_to_end(node_id)
+        return node
+
+    def _parse_node(self, node_id: str, json: Mapping[str, Any]) -> BaseNode:
+        """Deserialize a node, keeping it in the node cache if enabled."""
+        node = json_to_doc(json, validate=False)
+        if self._node_cache_size:
+            self._node_cache[node_id] = node
+            while len(self._node_cache) > self._node_cache_size:
+                self._node_cache.popitem(last=False)
+        return node
+
+    def _evict_cached_nodes(self, node_ids: Iterable[str]) -> None:
+        for node_id in node_ids:
+            self._node_cache.pop(node_id, None)
+
+    def _iter_node_items(self) -> Iterator[Tuple[str, BaseNode]]:
+        json_view = self._kvstore.get_all_view(collection=self._node_collection)
+        # iterate over a snapshot of the ids, the store may change in between
+        for node_id in list(json_view):
+            node = self._get_cached_node(node_id)
+            if node is None:
+                json = json_view.get(node_id, None)
+                if json is None:
+                    continue
+                node = self._parse_node(node_id, json)
+            yield node_id, node
 
     @property
     def docs(self) -> Dict[str, BaseNode]:
@@ -58,53 +116,182 @@ class KVDocumentStore(BaseDocumentStore):
             Dict[str, BaseDocument]: documents
 
         """
-        json_dict = self._kvstore.get_all(collection=self._node_collection)
-        return {key: json_to_doc(json) for key, json in json_dict.items()}
+        return dict(self._iter_node_items())
 
-    def add_documents(
-        self, nodes: Sequence[BaseNode], allow_update: bool = True
-    ) -> None:
-        """Add a document to the store.
+    def iter_docs(self) -> Iterator[BaseNode]:
+        """Iterate over all documents, deserializing them on demand.
 
-        Args:
-            docs (List[BaseDocument]): documents
-            allow_update (bool): allow update of docstore from document
+        Unlike `docs`, only the node being yielded is held in memory, and an
+        in-memory kvstore is read through a view without copying its data.
 
         """
-        for node in nodes:
-            # NOTE: doc could already exist in the store, but we overwrite it
-            if not allow_update and self.document_exists(node.node_id):
+        for _, node in self._iter_node_items():
+            yield node
+
+    def _check_nodes_not_stored(
+        self, node_ids: List[str], stored_jsons: List[Optional[dict]]
+    ) -> None:
+        """Raise if any node is already stored or repeated, for allow_update=False."""
+        seen_node_ids = set()
+        for node_id, json in zip(node_ids, stored_jsons):
+            if json is not None or node_id in seen_node_ids:
                 raise ValueError(
-                    f"node_id {node.node_id} already exists. "
+                    f"node_id {node_id} already exists. "
                     "Set allow_update to True to overwrite."
                 )
+            seen_node_ids.add(node_id)
+
+    def _get_ref_doc_ids(self, nodes: Sequence[BaseNode]) -> List[str]:
+        """Get the distinct ref doc ids of nodes, in order."""
+        return list(
+            dict.fromkeys(
+                node.ref_doc_id
+                for node in nodes
+                if isinstance(node, TextNode) and node.ref_doc_id is not None
+            )
+        )
+
+    def _get_kv_pairs_for_insert(
+        self,
+        nodes: Sequence[BaseNode],
+        ref_doc_ids: List[str],
+        ref_doc_info_dicts: List[Optional[dict]],
+    ) -> Tuple[List[Tuple[str, dict]], List[Tuple[str, dict]], List[Tuple[str, dict]]]:
+        """Get the node, ref doc info and metadata key-value pairs to write."""
+        ref_doc_infos: Dict[str, RefDocInfo] = {}
+        for ref_doc_id, ref_doc_info_dict in zip(ref_doc_ids, ref_doc_info_dicts):
+            ref_doc_infos[ref_doc_id] = (
+                self._to_ref_doc_info(ref_doc_info_dict)
+                if ref_doc_info_dict
+                else RefDocInfo()
+            )
+
+        node_kv_pairs: List[Tuple[str, dict]] = []
+        metadata_kv_pairs: List[Tuple[str, dict]] = []
+        for node in nodes:
+            # NOTE: doc could already exist in the store, but we overwrite it
             node_key = node.node_id
-            data = doc_to_json(node)
-            self._kvstore.put(node_key, data, collection=self._node_collection)
+            node_kv_pairs.append((node_key, doc_to_json(node)))
 
             # update doc_collection if needed
             metadata = {"doc_hash": node.hash}
             if isinstance(node, TextNode) and node.ref_doc_id is not None:
-                ref_doc_info = self.get_ref_doc_info(node.ref_doc_id) or RefDocInfo()
+                ref_doc_info = ref_doc_infos[node.ref_doc_id]
                 if node.node_id not in ref_doc_info.node_ids:
                     ref_doc_info.node_ids.append(node.node_id)
                 if not ref_doc_info.metadata:
                     ref_doc_info.metadata = node.metadata or {}
-                self._kvstore.put(
-                    node.ref_doc_id,
-                    ref_doc_info.to_dict(),
-                    collection=self._ref_doc_collection,
-                )
 
                 # update metadata with map
                 metadata["ref_doc_id"] = node.ref_doc_id
-                self._kvstore.put(
-                    node_key, metadata, collection=self._metadata_collection
-                )
-            else:
-                self._kvstore.put(
-                    node_key, metadata, collection=self._metadata_collection
-                )
+            metadata_kv_pairs.append((node_key, metadata))
+
+        ref_doc_kv_pairs = [
+            (ref_doc_id, ref_doc_info.to_dict())
+            for ref_doc_id, ref_doc_info in ref_doc_infos.items()
+        ]
+        return node_kv_pairs, ref_doc_kv_pairs, metadata_kv_pairs
+
+    def add_documents(
+        self,
+        nodes: Sequence[BaseNode],
+        allow_update: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Add a document to the store.
+
+        Node data, ref doc info and metadata are each written with a single
+        batched `put_all`, so a remote kvstore needs a constant number of round
+        trips per `batch_size` nodes instead of several per node.
+
+        Args:
+            docs (List[BaseDocument]): documents
+            allow_update (bool): allow update of docstore from document
+            batch_size (int): number of key-value pairs to write per request
+
+        """
+        if not allow_update:
+            node_ids = [node.node_id for node in nodes]
+            self._check_nodes_not_stored(
+                node_ids,
+                self._kvstore.get_many(node_ids, collection=self._node_collection),
+            )
+
+        # fetch the ref doc info of all referenced documents at once
+        ref_doc_ids = self._get_ref_doc_ids(nodes)
+        ref_doc_info_dicts = self._kvstore.get_many(
+            ref_doc_ids, collection=self._ref_doc_collection
+        )
+        (
+            node_kv_pairs,
+            ref_doc_kv_pairs,
+            metadata_kv_pairs,
+        ) = self._get_kv_pairs_for_insert(nodes, ref_doc_ids, ref_doc_info_dicts)
+
+        self._evict_cached_nodes(node.node_id for node in nodes)
+        self._kvstore.put_all(
+            node_kv_pairs, collection=self._node_collection, batch_size=batch_size
+        )
+        self._kvstore.put_all(
+            ref_doc_kv_pairs,
+            collection=self._ref_doc_collection,
+            batch_size=batch_size,
+        )
+        self._kvstore.put_all(
+            metadata_kv_pairs,
+            collection=self._metadata_collection,
+            batch_size=batch_size,
+        )
+
+    async def aadd_documents(
+        self,
+        nodes: Sequence[BaseNode],
+        allow_update: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Add a document to the store.
+
+        Args:
+            docs (List[BaseDocument]): documents
+            allow_update (bool): allow update of docstore from document
+            batch_size (int): number of key-value pairs to write per request
+
+        """
+        if not allow_update:
+            node_ids = [node.node_id for node in nodes]
+            self._check_nodes_not_stored(
+                node_ids,
+                await self._kvstore.aget_many(
+                    node_ids, collection=self._node_collection
+                ),
+            )
+
+        ref_doc_ids = self._get_ref_doc_ids(nodes)
+        ref_doc_info_dicts = await self._kvstore.aget_many(
+            ref_doc_ids, collection=self._ref_doc_collection
+        )
+        (
+            node_kv_pairs,
+            ref_doc_kv_pairs,
+            metadata_kv_pairs,
+        ) = self._get_kv_pairs_for_insert(nodes, ref_doc_ids, ref_doc_info_dicts)
+
+        self._evict_cached_nodes(node.node_id for node in nodes)
+        await asyncio.gather(
+            self._kvstore.aput_all(
+                node_kv_pairs, collection=self._node_collection, batch_size=batch_size
+            ),
+            self._kvstore.aput_all(
+                ref_doc_kv_pairs,
+                collection=self._ref_doc_collection,
+                batch_size=batch_size,
+            ),
+            self._kvstore.aput_all(
+                metadata_kv_pairs,
+                collection=self._metadata_collection,
+                batch_size=batch_size,
+            ),
+        )
 
     def get_document(self, doc_id: str, raise_error: bool = True) -> Optional[BaseNode]:
         """Get a document from the store.
@@ -114,13 +301,117 @@ class KVDocumentStore(BaseDocumentStore):
             raise_error (bool): raise error if doc_id not found
 
         """
+        node = self._get_cached_node(doc_id)
+        if node is not None:
+            return node
         json = self._kvstore.get(doc_id, collection=self._node_collection)
         if json is None:
             if raise_error:
                 raise ValueError(f"doc_id {doc_id} not found.")
             else:
                 return None
-        return json_to_doc(json)
+        return self._parse_node(doc_id, json)
+
+    async def aget_document(
+        self, doc_id: str, raise_error: bool = True
+    ) -> Optional[BaseNode]:
+        """Get a document from the store.
+
+        Args:
+            doc_id (str): document id
+            raise_error (bool): raise error if doc_id not found
+
+        """
+        node = self._get_cached_node(doc_id)
+        if node is not None:
+            return node
+        json = await self._kvstore.aget(doc_id, collection=self._node_collection)
+        if json is None:
+            if raise_error:
+                raise ValueError(f"doc_id {doc_id} not found.")
+            else:
+                return None
+        return self._parse_node(doc_id, json)
+
+    def _nodes_from_jsons(
+        self, node_ids: List[str], jsons: List[Optional[dict]], raise_error: bool
+    ) -> List[BaseNode]:
+        nodes = []
+        for node_id, json in zip(node_ids, jsons):
+            if json is None:
+                if raise_error:
+                    raise ValueError(f"doc_id {node_id} not found.")
+                raise ValueError(f"Document {node_id} is not a Node.")
+            nodes.append(self._parse_node(node_id, json))
+        return nodes
+
+    def _get_missing_node_ids(
+        self, node_ids: List[str], cached_nodes: List[Optional[BaseNode]]
+    ) -> List[str]:
+        return [
+            node_id for node_id, node in zip(node_ids, cached_nodes) if node is None
+        ]
+
+    def _merge_nodes(
+        self, cached_nodes: List[Optional[BaseNode]], fetched_nodes: List[BaseNode]
+    ) -> List[BaseNode]:
+        """Fill the cache misses with the fetched nodes, in order."""
+        fetched_iter = iter(fetched_nodes)
+        return [
+            node if node is not None else next(fetched_iter) for node in cached_nodes
+        ]
+
+    def get_nodes(
+        self, node_ids: List[str], raise_error: bool = True
+    ) -> List[BaseNode]:
+        """Get nodes from docstore with a single batched read.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found
+
+        """
+        cached_nodes = [self._get_cached_node(node_id) for node_id in node_ids]
+        missing_ids = self._get_missing_node_ids(node_ids, cached_nodes)
+        jsons = (
+            self._kvstore.get_many(missing_ids, collection=self._node_collection)
+            if missing_ids
+            else []
+        )
+        return self._merge_nodes(
+            cached_nodes, self._nodes_from_jsons(missing_ids, jsons, raise_error)
+        )
+
+    async def aget_nodes(
+        self, node_ids: List[str], raise_error: bool = True
+    ) -> List[BaseNode]:
+        """Get nodes from docstore with a single batched read.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found
+
+        """
+        cached_nodes = [self._get_cached_node(node_id) for node_id in node_ids]
+        missing_ids = self._get_missing_node_ids(node_ids, cached_nodes)
+        jsons = (
+            await self._kvstore.aget_many(missing_ids, collection=self._node_collection)
+            if missing_ids
+            else []
+        )
+        return self._merge_nodes(
+            cached_nodes, self._nodes_from_jsons(missing_ids, jsons, raise_error)
+        )
+
+    def get_node_dict(self, node_id_dict: Dict[int, str]) -> Dict[int, BaseNode]:
+        """Get node dict from docstore given a mapping of index to node ids.
+
+        Args:
+            node_id_dict (Dict[int, str]): mapping of index to node ids
+
+        """
+        nodes = self.get_nodes(list(node_id_dict.values()))
+        return dict(zip(node_id_dict.keys(), nodes))
 
     def get_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
         """Get the RefDocInfo for a given ref_doc_id."""
@@ -130,6 +421,20 @@ class KVDocumentStore(BaseDocumentStore):
         if not ref_doc_info:
             return None
 
+        return self._to_ref_doc_info(ref_doc_info)
+
+    async def aget_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
+        """Get the RefDocInfo for a given ref_doc_id."""
+        ref_doc_info = await self._kvstore.aget(
+            ref_doc_id, collection=self._ref_doc_collection
+        )
+        if not ref_doc_info:
+            return None
+
+        return self._to_ref_doc_info(ref_doc_info)
+
+    def _to_ref_doc_info(self, ref_doc_info: dict) -> RefDocInfo:
+        """Convert a stored ref doc info dict into a RefDocInfo."""
         # TODO: deprecated legacy support
         if "doc_ids" in ref_doc_info:
             ref_doc_info["node_ids"] = ref_doc_info.get("doc_ids", [])
@@ -167,6 +472,10 @@ class KVDocumentStore(BaseDocumentStore):
         """Check if document exists."""
         return self._kvstore.get(doc_id, self._node_collection) is not None
 
+    async def adocument_exists(self, doc_id: str) -> bool:
+        """Check if document exists."""
+        return await self._kvstore.aget(doc_id, self._node_collection) is not None
+
     def _remove_ref_doc_node(self, doc_id: str) -> None:
         """Helper function to remove node doc_id from ref_doc_collection."""
         metadata = self._kvstore.get(doc_id, collection=self._metadata_collection)
@@ -197,6 +506,40 @@ class KVDocumentStore(BaseDocumentStore):
 
             self._kvstore.delete(ref_doc_id, collection=self._metadata_collection)
 
+    async def _aremove_ref_doc_node(self, doc_id: str) -> None:
+        """Helper function to remove node doc_id from ref_doc_collection."""
+        metadata = await self._kvstore.aget(
+            doc_id, collection=self._metadata_collection
+        )
+        if metadata is None:
+            return
+
+        ref_doc_id = metadata.get("ref_doc_id", None)
+
+        if ref_doc_id is None:
+            return
+
+        ref_doc_info = await self._kvstore.aget(
+            ref_doc_id, collection=self._ref_doc_collection
+        )
+
+        if ref_doc_info is not None:
+            ref_doc_obj = RefDocInfo(**ref_doc_info)
+
+            ref_doc_obj.node_ids.remove(doc_id)
+
+            # delete ref_doc from collection if it has no more doc_ids
+            if len(ref_doc_obj.node_ids) > 0:
+                await self._kvstore.aput(
+                    ref_doc_id,
+                    ref_doc_obj.to_dict(),
+                    collection=self._ref_doc_collection,
+                )
+
+            await self._kvstore.adelete(
+                ref_doc_id, collection=self._metadata_collection
+            )
+
     def delete_document(
         self, doc_id: str, raise_error: bool = True, remove_ref_doc_node: bool = True
     ) -> None:
@@ -204,12 +547,29 @@ class KVDocumentStore(BaseDocumentStore):
         if remove_ref_doc_node:
             self._remove_ref_doc_node(doc_id)
 
+        self._evict_cached_nodes([doc_id])
         delete_success = self._kvstore.delete(doc_id, collection=self._node_collection)
         _ = self._kvstore.delete(doc_id, collection=self._metadata_collection)
 
         if not delete_success and raise_error:
             raise ValueError(f"doc_id {doc_id} not found.")
 
+    async def adelete_document(
+        self, doc_id: str, raise_error: bool = True, remove_ref_doc_node: bool = True
+    ) -> None:
+        """Delete a document from the store."""
+        if remove_ref_doc_node:
+            await self._aremove_ref_doc_node(doc_id)
+
+        self._evict_cached_nodes([doc_id])
+        delete_success = await self._kvstore.adelete(
+            doc_id, collection=self._node_collection
+        )
+        _ = await self._kvstore.adelete(doc_id, collection=self._metadata_collection)
+
+        if not delete_success and raise_error:
+            raise ValueError(f"doc_id {doc_id} not found.")
+
     def delete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
         """Delete a ref_doc and all it's associated nodes."""
         ref_doc_info = self.get_ref_doc_info(ref_doc_id)
@@ -219,17 +579,47 @@ class KVDocumentStore(BaseDocumentStore):
             else:
                 return
 
-        for doc_id in ref_doc_info.node_ids:
-            self.delete_document(doc_id, raise_error=False, remove_ref_doc_node=False)
+        self._evict_cached_nodes(ref_doc_info.node_ids)
+        self._kvstore.delete_many(
+            ref_doc_info.node_ids, collection=self._node_collection
+        )
+        self._kvstore.delete_many(
+            ref_doc_info.node_ids, collection=self._metadata_collection
+        )
 
         self._kvstore.delete(ref_doc_id, collection=self._metadata_collection)
         self._kvstore.delete(ref_doc_id, collection=self._ref_doc_collection)
 
+    async def adelete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
+        """Delete a ref_doc and all it's associated nodes."""
+        ref_doc_info = await self.aget_ref_doc_info(ref_doc_id)
+        if ref_doc_info is None:
+            if raise_error:
+                raise ValueError(f"ref_doc_id {ref_doc_id} not found.")
+            else:
+                return
+
+        self._evict_cached_nodes(ref_doc_info.node_ids)
+        await self._kvstore.adelete_many(
+            ref_doc_info.node_ids, collection=self._node_collection
+        )
+        await self._kvstore.adelete_many(
+            ref_doc_info.node_ids, collection=self._metadata_collection
+        )
+
+        await self._kvstore.adelete(ref_doc_id, collection=self._metadata_collection)
+        await self._kvstore.adelete(ref_doc_id, collection=self._ref_doc_collection)
+
     def set_document_hash(self, doc_id: str, doc_hash: str) -> None:
         """Set the hash for a given doc_id."""
         metadata = {"doc_hash": doc_hash}
         self._kvstore.put(doc_id, metadata, collection=self._metadata_collection)
 
+    async def aset_document_hash(self, doc_id: str, doc_hash: str) -> None:
+        """Set the hash for a given doc_id."""
+        metadata = {"doc_hash": doc_hash}
+        await self._kvstore.aput(doc_id, metadata, collection=self._metadata_collection)
+
     def get_document_hash(self, doc_id: str) -> Optional[str]:
         """Get the stored hash for a document, if it exists."""
         metadata = self._kvstore.get(doc_id, collection=self._metadata_collection)
@@ -237,3 +627,37 @@ class KVDocumentStore(BaseDocumentStore):
             return metadata.get("doc_hash", None)
         else:
             return None
+
+    async def aget_document_hash(self, doc_id: str) -> Optional[str]:
+        """Get the stored hash for a document, if it exists."""
+        metadata = await self._kvstore.aget(
+            doc_id, collection=self._metadata_collection
+        )
+        if metadata is not None:
+            return metadata.get("doc_hash", None)
+        else:
+            return None
+
+    def get_file_manifest(self) -> Dict[str, FileFingerprint]:
+        """Get a mapping of file path -> FileFingerprint for all loaded files."""
+        # constructed directly, from_dict is slow for large manifests
+        return {
+            file_path: FileFingerprint(**fingerprint)
+            for file_path, fingerprint in self._kvstore.get_all(
+                collection=self._file_manifest_collection
+            ).items()
+        }
+
+    def set_file_fingerprints(self, fingerprints: Dict[str, FileFingerprint]) -> None:
+        """Set the fingerprints of loaded files."""
+        self._kvstore.put_all(
+            [
+                (file_path, asdict(fingerprint))
+                for file_path, fingerprint in fingerprints.items()
+            ],
+            collection=self._file_manifest_collection,
+        )
+
+    def delete_file_fingerprints(self, file_paths: Sequence[str]) -> None:
+        """Delete the fingerprints of files."""
+        self._kvstore.delete_many(file_paths, collection=self._file_manifest_collection)
@@ -22,6 +22,7 @@ class SimpleDocumentStore(KVDocumentStore):
     Args:
         simple_kvstore (SimpleKVStore): simple key-value store
         namespace (str): namespace for the docstore
+        node_cache_size (Optional[int]): number of deserialized nodes to cache
 
     """
 
@@ -29,10 +30,11 @@ class SimpleDocumentStore(KVDocumentStore):
         self,
         simple_kvstore: Optional[SimpleKVStore] = None,
         namespace: Optional[str] = None,
+        node_cache_size: Optional[int] = None,
     ) -> None:
         """Init a SimpleDocumentStore."""
         simple_kvstore = simple_kvstore or SimpleKVStore()
-        super().__init__(simple_kvstore, namespace)
+        super().__init__(simple_kvstore, namespace, node_cache_size=node_cache_size)
 
     @classmethod
     def from_persist_dir(
@@ -40,6 +42,7 @@ class SimpleDocumentStore(KVDocumentStore):
         persist_dir: str = DEFAULT_PERSIST_DIR,
         namespace: Optional[str] = None,
         fs: Optional[fsspec.AbstractFileSystem] = None,
+        use_wal: Optional[bool] = None,
     ) -> "SimpleDocumentStore":
         """Create a SimpleDocumentStore from a persist directory.
 
@@ -47,13 +50,17 @@ class SimpleDocumentStore(KVDocumentStore):
             persist_dir (str): directory to persist the store
             namespace (Optional[str]): namespace for the docstore
             fs (Optional[fsspec.AbstractFileSystem]): filesystem to use
+            use_wal (Optional[bool]): whether to persist changes to a
+                write-ahead log; by default, only if the store already has one
 
         """
         if fs is not None:
             persist_path = concat_dirs(persist_dir, DEFAULT_PERSIST_FNAME)
         else:
             persist_path = os.path.join(persist_dir, DEFAULT_PERSIST_FNAME)
-        return cls.from_persist_path(persist_path, namespace=namespace, fs=fs)
+        return cls.from_persist_path(
+            persist_path, namespace=namespace, fs=fs, use_wal=use_wal
+        )
 
     @classmethod
     def from_persist_path(
@@ -61,6 +68,7 @@ class SimpleDocumentStore(KVDocumentStore):
         persist_path: str,
         namespace: Optional[str] = None,
         fs: Optional[fsspec.AbstractFileSystem] = None,
+        use_wal: Optional[bool] = None,
     ) -> "SimpleDocumentStore":
         """Create a SimpleDocumentStore from a persist path.
 
@@ -68,9 +76,13 @@ class SimpleDocumentStore(KVDocumentStore):
             persist_path (str): Path to persist the store
             namespace (Optional[str]): namespace for the docstore
             fs (Optional[fsspec.AbstractFileSystem]): filesystem to use
+            use_wal (Optional[bool]): whether to persist changes to a
+                write-ahead log; by default, only if the store already has one
 
         """
-        simple_kvstore = SimpleKVStore.from_persist_path(persist_path, fs=fs)
+        simple_kvstore = SimpleKVStore.from_persist_path(
+            persist_path, fs=fs, use_wal=use_wal
+        )
         return cls(simple_kvstore, namespace)
 
     def persist(
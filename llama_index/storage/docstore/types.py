@@ -1,7 +1,7 @@
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 import fsspec
 from dataclasses_json import DataClassJsonMixin
@@ -21,6 +21,16 @@ class RefDocInfo(DataClassJsonMixin):
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class FileFingerprint(DataClassJsonMixin):
+    """Dataclass to represent the state of a file when it was last loaded."""
+
+    mtime: float
+    size: int
+    hash: str
+    doc_ids: List[str] = field(default_factory=list)
+
+
 class BaseDocumentStore(ABC):
     # ===== Save/load =====
     def persist(
@@ -36,34 +46,61 @@ class BaseDocumentStore(ABC):
     def docs(self) -> Dict[str, BaseNode]:
         ...
 
+    def iter_docs(self) -> Iterator[BaseNode]:
+        """Iterate over all documents, deserializing them on demand."""
+        yield from self.docs.values()
+
     @abstractmethod
     def add_documents(
         self, docs: Sequence[BaseNode], allow_update: bool = True
     ) -> None:
         ...
 
+    async def aadd_documents(
+        self, docs: Sequence[BaseNode], allow_update: bool = True
+    ) -> None:
+        self.add_documents(docs, allow_update=allow_update)
+
     @abstractmethod
     def get_document(self, doc_id: str, raise_error: bool = True) -> Optional[BaseNode]:
         ...
 
+    async def aget_document(
+        self, doc_id: str, raise_error: bool = True
+    ) -> Optional[BaseNode]:
+        return self.get_document(doc_id, raise_error=raise_error)
+
     @abstractmethod
     def delete_document(self, doc_id: str, raise_error: bool = True) -> None:
         """Delete a document from the store."""
         ...
 
+    async def adelete_document(self, doc_id: str, raise_error: bool = True) -> None:
+        """Delete a document from the store."""
+        self.delete_document(doc_id, raise_error=raise_error)
+
     @abstractmethod
     def document_exists(self, doc_id: str) -> bool:
         ...
 
+    async def adocument_exists(self, doc_id: str) -> bool:
+        return self.document_exists(doc_id)
+
     # ===== Hash =====
     @abstractmethod
     def set_document_hash(self, doc_id: str, doc_hash: str) -> None:
         ...
 
+    async def aset_document_hash(self, doc_id: str, doc_hash: str) -> None:
+        self.set_document_hash(doc_id, doc_hash)
+
     @abstractmethod
     def get_document_hash(self, doc_id: str) -> Optional[str]:
         ...
 
+    async def aget_document_hash(self, doc_id: str) -> Optional[str]:
+        return self.get_document_hash(doc_id)
+
     # ==== Ref Docs =====
     @abstractmethod
     def get_all_ref_doc_info(self) -> Optional[Dict[str, RefDocInfo]]:
@@ -73,10 +110,31 @@ class BaseDocumentStore(ABC):
     def get_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
         """Get the RefDocInfo for a given ref_doc_id."""
 
+    async def aget_ref_doc_info(self, ref_doc_id: str) -> Optional[RefDocInfo]:
+        """Get the RefDocInfo for a given ref_doc_id."""
+        return self.get_ref_doc_info(ref_doc_id)
+
     @abstractmethod
     def delete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
         """Delete a ref_doc and all it's associated nodes."""
 
+    async def adelete_ref_doc(self, ref_doc_id: str, raise_error: bool = True) -> None:
+        """Delete a ref_doc and all it's associated nodes."""
+        self.delete_ref_doc(ref_doc_id, raise_error=raise_error)
+
+    # ===== File manifest =====
+    @abstractmethod
+    def get_file_manifest(self) -> Dict[str, FileFingerprint]:
+        """Get a mapping of file path -> FileFingerprint for all loaded files."""
+
+    @abstractmethod
+    def set_file_fingerprints(self, fingerprints: Dict[str, FileFingerprint]) -> None:
+        """Set the fingerprints of loaded files."""
+
+    @abstractmethod
+    def delete_file_fingerprints(self, file_paths: Sequence[str]) -> None:
+        """Delete the fingerprints of files."""
+
     # ===== Nodes =====
     def get_nodes(
         self, node_ids: List[str], raise_error: bool = True
@@ -90,6 +148,21 @@ class BaseDocumentStore(ABC):
         """
         return [self.get_node(node_id, raise_error=raise_error) for node_id in node_ids]
 
+    async def aget_nodes(
+        self, node_ids: List[str], raise_error: bool = True
+    ) -> List[BaseNode]:
+        """Get nodes from docstore.
+
+        Args:
+            node_ids (List[str]): node ids
+            raise_error (bool): raise error if node_id not found
+
+        """
+        return [
+            await self.aget_node(node_id, raise_error=raise_error)
+            for node_id in node_ids
+        ]
+
     def get_node(self, node_id: str, raise_error: bool = True) -> BaseNode:
         """Get node from docstore.
 
@@ -103,6 +176,19 @@ class BaseDocumentStore(ABC):
             raise ValueError(f"Document {node_id} is not a Node.")
         return doc
 
+    async def aget_node(self, node_id: str, raise_error: bool = True) -> BaseNode:
+        """Get node from docstore.
+
+        Args:
+            node_id (str): node id
+            raise_error (bool): raise error if node_id not found
+
+        """
+        doc = await self.aget_document(node_id, raise_error=raise_error)
+        if not isinstance(doc, BaseNode):
+            raise ValueError(f"Document {node_id} is not a Node.")
+        return doc
+
     def get_node_dict(self, node_id_dict: Dict[int, str]) -> Dict[int, BaseNode]:
         """Get node dict from docstore given a mapping of index to node ids.
 
@@ -1,3 +1,5 @@
+from typing import Any, Dict, Mapping, Type
+
 from llama_index.constants import DATA_KEY, TYPE_KEY
 from llama_index.schema import (
     BaseNode,
@@ -5,10 +7,22 @@ from llama_index.schema import (
     ImageNode,
     IndexNode,
     NodeRelationship,
+    ObjectType,
     RelatedNodeInfo,
+    RelatedNodeType,
     TextNode,
 )
 
+NODE_TYPES: Dict[str, Type[TextNode]] = {
+    Document.get_type(): Document,
+    TextNode.get_type(): TextNode,
+    ImageNode.get_type(): ImageNode,
+    IndexNode.get_type(): IndexNode,
+}
+# str enums hash like their values, so these map both values and members
+_NODE_RELATIONSHIPS = {member.value: member for member in NodeRelationship}
+_OBJECT_TYPES = {member.value: member for member in ObjectType}
+
 
 def doc_to_json(doc: BaseNode) -> dict:
     return {
@@ -17,29 +31,73 @@ def doc_to_json(doc: BaseNode) -> dict:
     }
 
 
-def json_to_doc(doc_dict: dict) -> BaseNode:
+def json_to_doc(doc_dict: Mapping[str, Any], validate: bool = True) -> BaseNode:
+    """Load a node from its JSON representation.
+
+    Args:
+        doc_dict (Mapping[str, Any]): JSON representation from `doc_to_json`
+        validate (bool): whether to validate the data and recompute the node
+            hash. Only skip this for data written by `doc_to_json`, e.g. nodes
+            loaded from a docstore.
+
+    """
     doc_type = doc_dict[TYPE_KEY]
     data_dict = doc_dict[DATA_KEY]
-    doc: BaseNode
 
     if "extra_info" in data_dict:
         return legacy_json_to_doc(doc_dict)
     else:
-        if doc_type == Document.get_type():
-            doc = Document.parse_obj(data_dict)
-        elif doc_type == TextNode.get_type():
-            doc = TextNode.parse_obj(data_dict)
-        elif doc_type == ImageNode.get_type():
-            doc = ImageNode.parse_obj(data_dict)
-        elif doc_type == IndexNode.get_type():
-            doc = IndexNode.parse_obj(data_dict)
-        else:
+        if doc_type not in NODE_TYPES:
             raise ValueError(f"Unknown doc type: {doc_type}")
+        node_cls = NODE_TYPES[doc_type]
+        # the stored hash is trusted, data without one is validated
+        if validate or not data_dict.get("hash", None):
+            return node_cls.parse_obj(data_dict)
+        return _construct_node(node_cls, data_dict)
 
-        return doc
+
+def _construct_related_node_info(data: Mapping[str, Any]) -> RelatedNodeInfo:
+    node_type = data.get("node_type", None)
+    return RelatedNodeInfo.construct(
+        node_id=data["node_id"],
+        node_type=_OBJECT_TYPES[node_type] if node_type is not None else None,
+        metadata=dict(data.get("metadata", None) or {}),
+        hash=data.get("hash", None),
+    )
+
+
+def _construct_node(node_cls: Type[TextNode], data: Mapping[str, Any]) -> TextNode:
+    """Create a node from trusted data without pydantic validation.
+
+    Containers are copied so the node does not share them with the store, as
+    `parse_obj` would, and relationships are converted to `RelatedNodeInfo`.
+    """
+    values = {key: val for key, val in data.items() if key in node_cls.__fields__}
+    for key in (
+        "metadata",
+        "excluded_embed_metadata_keys",
+        "excluded_llm_metadata_keys",
+    ):
+        if values.get(key, None) is not None:
+            values[key] = values[key].copy()
+    if values.get("embedding", None) is not None:
+        values["embedding"] = list(values["embedding"])
+
+    relationships: Dict[NodeRelationship, RelatedNodeType] = {}
+    for relationship, related in (values.get("relationships", None) or {}).items():
+        if isinstance(related, list):
+            relationships[_NODE_RELATIONSHIPS[relationship]] = [
+                _construct_related_node_info(info) for info in related
+            ]
+        else:
+            relationships[
+                _NODE_RELATIONSHIPS[relationship]
+            ] = _construct_related_node_info(related)
+    values["relationships"] = relationships
+    return node_cls.construct(**values)
 
 
-def legacy_json_to_doc(doc_dict: dict) -> BaseNode:
+def legacy_json_to_doc(doc_dict: Mapping[str, Any]) -> BaseNode:
     """Todo: Deprecated legacy support for old node versions."""
     doc_type = doc_dict[TYPE_KEY]
     data_dict = doc_dict[DATA_KEY]
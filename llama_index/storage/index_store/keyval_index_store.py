@@ -37,6 +37,17 @@ class KVIndexStore(BaseIndexStore):
         data = index_struct_to_json(index_struct)
         self._kvstore.put(key, data, collection=self._collection)
 
+    async def aadd_index_struct(self, index_struct: IndexStruct) -> None:
+        """Add an index struct.
+
+        Args:
+            index_struct (IndexStruct): index struct
+
+        """
+        key = index_struct.index_id
+        data = index_struct_to_json(index_struct)
+        await self._kvstore.aput(key, data, collection=self._collection)
+
     def delete_index_struct(self, key: str) -> None:
         """Delete an index struct.
 
@@ -46,6 +57,15 @@ class KVIndexStore(BaseIndexStore):
         """
         self._kvstore.delete(key, collection=self._collection)
 
+    async def adelete_index_struct(self, key: str) -> None:
+        """Delete an index struct.
+
+        Args:
+            key (str): index struct key
+
+        """
+        await self._kvstore.adelete(key, collection=self._collection)
+
     def get_index_struct(
         self, struct_id: Optional[str] = None
     ) -> Optional[IndexStruct]:
@@ -65,6 +85,25 @@ class KVIndexStore(BaseIndexStore):
                 return None
             return json_to_index_struct(json)
 
+    async def aget_index_struct(
+        self, struct_id: Optional[str] = None
+    ) -> Optional[IndexStruct]:
+        """Get an index struct.
+
+        Args:
+            struct_id (Optional[str]): index struct id
+
+        """
+        if struct_id is None:
+            structs = await self.aindex_structs()
+            assert len(structs) == 1
+            return structs[0]
+        else:
+            json = await self._kvstore.aget(struct_id, collection=self._collection)
+            if json is None:
+                return None
+            return json_to_index_struct(json)
+
     def index_structs(self) -> List[IndexStruct]:
         """Get all index structs.
 
@@ -74,3 +113,13 @@ class KVIndexStore(BaseIndexStore):
         """
         jsons = self._kvstore.get_all(collection=self._collection)
         return [json_to_index_struct(json) for json in jsons.values()]
+
+    async def aindex_structs(self) -> List[IndexStruct]:
+        """Get all index structs.
+
+        Returns:
+            List[IndexStruct]: index structs
+
+        """
+        jsons = await self._kvstore.aget_all(collection=self._collection)
+        return [json_to_index_struct(json) for json in jsons.values()]
@@ -16,20 +16,34 @@ class BaseIndexStore(ABC):
     def index_structs(self) -> List[IndexStruct]:
         pass
 
+    async def aindex_structs(self) -> List[IndexStruct]:
+        return self.index_structs()
+
     @abstractmethod
     def add_index_struct(self, index_struct: IndexStruct) -> None:
         pass
 
+    async def aadd_index_struct(self, index_struct: IndexStruct) -> None:
+        self.add_index_struct(index_struct)
+
     @abstractmethod
     def delete_index_struct(self, key: str) -> None:
         pass
 
+    async def adelete_index_struct(self, key: str) -> None:
+        self.delete_index_struct(key)
+
     @abstractmethod
     def get_index_struct(
         self, struct_id: Optional[str] = None
     ) -> Optional[IndexStruct]:
         pass
 
+    async def aget_index_struct(
+        self, struct_id: Optional[str] = None
+    ) -> Optional[IndexStruct]:
+        return self.get_index_struct(struct_id)
+
     def persist(
         self,
         persist_path: str = DEFAULT_PERSIST_PATH,
@@ -2,9 +2,13 @@ from __future__ import annotations
 
 import os
 from decimal import Decimal
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Sequence, Set, Tuple
 
-from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
+from llama_index.storage.kvstore.types import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_COLLECTION,
+    BaseKVStore,
+)
 
 IMPORT_ERROR_MSG = "`boto3` package not found, please run `pip install boto3`"
 
@@ -116,6 +120,34 @@ class DynamoDBKVStore(BaseKVStore):
         item[self._key_range] = key
         self._table.put_item(Item=item)
 
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Put key-value pairs into the store with BatchWriteItem requests.
+
+        The batch writer sends up to 25 items per request (the DynamoDB limit)
+        and resends unprocessed items, so `batch_size` is not used.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+            batch_size (int): unused
+        """
+        # later writes to the same key win, as with repeated `put` calls
+        items = {}
+        for key, val in kv_pairs:
+            item = {k: convert_float_to_decimal(v) for k, v in val.items()}
+            item[self._key_hash] = collection
+            item[self._key_range] = key
+            items[key] = item
+
+        with self._table.batch_writer() as batch:
+            for item in items.values():
+                batch.put_item(Item=item)
+
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> dict | None:
         """Get a value from the store.
 
@@ -178,3 +210,23 @@ class DynamoDBKVStore(BaseKVStore):
             return False
         else:
             return len(item) > 0
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple keys from the store with BatchWriteItem requests.
+
+        BatchWriteItem does not report whether an item existed, so this
+        returns the number of distinct keys deleted.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        with self._table.batch_writer() as batch:
+            for key in unique_keys:
+                batch.delete_item(
+                    Key={self._key_hash: collection, self._key_range: key}
+                )
+        return len(unique_keys)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
 
@@ -12,6 +12,8 @@ IMPORT_ERROR_MSG = (
     "`firestore` package not found, please run `pip3 install google-cloud-firestore`"
 )
 USER_AGENT = "LlamaIndex"
+# maximum number of writes in a Firestore batch
+MAX_BATCH_WRITES = 500
 DEFAULT_FIRESTORE_DATABASE = "(default)"
 
 
@@ -77,6 +79,28 @@ class FirestoreKVStore(BaseKVStore):
         doc = self._db.collection(collection_id).document(key)
         doc.set(val, merge=True)
 
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = MAX_BATCH_WRITES,
+    ) -> None:
+        """Put key-value pairs into the Firestore collection with batched writes.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+            batch_size (int): number of writes per batch, at most 500
+        """
+        collection_id = self.firestore_collection(collection)
+        batch_size = min(batch_size, MAX_BATCH_WRITES)
+        for i in range(0, len(kv_pairs), batch_size):
+            batch = self._db.batch()
+            for key, val in kv_pairs[i : i + batch_size]:
+                doc = self._db.collection(collection_id).document(key)
+                batch.set(doc, self.replace_field_name_set(val), merge=True)
+            batch.commit()
+
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         """Get a key-value pair from the Firestore.
 
@@ -91,6 +115,25 @@ class FirestoreKVStore(BaseKVStore):
 
         return self.replace_field_name_get(result)
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get multiple key-value pairs from the Firestore in one request.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+        """
+        collection_id = self.firestore_collection(collection)
+        docs = [self._db.collection(collection_id).document(key) for key in keys]
+        found = {}
+        # snapshots are not returned in request order
+        for snapshot in self._db.get_all(docs):
+            result = snapshot.to_dict()
+            if result:
+                found[snapshot.id] = self.replace_field_name_get(result)
+        return [found.get(key, None) for key in keys]
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the Firestore collection.
 
@@ -117,3 +160,20 @@ class FirestoreKVStore(BaseKVStore):
         doc = self._db.collection(collection_id).document(key)
         doc.delete()
         return True
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple values from the Firestore with batched writes.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+        """
+        collection_id = self.firestore_collection(collection)
+        for i in range(0, len(keys), MAX_BATCH_WRITES):
+            batch = self._db.batch()
+            for key in keys[i : i + MAX_BATCH_WRITES]:
+                batch.delete(self._db.collection(collection_id).document(key))
+            batch.commit()
+        return len(keys)
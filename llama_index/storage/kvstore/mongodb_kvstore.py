@@ -1,8 +1,29 @@
-from typing import Any, Dict, Optional, cast
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
-from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
+from llama_index.storage.kvstore.types import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_COLLECTION,
+    BaseKVStore,
+)
 
 IMPORT_ERROR_MSG = "`pymongo` package not found, please run `pip install pymongo`"
+ASYNC_IMPORT_ERROR_MSG = "`motor` package not found, please run `pip install motor`"
+
+logger = logging.getLogger(__name__)
+
+
+def _get_async_mongo_client_cls() -> Optional[Any]:
+    """Get the motor client class if motor is installed."""
+    try:
+        from motor.motor_asyncio import AsyncIOMotorClient
+    except ImportError:
+        logger.debug(ASYNC_IMPORT_ERROR_MSG)
+        return None
+    return AsyncIOMotorClient
 
 
 class MongoDBKVStore(BaseKVStore):
@@ -14,6 +35,15 @@ class MongoDBKVStore(BaseKVStore):
         host (Optional[str]): MongoDB host
         port (Optional[int]): MongoDB port
         db_name (Optional[str]): MongoDB database name
+        async_mongo_client (Optional[Any]): motor client used by the async
+            methods. It is bound to the event loop it is used in, so only pass
+            one when the async methods always run in the same event loop.
+            Without one, a motor client is created per event loop from the URI
+            or the host and port, or if motor is not installed, the async
+            methods use the sync client and block the event loop.
+
+    Motor clients created per event loop are closed by `aclose`, or once their
+    event loop is closed when a client is created for another event loop.
 
     """
 
@@ -24,6 +54,7 @@ class MongoDBKVStore(BaseKVStore):
         host: Optional[str] = None,
         port: Optional[int] = None,
         db_name: Optional[str] = None,
+        async_mongo_client: Optional[Any] = None,
     ) -> None:
         """Init a MongoDBKVStore."""
         try:
@@ -40,6 +71,59 @@ class MongoDBKVStore(BaseKVStore):
         self._db_name = db_name or "db_docstore"
         self._db = self._client[self._db_name]
 
+        self._async_client = async_mongo_client
+        self._async_client_args: Optional[Tuple[Any, ...]] = None
+        self._async_client_cls: Optional[Any] = None
+        if async_mongo_client is None and (uri is not None or host is not None):
+            self._async_client_args = (uri,) if uri is not None else (host, port)
+            self._async_client_cls = _get_async_mongo_client_cls()
+        # motor clients are bound to the event loop they are used in
+        self._async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
+        self._warned_sync_fallback = False
+
+    def _get_async_db(self) -> Optional[Any]:
+        """Get the motor database of the running event loop, if any."""
+        if self._async_client is not None:
+            return self._async_client[self._db_name]
+        if self._async_client_cls is None or self._async_client_args is None:
+            if not self._warned_sync_fallback:
+                logger.warning(
+                    "MongoDBKVStore has no motor client, its async methods use "
+                    "the sync client and block the event loop."
+                )
+                self._warned_sync_fallback = True
+            return None
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            async_client = self._async_clients.get(loop, None)
+            if async_client is None:
+                # motor clients keep their event loop alive, drop closed ones
+                closed_loops = [
+                    other_loop
+                    for other_loop in self._async_clients
+                    if other_loop.is_closed()
+                ]
+                for closed_loop in closed_loops:
+                    self._async_clients.pop(closed_loop).close()
+                async_client = self._async_client_cls(*self._async_client_args)
+                self._async_clients[loop] = async_client
+        return async_client[self._db_name]
+
+    async def aclose(self) -> None:
+        """Close the motor client created for the running event loop.
+
+        Motor clients are bound to an event loop, so call this before the loop
+        stops, e.g. at the end of the coroutine run by `asyncio.run`. A client
+        passed as `async_mongo_client` is left open.
+
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            async_client = self._async_clients.pop(loop, None)
+        if async_client is not None:
+            async_client.close()
+
     @classmethod
     def from_uri(
         cls,
@@ -115,6 +199,87 @@ class MongoDBKVStore(BaseKVStore):
             upsert=True,
         )
 
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Put key-value pairs into the store with bulk writes.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+            batch_size (int): number of pairs to write per bulk write
+
+        """
+        from pymongo import ReplaceOne
+
+        for i in range(0, len(kv_pairs), batch_size):
+            requests = []
+            for key, val in kv_pairs[i : i + batch_size]:
+                val = val.copy()
+                val["_id"] = key
+                requests.append(ReplaceOne({"_id": key}, val, upsert=True))
+            self._db[collection].bulk_write(requests)
+
+    async def aput(
+        self,
+        key: str,
+        val: dict,
+        collection: str = DEFAULT_COLLECTION,
+    ) -> None:
+        """Put a key-value pair into the store.
+
+        Args:
+            key (str): key
+            val (dict): value
+            collection (str): collection name
+
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            await super().aput(key, val, collection=collection)
+            return
+        val = val.copy()
+        val["_id"] = key
+        await adb[collection].replace_one(
+            {"_id": key},
+            val,
+            upsert=True,
+        )
+
+    async def aput_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Put key-value pairs into the store with bulk writes.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+            batch_size (int): number of pairs to write per bulk write
+
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            await super().aput_all(
+                kv_pairs, collection=collection, batch_size=batch_size
+            )
+            return
+
+        from pymongo import ReplaceOne
+
+        for i in range(0, len(kv_pairs), batch_size):
+            requests = []
+            for key, val in kv_pairs[i : i + batch_size]:
+                val = val.copy()
+                val["_id"] = key
+                requests.append(ReplaceOne({"_id": key}, val, upsert=True))
+            await adb[collection].bulk_write(requests)
+
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         """Get a value from the store.
 
@@ -129,6 +294,65 @@ class MongoDBKVStore(BaseKVStore):
             return result
         return None
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get values for multiple keys from the store with a single query.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if len(keys) == 0:
+            return []
+        results = self._db[collection].find({"_id": {"$in": list(keys)}})
+        found = {}
+        for result in results:
+            key = result.pop("_id")
+            found[key] = result
+        return [found.get(key, None) for key in keys]
+
+    async def aget(
+        self, key: str, collection: str = DEFAULT_COLLECTION
+    ) -> Optional[dict]:
+        """Get a value from the store.
+
+        Args:
+            key (str): key
+            collection (str): collection name
+
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            return await super().aget(key, collection=collection)
+        result = await adb[collection].find_one({"_id": key})
+        if result is not None:
+            result.pop("_id")
+            return result
+        return None
+
+    async def aget_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get values for multiple keys from the store with a single query.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            return await super().aget_many(keys, collection=collection)
+        if len(keys) == 0:
+            return []
+        found = {}
+        async for result in adb[collection].find({"_id": {"$in": list(keys)}}):
+            key = result.pop("_id")
+            found[key] = result
+        return [found.get(key, None) for key in keys]
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store.
 
@@ -143,6 +367,22 @@ class MongoDBKVStore(BaseKVStore):
             output[key] = result
         return output
 
+    async def aget_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        """Get all values from the store.
+
+        Args:
+            collection (str): collection name
+
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            return await super().aget_all(collection=collection)
+        output = {}
+        async for result in adb[collection].find():
+            key = result.pop("_id")
+            output[key] = result
+        return output
+
     def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
         """Delete a value from the store.
 
@@ -153,3 +393,50 @@ class MongoDBKVStore(BaseKVStore):
         """
         result = self._db[collection].delete_one({"_id": key})
         return result.deleted_count > 0
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple keys from the store with a single request.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if len(keys) == 0:
+            return 0
+        result = self._db[collection].delete_many({"_id": {"$in": list(keys)}})
+        return result.deleted_count
+
+    async def adelete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        """Delete a value from the store.
+
+        Args:
+            key (str): key
+            collection (str): collection name
+
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            return await super().adelete(key, collection=collection)
+        result = await adb[collection].delete_one({"_id": key})
+        return result.deleted_count > 0
+
+    async def adelete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple keys from the store with a single request.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        adb = self._get_async_db()
+        if adb is None:
+            return await super().adelete_many(keys, collection=collection)
+        if len(keys) == 0:
+            return 0
+        result = await adb[collection].delete_many({"_id": {"$in": list(keys)}})
+        return result.deleted_count
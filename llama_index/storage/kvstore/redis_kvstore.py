@@ -1,9 +1,33 @@
+import asyncio
 import json
-from typing import Any, Dict, Optional, cast
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
-from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseKVStore
+from llama_index.storage.kvstore.types import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_COLLECTION,
+    BaseKVStore,
+)
 
 IMPORT_ERROR_MSG = "`redis` package not found, please run `pip install redis`"
+ASYNC_IMPORT_ERROR_MSG = (
+    "`redis.asyncio` not found, please run `pip install -U redis` "
+    "(redis>=4.2.0) to use the async redis client"
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _get_async_redis_cls() -> Optional[Any]:
+    """Get the async redis client class if redis.asyncio is available."""
+    try:
+        from redis.asyncio import Redis as AsyncRedis
+    except ImportError:
+        logger.debug(ASYNC_IMPORT_ERROR_MSG)
+        return None
+    return AsyncRedis
 
 
 class RedisKVStore(BaseKVStore):
@@ -11,8 +35,18 @@ class RedisKVStore(BaseKVStore):
 
     Args:
         redis_client (Any): Redis client
+        async_redis_client (Any): `redis.asyncio` client used by the async methods.
+            It is bound to the event loop it is used in, so only pass one when
+            the async methods always run in the same event loop. Without one,
+            an async client is created per event loop from `redis_url`. With
+            only an injected `redis_client`, the async methods use it and block
+            the event loop.
         redis_url (Optional[str]): Redis server URI
 
+    Async clients created per event loop are closed by `aclose`. Clients of
+    event loops that were closed without it are dropped when a client is
+    created for another event loop.
+
     Raises:
             ValueError: If redis-py is not installed
 
@@ -34,6 +68,9 @@ class RedisKVStore(BaseKVStore):
         except ImportError:
             raise ValueError(IMPORT_ERROR_MSG)
 
+        self._async_redis_client = kwargs.pop("async_redis_client", None)
+        self._async_redis_cls: Optional[Any] = None
+
         # user could inject customized redis client.
         # for instance, redis have specific TLS connection, etc.
         if "redis_client" in kwargs:
@@ -45,9 +82,72 @@ class RedisKVStore(BaseKVStore):
                 self._redis_client = Redis.from_url(redis_uri, **kwargs)
             except ValueError as e:
                 raise ValueError(f"Redis failed to connect: {e}")
+            if self._async_redis_client is None:
+                self._async_redis_cls = _get_async_redis_cls()
         else:
             raise ValueError("Either 'redis_client' or redis_url must be provided.")
 
+        self._redis_uri = redis_uri
+        self._redis_kwargs = kwargs
+        # async clients are bound to the event loop they are used in
+        self._async_redis_clients: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_redis_clients_lock = threading.Lock()
+        self._warned_sync_fallback = False
+
+    def _get_async_redis_client(self) -> Optional[Any]:
+        """Get the async client of the running event loop.
+
+        Without an async client (e.g. only a sync client was injected), the
+        async methods fall back to the sync client.
+        """
+        if self._async_redis_client is not None:
+            return self._async_redis_client
+        if self._async_redis_cls is None:
+            if not self._warned_sync_fallback:
+                logger.warning(
+                    "RedisKVStore has no async redis client, its async methods "
+                    "use the sync client and block the event loop."
+                )
+                self._warned_sync_fallback = True
+            return None
+        loop = asyncio.get_running_loop()
+        with self._async_redis_clients_lock:
+            async_redis_client = self._async_redis_clients.get(loop, None)
+            if async_redis_client is None:
+                # clients keep their event loop alive through their connections.
+                # Those of closed loops cannot be awaited anymore, their sockets
+                # are closed once they are garbage collected.
+                closed_loops = [
+                    other_loop
+                    for other_loop in self._async_redis_clients
+                    if other_loop.is_closed()
+                ]
+                for closed_loop in closed_loops:
+                    del self._async_redis_clients[closed_loop]
+                async_redis_client = self._async_redis_cls.from_url(
+                    self._redis_uri, **self._redis_kwargs
+                )
+                self._async_redis_clients[loop] = async_redis_client
+        return async_redis_client
+
+    async def aclose(self) -> None:
+        """Close the async client created for the running event loop.
+
+        Async clients are bound to an event loop, so call this before the loop
+        stops, e.g. at the end of the coroutine run by `asyncio.run`. A client
+        passed as `async_redis_client` is left open.
+
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_redis_clients_lock:
+            async_redis_client = self._async_redis_clients.pop(loop, None)
+        if async_redis_client is not None:
+            # `close` is deprecated in favor of `aclose` since redis 5.0.1
+            close = getattr(async_redis_client, "aclose", async_redis_client.close)
+            await close()
+
     def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
         """Put a key-value pair into the store.
 
@@ -59,6 +159,71 @@ class RedisKVStore(BaseKVStore):
         """
         self._redis_client.hset(name=collection, key=key, value=json.dumps(val))
 
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Put key-value pairs into the store.
+
+        Pairs are sent through a pipeline, one round trip per batch.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+            batch_size (int): number of pairs to send per round trip
+
+        """
+        for i in range(0, len(kv_pairs), batch_size):
+            with self._redis_client.pipeline(transaction=False) as pipe:
+                for key, val in kv_pairs[i : i + batch_size]:
+                    pipe.hset(name=collection, key=key, value=json.dumps(val))
+                pipe.execute()
+
+    async def aput(
+        self, key: str, val: dict, collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Put a key-value pair into the store.
+
+        Args:
+            key (str): key
+            val (dict): value
+            collection (str): collection name
+
+        """
+        async_redis_client = self._get_async_redis_client()
+        if async_redis_client is None:
+            await super().aput(key, val, collection=collection)
+            return
+        await async_redis_client.hset(name=collection, key=key, value=json.dumps(val))
+
+    async def aput_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Put key-value pairs into the store.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+            batch_size (int): number of pairs to send per round trip
+
+        """
+        async_redis_client = self._get_async_redis_client()
+        if async_redis_client is None:
+            await super().aput_all(
+                kv_pairs, collection=collection, batch_size=batch_size
+            )
+            return
+        for i in range(0, len(kv_pairs), batch_size):
+            async with async_redis_client.pipeline(transaction=False) as pipe:
+                for key, val in kv_pairs[i : i + batch_size]:
+                    pipe.hset(name=collection, key=key, value=json.dumps(val))
+                await pipe.execute()
+
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         """Get a value from the store.
 
@@ -72,6 +237,61 @@ class RedisKVStore(BaseKVStore):
             return None
         return json.loads(val_str)
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get values for multiple keys from the store in one round trip.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if len(keys) == 0:
+            return []
+        val_strs = self._redis_client.hmget(collection, list(keys))
+        return [
+            json.loads(val_str) if val_str is not None else None for val_str in val_strs
+        ]
+
+    async def aget(
+        self, key: str, collection: str = DEFAULT_COLLECTION
+    ) -> Optional[dict]:
+        """Get a value from the store.
+
+        Args:
+            key (str): key
+            collection (str): collection name
+
+        """
+        async_redis_client = self._get_async_redis_client()
+        if async_redis_client is None:
+            return await super().aget(key, collection=collection)
+        val_str = await async_redis_client.hget(name=collection, key=key)
+        if val_str is None:
+            return None
+        return json.loads(val_str)
+
+    async def aget_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get values for multiple keys from the store in one round trip.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        async_redis_client = self._get_async_redis_client()
+        if async_redis_client is None:
+            return await super().aget_many(keys, collection=collection)
+        if len(keys) == 0:
+            return []
+        val_strs = await async_redis_client.hmget(collection, list(keys))
+        return [
+            json.loads(val_str) if val_str is not None else None for val_str in val_strs
+        ]
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store."""
         collection_kv_dict = {}
@@ -80,6 +300,17 @@ class RedisKVStore(BaseKVStore):
             collection_kv_dict[key.decode()] = value
         return collection_kv_dict
 
+    async def aget_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        """Get all values from the store."""
+        async_redis_client = self._get_async_redis_client()
+        if async_redis_client is None:
+            return await super().aget_all(collection=collection)
+        collection_kv_dict = {}
+        async for key, val_str in async_redis_client.hscan_iter(name=collection):
+            value = dict(json.loads(val_str))
+            collection_kv_dict[key.decode()] = value
+        return collection_kv_dict
+
     def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
         """Delete a value from the store.
 
@@ -91,6 +322,51 @@ class RedisKVStore(BaseKVStore):
         deleted_num = self._redis_client.hdel(collection, key)
         return bool(deleted_num > 0)
 
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple keys from the store in one round trip.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        if len(keys) == 0:
+            return 0
+        return int(self._redis_client.hdel(collection, *keys))
+
+    async def adelete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        """Delete a value from the store.
+
+        Args:
+            key (str): key
+            collection (str): collection name
+
+        """
+        async_redis_client = self._get_async_redis_client()
+        if async_redis_client is None:
+            return await super().adelete(key, collection=collection)
+        deleted_num = await async_redis_client.hdel(collection, key)
+        return bool(deleted_num > 0)
+
+    async def adelete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple keys from the store in one round trip.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        """
+        async_redis_client = self._get_async_redis_client()
+        if async_redis_client is None:
+            return await super().adelete_many(keys, collection=collection)
+        if len(keys) == 0:
+            return 0
+        return int(await async_redis_client.hdel(collection, *keys))
+
     @classmethod
     def from_host_and_port(
         cls,
@@ -107,10 +383,13 @@ class RedisKVStore(BaseKVStore):
         return cls(redis_uri=url)
 
     @classmethod
-    def from_redis_client(cls, redis_client: Any) -> "RedisKVStore":
+    def from_redis_client(
+        cls, redis_client: Any, async_redis_client: Optional[Any] = None
+    ) -> "RedisKVStore":
         """Load a RedisKVStore from a Redis Client.
 
         Args:
             redis_client (Redis): Redis client
+            async_redis_client (Optional[redis.asyncio.Redis]): async Redis client
         """
-        return cls(redis_client=redis_client)
+        return cls(redis_client=redis_client, async_redis_client=async_redis_client)
@@ -1,36 +1,160 @@
+import hashlib
 import json
 import logging
 import os
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 import fsspec
+from fsspec.implementations.local import LocalFileSystem
 
-from llama_index.storage.kvstore.types import DEFAULT_COLLECTION, BaseInMemoryKVStore
+from llama_index.storage.kvstore.types import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_COLLECTION,
+    BaseInMemoryKVStore,
+)
+
+try:
+    import orjson
+
+    ORJSON_INSTALLED = True
+except ImportError:
+    ORJSON_INSTALLED = False
 
 logger = logging.getLogger(__name__)
 
 DATA_TYPE = Dict[str, Dict[str, dict]]
 
+WAL_SUFFIX = ".wal"
+DEFAULT_WAL_COMPACTION_THRESHOLD = 1000
+
+
+def get_wal_path(persist_path: str) -> str:
+    """Get the path of the write-ahead log next to a snapshot."""
+    return f"{persist_path}{WAL_SUFFIX}"
+
+
+def _snapshot_digest(snapshot: bytes) -> str:
+    """Get the digest a write-ahead log uses to name the snapshot it extends."""
+    return hashlib.blake2b(snapshot, digest_size=16).hexdigest()
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to JSON, with orjson if installed.
+
+    Both produce the same file format, so stores remain loadable either way.
+    Values orjson cannot serialize fall back to the standard library.
+    """
+    if ORJSON_INSTALLED:
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+    return json.dumps(data).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize JSON, with orjson if installed."""
+    if ORJSON_INSTALLED:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN written by the standard library
+            pass
+    return json.loads(data)
+
+
+class _CollectionView(Mapping[str, Mapping[str, Any]]):
+    """Live read-only view of a collection, wrapping values without copying."""
+
+    def __init__(self, data: DATA_TYPE, collection: str) -> None:
+        self._data = data
+        self._collection = collection
+
+    def __getitem__(self, key: str) -> Mapping[str, Any]:
+        return MappingProxyType(self._data.get(self._collection, {})[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data.get(self._collection, {}))
+
+    def __len__(self) -> int:
+        return len(self._data.get(self._collection, {}))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data.get(self._collection, {})
+
 
 class SimpleKVStore(BaseInMemoryKVStore):
     """Simple in-memory Key-Value store.
 
+    By default `persist` writes the whole store as one JSON snapshot. With
+    `use_wal` set, only the keys changed since the last persist are appended to
+    a write-ahead log next to the snapshot (`<persist_path>.wal`), so persist
+    cost scales with the changes instead of the store size. The log is
+    compacted into a new snapshot once it holds more records than both
+    `wal_compaction_threshold` and the number of keys in the store.
+
+    Snapshots are written to a temporary file and renamed into place, so a
+    crash while persisting never leaves a partially written snapshot. The log
+    starts with a digest of the snapshot it extends, and a log that does not
+    match the snapshot (e.g. after a crash between writing a snapshot and
+    resetting the log) is ignored on load.
+
     Args:
         data (Optional[DATA_TYPE]): data to initialize the store with
+        use_wal (bool): whether to persist changes to a write-ahead log
+        wal_compaction_threshold (int): minimum number of log records before
+            the log is compacted into a snapshot
     """
 
     def __init__(
         self,
         data: Optional[DATA_TYPE] = None,
+        use_wal: bool = False,
+        wal_compaction_threshold: int = DEFAULT_WAL_COMPACTION_THRESHOLD,
     ) -> None:
         """Init a SimpleKVStore."""
         self._data: DATA_TYPE = data or {}
+        self._use_wal = use_wal
+        self._wal_compaction_threshold = wal_compaction_threshold
+        # (collection, key) pairs changed since the last persist, in order
+        self._wal_pending: Dict[Tuple[str, str], None] = {}
+        # snapshot path the write-ahead log currently belongs to
+        self._wal_persist_path: Optional[str] = None
+        self._wal_num_records = 0
+
+    @property
+    def use_wal(self) -> bool:
+        """Whether changes are persisted to a write-ahead log."""
+        return self._use_wal
+
+    def _mark_changed(self, key: str, collection: str) -> None:
+        if self._use_wal:
+            pending_key = (collection, key)
+            # move to the end, so the log keeps the order of the changes
+            self._wal_pending.pop(pending_key, None)
+            self._wal_pending[pending_key] = None
 
     def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
         """Put a key-value pair into the store."""
         if collection not in self._data:
             self._data[collection] = {}
         self._data[collection][key] = val.copy()
+        self._mark_changed(key, collection)
+
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Put key-value pairs into the store."""
+        collection_data = self._data.setdefault(collection, {})
+        for key, val in kv_pairs:
+            collection_data[key] = val.copy()
+            self._mark_changed(key, collection)
 
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         """Get a value from the store."""
@@ -41,40 +165,217 @@ class SimpleKVStore(BaseInMemoryKVStore):
             return None
         return collection_data[key].copy()
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get values for multiple keys from the store."""
+        collection_data = self._data.get(collection, {})
+        vals: List[Optional[dict]] = []
+        for key in keys:
+            val = collection_data.get(key, None)
+            vals.append(val.copy() if val is not None else None)
+        return vals
+
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         """Get all values from the store."""
         return self._data.get(collection, {}).copy()
 
+    def get_all_view(
+        self, collection: str = DEFAULT_COLLECTION
+    ) -> Mapping[str, Mapping[str, Any]]:
+        """Get a live read-only view of all values in a collection.
+
+        Unlike `get_all`, neither the collection nor its values are copied.
+        Values are wrapped in read-only mappings; nested containers are shared
+        with the store and must not be modified.
+
+        """
+        return _CollectionView(self._data, collection)
+
     def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
         """Delete a value from the store."""
         try:
             self._data[collection].pop(key)
-            return True
         except KeyError:
             return False
+        self._mark_changed(key, collection)
+        return True
+
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple keys from the store."""
+        collection_data = self._data.get(collection, {})
+        num_deleted = 0
+        for key in keys:
+            if collection_data.pop(key, None) is not None:
+                num_deleted += 1
+                self._mark_changed(key, collection)
+        return num_deleted
 
     def persist(
         self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
     ) -> None:
-        """Persist the store."""
+        """Persist the store.
+
+        With `use_wal` set, changes since the last persist to the same path are
+        appended to the write-ahead log. A full snapshot is written on the
+        first persist to a path, when the log needs compaction, and on
+        filesystems that do not support appending to files.
+
+        """
         fs = fs or fsspec.filesystem("file")
         dirpath = os.path.dirname(persist_path)
         if not fs.exists(dirpath):
             fs.makedirs(dirpath)
 
-        with fs.open(persist_path, "w") as f:
-            f.write(json.dumps(self._data))
+        if (
+            not self._use_wal
+            or not isinstance(fs, LocalFileSystem)
+            or persist_path != self._wal_persist_path
+            or not fs.exists(persist_path)
+        ):
+            self._write_snapshot(persist_path, fs)
+            return
+
+        if not self._wal_pending:
+            return
+        num_records = self._wal_num_records + len(self._wal_pending)
+        num_keys = sum(len(collection) for collection in self._data.values())
+        if num_records > max(self._wal_compaction_threshold, num_keys):
+            self._write_snapshot(persist_path, fs)
+            return
+
+        with fs.open(get_wal_path(persist_path), "ab") as f:
+            f.write(
+                b"".join(_json_dumps(record) + b"\n" for record in self._wal_records())
+            )
+        self._wal_num_records = num_records
+        self._wal_pending.clear()
+
+    def compact(
+        self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
+    ) -> None:
+        """Write a full snapshot of the store and drop its write-ahead log."""
+        fs = fs or fsspec.filesystem("file")
+        dirpath = os.path.dirname(persist_path)
+        if not fs.exists(dirpath):
+            fs.makedirs(dirpath)
+        self._write_snapshot(persist_path, fs)
+
+    def _wal_records(self) -> Iterator[dict]:
+        for collection, key in self._wal_pending:
+            val = self._data.get(collection, {}).get(key, None)
+            if val is None:
+                yield {"collection": collection, "key": key, "deleted": True}
+            else:
+                yield {"collection": collection, "key": key, "val": val}
+
+    def _write_snapshot(self, persist_path: str, fs: fsspec.AbstractFileSystem) -> None:
+        """Write the whole store to a temporary file and rename it into place.
+
+        The write-ahead log is reset (or removed, without `use_wal`) only after
+        the rename. Until then it names the previous snapshot, so a crash in
+        between leaves a stale log that is ignored on load.
+
+        """
+        snapshot = _json_dumps(self._data)
+        tmp_path = f"{persist_path}.tmp"
+        with fs.open(tmp_path, "wb") as f:
+            f.write(snapshot)
+        fs.mv(tmp_path, persist_path)
+
+        wal_path = get_wal_path(persist_path)
+        if self._use_wal and isinstance(fs, LocalFileSystem):
+            with fs.open(wal_path, "wb") as f:
+                f.write(_json_dumps({"snapshot": _snapshot_digest(snapshot)}) + b"\n")
+        elif fs.exists(wal_path):
+            fs.rm(wal_path)
+        self._wal_pending.clear()
+        self._wal_num_records = 0
+        self._wal_persist_path = persist_path if self._use_wal else None
 
     @classmethod
     def from_persist_path(
-        cls, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
+        cls,
+        persist_path: str,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+        use_wal: Optional[bool] = None,
     ) -> "SimpleKVStore":
-        """Load a SimpleKVStore from a persist path and filesystem."""
+        """Load a SimpleKVStore from a persist path and filesystem.
+
+        A write-ahead log next to the snapshot is replayed unless it belongs to
+        an older snapshot. If `use_wal` is None, the loaded store keeps using a
+        log only if one was found; otherwise the next persist folds the log
+        into a new snapshot. The next persist also writes a new snapshot if the
+        log was stale or ends in a truncated record, instead of appending to it.
+
+        """
         fs = fs or fsspec.filesystem("file")
         logger.debug(f"Loading {__name__} from {persist_path}.")
         with fs.open(persist_path, "rb") as f:
-            data = json.load(f)
-        return cls(data)
+            snapshot = f.read()
+        data = _json_loads(snapshot)
+
+        wal_path = get_wal_path(persist_path)
+        has_wal = fs.exists(wal_path)
+        num_records = (
+            cls._replay_wal(data, _snapshot_digest(snapshot), wal_path, fs)
+            if has_wal
+            else None
+        )
+
+        kvstore = cls(data, use_wal=has_wal if use_wal is None else use_wal)
+        if kvstore.use_wal and num_records is not None:
+            kvstore._wal_persist_path = persist_path
+            kvstore._wal_num_records = num_records
+        return kvstore
+
+    @staticmethod
+    def _replay_wal(
+        data: DATA_TYPE,
+        snapshot_digest: str,
+        wal_path: str,
+        fs: fsspec.AbstractFileSystem,
+    ) -> Optional[int]:
+        """Apply the records of a write-ahead log to data.
+
+        A log written for another snapshot is skipped. A truncated last record,
+        left by a crash while appending, is ignored.
+
+        Returns:
+            The number of records applied, or None if new records cannot be
+            appended to the log as it is.
+
+        """
+        with fs.open(wal_path, "rb") as f:
+            lines = f.read().split(b"\n")
+
+        num_records = 0
+        can_append = False
+        for i, line in enumerate(lines):
+            if not line:
+                continue
+            try:
+                record = _json_loads(line)
+            except json.JSONDecodeError:
+                if i == len(lines) - 1:
+                    logger.warning(f"Ignoring truncated record at end of {wal_path}.")
+                    return None
+                raise
+            if i == 0 and "snapshot" in record:
+                if record["snapshot"] != snapshot_digest:
+                    logger.warning(f"Ignoring {wal_path} of an older snapshot.")
+                    return None
+                can_append = True
+                continue
+            collection_data = data.setdefault(record["collection"], {})
+            if record.get("deleted", False):
+                collection_data.pop(record["key"], None)
+            else:
+                collection_data[record["key"]] = record["val"]
+            num_records += 1
+        return num_records if can_append else None
 
     def to_dict(self) -> dict:
         """Save the store as dict."""
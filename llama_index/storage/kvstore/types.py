@@ -1,30 +1,138 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import fsspec
 
 DEFAULT_COLLECTION = "data"
+DEFAULT_BATCH_SIZE = 100
 
 
 class BaseKVStore(ABC):
-    """Base key-value store."""
+    """Base key-value store.
+
+    The async methods default to calling their sync counterparts, which is
+    appropriate for in-memory stores. Stores backed by a remote service
+    override them with non-blocking implementations.
+    """
 
     @abstractmethod
     def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
         pass
 
+    def put_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Put key-value pairs into the store.
+
+        Stores backed by a remote service override this to write `batch_size`
+        pairs per round trip.
+
+        Args:
+            kv_pairs (Sequence[Tuple[str, dict]]): key-value pairs
+            collection (str): collection name
+            batch_size (int): number of pairs to write per request
+
+        """
+        for key, val in kv_pairs:
+            self.put(key, val, collection=collection)
+
+    async def aput(
+        self, key: str, val: dict, collection: str = DEFAULT_COLLECTION
+    ) -> None:
+        """Put a key-value pair into the store."""
+        self.put(key, val, collection=collection)
+
+    async def aput_all(
+        self,
+        kv_pairs: Sequence[Tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Put key-value pairs into the store."""
+        self.put_all(kv_pairs, collection=collection, batch_size=batch_size)
+
     @abstractmethod
     def get(self, key: str, collection: str = DEFAULT_COLLECTION) -> Optional[dict]:
         pass
 
+    def get_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get values for multiple keys from the store.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        Returns:
+            List[Optional[dict]]: values in the order of `keys`, None for
+                missing keys
+
+        """
+        return [self.get(key, collection=collection) for key in keys]
+
+    async def aget(
+        self, key: str, collection: str = DEFAULT_COLLECTION
+    ) -> Optional[dict]:
+        """Get a value from the store."""
+        return self.get(key, collection=collection)
+
+    async def aget_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> List[Optional[dict]]:
+        """Get values for multiple keys from the store."""
+        return self.get_many(keys, collection=collection)
+
     @abstractmethod
     def get_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
         pass
 
+    async def aget_all(self, collection: str = DEFAULT_COLLECTION) -> Dict[str, dict]:
+        """Get all values from the store."""
+        return self.get_all(collection=collection)
+
+    def get_all_view(
+        self, collection: str = DEFAULT_COLLECTION
+    ) -> Mapping[str, Mapping[str, Any]]:
+        """Get a read-only mapping of all values in a collection.
+
+        Callers must not modify the returned values. In-memory stores override
+        this to return a view of their data without copying it.
+        """
+        return self.get_all(collection=collection)
+
     @abstractmethod
     def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
         pass
 
+    def delete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple keys from the store.
+
+        Args:
+            keys (Sequence[str]): keys
+            collection (str): collection name
+
+        Returns:
+            int: number of keys that were deleted
+
+        """
+        return sum(self.delete(key, collection=collection) for key in keys)
+
+    async def adelete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        """Delete a value from the store."""
+        return self.delete(key, collection=collection)
+
+    async def adelete_many(
+        self, keys: Sequence[str], collection: str = DEFAULT_COLLECTION
+    ) -> int:
+        """Delete multiple keys from the store."""
+        return self.delete_many(keys, collection=collection)
+
 
 class BaseInMemoryKVStore(BaseKVStore):
     """Base in-memory key-value store."""
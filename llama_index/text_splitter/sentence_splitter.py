@@ -13,7 +13,7 @@ from llama_index.text_splitter.utils import (
     split_by_sentence_tokenizer,
     split_by_sep,
 )
-from llama_index.utils import globals_helper
+from llama_index.utils import count_tokens, globals_helper
 
 SENTENCE_CHUNK_OVERLAP = 200
 CHUNKING_REGEX = "[^,.;。？！]+[,.;。？！]?"
@@ -24,6 +24,7 @@ DEFAULT_PARAGRAPH_SEP = "\n\n\n"
 class _Split:
     text: str  # the split text
     is_sentence: bool  # save whether this is a full sentence
+    token_size: int  # number of tokens in the split text
 
 
 class SentenceSplitter(MetadataAwareTextSplitter):
@@ -118,7 +119,7 @@ class SentenceSplitter(MetadataAwareTextSplitter):
         return "SentenceSplitter"
 
     def split_text_metadata_aware(self, text: str, metadata_str: str) -> List[str]:
-        metadata_len = len(self.tokenizer(metadata_str))
+        metadata_len = self._token_size(metadata_str)
         effective_chunk_size = self.chunk_size - metadata_len
         if effective_chunk_size <= 0:
             raise ValueError(
@@ -159,7 +160,9 @@ class SentenceSplitter(MetadataAwareTextSplitter):
 
         return chunks
 
-    def _split(self, text: str, chunk_size: int) -> List[_Split]:
+    def _split(
+        self, text: str, chunk_size: int, token_size: Optional[int] = None
+    ) -> List[_Split]:
         r"""Break text into splits that are smaller than chunk size.
 
         The order of splitting is:
@@ -168,37 +171,53 @@ class SentenceSplitter(MetadataAwareTextSplitter):
         3. split by second chunking regex (default is "[^,\.;]+[,\.;]?")
         4. split by default separator (" ")
 
+        Each piece of text is tokenized once: the token size of a split is passed
+        down when it is split further, and kept on the split for merging.
+
         """
-        if self._token_size(text) <= chunk_size:
-            return [_Split(text, is_sentence=True)]
+        if token_size is None:
+            token_size = self._token_size(text)
+        if token_size <= chunk_size:
+            return [_Split(text, is_sentence=True, token_size=token_size)]
 
         text_splits_by_fns, is_sentence = self._get_splits_by_fns(text)
 
         text_splits = []
         for text_split_by_fns in text_splits_by_fns:
-            if self._token_size(text_split_by_fns) <= chunk_size:
-                text_splits.append(_Split(text_split_by_fns, is_sentence=is_sentence))
+            split_token_size = self._token_size(text_split_by_fns)
+            if split_token_size <= chunk_size:
+                text_splits.append(
+                    _Split(
+                        text_split_by_fns,
+                        is_sentence=is_sentence,
+                        token_size=split_token_size,
+                    )
+                )
             else:
                 recursive_text_splits = self._split(
-                    text_split_by_fns, chunk_size=chunk_size
+                    text_split_by_fns,
+                    chunk_size=chunk_size,
+                    token_size=split_token_size,
                 )
                 text_splits.extend(recursive_text_splits)
         return text_splits
 
     def _merge(self, splits: List[_Split], chunk_size: int) -> List[str]:
-        """Merge splits into chunks."""
+        """Merge splits into chunks.
+
+        Walks the splits once with an index cursor, using the token sizes computed
+        while splitting.
+        """
         chunks: List[str] = []
         cur_chunk: List[Tuple[str, int]] = []  # list of (text, length)
-        last_chunk: List[Tuple[str, int]] = []
         cur_chunk_len = 0
         new_chunk = True
 
         def close_chunk() -> None:
-            nonlocal chunks, cur_chunk, last_chunk, cur_chunk_len, new_chunk
+            nonlocal cur_chunk, cur_chunk_len, new_chunk
 
             chunks.append("".join([text for text, length in cur_chunk]))
             last_chunk = cur_chunk
-            cur_chunk = []
             cur_chunk_len = 0
             new_chunk = True
 
@@ -208,20 +227,20 @@ class SentenceSplitter(MetadataAwareTextSplitter):
             # in theory the correct thing to do would be to remove some/all of the
             # overlap. However, it would complicate the logic further without
             # much real world benefit, so it's not implemented now.
-            if len(last_chunk) > 0:
-                last_index = len(last_chunk) - 1
-                while (
-                    last_index >= 0
-                    and cur_chunk_len + last_chunk[last_index][1] <= self.chunk_overlap
-                ):
-                    text, length = last_chunk[last_index]
-                    cur_chunk_len += length
-                    cur_chunk.insert(0, (text, length))
-                    last_index -= 1
-
-        while len(splits) > 0:
-            cur_split = splits[0]
-            cur_split_len = len(self.tokenizer(cur_split.text))
+            overlap_start = len(last_chunk)
+            while (
+                overlap_start > 0
+                and cur_chunk_len + last_chunk[overlap_start - 1][1]
+                <= self.chunk_overlap
+            ):
+                cur_chunk_len += last_chunk[overlap_start - 1][1]
+                overlap_start -= 1
+            cur_chunk = last_chunk[overlap_start:]
+
+        split_idx = 0
+        while split_idx < len(splits):
+            cur_split = splits[split_idx]
+            cur_split_len = cur_split.token_size
             if cur_split_len > chunk_size:
                 raise ValueError("Single token exceeded chunk size")
             if cur_chunk_len + cur_split_len > chunk_size and not new_chunk:
@@ -236,7 +255,7 @@ class SentenceSplitter(MetadataAwareTextSplitter):
                     # add split to chunk
                     cur_chunk_len += cur_split_len
                     cur_chunk.append((cur_split.text, cur_split_len))
-                    splits.pop(0)
+                    split_idx += 1
                     new_chunk = False
                 else:
                     # close out chunk
@@ -263,7 +282,7 @@ class SentenceSplitter(MetadataAwareTextSplitter):
         return new_chunks
 
     def _token_size(self, text: str) -> int:
-        return len(self.tokenizer(text))
+        return count_tokens(text, self.tokenizer)
 
     def _get_splits_by_fns(self, text: str) -> Tuple[List[str], bool]:
         for split_fn in self._split_fns:
@@ -8,7 +8,7 @@ from llama_index.callbacks.schema import CBEventType, EventPayload
 from llama_index.constants import DEFAULT_CHUNK_OVERLAP, DEFAULT_CHUNK_SIZE
 from llama_index.text_splitter.types import MetadataAwareTextSplitter
 from llama_index.text_splitter.utils import split_by_char, split_by_sep
-from llama_index.utils import globals_helper
+from llama_index.utils import count_tokens, globals_helper
 
 _logger = logging.getLogger(__name__)
 
@@ -79,7 +79,7 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
 
     def split_text_metadata_aware(self, text: str, metadata_str: str) -> List[str]:
         """Split text into chunks, reserving space required for metadata str."""
-        metadata_len = len(self.tokenizer(metadata_str)) + DEFAULT_METADATA_FORMAT_LEN
+        metadata_len = self._token_size(metadata_str) + DEFAULT_METADATA_FORMAT_LEN
         effective_chunk_size = self.chunk_size - metadata_len
         if effective_chunk_size <= 0:
             raise ValueError(
@@ -102,6 +102,9 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
         """Split text into chunks."""
         return self._split_text(text, chunk_size=self.chunk_size)
 
+    def _token_size(self, text: str) -> int:
+        return count_tokens(text, self.tokenizer)
+
     def _split_text(self, text: str, chunk_size: int) -> List[str]:
         """Split text into chunks up to chunk_size."""
         if text == "":
@@ -129,7 +132,7 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
 
         NOTE: the splits contain the separators.
         """
-        if len(self.tokenizer(text)) <= chunk_size:
+        if self._token_size(text) <= chunk_size:
             return [text]
 
         for split_fn in self._split_fns:
@@ -139,7 +142,7 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
 
         new_splits = []
         for split in splits:
-            split_len = len(self.tokenizer(split))
+            split_len = self._token_size(split)
             if split_len <= chunk_size:
                 new_splits.append(split)
             else:
@@ -161,7 +164,7 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
         cur_chunk: List[str] = []
         cur_len = 0
         for split in splits:
-            split_len = len(self.tokenizer(split))
+            split_len = self._token_size(split)
             if split_len > chunk_size:
                 _logger.warning(
                     f"Got a split of size {split_len}, ",
@@ -183,7 +186,7 @@ class TokenTextSplitter(MetadataAwareTextSplitter):
                 while cur_len > self.chunk_overlap or cur_len + split_len > chunk_size:
                     # pop off the first element
                     first_chunk = cur_chunk.pop(0)
-                    cur_len -= len(self.tokenizer(first_chunk))
+                    cur_len -= self._token_size(first_chunk)
 
             cur_chunk.append(split)
             cur_len += split_len
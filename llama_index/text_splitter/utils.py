@@ -1,5 +1,7 @@
 import logging
-from typing import Callable, List
+import re
+from functools import partial
+from typing import Any, Callable, List
 
 from llama_index.text_splitter.types import TextSplitter
 
@@ -19,17 +21,25 @@ def split_text_keep_separator(text: str, separator: str) -> List[str]:
     return [s for s in result if s]
 
 
+def _split_text(text: str, separator: str) -> List[str]:
+    return text.split(separator)
+
+
+# split functions are partials of module-level functions rather than closures,
+# so that text splitters can be pickled and sent to worker processes
+
+
 def split_by_sep(sep: str, keep_sep: bool = True) -> Callable[[str], List[str]]:
     """Split text by separator."""
     if keep_sep:
-        return lambda text: split_text_keep_separator(text, sep)
+        return partial(split_text_keep_separator, separator=sep)
     else:
-        return lambda text: text.split(sep)
+        return partial(_split_text, separator=sep)
 
 
 def split_by_char() -> Callable[[str], List[str]]:
     """Split text by character."""
-    return lambda text: list(text)
+    return list
 
 
 def split_by_sentence_tokenizer() -> Callable[[str], List[str]]:
@@ -59,31 +69,29 @@ def split_by_sentence_tokenizer() -> Callable[[str], List[str]]:
             )
 
     tokenizer = nltk.tokenize.PunktSentenceTokenizer()
+    return partial(_split_by_sentence_spans, tokenizer)
 
+
+def _split_by_sentence_spans(tokenizer: Any, text: str) -> List[str]:
     # get the spans and then return the sentences
     # using the start index of each span
     # instead of using end, use the start of the next span if available
-    def split(text: str) -> List[str]:
-        spans = list(tokenizer.span_tokenize(text))
-        sentences = []
-        for i, span in enumerate(spans):
-            start = span[0]
-            if i < len(spans) - 1:
-                end = spans[i + 1][0]
-            else:
-                end = len(text)
-            sentences.append(text[start:end])
-
-        return sentences
+    spans = list(tokenizer.span_tokenize(text))
+    sentences = []
+    for i, span in enumerate(spans):
+        start = span[0]
+        if i < len(spans) - 1:
+            end = spans[i + 1][0]
+        else:
+            end = len(text)
+        sentences.append(text[start:end])
 
-    return split
+    return sentences
 
 
 def split_by_regex(regex: str) -> Callable[[str], List[str]]:
     """Split text by regex."""
-    import re
-
-    return lambda text: re.findall(regex, text)
+    return partial(re.findall, regex)
 
 
 def split_by_phrase_regex() -> Callable[[str], List[str]]:
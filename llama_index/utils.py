@@ -1,16 +1,21 @@
 """General utils functions."""
 
 import asyncio
+import multiprocessing
 import os
 import random
 import sys
+import threading
 import time
 import traceback
 import uuid
+import weakref
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import partial, wraps
 from itertools import islice
+from multiprocessing.context import BaseContext
 from pathlib import Path
 from typing import (
     Any,
@@ -21,12 +26,153 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Set,
     Type,
     Union,
     cast,
 )
 
+DEFAULT_TOKEN_COUNT_CACHE_SIZE = 4096
+# longer texts are counted without being kept in the cache
+DEFAULT_MAX_CACHED_TEXT_LENGTH = 8192
+DEFAULT_TOKENIZER_NUM_THREADS = 8
+
+# modules imported once by the fork server instead of by every worker process
+_forkserver_preload_modules: Set[str] = set()
+
+
+class TokenizerService:
+    """Token counting on top of a tokenizer.
+
+    Token counts of repeated texts (e.g. prompt templates) are kept in an LRU
+    cache, so counting them again does not tokenize them again. Only counts are
+    cached, token lists are dropped as soon as they are counted.
+
+    Args:
+        tokenizer (Callable[[str], List]): Tokenizer to count tokens with.
+        batch_tokenizer (Optional[Callable[..., List[List]]]): Tokenizer taking a
+            list of texts and a `num_threads` keyword argument,
+            e.g. tiktoken's `encode_batch`. Used by `count_tokens_many`.
+        cache_size (int): Maximum number of token counts to cache.
+        max_cached_text_length (int): Texts longer than this are not cached.
+
+    """
+
+    def __init__(
+        self,
+        tokenizer: Callable[[str], List],
+        batch_tokenizer: Optional[Callable[..., List[List]]] = None,
+        cache_size: int = DEFAULT_TOKEN_COUNT_CACHE_SIZE,
+        max_cached_text_length: int = DEFAULT_MAX_CACHED_TEXT_LENGTH,
+    ) -> None:
+        self._tokenizer = tokenizer
+        self._batch_tokenizer = batch_tokenizer
+        self._cache_size = cache_size
+        self._max_cached_text_length = max_cached_text_length
+        self._cache: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def tokenizer(self) -> Callable[[str], List]:
+        """Get the underlying tokenizer."""
+        return self._tokenizer
+
+    def __call__(self, text: str) -> List:
+        """Tokenize text, without caching."""
+        return self._tokenizer(text)
+
+    def _is_cacheable(self, text: str) -> bool:
+        return self._cache_size > 0 and len(text) <= self._max_cached_text_length
+
+    def _get_cached(self, text: str) -> Optional[int]:
+        with self._lock:
+            count = self._cache.get(text, None)
+            if count is None:
+                self.cache_misses += 1
+            else:
+                self._cache.move_to_end(text)
+                self.cache_hits += 1
+            return count
+
+    def _put_cached(self, text: str, count: int) -> None:
+        with self._lock:
+            self._cache[text] = count
+            self._cache.move_to_end(text)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of a text."""
+        if not self._is_cacheable(text):
+            return len(self._tokenizer(text))
+
+        count = self._get_cached(text)
+        if count is None:
+            count = len(self._tokenizer(text))
+            self._put_cached(text, count)
+        return count
+
+    def count_tokens_many(
+        self, texts: Sequence[str], num_threads: Optional[int] = None
+    ) -> List[int]:
+        """Count the tokens of many texts.
+
+        Texts missing from the cache are tokenized once each, with the batch
+        tokenizer if there is one and more than one thread to run it on.
+
+        Args:
+            texts (Sequence[str]): Texts to count tokens of.
+            num_threads (Optional[int]): Number of threads for the batch tokenizer.
+                Defaults to the number of CPUs, up to
+                DEFAULT_TOKENIZER_NUM_THREADS.
+
+        """
+        if num_threads is None:
+            num_threads = min(DEFAULT_TOKENIZER_NUM_THREADS, os.cpu_count() or 1)
+
+        counts: List[int] = [0] * len(texts)
+        # positions of each text to tokenize
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if text in missing:
+                missing[text].append(i)
+                continue
+            count = self._get_cached(text) if self._is_cacheable(text) else None
+            if count is None:
+                missing[text] = [i]
+            else:
+                counts[i] = count
+
+        missing_texts = list(missing)
+        if (
+            self._batch_tokenizer is not None
+            and num_threads > 1
+            and len(missing_texts) > 1
+        ):
+            missing_counts = [
+                len(tokens)
+                for tokens in self._batch_tokenizer(
+                    missing_texts, num_threads=num_threads
+                )
+            ]
+        else:
+            missing_counts = [len(self._tokenizer(text)) for text in missing_texts]
+
+        for text, count in zip(missing_texts, missing_counts):
+            for i in missing[text]:
+                counts[i] = count
+            if self._is_cacheable(text):
+                self._put_cached(text, count)
+        return counts
+
+    def clear_cache(self) -> None:
+        """Clear the token count cache."""
+        with self._lock:
+            self._cache.clear()
+
 
 class GlobalsHelper:
     """Helper to retrieve globals.
@@ -37,12 +183,22 @@ class GlobalsHelper:
     """
 
     _tokenizer: Optional[Callable[[str], List]] = None
+    _tokenizer_service: Optional[TokenizerService] = None
+    # tokenizer services of custom tokenizers, shared by all helpers
+    _tokenizer_services: "weakref.WeakKeyDictionary[Callable, TokenizerService]" = (
+        weakref.WeakKeyDictionary()
+    )
     _stopwords: Optional[List[str]] = None
 
     @property
     def tokenizer(self) -> Callable[[str], List]:
         """Get tokenizer."""
-        if self._tokenizer is None:
+        return self.tokenizer_service.tokenizer
+
+    @property
+    def tokenizer_service(self) -> TokenizerService:
+        """Get the tokenizer service of the default tokenizer."""
+        if GlobalsHelper._tokenizer_service is None:
             tiktoken_import_err = (
                 "`tiktoken` package not found, please run `pip install tiktoken`"
             )
@@ -51,9 +207,41 @@ class GlobalsHelper:
             except ImportError:
                 raise ImportError(tiktoken_import_err)
             enc = tiktoken.get_encoding("gpt2")
-            self._tokenizer = cast(Callable[[str], List], enc.encode)
-            self._tokenizer = partial(self._tokenizer, allowed_special="all")
-        return self._tokenizer  # type: ignore
+            tokenizer = cast(Callable[[str], List], enc.encode)
+            GlobalsHelper._tokenizer = partial(tokenizer, allowed_special="all")
+            GlobalsHelper._tokenizer_service = TokenizerService(
+                GlobalsHelper._tokenizer,
+                batch_tokenizer=partial(enc.encode_batch, allowed_special="all"),
+            )
+        return GlobalsHelper._tokenizer_service
+
+    def get_tokenizer_service(
+        self, tokenizer: Optional[Callable[[str], List]] = None
+    ) -> TokenizerService:
+        """Get a tokenizer service for a tokenizer.
+
+        Services of custom tokenizers are reused as long as the tokenizer exists,
+        so their token count caches are shared by everyone using the tokenizer.
+
+        Args:
+            tokenizer (Optional[Callable[[str], List]]): Tokenizer to count tokens
+                with. Defaults to the default tokenizer.
+
+        """
+        if tokenizer is None or tokenizer is self.tokenizer:
+            return self.tokenizer_service
+        if isinstance(tokenizer, TokenizerService):
+            return tokenizer
+
+        try:
+            service = self._tokenizer_services.get(tokenizer, None)
+        except TypeError:
+            # tokenizer cannot be weakly referenced, count without a shared cache
+            return TokenizerService(tokenizer)
+        if service is None:
+            service = TokenizerService(tokenizer)
+            self._tokenizer_services[tokenizer] = service
+        return service
 
     @property
     def stopwords(self) -> List[str]:
@@ -233,9 +421,41 @@ def get_tqdm_iterable(items: Iterable, show_progress: bool, desc: str) -> Iterab
     return _iterator
 
 
-def count_tokens(text: str) -> int:
-    tokens = globals_helper.tokenizer(text)
-    return len(tokens)
+def get_worker_process_context(preload_module: str) -> BaseContext:
+    """Get the multiprocessing context of worker process pools.
+
+    Forking a process with running threads can deadlock, and fork is unsafe on
+    macOS, so workers are started from a fork server where available, and
+    spawned otherwise. Either way, everything sent to the workers must be
+    picklable.
+
+    Args:
+        preload_module (str): module the workers need, imported by the fork
+            server before it starts
+
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        _forkserver_preload_modules.add(preload_module)
+        context.set_forkserver_preload(sorted(_forkserver_preload_modules))
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def count_tokens(text: str, tokenizer: Optional[Callable[[str], List]] = None) -> int:
+    """Count the tokens of a text, with the default tokenizer if none is given."""
+    return globals_helper.get_tokenizer_service(tokenizer).count_tokens(text)
+
+
+def count_tokens_many(
+    texts: Sequence[str],
+    tokenizer: Optional[Callable[[str], List]] = None,
+    num_threads: Optional[int] = None,
+) -> List[int]:
+    """Count the tokens of many texts, with the default tokenizer if none is given."""
+    return globals_helper.get_tokenizer_service(tokenizer).count_tokens_many(
+        texts, num_threads=num_threads
+    )
 
 
 def get_transformer_tokenizer_fn(model_name: str) -> Callable[[str], List[str]]:
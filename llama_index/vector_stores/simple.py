@@ -3,11 +3,29 @@
 import json
 import logging
 import os
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Mapping, Optional, cast
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import fsspec
+import numpy as np
 from dataclasses_json import DataClassJsonMixin
+from fsspec.implementations.local import LocalFileSystem
 
 from llama_index.indices.query.embedding_utils import (
     get_top_k_embeddings,
@@ -40,31 +58,804 @@ MMR_MODE = VectorStoreQueryMode.MMR
 NAMESPACE_SEP = "__"
 DEFAULT_VECTOR_STORE = "default"
 
+DEFAULT_MATRIX_CAPACITY = 1024
+# compact once tombstoned rows make up this fraction of the used rows
+MATRIX_COMPACTION_RATIO = 0.5
+DEFAULT_QUERY_BATCH_SIZE = 64
+
+DEFAULT_IVF_NLIST = 256
+DEFAULT_IVF_NPROBE = 8
+DEFAULT_KMEANS_NITER = 10
+# train the IVF index once there are this many rows per list
+IVF_MIN_POINTS_PER_LIST = 32
+# cap on the number of rows per list sampled for k-means training
+IVF_MAX_POINTS_PER_LIST = 256
+# rows normalized at a time when assigning rows to IVF lists
+IVF_ADD_BATCH_SIZE = 16384
+
+
+# sentinel posting value for metadata values that match any filter
+_MATCH_ANY = object()
+
+
+def _discard(postings: Dict[Any, Set[str]], key: Any, node_id: str) -> None:
+    """Remove a node id from a posting set, dropping the set once empty."""
+    node_ids = postings.get(key, None)
+    if node_ids is None:
+        return
+    node_ids.discard(node_id)
+    if not node_ids:
+        del postings[key]
+
+
+class MetadataIndex:
+    """Inverted index over the node metadata of a SimpleVectorStore.
+
+    Maps every metadata key and value to the ids of the nodes holding it, and
+    every ref doc id to its node ids. Filters and id restrictions then
+    resolve to a candidate set with a few set intersections instead of
+    evaluating every node's metadata.
+
+    A scalar value matches filters equal to it, a list value matches any of
+    its elements, and a value that is neither a scalar nor a list matches any
+    filter on its key. Missing and None values match nothing.
+
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[Any, Set[str]]] = {}
+        self._match_any: Dict[str, Set[str]] = {}
+        self._doc_to_node_ids: Dict[str, Set[str]] = {}
+        # insertion order of the nodes, used to order candidates
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+
+    @classmethod
+    def from_data(
+        cls,
+        text_id_to_ref_doc_id: Mapping[str, str],
+        metadata_dict: Optional[Mapping[str, Any]],
+    ) -> "MetadataIndex":
+        """Build the index from the node id mappings of a SimpleVectorStoreData."""
+        index = cls()
+        for node_id, ref_doc_id in text_id_to_ref_doc_id.items():
+            metadata = (metadata_dict or {}).get(node_id, None) or {}
+            index.add(node_id, ref_doc_id, metadata)
+        return index
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @staticmethod
+    def _iter_postings(metadata: Mapping[str, Any]) -> Iterator[Tuple[str, Any]]:
+        """Iterate over the (key, value) postings of a metadata dict.
+
+        Values that match any filter are yielded with `value=_MATCH_ANY`.
+
+        """
+        for key, value in metadata.items():
+            if value is None:
+                continue
+            elif isinstance(value, list):
+                for element in value:
+                    try:
+                        hash(element)
+                    except TypeError:
+                        # can never equal a filter value
+                        continue
+                    yield key, element
+            elif isinstance(value, (int, float, str, bool)):
+                yield key, value
+            else:
+                yield key, _MATCH_ANY
+
+    def add(self, node_id: str, ref_doc_id: str, metadata: Mapping[str, Any]) -> None:
+        """Index a node. The node must not already be indexed."""
+        self._positions[node_id] = self._next_position
+        self._next_position += 1
+        self._doc_to_node_ids.setdefault(ref_doc_id, set()).add(node_id)
+        for key, value in self._iter_postings(metadata):
+            if value is _MATCH_ANY:
+                self._match_any.setdefault(key, set()).add(node_id)
+            else:
+                self._postings.setdefault(key, {}).setdefault(value, set()).add(node_id)
+
+    def remove(
+        self, node_id: str, ref_doc_id: str, metadata: Mapping[str, Any]
+    ) -> None:
+        """Remove a node indexed with the given ref doc id and metadata."""
+        if self._positions.pop(node_id, None) is None:
+            return
+        _discard(self._doc_to_node_ids, ref_doc_id, node_id)
+        for key, value in self._iter_postings(metadata):
+            if value is _MATCH_ANY:
+                _discard(self._match_any, key, node_id)
+            else:
+                values = self._postings.get(key, {})
+                _discard(values, value, node_id)
+                if not values:
+                    self._postings.pop(key, None)
+
+    def get_doc_node_ids(self, ref_doc_ids: Sequence[str]) -> Set[str]:
+        """Get the ids of the nodes of the given ref docs."""
+        node_ids: Set[str] = set()
+        for ref_doc_id in ref_doc_ids:
+            node_ids.update(self._doc_to_node_ids.get(ref_doc_id, ()))
+        return node_ids
+
+    def filter_node_ids(self, metadata_filters: MetadataFilters) -> Set[str]:
+        """Get the ids of the nodes matching all filters."""
+        matches = []
+        for filter_ in metadata_filters.filters:
+            filter_matches = self._postings.get(filter_.key, {}).get(
+                filter_.value, set()
+            )
+            match_any = self._match_any.get(filter_.key, None)
+            if match_any:
+                filter_matches = filter_matches | match_any
+            matches.append(filter_matches)
+
+        if not matches:
+            return set(self._positions)
+        # intersect starting from the most selective filter
+        matches.sort(key=len)
+        return matches[0].intersection(*matches[1:])
+
+    def sort_node_ids(self, node_ids: Iterable[str]) -> List[str]:
+        """Sort indexed node ids by insertion order, dropping unknown ids."""
+        positions = self._positions
+        return sorted(
+            (node_id for node_id in node_ids if node_id in positions),
+            key=positions.__getitem__,
+        )
+
+
+class IVFIndex:
+    """Inverted file (IVF) index over the rows of an EmbeddingMatrix.
+
+    Rows are clustered with spherical k-means into `nlist` inverted lists.
+    A query only scores the rows of the `nprobe` lists whose centroids are
+    most similar to it, trading a little recall for sub-linear search.
+
+    The index trains itself once the matrix holds enough rows
+    (`nlist * IVF_MIN_POINTS_PER_LIST`); until then queries fall back to
+    exact search. Rows added after training are assigned to their nearest
+    centroid; centroids are not retrained. To retrain, set a fresh index
+    with `EmbeddingMatrix.set_ivf_index`.
+
+    Args:
+        nlist (int): number of inverted lists (k-means centroids).
+        nprobe (int): default number of lists scanned per query.
+        niter (int): number of k-means iterations.
+        seed (int): random seed for k-means initialization and sampling.
+
+    """
+
+    def __init__(
+        self,
+        nlist: int = DEFAULT_IVF_NLIST,
+        nprobe: int = DEFAULT_IVF_NPROBE,
+        niter: int = DEFAULT_KMEANS_NITER,
+        seed: int = 0,
+    ) -> None:
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.niter = niter
+        self.seed = seed
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[List[int]] = []
+        self._assignments = np.full(0, -1, dtype=np.int32)
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether centroids have been computed."""
+        return self._centroids is not None
+
+    @property
+    def min_train_size(self) -> int:
+        """Number of rows needed before the index trains itself."""
+        return self.nlist * IVF_MIN_POINTS_PER_LIST
+
+    def sample_rows(self, rows: np.ndarray) -> np.ndarray:
+        """Pick the rows to train on, at most `nlist * IVF_MAX_POINTS_PER_LIST`."""
+        rng = np.random.default_rng(self.seed)
+        num_samples = min(len(rows), self.nlist * IVF_MAX_POINTS_PER_LIST)
+        return np.sort(rows[rng.choice(len(rows), num_samples, replace=False)])
+
+    def train(self, sample: np.ndarray) -> None:
+        """Compute centroids from (normalized) sample vectors.
+
+        All lists are emptied; rows are assigned to them with `add`.
+
+        """
+        rng = np.random.default_rng(self.seed)
+        self._centroids = _spherical_kmeans(sample, self.nlist, self.niter, rng)
+        self._lists = [[] for _ in range(len(self._centroids))]
+        self._assignments = np.full(0, -1, dtype=np.int32)
+
+    def add(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        """Assign (normalized) vectors of the given rows to their nearest list."""
+        if self._centroids is None or len(rows) == 0:
+            return
+        if rows.max() >= len(self._assignments):
+            assignments = np.full(
+                max(int(rows.max()) + 1, 2 * len(self._assignments)), -1, np.int32
+            )
+            assignments[: len(self._assignments)] = self._assignments
+            self._assignments = assignments
+
+        list_idxs = np.argmax(vectors @ self._centroids.T, axis=1)
+        old_list_idxs = self._assignments[rows]
+        changed = old_list_idxs != list_idxs
+        moved = changed & (old_list_idxs >= 0)
+        for row, old_list_idx in zip(
+            rows[moved].tolist(), old_list_idxs[moved].tolist()
+        ):
+            # overwritten embedding moved to another list
+            self._lists[old_list_idx].remove(row)
+        for row, list_idx in zip(rows[changed].tolist(), list_idxs[changed].tolist()):
+            self._lists[list_idx].append(row)
+        self._assignments[rows] = list_idxs
+
+    def unassigned_rows(self, rows: np.ndarray) -> np.ndarray:
+        """Get the rows that are not in any list yet."""
+        assigned = np.zeros(len(rows), dtype=bool)
+        in_range = rows < len(self._assignments)
+        assigned[in_range] = self._assignments[rows[in_range]] >= 0
+        return rows[~assigned]
+
+    def remap(self, row_mapping: np.ndarray) -> None:
+        """Renumber rows after compaction (-1 marks a dropped row)."""
+        self._lists = [
+            [int(row_mapping[row]) for row in rows if row_mapping[row] >= 0]
+            for rows in self._lists
+        ]
+        assignments = np.full(len(self._assignments), -1, dtype=np.int32)
+        for list_idx, rows in enumerate(self._lists):
+            assignments[rows] = list_idx
+        self._assignments = assignments
+
+    def search_rows(
+        self, query_embedding: np.ndarray, nprobe: Optional[int] = None
+    ) -> np.ndarray:
+        """Get the candidate rows for a (normalized) query."""
+        assert self._centroids is not None
+        nprobe = min(nprobe or self.nprobe, len(self._centroids))
+        centroid_scores = self._centroids @ query_embedding
+        probe = np.argpartition(-centroid_scores, nprobe - 1)[:nprobe]
+        candidate_lists = [self._lists[list_idx] for list_idx in probe]
+        return np.fromiter(
+            (row for rows in candidate_lists for row in rows),
+            dtype=np.int64,
+            count=sum(len(rows) for rows in candidate_lists),
+        )
+
+    def to_dict(self, row_to_id: Callable[[int], Optional[str]]) -> Dict[str, Any]:
+        """Serialize the index, referring to rows by node id."""
+        return {
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+            "niter": self.niter,
+            "seed": self.seed,
+            "centroids": (
+                self._centroids.tolist() if self._centroids is not None else None
+            ),
+            "lists": [
+                [node_id for node_id in map(row_to_id, rows) if node_id is not None]
+                for rows in self._lists
+            ],
+        }
+
+    @classmethod
+    def from_dict(
+        cls, ivf_dict: Dict[str, Any], id_to_row: Mapping[str, int]
+    ) -> "IVFIndex":
+        """Load an index serialized with `to_dict`."""
+        ivf_index = cls(
+            nlist=ivf_dict["nlist"],
+            nprobe=ivf_dict["nprobe"],
+            niter=ivf_dict["niter"],
+            seed=ivf_dict["seed"],
+        )
+        if ivf_dict["centroids"] is not None:
+            ivf_index._centroids = np.asarray(ivf_dict["centroids"], dtype=np.float32)
+            ivf_index._lists = [
+                [id_to_row[node_id] for node_id in node_ids if node_id in id_to_row]
+                for node_ids in ivf_dict["lists"]
+            ]
+            ivf_index._assignments = np.full(
+                max(id_to_row.values(), default=-1) + 1, -1, dtype=np.int32
+            )
+            for list_idx, rows in enumerate(ivf_index._lists):
+                ivf_index._assignments[rows] = list_idx
+        return ivf_index
+
+
+def _spherical_kmeans(
+    vectors: np.ndarray, num_clusters: int, niter: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Cluster normalized vectors by cosine similarity, returning centroids."""
+    num_clusters = min(num_clusters, len(vectors))
+    centroids = vectors[rng.choice(len(vectors), num_clusters, replace=False)]
+    for _ in range(niter):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        counts = np.bincount(assignments, minlength=num_clusters)
+        # sum the members of each cluster with one reduceat over sorted rows
+        order = np.argsort(assignments, kind="stable")
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        sums = np.zeros_like(centroids)
+        nonempty = counts > 0
+        sums[nonempty] = np.add.reduceat(vectors[order], starts[nonempty], axis=0)
+        # re-seed empty clusters with random vectors
+        empty = counts == 0
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()))]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = np.divide(sums, norms, out=np.zeros_like(sums), where=norms > 0)
+    return centroids
+
+
+class EmbeddingMatrix(MutableMapping[str, List[float]]):
+    """Contiguous float32 embedding matrix with an id <-> row mapping.
+
+    Inverse row norms are precomputed on insert, so cosine similarity against
+    every row is a single matrix-vector product followed by an elementwise
+    scale. Embeddings are stored as-is (at float32 precision) so they can be
+    read back and persisted unchanged.
+
+    Rows are appended with amortized (doubling) growth. Deleted rows are
+    tombstoned and reclaimed by compaction once they make up a large enough
+    fraction of the matrix.
+
+    Behaves like a ``Dict[str, List[float]]`` so it can be used as the
+    ``embedding_dict`` of ``SimpleVectorStoreData``.
+
+    Args:
+        embedding_dim (Optional[int]): embedding dimension. Inferred from the
+            first embedding added if not provided.
+        capacity (int): number of rows to preallocate.
+
+    """
+
+    def __init__(
+        self,
+        embedding_dim: Optional[int] = None,
+        capacity: int = DEFAULT_MATRIX_CAPACITY,
+    ) -> None:
+        self._embedding_dim = embedding_dim
+        self._capacity = max(capacity, 1)
+        self._num_rows = 0
+        self._id_to_row: Dict[str, int] = {}
+        self._row_to_id: List[Optional[str]] = []
+        self._embeddings: Optional[np.ndarray] = None
+        self._inv_norms = np.zeros(self._capacity, dtype=np.float32)
+        self._valid = np.zeros(self._capacity, dtype=bool)
+        self._ivf_index: Optional[IVFIndex] = None
+        if embedding_dim is not None:
+            self._embeddings = np.zeros(
+                (self._capacity, embedding_dim), dtype=np.float32
+            )
+
+    @classmethod
+    def from_dict(
+        cls, embedding_dict: Mapping[str, Sequence[float]]
+    ) -> "EmbeddingMatrix":
+        """Build a matrix from a dict mapping node ids to embeddings."""
+        matrix = cls(capacity=max(len(embedding_dict), DEFAULT_MATRIX_CAPACITY))
+        matrix.add_many(list(embedding_dict.keys()), list(embedding_dict.values()))
+        return matrix
+
+    @classmethod
+    def from_arrays(
+        cls,
+        node_ids: Sequence[str],
+        embeddings: np.ndarray,
+        inv_norms: np.ndarray,
+    ) -> "EmbeddingMatrix":
+        """Wrap existing arrays (e.g. memory-mapped files) without copying.
+
+        Args:
+            node_ids (Sequence[str]): node id of each row.
+            embeddings (np.ndarray): (num_rows, embedding_dim) float32 array.
+            inv_norms (np.ndarray): (num_rows,) float32 inverse row norms.
+
+        """
+        if len(node_ids) == 0:
+            return cls()
+        if embeddings.shape[0] != len(node_ids) or inv_norms.shape != (len(node_ids),):
+            raise ValueError(
+                f"Expected arrays with {len(node_ids)} rows, got embeddings of "
+                f"shape {embeddings.shape} and inv_norms of shape {inv_norms.shape}."
+            )
+        matrix = cls(capacity=len(node_ids))
+        matrix._embedding_dim = embeddings.shape[1]
+        matrix._embeddings = embeddings
+        matrix._inv_norms = inv_norms
+        matrix._valid = np.ones(len(node_ids), dtype=bool)
+        matrix._row_to_id = list(node_ids)
+        matrix._id_to_row = {node_id: row for row, node_id in enumerate(node_ids)}
+        matrix._num_rows = len(node_ids)
+        return matrix
+
+    def to_arrays(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Get node ids, embeddings and inverse norms of the live rows."""
+        self.compact()
+        embedding_dim = self._embedding_dim or 0
+        if self._embeddings is None:
+            return (
+                [],
+                np.zeros((0, embedding_dim), dtype=np.float32),
+                self._inv_norms[:0],
+            )
+        return (
+            cast(List[str], self._row_to_id[: self._num_rows]),
+            self._embeddings[: self._num_rows],
+            self._inv_norms[: self._num_rows],
+        )
+
+    @property
+    def embedding_dim(self) -> Optional[int]:
+        """Get embedding dimension."""
+        return self._embedding_dim
+
+    @property
+    def num_rows(self) -> int:
+        """Number of used rows, including tombstoned ones."""
+        return self._num_rows
+
+    @property
+    def num_tombstones(self) -> int:
+        """Number of deleted rows not yet reclaimed by compaction."""
+        return self._num_rows - len(self._id_to_row)
+
+    @property
+    def ivf_index(self) -> Optional[IVFIndex]:
+        """Get the IVF index used for approximate search, if any."""
+        return self._ivf_index
+
+    def set_ivf_index(self, ivf_index: Optional[IVFIndex]) -> None:
+        """Set (or unset) the IVF index used for approximate search.
+
+        Rows already in the lists of the index (e.g. restored with a persisted
+        index) are kept as they are; only the other rows are read and indexed.
+
+        """
+        self._ivf_index = ivf_index
+        if ivf_index is not None:
+            rows = np.flatnonzero(self._valid[: self._num_rows])
+            self._update_ivf_index(ivf_index.unassigned_rows(rows))
+
+    def _normalized_rows(self, rows: np.ndarray) -> np.ndarray:
+        assert self._embeddings is not None
+        return self._embeddings[rows] * self._inv_norms[rows, None]
+
+    def _update_ivf_index(self, rows: np.ndarray) -> None:
+        """Index newly written rows, training the IVF index once possible."""
+        ivf_index = self._ivf_index
+        if ivf_index is None:
+            return
+        if ivf_index.is_trained:
+            self._add_to_ivf_index(ivf_index, rows)
+        elif len(self._id_to_row) >= ivf_index.min_train_size:
+            live_rows = np.flatnonzero(self._valid[: self._num_rows])
+            ivf_index.train(self._normalized_rows(ivf_index.sample_rows(live_rows)))
+            self._add_to_ivf_index(ivf_index, live_rows)
+
+    def _add_to_ivf_index(self, ivf_index: IVFIndex, rows: np.ndarray) -> None:
+        # normalize in batches, so memory use does not grow with the store
+        for start in range(0, len(rows), IVF_ADD_BATCH_SIZE):
+            batch_rows = rows[start : start + IVF_ADD_BATCH_SIZE]
+            ivf_index.add(batch_rows, self._normalized_rows(batch_rows))
+
+    @property
+    def id_to_row(self) -> Mapping[str, int]:
+        """Get a read-only mapping from node ids to matrix rows."""
+        return MappingProxyType(self._id_to_row)
+
+    def get_row(self, node_id: str) -> int:
+        """Get the matrix row of a node id."""
+        return self._id_to_row[node_id]
+
+    def get_id(self, row: int) -> Optional[str]:
+        """Get the node id stored in a matrix row (None if tombstoned)."""
+        return self._row_to_id[row]
+
+    def _reserve(self, num_rows: int) -> None:
+        """Make sure there is room for `num_rows` more rows."""
+        required = self._num_rows + num_rows
+        if required <= self._capacity and self._embeddings is not None:
+            return
+        capacity = self._capacity
+        while capacity < required:
+            capacity *= 2
+        assert self._embedding_dim is not None
+        embeddings = np.zeros((capacity, self._embedding_dim), dtype=np.float32)
+        inv_norms = np.zeros(capacity, dtype=np.float32)
+        valid = np.zeros(capacity, dtype=bool)
+        if self._embeddings is not None:
+            embeddings[: self._num_rows] = self._embeddings[: self._num_rows]
+        inv_norms[: self._num_rows] = self._inv_norms[: self._num_rows]
+        valid[: self._num_rows] = self._valid[: self._num_rows]
+        self._embeddings, self._inv_norms, self._valid = embeddings, inv_norms, valid
+        self._capacity = capacity
+
+    def add_many(
+        self,
+        node_ids: Sequence[str],
+        embeddings: Union[Sequence[Sequence[float]], np.ndarray],
+    ) -> None:
+        """Add (or overwrite) embeddings for the given node ids.
+
+        Embeddings can be given as lists or as a (num_nodes, dim) array.
+
+        """
+        if len(node_ids) != len(embeddings):
+            raise ValueError("node_ids and embeddings must have the same length.")
+        if not node_ids:
+            return
+
+        embeddings_np = np.asarray(embeddings, dtype=np.float32)
+        if embeddings_np.ndim != 2:
+            raise ValueError("All embeddings must have the same dimension.")
+        if self._embedding_dim is None:
+            self._embedding_dim = embeddings_np.shape[1]
+        elif embeddings_np.shape[1] != self._embedding_dim:
+            raise ValueError(
+                f"Expected embeddings of dimension {self._embedding_dim}, "
+                f"got {embeddings_np.shape[1]}."
+            )
+
+        norms = np.linalg.norm(embeddings_np, axis=1)
+        # zero vectors get a zero inverse norm, i.e. a similarity of 0
+        inv_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
 
-def _build_metadata_filter_fn(
-    metadata_lookup_fn: Callable[[str], Mapping[str, Any]],
-    metadata_filters: Optional[MetadataFilters] = None,
-) -> Callable[[str], bool]:
-    """Build metadata filter function."""
-    filter_list = metadata_filters.filters if metadata_filters else []
-    if not filter_list:
-        return lambda _: True
-
-    def filter_fn(node_id: str) -> bool:
-        metadata = metadata_lookup_fn(node_id)
-        for filter_ in filter_list:
-            metadata_value = metadata.get(filter_.key, None)
-            if metadata_value is None:
-                return False
-            elif isinstance(metadata_value, list):
-                if filter_.value not in metadata_value:
-                    return False
-            elif isinstance(metadata_value, (int, float, str, bool)):
-                if metadata_value != filter_.value:
-                    return False
-        return True
-
-    return filter_fn
+        # resolve target rows: existing ids are overwritten in place
+        rows = np.empty(len(node_ids), dtype=np.int64)
+        num_new = sum(1 for node_id in set(node_ids) if node_id not in self._id_to_row)
+        self._reserve(num_new)
+        for i, node_id in enumerate(node_ids):
+            row = self._id_to_row.get(node_id)
+            if row is None:
+                row = self._num_rows
+                self._id_to_row[node_id] = row
+                self._row_to_id.append(node_id)
+                self._num_rows += 1
+            rows[i] = row
+
+        assert self._embeddings is not None
+        self._embeddings[rows] = embeddings_np
+        self._inv_norms[rows] = inv_norms
+        self._valid[rows] = True
+        self._update_ivf_index(rows)
+
+    def delete_many(self, node_ids: Sequence[str]) -> None:
+        """Tombstone the rows of the given node ids."""
+        for node_id in node_ids:
+            row = self._id_to_row.pop(node_id, None)
+            if row is None:
+                continue
+            self._row_to_id[row] = None
+            self._valid[row] = False
+
+        if (
+            self._num_rows >= DEFAULT_MATRIX_CAPACITY
+            and self.num_tombstones > MATRIX_COMPACTION_RATIO * self._num_rows
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Reclaim tombstoned rows, preserving the order of live rows."""
+        if self.num_tombstones == 0:
+            return
+        live_rows = np.flatnonzero(self._valid[: self._num_rows])
+        num_live = len(live_rows)
+        if self._ivf_index is not None:
+            row_mapping = np.full(self._num_rows, -1, dtype=np.int64)
+            row_mapping[live_rows] = np.arange(num_live)
+            self._ivf_index.remap(row_mapping)
+        if self._embeddings is not None:
+            self._embeddings[:num_live] = self._embeddings[live_rows]
+            self._embeddings[num_live : self._num_rows] = 0
+        self._inv_norms[:num_live] = self._inv_norms[live_rows]
+        self._inv_norms[num_live : self._num_rows] = 0
+        self._valid[:num_live] = True
+        self._valid[num_live : self._num_rows] = False
+        self._row_to_id = [self._row_to_id[row] for row in live_rows]
+        self._id_to_row = {
+            cast(str, node_id): row for row, node_id in enumerate(self._row_to_id)
+        }
+        self._num_rows = num_live
+
+    def _score(
+        self, query_embeddings: Sequence[Sequence[float]], rows: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score queries against live rows.
+
+        Returns the scored rows and a (num_queries, num_rows) score matrix.
+
+        """
+        assert self._embeddings is not None
+        queries_np = np.asarray(query_embeddings, dtype=np.float32)
+        query_norms = np.linalg.norm(queries_np, axis=1, keepdims=True)
+        queries_np = np.divide(
+            queries_np,
+            query_norms,
+            out=np.zeros_like(queries_np),
+            where=query_norms > 0,
+        )
+
+        if rows is None:
+            live_rows = np.flatnonzero(self._valid[: self._num_rows])
+            if len(live_rows) == self._num_rows:
+                # no tombstones: score the contiguous block directly
+                scores = queries_np @ self._embeddings[: self._num_rows].T
+                scores *= self._inv_norms[: self._num_rows]
+                return live_rows, scores
+        else:
+            live_rows = rows[self._valid[rows]]
+        scores = (queries_np @ self._embeddings[live_rows].T) * self._inv_norms[
+            live_rows
+        ]
+        return live_rows, scores
+
+    def _select_top_k(
+        self, scores: np.ndarray, rows: np.ndarray, similarity_top_k: Optional[int]
+    ) -> Tuple[List[float], List[str]]:
+        """Select the top k rows of a single query's scores."""
+        if similarity_top_k and similarity_top_k < len(rows):
+            top_idxs = np.argpartition(-scores, similarity_top_k - 1)[:similarity_top_k]
+        else:
+            top_idxs = np.arange(len(rows))
+        top_idxs = top_idxs[np.argsort(-scores[top_idxs], kind="stable")]
+
+        similarities = scores[top_idxs].tolist()
+        ids = [cast(str, self._row_to_id[rows[idx]]) for idx in top_idxs]
+        return similarities, ids
+
+    def top_k(
+        self,
+        query_embedding: Sequence[float],
+        similarity_top_k: Optional[int] = None,
+        rows: Optional[np.ndarray] = None,
+        exact: bool = False,
+        nprobe: Optional[int] = None,
+    ) -> Tuple[List[float], List[str]]:
+        """Get top rows by cosine similarity to the query.
+
+        Uses the IVF index (if set and trained) unless `rows` is given.
+
+        Args:
+            query_embedding (Sequence[float]): query embedding.
+            similarity_top_k (Optional[int]): number of results. All candidates
+                are returned (sorted) if not set.
+            rows (Optional[np.ndarray]): restrict scoring to these matrix rows.
+            exact (bool): skip the IVF index and score every row.
+            nprobe (Optional[int]): override the IVF index's nprobe.
+
+        """
+        if self._embeddings is None or len(self._id_to_row) == 0:
+            return [], []
+
+        if (
+            rows is None
+            and not exact
+            and self._ivf_index is not None
+            and self._ivf_index.is_trained
+        ):
+            query_np = np.asarray(query_embedding, dtype=np.float32)
+            rows = self._ivf_index.search_rows(query_np, nprobe=nprobe)
+
+        rows, scores = self._score([query_embedding], rows)
+        if len(rows) == 0:
+            return [], []
+        return self._select_top_k(scores[0], rows, similarity_top_k)
+
+    def top_k_batch(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        similarity_top_k: Optional[Sequence[Optional[int]]] = None,
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+        exact: bool = False,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[List[float], List[str]]]:
+        """Get top rows for a batch of queries.
+
+        Each chunk of `batch_size` queries is scored with a single
+        matrix-matrix product. With a trained IVF index, queries are
+        searched one at a time over their own candidate lists instead.
+
+        Args:
+            query_embeddings (Sequence[Sequence[float]]): query embeddings.
+            similarity_top_k (Optional[Sequence[Optional[int]]]): number of
+                results per query. All rows are returned (sorted) if not set.
+            batch_size (int): number of queries scored at once, bounds the
+                size of the intermediate score matrix.
+            exact (bool): skip the IVF index and score every row.
+            nprobe (Optional[int]): override the IVF index's nprobe.
+
+        """
+        top_ks = similarity_top_k or [None] * len(query_embeddings)
+        if self._embeddings is None or len(self._id_to_row) == 0:
+            return [([], []) for _ in query_embeddings]
+
+        if not exact and self._ivf_index is not None and self._ivf_index.is_trained:
+            return [
+                self.top_k(query_embedding, top_k, nprobe=nprobe)
+                for query_embedding, top_k in zip(query_embeddings, top_ks)
+            ]
+
+        results: List[Tuple[List[float], List[str]]] = []
+        for start in range(0, len(query_embeddings), batch_size):
+            rows, scores = self._score(
+                query_embeddings[start : start + batch_size], rows=None
+            )
+            for query_scores, top_k in zip(scores, top_ks[start : start + batch_size]):
+                results.append(self._select_top_k(query_scores, rows, top_k))
+        return results
+
+    def get_many(self, node_ids: Sequence[str]) -> np.ndarray:
+        """Get the embeddings of the given node ids as a float32 matrix."""
+        if self._embeddings is None:
+            return np.zeros((0, self._embedding_dim or 0), dtype=np.float32)
+        rows = np.fromiter(
+            (self._id_to_row[node_id] for node_id in node_ids),
+            dtype=np.int64,
+            count=len(node_ids),
+        )
+        return self._embeddings[rows]
+
+    def __getitem__(self, node_id: str) -> List[float]:
+        row = self._id_to_row[node_id]
+        assert self._embeddings is not None
+        return self._embeddings[row].tolist()
+
+    def __setitem__(self, node_id: str, embedding: List[float]) -> None:
+        self.add_many([node_id], [embedding])
+
+    def __delitem__(self, node_id: str) -> None:
+        if node_id not in self._id_to_row:
+            raise KeyError(node_id)
+        self.delete_many([node_id])
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self._id_to_row
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._id_to_row))
+
+    def __len__(self) -> int:
+        return len(self._id_to_row)
+
+
+def _get_binary_persist_paths(persist_path: str) -> Tuple[str, str]:
+    """Get the embeddings and inverse norms .npy paths of a JSON persist path."""
+    base_path = persist_path[: -len(".json")]
+    if not persist_path.endswith(".json"):
+        base_path = persist_path
+    return f"{base_path}.embeddings.npy", f"{base_path}.inv_norms.npy"
+
+
+def _save_npy(path: str, array: np.ndarray, fs: fsspec.AbstractFileSystem) -> None:
+    """Save an array as .npy.
+
+    Writes to a temporary file and renames it, so processes that memory-mapped
+    the previous file keep a valid mapping.
+
+    """
+    tmp_path = f"{path}.tmp"
+    with fs.open(tmp_path, "wb") as f:
+        np.save(f, np.ascontiguousarray(array, dtype=np.float32))
+    fs.mv(tmp_path, path)
+
+
+def _load_npy(path: str, fs: fsspec.AbstractFileSystem, mmap: bool) -> np.ndarray:
+    """Load a .npy array, memory-mapped (copy-on-write) on local filesystems."""
+    if mmap and isinstance(fs, LocalFileSystem):
+        return np.load(path, mmap_mode="c")
+    with fs.open(path, "rb") as f:
+        return np.load(f)
 
 
 @dataclass
@@ -75,12 +866,18 @@ class SimpleVectorStoreData(DataClassJsonMixin):
         embedding_dict (Optional[dict]): dict mapping node_ids to embeddings.
         text_id_to_ref_doc_id (Optional[dict]):
             dict mapping text_ids/node_ids to ref_doc_ids.
+        ivf_index (Optional[dict]): serialized IVFIndex, if the store uses one.
+        embedding_ids (Optional[list]): node ids of the rows of the binary
+            embedding files, if the store was persisted in binary format.
+            `embedding_dict` is empty in that case.
 
     """
 
     embedding_dict: Dict[str, List[float]] = field(default_factory=dict)
     text_id_to_ref_doc_id: Dict[str, str] = field(default_factory=dict)
     metadata_dict: Dict[str, Any] = field(default_factory=dict)
+    ivf_index: Optional[Dict[str, Any]] = None
+    embedding_ids: Optional[List[str]] = None
 
 
 class SimpleVectorStore(VectorStore):
@@ -92,6 +889,17 @@ class SimpleVectorStore(VectorStore):
         simple_vector_store_data_dict (Optional[dict]): data dict
             containing the embeddings and doc_ids. See SimpleVectorStoreData
             for more details.
+        use_matrix (bool): keep embeddings in a contiguous float32 matrix
+            (see EmbeddingMatrix) instead of a dict of lists. Default queries
+            are then scored with a single matrix-vector product.
+        ivf_nlist (Optional[int]): if set, build an IVFIndex with this many
+            lists for approximate default-mode search. Implies `use_matrix`.
+        ivf_nprobe (int): number of IVF lists scanned per query. Can be
+            overridden per query with the `ivf_nprobe` query kwarg.
+        binary_persist (bool): persist embeddings as float32 `.npy` files next
+            to a JSON sidecar holding ids and metadata, instead of one JSON
+            file. Binary stores are loaded with `np.memmap`, so startup is
+            instant and pages are shared between processes.
     """
 
     stores_text: bool = False
@@ -100,11 +908,51 @@ class SimpleVectorStore(VectorStore):
         self,
         data: Optional[SimpleVectorStoreData] = None,
         fs: Optional[fsspec.AbstractFileSystem] = None,
+        use_matrix: bool = False,
+        ivf_nlist: Optional[int] = None,
+        ivf_nprobe: int = DEFAULT_IVF_NPROBE,
+        binary_persist: bool = False,
         **kwargs: Any,
     ) -> None:
         """Initialize params."""
         self._data = data or SimpleVectorStoreData()
         self._fs = fs or fsspec.filesystem("file")
+        self._binary_persist = binary_persist
+        # built on first use, see `metadata_index`
+        self._metadata_index: Optional[MetadataIndex] = None
+        use_matrix = (
+            use_matrix or ivf_nlist is not None or self._data.ivf_index is not None
+        )
+        if use_matrix and not isinstance(self._data.embedding_dict, EmbeddingMatrix):
+            self._data.embedding_dict = cast(
+                Dict[str, List[float]],
+                EmbeddingMatrix.from_dict(self._data.embedding_dict),
+            )
+
+        matrix = self._data.embedding_dict
+        if isinstance(matrix, EmbeddingMatrix):
+            if self._data.ivf_index is not None:
+                matrix.set_ivf_index(
+                    IVFIndex.from_dict(self._data.ivf_index, matrix.id_to_row)
+                )
+                # re-serialized from the live index on persist
+                self._data.ivf_index = None
+            elif ivf_nlist is not None:
+                matrix.set_ivf_index(IVFIndex(nlist=ivf_nlist, nprobe=ivf_nprobe))
+
+    @property
+    def use_matrix(self) -> bool:
+        """Whether embeddings are stored in an EmbeddingMatrix."""
+        return isinstance(self._data.embedding_dict, EmbeddingMatrix)
+
+    @property
+    def metadata_index(self) -> MetadataIndex:
+        """Inverted index over node metadata and ref doc ids."""
+        if self._metadata_index is None:
+            self._metadata_index = MetadataIndex.from_data(
+                self._data.text_id_to_ref_doc_id, self._data.metadata_dict
+            )
+        return self._metadata_index
 
     @classmethod
     def from_persist_dir(
@@ -112,6 +960,7 @@ class SimpleVectorStore(VectorStore):
         persist_dir: str = DEFAULT_PERSIST_DIR,
         namespace: Optional[str] = None,
         fs: Optional[fsspec.AbstractFileSystem] = None,
+        use_matrix: bool = False,
     ) -> "SimpleVectorStore":
         """Load from persist dir."""
         if namespace:
@@ -123,7 +972,7 @@ class SimpleVectorStore(VectorStore):
             persist_path = concat_dirs(persist_dir, persist_fname)
         else:
             persist_path = os.path.join(persist_dir, persist_fname)
-        return cls.from_persist_path(persist_path, fs=fs)
+        return cls.from_persist_path(persist_path, fs=fs, use_matrix=use_matrix)
 
     @classmethod
     def from_namespaced_persist_dir(
@@ -179,8 +1028,19 @@ class SimpleVectorStore(VectorStore):
         **add_kwargs: Any,
     ) -> List[str]:
         """Add nodes to index."""
+        if isinstance(self._data.embedding_dict, EmbeddingMatrix):
+            # normalize and copy the whole batch into the matrix at once
+            self._data.embedding_dict.add_many(
+                [node.node_id for node in nodes],
+                [node.get_embedding() for node in nodes],
+            )
+        else:
+            for node in nodes:
+                self._data.embedding_dict[node.node_id] = node.get_embedding()
+
         for node in nodes:
-            self._data.embedding_dict[node.node_id] = node.get_embedding()
+            if node.node_id in self._data.text_id_to_ref_doc_id:
+                self._remove_from_metadata_index(node.node_id)
             self._data.text_id_to_ref_doc_id[node.node_id] = node.ref_doc_id or "None"
 
             metadata = node_to_metadata_dict(
@@ -188,8 +1048,22 @@ class SimpleVectorStore(VectorStore):
             )
             metadata.pop("_node_content", None)
             self._data.metadata_dict[node.node_id] = metadata
+            if self._metadata_index is not None:
+                self._metadata_index.add(
+                    node.node_id, node.ref_doc_id or "None", metadata
+                )
         return [node.node_id for node in nodes]
 
+    def _remove_from_metadata_index(self, node_id: str) -> None:
+        """Remove a node from the metadata index, if it was built."""
+        if self._metadata_index is None:
+            return
+        self._metadata_index.remove(
+            node_id,
+            self._data.text_id_to_ref_doc_id[node_id],
+            (self._data.metadata_dict or {}).get(node_id, None) or {},
+        )
+
     def delete(self, ref_doc_id: str, **delete_kwargs: Any) -> None:
         """
         Delete nodes using with ref_doc_id.
@@ -198,13 +1072,16 @@ class SimpleVectorStore(VectorStore):
             ref_doc_id (str): The doc_id of the document to delete.
 
         """
-        text_ids_to_delete = set()
-        for text_id, ref_doc_id_ in self._data.text_id_to_ref_doc_id.items():
-            if ref_doc_id == ref_doc_id_:
-                text_ids_to_delete.add(text_id)
+        text_ids_to_delete = self.metadata_index.get_doc_node_ids([ref_doc_id])
+
+        if isinstance(self._data.embedding_dict, EmbeddingMatrix):
+            self._data.embedding_dict.delete_many(list(text_ids_to_delete))
+        else:
+            for text_id in text_ids_to_delete:
+                del self._data.embedding_dict[text_id]
 
         for text_id in text_ids_to_delete:
-            del self._data.embedding_dict[text_id]
+            self._remove_from_metadata_index(text_id)
             del self._data.text_id_to_ref_doc_id[text_id]
             # Handle metadata_dict not being present in stores that were persisted
             # without metadata, or, not being present for nodes stored
@@ -228,31 +1105,35 @@ class SimpleVectorStore(VectorStore):
                 "Cannot filter stores that were persisted without metadata. "
                 "Please rebuild the store with metadata to enable filtering."
             )
-        # Prefilter nodes based on the query filter and node ID restrictions.
-        query_filter_fn = _build_metadata_filter_fn(
-            lambda node_id: self._data.metadata_dict[node_id], query.filters
-        )
+        # Prefilter nodes based on the query filter and node/doc ID restrictions.
+        candidate_ids = self._get_candidate_ids(query)
 
-        if query.node_ids is not None:
-            available_ids = set(query.node_ids)
+        query_embedding = cast(List[float], query.query_embedding)
 
-            def node_filter_fn(node_id: str) -> bool:
-                return node_id in available_ids
+        if (
+            isinstance(self._data.embedding_dict, EmbeddingMatrix)
+            and query.mode == VectorStoreQueryMode.DEFAULT
+        ):
+            top_similarities, top_ids = self._query_matrix(
+                self._data.embedding_dict,
+                query,
+                candidate_ids,
+                ivf_nprobe=kwargs.get("ivf_nprobe", None),
+            )
+            return VectorStoreQueryResult(similarities=top_similarities, ids=top_ids)
 
+        if candidate_ids is None:
+            node_ids = list(self._data.embedding_dict.keys())
         else:
-
-            def node_filter_fn(node_id: str) -> bool:
-                return True
-
-        node_ids = []
-        embeddings = []
+            node_ids = self.metadata_index.sort_node_ids(candidate_ids)
         # TODO: consolidate with get_query_text_embedding_similarities
-        for node_id, embedding in self._data.embedding_dict.items():
-            if node_filter_fn(node_id) and query_filter_fn(node_id):
-                node_ids.append(node_id)
-                embeddings.append(embedding)
-
-        query_embedding = cast(List[float], query.query_embedding)
+        if isinstance(self._data.embedding_dict, EmbeddingMatrix):
+            # avoid a round trip through python lists
+            embeddings = cast(
+                List[List[float]], self._data.embedding_dict.get_many(node_ids)
+            )
+        else:
+            embeddings = [self._data.embedding_dict[node_id] for node_id in node_ids]
 
         if query.mode in LEARNER_MODES:
             top_similarities, top_ids = get_top_k_embeddings_learner(
@@ -269,6 +1150,7 @@ class SimpleVectorStore(VectorStore):
                 similarity_top_k=query.similarity_top_k,
                 embedding_ids=node_ids,
                 mmr_threshold=mmr_threshold,
+                fetch_k=kwargs.get("mmr_prefetch_k", None),
             )
         elif query.mode == VectorStoreQueryMode.DEFAULT:
             top_similarities, top_ids = get_top_k_embeddings(
@@ -282,6 +1164,99 @@ class SimpleVectorStore(VectorStore):
 
         return VectorStoreQueryResult(similarities=top_similarities, ids=top_ids)
 
+    def query_batch(
+        self,
+        queries: Sequence[VectorStoreQuery],
+        **kwargs: Any,
+    ) -> List[VectorStoreQueryResult]:
+        """Get nodes for a batch of queries.
+
+        In matrix mode, unrestricted default-mode queries are scored together
+        with a matrix-matrix product. All other queries go through `query`.
+
+        """
+        matrix = self._data.embedding_dict
+        if not isinstance(matrix, EmbeddingMatrix):
+            return [self.query(query, **kwargs) for query in queries]
+
+        results: List[Optional[VectorStoreQueryResult]] = [None] * len(queries)
+        batch_idxs = []
+        for idx, query in enumerate(queries):
+            if (
+                query.mode == VectorStoreQueryMode.DEFAULT
+                and query.filters is None
+                and query.node_ids is None
+                and query.doc_ids is None
+            ):
+                batch_idxs.append(idx)
+            else:
+                results[idx] = self.query(query, **kwargs)
+
+        batch_results = matrix.top_k_batch(
+            [cast(List[float], queries[idx].query_embedding) for idx in batch_idxs],
+            similarity_top_k=[queries[idx].similarity_top_k for idx in batch_idxs],
+            nprobe=kwargs.get("ivf_nprobe", None),
+        )
+        for idx, (top_similarities, top_ids) in zip(batch_idxs, batch_results):
+            results[idx] = VectorStoreQueryResult(
+                similarities=top_similarities, ids=top_ids
+            )
+
+        return cast(List[VectorStoreQueryResult], results)
+
+    def _get_candidate_ids(self, query: VectorStoreQuery) -> Optional[Set[str]]:
+        """Resolve the node id, doc id and metadata filter restrictions of a query.
+
+        Returns None if the query is not restricted.
+
+        """
+        candidate_sets: List[Set[str]] = []
+        if query.node_ids is not None:
+            candidate_sets.append(set(query.node_ids))
+        if query.doc_ids is not None:
+            candidate_sets.append(self.metadata_index.get_doc_node_ids(query.doc_ids))
+        if query.filters is not None and query.filters.filters:
+            candidate_sets.append(self.metadata_index.filter_node_ids(query.filters))
+
+        if not candidate_sets:
+            return None
+        candidate_sets.sort(key=len)
+        return candidate_sets[0].intersection(*candidate_sets[1:])
+
+    def _query_matrix(
+        self,
+        matrix: EmbeddingMatrix,
+        query: VectorStoreQuery,
+        candidate_ids: Optional[Set[str]] = None,
+        ivf_nprobe: Optional[int] = None,
+    ) -> Tuple[List[float], List[str]]:
+        """Score a default query against the embedding matrix.
+
+        Queries restricted to candidate ids are scored exactly over the
+        candidate rows, other queries may go through the IVF index.
+
+        """
+        rows: Optional[np.ndarray] = None
+        if candidate_ids is not None:
+            id_to_row = matrix.id_to_row
+            rows = np.sort(
+                np.fromiter(
+                    (
+                        id_to_row[node_id]
+                        for node_id in candidate_ids
+                        if node_id in id_to_row
+                    ),
+                    dtype=np.int64,
+                )
+            )
+
+        return matrix.top_k(
+            cast(List[float], query.query_embedding),
+            similarity_top_k=query.similarity_top_k,
+            rows=rows,
+            nprobe=ivf_nprobe,
+        )
+
     def persist(
         self,
         persist_path: str = os.path.join(DEFAULT_PERSIST_DIR, DEFAULT_PERSIST_FNAME),
@@ -293,14 +1268,46 @@ class SimpleVectorStore(VectorStore):
         if not fs.exists(dirpath):
             fs.makedirs(dirpath)
 
+        if self._binary_persist:
+            self._persist_binary(persist_path, fs)
+            return
+
         with fs.open(persist_path, "w") as f:
-            json.dump(self._data.to_dict(), f)
+            json.dump(self.to_dict(), f)
+
+    def _persist_binary(self, persist_path: str, fs: fsspec.AbstractFileSystem) -> None:
+        """Persist embeddings to .npy files and everything else to JSON."""
+        embedding_dict = self._data.embedding_dict
+        matrix = (
+            embedding_dict
+            if isinstance(embedding_dict, EmbeddingMatrix)
+            else EmbeddingMatrix.from_dict(embedding_dict)
+        )
+        node_ids, embeddings, inv_norms = matrix.to_arrays()
+
+        embeddings_path, inv_norms_path = _get_binary_persist_paths(persist_path)
+        _save_npy(embeddings_path, embeddings, fs)
+        _save_npy(inv_norms_path, inv_norms, fs)
+
+        # write the sidecar last, it is what marks the store as binary
+        sidecar_data = replace(self._data, embedding_dict={}, embedding_ids=node_ids)
+        with fs.open(persist_path, "w") as f:
+            json.dump(self._to_dict(sidecar_data), f)
 
     @classmethod
     def from_persist_path(
-        cls, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
+        cls,
+        persist_path: str,
+        fs: Optional[fsspec.AbstractFileSystem] = None,
+        use_matrix: bool = False,
+        mmap: bool = True,
     ) -> "SimpleVectorStore":
-        """Create a SimpleKVStore from a persist directory."""
+        """Create a SimpleKVStore from a persist directory.
+
+        Stores persisted in binary format are memory-mapped (copy-on-write)
+        when `mmap` is set and `fs` is a local filesystem.
+
+        """
         fs = fs or fsspec.filesystem("file")
         if not fs.exists(persist_path):
             raise ValueError(
@@ -311,12 +1318,35 @@ class SimpleVectorStore(VectorStore):
         with fs.open(persist_path, "rb") as f:
             data_dict = json.load(f)
             data = SimpleVectorStoreData.from_dict(data_dict)
-        return cls(data)
+
+        if data.embedding_ids is None:
+            return cls(data, use_matrix=use_matrix)
+
+        embeddings_path, inv_norms_path = _get_binary_persist_paths(persist_path)
+        data.embedding_dict = cast(
+            Dict[str, List[float]],
+            EmbeddingMatrix.from_arrays(
+                data.embedding_ids,
+                _load_npy(embeddings_path, fs, mmap=mmap),
+                _load_npy(inv_norms_path, fs, mmap=mmap),
+            ),
+        )
+        data.embedding_ids = None
+        return cls(data, binary_persist=True)
 
     @classmethod
-    def from_dict(cls, save_dict: dict) -> "SimpleVectorStore":
+    def from_dict(
+        cls, save_dict: dict, use_matrix: bool = False
+    ) -> "SimpleVectorStore":
         data = SimpleVectorStoreData.from_dict(save_dict)
-        return cls(data)
+        return cls(data, use_matrix=use_matrix)
 
     def to_dict(self) -> dict:
-        return self._data.to_dict()
+        return self._to_dict(self._data)
+
+    def _to_dict(self, data: SimpleVectorStoreData) -> dict:
+        save_dict = data.to_dict()
+        matrix = self._data.embedding_dict
+        if isinstance(matrix, EmbeddingMatrix) and matrix.ivf_index is not None:
+            save_dict["ivf_index"] = matrix.ivf_index.to_dict(matrix.get_id)
+        return save_dict
@@ -1,4 +1,5 @@
 """Vector store index types."""
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -203,6 +204,28 @@ class VectorStore(Protocol):
         """
         return self.query(query, **kwargs)
 
+    def query_batch(
+        self, queries: Sequence[VectorStoreQuery], **kwargs: Any
+    ) -> List[VectorStoreQueryResult]:
+        """
+        Query vector store with a batch of queries.
+        NOTE: this is not implemented for all vector stores. If not implemented,
+        it will just call query for each query.
+        """
+        return [self.query(query, **kwargs) for query in queries]
+
+    async def aquery_batch(
+        self, queries: Sequence[VectorStoreQuery], **kwargs: Any
+    ) -> List[VectorStoreQueryResult]:
+        """
+        Asynchronously query vector store with a batch of queries.
+        NOTE: this is not implemented for all vector stores. If not implemented,
+        it will just call aquery concurrently for each query.
+        """
+        return await asyncio.gather(
+            *[self.aquery(query, **kwargs) for query in queries]
+        )
+
     def persist(
         self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
     ) -> None:
@@ -266,6 +289,28 @@ class BasePydanticVectorStore(BaseComponent, ABC):
         """
         return self.query(query, **kwargs)
 
+    def query_batch(
+        self, queries: Sequence[VectorStoreQuery], **kwargs: Any
+    ) -> List[VectorStoreQueryResult]:
+        """
+        Query vector store with a batch of queries.
+        NOTE: this is not implemented for all vector stores. If not implemented,
+        it will just call query for each query.
+        """
+        return [self.query(query, **kwargs) for query in queries]
+
+    async def aquery_batch(
+        self, queries: Sequence[VectorStoreQuery], **kwargs: Any
+    ) -> List[VectorStoreQueryResult]:
+        """
+        Asynchronously query vector store with a batch of queries.
+        NOTE: this is not implemented for all vector stores. If not implemented,
+        it will just call aquery concurrently for each query.
+        """
+        return await asyncio.gather(
+            *[self.aquery(query, **kwargs) for query in queries]
+        )
+
     def persist(
         self, persist_path: str, fs: Optional[fsspec.AbstractFileSystem] = None
     ) -> None:
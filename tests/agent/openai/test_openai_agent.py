@@ -1,5 +1,8 @@
+import asyncio
+import json
+import time
 from typing import Any, List, Sequence
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from llama_index.agent.openai_agent import OpenAIAgent
@@ -10,6 +13,10 @@ from llama_index.llms.openai import OpenAI
 from llama_index.tools.function_tool import FunctionTool
 from openai.types.chat.chat_completion import ChatCompletion, Choice
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
+from openai.types.chat.chat_completion_message_tool_call import (
+    ChatCompletionMessageToolCall,
+    Function,
+)
 
 
 def mock_chat_completion(*args: Any, **kwargs: Any) -> ChatCompletion:
@@ -100,3 +107,123 @@ def test_chat_no_functions(MockSyncOpenAI: MagicMock) -> None:
     response = agent.chat("What is 1 + 1?")
     assert isinstance(response, AgentChatResponse)
     assert response.response == "\n\nThis is a test!"
+
+
+def mock_tool_calls_completion(delays: List[float]) -> ChatCompletion:
+    tool_calls = [
+        ChatCompletionMessageToolCall(
+            id=f"call_{i}",
+            type="function",
+            function=Function(
+                name="wait", arguments=json.dumps({"value": i, "delay": delay})
+            ),
+        )
+        for i, delay in enumerate(delays)
+    ]
+    return ChatCompletion(
+        id="chatcmpl-abc123",
+        object="chat.completion",
+        created=1677858242,
+        model="gpt-3.5-turbo-0301",
+        choices=[
+            Choice(
+                message=ChatCompletionMessage(
+                    role="assistant", content=None, tool_calls=tool_calls
+                ),
+                finish_reason="tool_calls",
+                index=0,
+            )
+        ],
+    )
+
+
+@pytest.fixture()
+def wait_tool() -> FunctionTool:
+    def wait(value: int, delay: float) -> int:
+        """Wait for a delay and return the value."""
+        time.sleep(delay)
+        return value
+
+    async def await_(value: int, delay: float) -> int:
+        await asyncio.sleep(delay)
+        return value
+
+    return FunctionTool.from_defaults(fn=wait, async_fn=await_)
+
+
+DELAYS = [0.3, 0.1, 0.2]
+
+
+def _assert_function_messages(agent: OpenAIAgent, contents: List[str]) -> None:
+    function_messages = [
+        message for message in agent.chat_history if message.role == "tool"
+    ]
+    assert [message.content for message in function_messages] == contents
+    assert [
+        message.additional_kwargs["tool_call_id"] for message in function_messages
+    ] == [f"call_{i}" for i in range(len(contents))]
+    assert [str(source) for source in agent.sources] == contents
+
+
+@patch("llama_index.llms.openai.SyncOpenAI")
+def test_chat_parallel_tool_calls(
+    MockSyncOpenAI: MagicMock, wait_tool: FunctionTool
+) -> None:
+    mock_instance = MockSyncOpenAI.return_value
+    mock_instance.chat.completions.create.side_effect = [
+        mock_tool_calls_completion(DELAYS),
+        mock_chat_completion(),
+    ]
+
+    agent = OpenAIAgent.from_tools(tools=[wait_tool], llm=OpenAI(model="gpt-3.5-turbo"))
+    start = time.monotonic()
+    response = agent.chat("Wait for me")
+    assert time.monotonic() - start < sum(DELAYS)
+    assert response.response == "\n\nThis is a test!"
+    # function messages are in the order of the tool calls
+    _assert_function_messages(agent, ["0", "1", "2"])
+
+
+@patch("llama_index.llms.openai.SyncOpenAI")
+def test_chat_tool_call_timeout(
+    MockSyncOpenAI: MagicMock, wait_tool: FunctionTool
+) -> None:
+    mock_instance = MockSyncOpenAI.return_value
+    mock_instance.chat.completions.create.side_effect = [
+        mock_tool_calls_completion([0.0, 1.0, 0.0]),
+        mock_chat_completion(),
+    ]
+
+    agent = OpenAIAgent.from_tools(
+        tools=[wait_tool], llm=OpenAI(model="gpt-3.5-turbo"), tool_call_timeout=0.2
+    )
+    agent.chat("Wait for me")
+    _assert_function_messages(
+        agent, ["0", "Error: function wait timed out after 0.2 seconds.", "2"]
+    )
+
+
+@pytest.mark.asyncio()
+@patch("llama_index.llms.openai.AsyncOpenAI")
+async def test_achat_parallel_tool_calls(
+    MockAsyncOpenAI: MagicMock, wait_tool: FunctionTool
+) -> None:
+    mock_instance = MockAsyncOpenAI.return_value
+    mock_instance.chat.completions.create = AsyncMock(
+        side_effect=[
+            mock_tool_calls_completion([*DELAYS, 1.0]),
+            mock_chat_completion(),
+        ]
+    )
+
+    agent = OpenAIAgent.from_tools(
+        tools=[wait_tool], llm=OpenAI(model="gpt-3.5-turbo"), tool_call_timeout=0.5
+    )
+    start = time.monotonic()
+    response = await agent.achat("Wait for me")
+    # sequential calls would take sum(DELAYS) + the timeout
+    assert time.monotonic() - start < sum(DELAYS) + 0.5
+    assert response.response == "\n\nThis is a test!"
+    _assert_function_messages(
+        agent, ["0", "1", "2", "Error: function wait timed out after 0.5 seconds."]
+    )
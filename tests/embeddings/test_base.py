@@ -1,12 +1,16 @@
 """Embeddings."""
+import asyncio
 import os
 from typing import Any, List
 from unittest.mock import patch
 
+import pytest
 from llama_index.embeddings.base import SimilarityMode, mean_agg
 from llama_index.embeddings.openai import OpenAIEmbedding
+from pytest_mock import MockerFixture
 
 from tests.conftest import CachedOpenAIApiKeys
+from tests.indices.vector_store.mock_services import MockEmbedding
 
 
 def mock_get_text_embedding(text: str) -> List[float]:
@@ -111,3 +115,143 @@ def test_validates_api_key_is_present() -> None:
         # We can create a new LLM when the api_key is set on the
         # class directly
         assert OpenAIEmbedding(api_key="sk-" + ("a" * 48))
+
+
+@patch.object(
+    OpenAIEmbedding, "_get_query_embeddings", side_effect=mock_get_text_embeddings
+)
+def test_get_query_embedding_batch(_mock_get_query_embeddings: Any) -> None:
+    """Test query embeddings are requested in batches."""
+    embed_model = OpenAIEmbedding(embed_batch_size=2)
+    queries = ["Hello world.", "This is a test.", "This is another test."]
+
+    result_embeddings = embed_model.get_query_embedding_batch(queries)
+
+    assert result_embeddings == mock_get_text_embeddings(queries)
+    assert _mock_get_query_embeddings.call_count == 2
+
+
+class RateLimitError(Exception):
+    """Stand-in for a provider rate limit error."""
+
+
+class ConcurrencyTrackingEmbedding(MockEmbedding):
+    """Mock embedding recording its batches and concurrency."""
+
+    batches: List[List[str]] = []
+    max_in_flight: int = 0
+    in_flight: int = 0
+    # number of calls to fail with a rate limit error
+    num_rate_limits: int = 0
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # finish batches in reverse order
+            await asyncio.sleep(0.01 / (len(self.batches) + 1))
+            if self.num_rate_limits > 0:
+                self.num_rate_limits -= 1
+                raise RateLimitError
+            self.batches.append(texts)
+            return [await self._aget_text_embedding(text) for text in texts]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.parametrize("show_progress", [False, True])
+def test_aget_text_embedding_batch_limits_concurrency(show_progress: bool) -> None:
+    embed_model = ConcurrencyTrackingEmbedding(
+        batches=[], embed_batch_size=2, embed_max_concurrency=3
+    )
+    texts = [f"text {i}" for i in range(20)] + ["Hello world.", "This is a test."]
+
+    result_embeddings = asyncio.run(
+        embed_model.aget_text_embedding_batch(texts, show_progress=show_progress)
+    )
+
+    assert result_embeddings == MockEmbedding().get_text_embedding_batch(texts)
+    assert embed_model.max_in_flight == 3
+    assert len(embed_model.batches) == 11
+
+
+def test_aget_text_embedding_batch_token_budget() -> None:
+    embed_model = ConcurrencyTrackingEmbedding(
+        batches=[], embed_batch_size=10, embed_batch_token_budget=8
+    )
+    # "Hello world." is 3 tokens, "This is a test." is 5 tokens
+    texts = ["Hello world.", "Hello world.", "This is a test.", "This is a test."]
+    assert embed_model._get_text_batch_ranges(texts) == [(0, 2), (2, 3), (3, 4)]
+
+    result_embeddings = asyncio.run(embed_model.aget_text_embedding_batch(texts))
+    assert result_embeddings == MockEmbedding().get_text_embedding_batch(texts)
+
+
+def test_aget_text_embedding_batch_shrinks_batches_on_rate_limits(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("llama_index.embeddings.base.EMBED_MIN_BACKOFF_SECS", 0.0)
+    embed_model = ConcurrencyTrackingEmbedding(
+        batches=[], embed_batch_size=8, embed_max_concurrency=1, num_rate_limits=2
+    )
+    texts = [f"text {i}" for i in range(16)]
+
+    result_embeddings = asyncio.run(embed_model.aget_text_embedding_batch(texts))
+
+    assert result_embeddings == MockEmbedding().get_text_embedding_batch(texts)
+    # halved twice to 2, then the limit grows back by one text per batch
+    # while the leftovers of the split batches are embedded
+    assert [len(batch) for batch in embed_model.batches] == [2, 2, 4, 5, 3]
+
+
+class BackoffTrackingEmbedding(MockEmbedding):
+    """Mock embedding recording when batches are sent and rate limited."""
+
+    send_times: List[float] = []
+    rate_limit_times: List[float] = []
+    # number of calls to fail with a rate limit error
+    num_rate_limits: int = 0
+
+    async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+        now = asyncio.get_running_loop().time()
+        if self.num_rate_limits > 0:
+            self.num_rate_limits -= 1
+            self.rate_limit_times.append(now)
+            raise RateLimitError
+        self.send_times.append(now)
+        await asyncio.sleep(0.01)
+        return [await self._aget_text_embedding(text) for text in texts]
+
+
+def test_aget_text_embedding_batch_backs_off_all_workers(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("llama_index.embeddings.base.EMBED_MIN_BACKOFF_SECS", 0.05)
+    mocker.patch("llama_index.embeddings.base.random.uniform", return_value=1.0)
+    embed_model = BackoffTrackingEmbedding(
+        send_times=[],
+        rate_limit_times=[],
+        embed_batch_size=2,
+        embed_max_concurrency=4,
+        num_rate_limits=1,
+    )
+    texts = [f"text {i}" for i in range(16)]
+
+    result_embeddings = asyncio.run(embed_model.aget_text_embedding_batch(texts))
+
+    assert result_embeddings == MockEmbedding().get_text_embedding_batch(texts)
+    (rate_limit_time,) = embed_model.rate_limit_times
+    # no worker sends a batch during the backoff window
+    assert all(
+        send_time < rate_limit_time or send_time >= rate_limit_time + 0.05
+        for send_time in embed_model.send_times
+    )
+
+
+def test_aget_text_embedding_batch_gives_up_on_other_errors() -> None:
+    class FailingEmbedding(MockEmbedding):
+        async def _aget_text_embeddings(self, texts: List[str]) -> List[List[float]]:
+            raise ValueError("bad input")
+
+    with pytest.raises(ValueError, match="bad input"):
+        asyncio.run(FailingEmbedding().aget_text_embedding_batch(["Hello world."] * 30))
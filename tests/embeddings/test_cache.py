@@ -0,0 +1,151 @@
+"""Test embedding cache."""
+import asyncio
+from pathlib import Path
+from typing import List
+
+from llama_index.callbacks import CallbackManager, LlamaDebugHandler
+from llama_index.callbacks.schema import CBEventType, EventPayload
+from llama_index.embeddings.cache import (
+    BaseEmbeddingCache,
+    CachedEmbedding,
+    InMemoryEmbeddingCache,
+    KVStoreEmbeddingCache,
+    SQLiteEmbeddingCache,
+)
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+
+from tests.indices.vector_store.mock_services import MockEmbedding
+
+TEXTS = ["Hello world.", "This is a test.", "Hello world.", "This is another test."]
+
+
+class CountingEmbedding(MockEmbedding):
+    """Mock embedding recording the texts it was asked to embed."""
+
+    embedded_texts: List[str] = []
+
+    def _get_text_embedding(self, text: str) -> List[float]:
+        self.embedded_texts.append(text)
+        return super()._get_text_embedding(text)
+
+    async def _aget_text_embedding(self, text: str) -> List[float]:
+        self.embedded_texts.append(text)
+        return await super()._aget_text_embedding(text)
+
+    def _get_query_embedding(self, query: str) -> List[float]:
+        self.embedded_texts.append(query)
+        return super()._get_query_embedding(query)
+
+
+def _get_caches(tmp_path: Path) -> List[BaseEmbeddingCache]:
+    return [
+        InMemoryEmbeddingCache(),
+        SQLiteEmbeddingCache(str(tmp_path / "cache.db")),
+        KVStoreEmbeddingCache(SimpleKVStore()),
+    ]
+
+
+def test_cached_embedding_only_embeds_misses(tmp_path: Path) -> None:
+    for cache in _get_caches(tmp_path):
+        embed_model = CountingEmbedding(embedded_texts=[])
+        cached_model = CachedEmbedding(embed_model, cache=cache)
+
+        embeddings = cached_model.get_text_embedding_batch(TEXTS)
+        assert embeddings == MockEmbedding().get_text_embedding_batch(TEXTS)
+        # duplicates within a call are embedded once
+        assert embed_model.embedded_texts == [
+            "Hello world.",
+            "This is a test.",
+            "This is another test.",
+        ]
+
+        embed_model.embedded_texts.clear()
+        assert cached_model.get_text_embedding_batch(TEXTS) == embeddings
+        assert cached_model.get_text_embedding("This is a test v2.") == [
+            0,
+            0,
+            0,
+            1,
+            0,
+        ]
+        assert embed_model.embedded_texts == ["This is a test v2."]
+        # the duplicate in the first call is not a cache hit
+        assert cached_model.cache_hits == 4
+        assert cached_model.cache_misses == 4
+        assert cached_model.cache_duplicates == 1
+
+        # query embeddings are cached separately from text embeddings
+        assert cached_model.get_query_embedding("Hello world.") == [0, 0, 1, 0, 0]
+        assert cached_model.get_query_embedding("Hello world.") == [0, 0, 1, 0, 0]
+        assert embed_model.embedded_texts == ["This is a test v2.", "Hello world."]
+
+
+def test_cached_embedding_async() -> None:
+    embed_model = CountingEmbedding(embedded_texts=[])
+    cached_model = CachedEmbedding(embed_model)
+
+    embeddings = asyncio.run(cached_model.aget_text_embedding_batch(TEXTS))
+    assert embeddings == MockEmbedding().get_text_embedding_batch(TEXTS)
+    assert asyncio.run(cached_model.aget_text_embedding("Hello world.")) == [
+        1,
+        0,
+        0,
+        0,
+        0,
+    ]
+    assert len(embed_model.embedded_texts) == 3
+    assert cached_model.cache_hits == 1
+    assert cached_model.cache_duplicates == 1
+
+
+def test_cached_embedding_callback_events() -> None:
+    handler = LlamaDebugHandler()
+    cached_model = CachedEmbedding(
+        MockEmbedding(), callback_manager=CallbackManager([handler])
+    )
+    cached_model.get_text_embedding_batch(TEXTS)
+    cached_model.get_text_embedding_batch(TEXTS)
+
+    cache_events = handler.get_event_pairs(CBEventType.EMBEDDING_CACHE)
+    assert [
+        (end.payload[EventPayload.CACHE_HITS], end.payload[EventPayload.CACHE_MISSES])
+        for _, end in cache_events
+        if end.payload is not None
+    ] == [(0, 3), (4, 0)]
+    # only misses are sent to the model
+    embedding_events = handler.get_event_pairs(CBEventType.EMBEDDING)
+    assert len(embedding_events) == 1
+
+
+def test_in_memory_cache_evicts_least_recently_used() -> None:
+    cache = InMemoryEmbeddingCache(max_size=2)
+    cache.put_many([("a", [1.0]), ("b", [2.0])])
+    assert cache.get_many(["a"]) == [[1.0]]
+    cache.put_many([("c", [3.0])])
+    assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+    assert len(cache) == 2
+
+
+def test_cached_embeddings_are_copies() -> None:
+    cached_model = CachedEmbedding(MockEmbedding())
+    embedding = cached_model.get_text_embedding("Hello world.")
+    expected = list(embedding)
+    embedding.append(0.0)
+    cached_embedding = cached_model.get_text_embedding("Hello world.")
+    assert cached_embedding == expected
+    cached_embedding[0] = -1.0
+    assert cached_model.get_text_embedding("Hello world.") == expected
+    assert (cached_model.cache_hits, cached_model.cache_misses) == (2, 1)
+
+
+def test_sqlite_cache_persists(tmp_path: Path) -> None:
+    database = str(tmp_path / "cache.db")
+    cache = SQLiteEmbeddingCache(database)
+    cache.put_many([("a", [0.1, 0.2]), ("b", [0.3, 0.4])])
+    cache.close()
+
+    cache = SQLiteEmbeddingCache(database)
+    assert cache.get_many(["b", "missing", "a"]) == [[0.3, 0.4], None, [0.1, 0.2]]
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
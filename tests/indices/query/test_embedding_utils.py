@@ -1,6 +1,9 @@
 """ Test embedding utility functions."""
 
+from typing import List
+
 import numpy as np
+from llama_index.embeddings.base import similarity
 from llama_index.indices.query.embedding_utils import (
     get_top_k_embeddings,
     get_top_k_mmr_embeddings,
@@ -71,3 +74,73 @@ def test_get_top_k_mmr_embeddings() -> None:
         result_similarities_no_mmr, result_similarities
     ):
         assert np.isclose(result_no_mmr, result_with_mmr, atol=0.00001)
+
+
+def _naive_mmr(
+    query_embedding: np.ndarray, embeddings: np.ndarray, top_k: int, threshold: float
+) -> List[int]:
+    """Reference MMR, discounting by the max similarity to any previous result."""
+    embeddings = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    query_embedding = query_embedding / np.linalg.norm(query_embedding)
+    selected: List[int] = []
+    while len(selected) < top_k:
+        best, best_score = -1, -np.inf
+        for i, embedding in enumerate(embeddings):
+            if i in selected:
+                continue
+            score = threshold * float(embedding @ query_embedding)
+            if selected:
+                overlap = max(float(embedding @ embeddings[j]) for j in selected)
+                score -= (1 - threshold) * overlap
+            if score > best_score:
+                best, best_score = i, score
+        selected.append(best)
+    return selected
+
+
+def test_get_top_k_mmr_embeddings_matches_reference() -> None:
+    rng = np.random.default_rng(0)
+    embeddings = rng.normal(size=(200, 8))
+    query_embedding = rng.normal(size=8)
+
+    for threshold in [0.2, 0.5, 0.9]:
+        _, result_ids = get_top_k_mmr_embeddings(
+            query_embedding.tolist(),
+            embeddings.tolist(),
+            similarity_top_k=10,
+            mmr_threshold=threshold,
+        )
+        assert result_ids == _naive_mmr(query_embedding, embeddings, 10, threshold)
+
+        # a custom similarity_fn takes the non-vectorized path
+        _, result_ids_custom_fn = get_top_k_mmr_embeddings(
+            query_embedding.tolist(),
+            embeddings.tolist(),
+            similarity_fn=lambda a, b: similarity(a, b),
+            similarity_top_k=10,
+            mmr_threshold=threshold,
+        )
+        assert result_ids_custom_fn == result_ids
+
+
+def test_get_top_k_mmr_embeddings_fetch_k() -> None:
+    rng = np.random.default_rng(1)
+    embeddings = rng.normal(size=(100, 8))
+    query_embedding = rng.normal(size=8)
+    _, top_ids = get_top_k_embeddings(
+        query_embedding.tolist(), embeddings.tolist(), similarity_top_k=20
+    )
+
+    _, result_ids = get_top_k_mmr_embeddings(
+        query_embedding.tolist(),
+        embeddings.tolist(),
+        similarity_top_k=5,
+        mmr_threshold=0.3,
+        fetch_k=20,
+    )
+    assert len(result_ids) == 5
+    assert set(result_ids) <= set(top_ids)
+
+    pool = sorted(top_ids)
+    expected = _naive_mmr(query_embedding, embeddings[pool], 5, 0.3)
+    assert result_ids == [pool[i] for i in expected]
@@ -4,6 +4,7 @@ from typing import List, Sequence
 from unittest.mock import Mock
 
 import pytest
+from llama_index.async_utils import AsyncExecutor
 from llama_index.indices.prompt_helper import PromptHelper
 from llama_index.indices.service_context import ServiceContext
 from llama_index.prompts.base import PromptTemplate
@@ -139,3 +140,28 @@ async def test_tree_summarize_async(
         text_chunks=texts, query_str=query_str
     )
     assert str(response) == "Text chunk 1\nText chunk 2\nText chunk 3\nText chunk 4"
+
+
+@pytest.mark.asyncio()
+async def test_tree_summarize_async_executor(
+    mock_service_context_merge_chunks: ServiceContext,
+) -> None:
+    mock_summary_prompt = PromptTemplate(
+        "{context_str}{query_str}", prompt_type=PromptType.SUMMARY
+    )
+    executor = AsyncExecutor(max_in_flight=1)
+    executor.gather = Mock(wraps=executor.gather)  # type: ignore
+    mock_service_context_merge_chunks.async_executor = executor
+
+    texts = ["Text chunk 1", "Text chunk 2", "Text chunk 3", "Text chunk 4"]
+    tree_summarize = TreeSummarize(
+        service_context=mock_service_context_merge_chunks,
+        summary_template=mock_summary_prompt,
+    )
+    response = await tree_summarize.aget_response(
+        text_chunks=texts, query_str="What is?"
+    )
+    assert str(response) == "Text chunk 1\nText chunk 2\nText chunk 3\nText chunk 4"
+    # the chunk summaries of the first level ran through the executor
+    assert executor.gather.call_count == 1
+    assert len(executor.gather.call_args[0][0]) == 2
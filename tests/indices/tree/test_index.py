@@ -6,7 +6,7 @@ from unittest.mock import patch
 from llama_index.data_structs.data_structs import IndexGraph
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.tree.base import TreeIndex
-from llama_index.schema import BaseNode, Document
+from llama_index.schema import BaseNode, Document, TextNode
 from llama_index.storage.docstore import BaseDocumentStore
 
 
@@ -212,3 +212,40 @@ def test_twice_insert_empty(
 def _mock_tokenizer(text: str) -> int:
     """Mock tokenizer that splits by spaces."""
     return len(text.split(" "))
+
+
+def test_index_graph_node_index_map() -> None:
+    """Test the node id to index map is kept in sync and restored on load."""
+    leaves = [TextNode(text=f"leaf {i}", id_=f"leaf_{i}") for i in range(4)]
+    parent = TextNode(text="parent", id_="parent")
+    index_graph = IndexGraph()
+    for leaf in leaves[:3]:
+        index_graph.insert(leaf)
+    index_graph.insert(parent, children_nodes=leaves[:2])
+    index_graph.insert_under_parent(leaves[3], parent, new_index=10)
+
+    assert index_graph.get_index(parent) == 3
+    assert index_graph.get_children(parent) == {
+        0: "leaf_0",
+        1: "leaf_1",
+        10: "leaf_3",
+    }
+    assert index_graph.node_id_to_index == {
+        node_id: index for index, node_id in index_graph.all_nodes.items()
+    }
+
+    loaded_graph = IndexGraph.from_json(index_graph.to_json())
+    assert "_node_id_to_index" not in index_graph.to_dict()
+    assert loaded_graph == index_graph
+    assert loaded_graph.get_children(parent) == index_graph.get_children(parent)
+
+    # direct modifications of all_nodes are picked up
+    index_graph.all_nodes[11] = index_graph.all_nodes.pop(2)
+    assert index_graph.get_index(leaves[2]) == 11
+    index_graph.all_nodes[0], index_graph.all_nodes[1] = "leaf_1", "leaf_0"
+    assert index_graph.get_index(leaves[0]) == 1
+    assert index_graph.node_id_to_index["leaf_0"] == 1
+
+    # the returned map is a copy
+    index_graph.node_id_to_index["leaf_0"] = 5
+    assert index_graph.get_index(leaves[0]) == 1
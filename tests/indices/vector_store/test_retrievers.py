@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, cast
 
 import pytest
@@ -5,8 +6,10 @@ from llama_index.indices.query.schema import QueryBundle
 from llama_index.indices.service_context import ServiceContext
 from llama_index.indices.vector_store.base import VectorStoreIndex
 from llama_index.schema import Document, NodeRelationship, RelatedNodeInfo, TextNode
+from llama_index.storage.docstore import SimpleDocumentStore
 from llama_index.storage.storage_context import StorageContext
 from llama_index.vector_stores.simple import SimpleVectorStore
+from pytest_mock import MockerFixture
 
 try:
     import faiss
@@ -148,3 +151,57 @@ def test_query(mock_service_context: ServiceContext) -> None:
     query_str = "What is?"
     retriever = index.as_retriever()
     _ = retriever.retrieve(QueryBundle(query_str))
+
+
+@pytest.mark.parametrize("use_matrix", [False, True])
+def test_simple_retrieve_batch(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+    use_matrix: bool,
+) -> None:
+    """Test batched retrieval matches one-at-a-time retrieval."""
+    storage_context = StorageContext.from_defaults(
+        vector_store=SimpleVectorStore(use_matrix=use_matrix)
+    )
+    index = VectorStoreIndex.from_documents(
+        documents,
+        storage_context=storage_context,
+        service_context=mock_service_context,
+    )
+
+    retriever = index.as_retriever(similarity_top_k=2)
+    query_bundles = [
+        QueryBundle("What is?"),
+        QueryBundle("Which?", embedding=[1, 0, 0, 0, 0]),
+    ]
+    batch_nodes = retriever.retrieve_batch(query_bundles)
+    assert len(batch_nodes) == 2
+    for query_bundle, nodes in zip(query_bundles, batch_nodes):
+        expected_nodes = retriever.retrieve(query_bundle)
+        assert [n.node.node_id for n in nodes] == [
+            n.node.node_id for n in expected_nodes
+        ]
+    assert batch_nodes[0][0].node.get_content() == "This is another test."
+    assert batch_nodes[1][0].node.get_content() == "Hello world."
+
+
+def test_simple_aretrieve_uses_async_docstore(
+    documents: List[Document],
+    mock_service_context: ServiceContext,
+    mocker: MockerFixture,
+) -> None:
+    """Test the async build and query paths don't block on the sync docstore."""
+    for method in ("add_documents", "get_nodes", "get_node", "document_exists"):
+        mocker.patch.object(
+            SimpleDocumentStore, method, side_effect=AssertionError(method)
+        )
+    index = VectorStoreIndex.from_documents(
+        documents, service_context=mock_service_context, use_async=True
+    )
+    # SimpleVectorStore doesn't store text, so nodes are read from the docstore
+    assert len(index.docstore.docs) == len(index.index_struct.nodes_dict)
+
+    retriever = index.as_retriever(similarity_top_k=1)
+    nodes = asyncio.run(retriever.aretrieve(QueryBundle("What is?")))
+    assert len(nodes) == 1
+    assert nodes[0].node.get_content() == "This is another test."
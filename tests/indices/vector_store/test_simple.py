@@ -1,12 +1,19 @@
 """Test vector store indexes."""
-from typing import Any, List, cast
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, cast
 
+import pytest
 from llama_index.indices.loading import load_index_from_storage
 from llama_index.indices.service_context import ServiceContext
-from llama_index.indices.vector_store.base import VectorStoreIndex
+from llama_index.indices.vector_store.base import (
+    _UNCOMMITTED_DOC_HASH,
+    VectorStoreIndex,
+)
 from llama_index.schema import Document
+from llama_index.storage.docstore.types import BaseDocumentStore
 from llama_index.storage.storage_context import StorageContext
 from llama_index.vector_stores.simple import SimpleVectorStore
+from pytest_mock import MockerFixture
 
 
 def test_build_simple(
@@ -191,3 +198,100 @@ def test_simple_insert_save(
     loaded_index = load_index_from_storage(storage_context=storage_context)
     assert isinstance(loaded_index, VectorStoreIndex)
     assert index.index_struct == loaded_index.index_struct
+
+
+_STREAM_TEXTS = [
+    "Hello world.",
+    "This is a test.",
+    "This is another test.",
+    "This is a test v2.",
+    "This is a test v3.",
+]
+
+
+def _document_stream(
+    docstore: BaseDocumentStore,
+    max_uncommitted: List[int],
+    fail_after: Optional[int] = None,
+) -> Iterator[Document]:
+    """Yield documents, tracking how many were read but not yet committed."""
+    for idx, text in enumerate(_STREAM_TEXTS):
+        if fail_after is not None and idx == fail_after:
+            raise RuntimeError("reader failed")
+        num_committed = sum(
+            docstore.get_document_hash(f"doc-{i}") is not None for i in range(idx)
+        )
+        max_uncommitted.append(idx - num_committed)
+        yield Document(text=text, id_=f"doc-{idx}")
+
+
+def _get_stored_texts(index: VectorStoreIndex) -> List[str]:
+    nodes = index.docstore.get_nodes(list(index.index_struct.nodes_dict.values()))
+    return sorted(node.get_content() for node in nodes)
+
+
+def test_build_from_document_stream(
+    mock_service_context: ServiceContext, mocker: MockerFixture
+) -> None:
+    delete_ref_doc = mocker.spy(VectorStoreIndex, "delete_ref_doc")
+    storage_context = StorageContext.from_defaults()
+    max_uncommitted: List[int] = []
+    index = VectorStoreIndex.from_document_stream(
+        _document_stream(storage_context.docstore, max_uncommitted),
+        storage_context=storage_context,
+        service_context=mock_service_context,
+        window_size=2,
+    )
+
+    assert _get_stored_texts(index) == sorted(_STREAM_TEXTS)
+    # new documents have nothing to delete
+    assert delete_ref_doc.call_count == 0
+    # documents are read one window at a time
+    assert max(max_uncommitted) < 2
+    vector_store = cast(SimpleVectorStore, index.vector_store)
+    for text_id, node_id in index.index_struct.nodes_dict.items():
+        node = index.docstore.get_node(node_id)
+        assert vector_store.get(
+            text_id
+        ) == mock_service_context.embed_model.get_text_embedding(node.get_content())
+
+
+def test_resume_document_stream(
+    tmp_path: Path, mock_service_context: ServiceContext
+) -> None:
+    persist_dir = str(tmp_path)
+    storage_context = StorageContext.from_defaults()
+    with pytest.raises(RuntimeError, match="reader failed"):
+        VectorStoreIndex.from_document_stream(
+            _document_stream(storage_context.docstore, [], fail_after=3),
+            storage_context=storage_context,
+            service_context=mock_service_context,
+            window_size=2,
+            persist_dir=persist_dir,
+        )
+
+    # only the first window was committed and persisted
+    storage_context = StorageContext.from_defaults(persist_dir=persist_dir)
+    index = cast(
+        VectorStoreIndex,
+        load_index_from_storage(storage_context, service_context=mock_service_context),
+    )
+    assert _get_stored_texts(index) == sorted(_STREAM_TEXTS[:2])
+
+    # a partially written window is redone without duplicating nodes
+    index.docstore.set_document_hash("doc-2", _UNCOMMITTED_DOC_HASH)
+    index.insert_nodes(
+        mock_service_context.node_parser.get_nodes_from_documents(
+            [Document(text=_STREAM_TEXTS[2], id_="doc-2")]
+        )
+    )
+    index.insert_document_stream(
+        _document_stream(storage_context.docstore, []), window_size=2
+    )
+    assert _get_stored_texts(index) == sorted(_STREAM_TEXTS)
+    assert len(cast(SimpleVectorStore, index.vector_store)._data.embedding_dict) == 5
+
+    # committed documents are skipped, changed documents are re-inserted
+    changed_doc = Document(text="This is bar test.", id_="doc-0")
+    index.insert_document_stream([changed_doc])
+    assert _get_stored_texts(index) == sorted(["This is bar test."] + _STREAM_TEXTS[1:])
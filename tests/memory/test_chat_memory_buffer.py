@@ -1,4 +1,5 @@
 import pickle
+from typing import List
 
 from llama_index.llms import ChatMessage, MessageRole
 from llama_index.memory.chat_memory_buffer import ChatMemoryBuffer
@@ -73,3 +74,26 @@ def test_pickle() -> None:
     memory = ChatMemoryBuffer.from_defaults()
     bytes_ = pickle.dumps(memory)
     assert isinstance(pickle.loads(bytes_), ChatMemoryBuffer)
+
+
+def test_tokenizes_each_message_once() -> None:
+    tokenized_texts = []
+
+    def tokenizer_fn(text: str) -> List[str]:
+        tokenized_texts.append(text)
+        return text.split()
+
+    memory = ChatMemoryBuffer.from_defaults(token_limit=5, tokenizer_fn=tokenizer_fn)
+    for i in range(10):
+        memory.put(ChatMessage(role=MessageRole.USER, content=f"message {i}"))
+        assert [m.content for m in memory.get()] == [
+            f"message {j}" for j in range(max(i - 1, 0), i + 1)
+        ]
+    assert len(tokenized_texts) == 10
+
+    # direct changes to the chat history are picked up
+    memory.chat_history[-1].content = "a much longer message"
+    assert [m.content for m in memory.get()] == ["a much longer message"]
+    memory.chat_history.pop()
+    assert [m.content for m in memory.get()] == ["message 7", "message 8"]
+    assert len(tokenized_texts) == 11
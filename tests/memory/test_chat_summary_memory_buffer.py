@@ -0,0 +1,54 @@
+import pickle
+
+from llama_index.llms import ChatMessage, MessageRole
+from llama_index.llms.mock import MockLLM
+from llama_index.memory.chat_summary_memory_buffer import (
+    SUMMARY_MESSAGE_PREFIX,
+    ChatSummaryMemoryBuffer,
+)
+
+
+def _message(i: int) -> ChatMessage:
+    role = MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT
+    return ChatMessage(role=role, content=f"message {i}")
+
+
+def test_rolling_memory_evicts_oldest_messages() -> None:
+    memory = ChatSummaryMemoryBuffer.from_defaults(
+        token_limit=8, tokenizer_fn=lambda text: text.split()
+    )
+    for i in range(5):
+        memory.put(_message(i))
+
+    # 5 messages of 2 tokens exceed the limit, the history is reduced to
+    # half of it, without starting on an assistant message
+    assert [m.content for m in memory.get_all()] == ["message 4"]
+    assert memory.summary is None
+    assert memory.get() == memory.get_all()
+
+
+def test_summary_memory_summarizes_evicted_messages() -> None:
+    memory = ChatSummaryMemoryBuffer.from_defaults(
+        llm=MockLLM(max_tokens=2),
+        token_limit=12,
+        tokenizer_fn=lambda text: text.split(),
+    )
+    for i in range(7):
+        memory.put(_message(i))
+
+    assert memory.summary == "text text"
+    assert [m.content for m in memory.get_all()] == ["message 6"]
+    messages = memory.get()
+    assert messages[0].role == MessageRole.SYSTEM
+    assert messages[0].content == SUMMARY_MESSAGE_PREFIX + "text text"
+    assert messages[1:] == memory.get_all()
+    # the summary is dropped first when the history does not fit with it
+    assert memory.get(initial_token_count=8) == memory.get_all()
+
+    new_memory = ChatSummaryMemoryBuffer.from_string(memory.to_string())
+    assert isinstance(new_memory, ChatSummaryMemoryBuffer)
+    assert new_memory.summary == memory.summary
+    assert pickle.loads(pickle.dumps(memory)).summary == memory.summary
+
+    memory.reset()
+    assert memory.get() == []
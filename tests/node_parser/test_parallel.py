@@ -0,0 +1,91 @@
+"""Test parsing documents with multiple worker processes."""
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+import pytest
+from llama_index.node_parser import (
+    HierarchicalNodeParser,
+    SentenceWindowNodeParser,
+    SimpleNodeParser,
+)
+from llama_index.node_parser.interface import NodeParser
+from llama_index.node_parser.node_utils import parallel_parse_documents
+from llama_index.schema import BaseNode, Document, MetadataMode
+
+
+def _documents() -> List[Document]:
+    return [
+        Document(
+            text=" ".join(
+                f"This is sentence {j} of document {i}." for j in range(i * 7 + 3)
+            ),
+            metadata={"doc_index": i},
+            id_=f"doc_{i}",
+        )
+        for i in range(13)
+    ]
+
+
+def _node_structure(nodes: List[BaseNode]) -> List[Tuple[Any, ...]]:
+    """Describe nodes with relationships to other nodes as indices instead of ids."""
+    positions = {node.node_id: i for i, node in enumerate(nodes)}
+
+    def _position(node_id: str) -> Any:
+        return positions.get(node_id, node_id)
+
+    structure = []
+    for node in nodes:
+        relationships: Dict[str, Any] = {}
+        for relationship, related in node.relationships.items():
+            if isinstance(related, list):
+                relationships[relationship.name] = [
+                    _position(info.node_id) for info in related
+                ]
+            else:
+                relationships[relationship.name] = _position(related.node_id)
+        structure.append(
+            (
+                node.get_content(metadata_mode=MetadataMode.ALL),
+                node.metadata,
+                relationships,
+            )
+        )
+    return structure
+
+
+def _get_node_parser(node_parser_cls: Type[NodeParser], **kwargs: Any) -> NodeParser:
+    if node_parser_cls is SimpleNodeParser:
+        return SimpleNodeParser.from_defaults(chunk_size=32, chunk_overlap=4, **kwargs)
+    elif node_parser_cls is SentenceWindowNodeParser:
+        return SentenceWindowNodeParser.from_defaults(window_size=2, **kwargs)
+    elif node_parser_cls is HierarchicalNodeParser:
+        return HierarchicalNodeParser.from_defaults(chunk_sizes=[96, 48, 24], **kwargs)
+    raise ValueError(f"Unknown node parser: {node_parser_cls}")
+
+
+@pytest.mark.parametrize(
+    "node_parser_cls",
+    [SimpleNodeParser, SentenceWindowNodeParser, HierarchicalNodeParser],
+)
+def test_parallel_parsing_matches_serial(node_parser_cls: Type[NodeParser]) -> None:
+    documents = _documents()
+    serial_nodes = _get_node_parser(node_parser_cls).get_nodes_from_documents(documents)
+
+    parallel_parser = _get_node_parser(node_parser_cls, num_workers=3)
+    parallel_nodes = parallel_parser.get_nodes_from_documents(documents)
+
+    assert len(parallel_nodes) == len(serial_nodes)
+    assert _node_structure(parallel_nodes) == _node_structure(serial_nodes)
+    assert len({node.node_id for node in parallel_nodes}) == len(parallel_nodes)
+
+
+def test_parallel_parsing_with_unpicklable_parser() -> None:
+    documents = _documents()
+    node_parser = _get_node_parser(SimpleNodeParser)
+    serial_nodes = node_parser.get_nodes_from_documents(documents)
+
+    def parse_fn(documents: Sequence[Document]) -> List[BaseNode]:
+        return node_parser.get_nodes_from_documents(documents)
+
+    # a local function cannot be sent to worker processes
+    parallel_nodes = parallel_parse_documents(parse_fn, documents, num_workers=3)
+    assert _node_structure(parallel_nodes) == _node_structure(serial_nodes)
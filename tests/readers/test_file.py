@@ -1,5 +1,6 @@
 """Test file reader."""
 
+from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Any, Dict
 
@@ -423,3 +424,90 @@ def test_error_if_not_dir_or_file() -> None:
         SimpleDirectoryReader(input_files=["not_a_file"])
     with TemporaryDirectory() as tmp_dir, pytest.raises(ValueError, match="No files"):
         SimpleDirectoryReader(tmp_dir)
+
+
+@pytest.mark.parametrize("num_workers", [2, 3])
+def test_parallel_load_matches_serial(num_workers: int) -> None:
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(7):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+        # markdown files are loaded by a file reader in worker processes
+        for i in range(3):
+            with open(f"{tmp_dir}/test{i}.md", "w") as f:
+                f.write(f"# header {i}\ntest{i}\n# second header\nmore text")
+
+        serial_reader = SimpleDirectoryReader(tmp_dir, filename_as_id=True)
+        parallel_reader = SimpleDirectoryReader(
+            tmp_dir, filename_as_id=True, num_workers=num_workers
+        )
+        serial_documents = serial_reader.load_data()
+
+        assert list(parallel_reader.iter_data()) == serial_documents
+        assert parallel_reader.load_data() == serial_documents
+        assert [doc.id_ for doc in serial_documents][:3] == [
+            f"{tmp_dir}/test0.md_part_0",
+            f"{tmp_dir}/test0.md_part_1",
+            f"{tmp_dir}/test0.txt",
+        ]
+
+
+def test_iter_data_is_lazy() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(3):
+            with open(f"{tmp_dir}/test{i}.txt", "w") as f:
+                f.write(f"test{i}")
+
+        loaded_files = []
+
+        def file_metadata(file_path: str) -> Dict:
+            loaded_files.append(file_path)
+            return {"file_path": file_path}
+
+        reader = SimpleDirectoryReader(tmp_dir, file_metadata=file_metadata)
+        documents = reader.iter_data()
+        assert next(documents).text == "test0"
+        assert loaded_files == [f"{tmp_dir}/test0.txt"]
+        assert [doc.text for doc in documents] == ["test1", "test2"]
+
+
+def test_parallel_load_with_unpicklable_reader() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(3):
+            with open(f"{tmp_dir}/test{i}.md", "w") as f:
+                f.write(f"# header {i}\ntest{i}")
+
+        # a local function cannot be sent to worker processes
+        def file_metadata(file_path: str) -> Dict:
+            return {"file_name": Path(file_path).name}
+
+        serial_documents = SimpleDirectoryReader(
+            tmp_dir, file_metadata=file_metadata
+        ).load_data()
+        parallel_documents = SimpleDirectoryReader(
+            tmp_dir, file_metadata=file_metadata, num_workers=2
+        ).load_data()
+        assert [doc.text for doc in parallel_documents] == [
+            doc.text for doc in serial_documents
+        ]
+        assert parallel_documents[0].metadata["file_name"] == "test0.md"
+
+
+def test_iter_file_documents() -> None:
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(2):
+            with open(f"{tmp_dir}/test{i}.md", "w") as f:
+                f.write(f"# header {i}\ntest{i}\n# second header\nmore text")
+        with open(f"{tmp_dir}/test2.txt", "w") as f:
+            f.write("test2")
+
+        reader = SimpleDirectoryReader(tmp_dir, filename_as_id=True)
+        file_documents = list(reader.iter_file_documents())
+        assert [(path.name, len(docs)) for path, docs in file_documents] == [
+            ("test0.md", 2),
+            ("test1.md", 2),
+            ("test2.txt", 1),
+        ]
+        assert [doc for _, docs in file_documents for doc in docs] == (
+            reader.load_data()
+        )
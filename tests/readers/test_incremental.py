@@ -0,0 +1,63 @@
+"""Test incremental directory loader."""
+import os
+from pathlib import Path
+
+import llama_index.readers.file.incremental as incremental
+from llama_index.indices.list.base import SummaryIndex
+from llama_index.indices.service_context import ServiceContext
+from llama_index.readers.file.incremental import IncrementalDirectoryLoader
+from pytest_mock import MockerFixture
+
+
+def _write(path: Path, text: str, mtime: float) -> None:
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+
+
+def test_sync_loads_only_changed_files(
+    tmp_path: Path, mock_service_context: ServiceContext, mocker: MockerFixture
+) -> None:
+    for name in ["a", "b", "c"]:
+        _write(tmp_path / f"{name}.txt", f"text {name}", mtime=1000)
+    loader = IncrementalDirectoryLoader(str(tmp_path))
+    index = SummaryIndex([], service_context=mock_service_context)
+
+    result = loader.sync(index)
+    file_paths = [str(tmp_path / f"{name}.txt") for name in ["a", "b", "c"]]
+    assert result.added == file_paths
+    assert set(index.ref_doc_info) == set(file_paths)
+
+    # unchanged files are not opened
+    get_file_hash = mocker.spy(incremental, "get_file_hash")
+    result = loader.sync(index)
+    assert result.num_unchanged == 3
+    assert not result.added and not result.updated and not result.deleted
+    assert get_file_hash.call_count == 0
+
+    # b changes, c is touched without changing, a is deleted
+    _write(tmp_path / "b.txt", "new text b", mtime=2000)
+    _write(tmp_path / "c.txt", "text c", mtime=2000)
+    os.remove(tmp_path / "a.txt")
+    refresh_ref_docs = mocker.spy(index, "refresh_ref_docs")
+
+    result = loader.sync(index)
+    assert result.updated == [file_paths[1]]
+    assert result.deleted == [file_paths[0]]
+    assert result.num_unchanged == 1
+    assert refresh_ref_docs.call_count == 1
+    assert set(index.ref_doc_info) == set(file_paths[1:])
+    nodes = index.docstore.get_nodes(index.ref_doc_info[file_paths[1]].node_ids)
+    assert [node.get_content() for node in nodes] == ["new text b"]
+
+    manifest = index.docstore.get_file_manifest()
+    assert set(manifest) == set(file_paths[1:])
+    assert manifest[file_paths[2]].mtime == 2000
+    assert manifest[file_paths[1]].doc_ids == [file_paths[1]]
+
+    # removing every file deletes all documents
+    for file_path in file_paths[1:]:
+        os.remove(file_path)
+    result = loader.sync(index)
+    assert result.deleted == file_paths[1:]
+    assert index.ref_doc_info == {}
+    assert index.docstore.get_file_manifest() == {}
@@ -0,0 +1,164 @@
+import asyncio
+from typing import Any, Generator, List
+
+import pytest
+from llama_index.bridge.pydantic import PrivateAttr
+from llama_index.indices.prompt_helper import PromptHelper
+from llama_index.indices.service_context import ServiceContext
+from llama_index.llms.base import CompletionResponse, llm_completion_callback
+from llama_index.llms.mock import MockLLM
+from llama_index.prompts import PromptTemplate
+from llama_index.response.schema import AsyncStreamingResponse
+from llama_index.response_synthesizers import (
+    CompactAndRefine,
+    ParallelRefine,
+    ResponseMode,
+    get_response_synthesizer,
+)
+from llama_index.schema import NodeWithScore, TextNode
+from tests.indices.vector_store.mock_services import MockEmbedding
+
+TEXT_QA_TEMPLATE = PromptTemplate("{context_str}")
+REFINE_TEMPLATE = PromptTemplate("{existing_answer}|{context_msg}")
+
+TEXT_CHUNKS = ["alpha", "beta", "gamma", "delta"]
+
+
+class SlowEchoLLM(MockLLM):
+    """Echo LLM which sleeps in async calls, tracking the calls in flight."""
+
+    _num_in_flight: int = PrivateAttr(default=0)
+    _max_in_flight: int = PrivateAttr(default=0)
+
+    @property
+    def max_in_flight(self) -> int:
+        return self._max_in_flight
+
+    @llm_completion_callback()
+    async def acomplete(self, prompt: str, **kwargs: Any) -> CompletionResponse:
+        self._num_in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._num_in_flight)
+        await asyncio.sleep(0.01)
+        self._num_in_flight -= 1
+        return self.complete(prompt, **kwargs)
+
+
+@pytest.fixture()
+def llm() -> SlowEchoLLM:
+    return SlowEchoLLM()
+
+
+@pytest.fixture()
+def service_context(llm: SlowEchoLLM) -> ServiceContext:
+    # each text chunk fills a whole prompt
+    prompt_helper = PromptHelper(
+        context_window=3900, num_output=256, chunk_size_limit=3
+    )
+    return ServiceContext.from_defaults(
+        llm=llm, embed_model=MockEmbedding(), prompt_helper=prompt_helper
+    )
+
+
+def _get_synthesizers(
+    service_context: ServiceContext, **kwargs: Any
+) -> List[CompactAndRefine]:
+    return [
+        synthesizer_cls(
+            service_context=service_context,
+            text_qa_template=TEXT_QA_TEMPLATE,
+            refine_template=REFINE_TEMPLATE,
+            **kwargs,
+        )
+        for synthesizer_cls in (CompactAndRefine, ParallelRefine)
+    ]
+
+
+def test_parallel_refine_matches_compact_and_refine(
+    service_context: ServiceContext,
+) -> None:
+    compact_and_refine, parallel_refine = _get_synthesizers(service_context)
+    expected = compact_and_refine.get_response("query", TEXT_CHUNKS)
+    assert expected == "|".join(TEXT_CHUNKS)
+    assert parallel_refine.get_response("query", TEXT_CHUNKS) == expected
+
+
+def test_parallel_refine_merge_tree(service_context: ServiceContext) -> None:
+    parallel_refine = ParallelRefine(
+        service_context=service_context,
+        text_qa_template=TEXT_QA_TEMPLATE,
+        refine_template=REFINE_TEMPLATE,
+        use_merge_tree=True,
+    )
+    response = parallel_refine.get_response("query", TEXT_CHUNKS)
+    # merged answers are repacked into refine contexts of the chunk size limit
+    assert isinstance(response, str)
+    assert response.replace("|", "") == "".join(TEXT_CHUNKS)
+
+
+@pytest.mark.asyncio()
+async def test_parallel_refine_concurrency(
+    llm: SlowEchoLLM, service_context: ServiceContext
+) -> None:
+    parallel_refine = ParallelRefine(
+        service_context=service_context,
+        text_qa_template=TEXT_QA_TEMPLATE,
+        refine_template=REFINE_TEMPLATE,
+        max_concurrency=2,
+    )
+    response = await parallel_refine.aget_response("query", TEXT_CHUNKS)
+    assert response == "|".join(TEXT_CHUNKS)
+    assert llm.max_in_flight == 2
+
+    parallel_refine = ParallelRefine(
+        service_context=service_context,
+        text_qa_template=TEXT_QA_TEMPLATE,
+        refine_template=REFINE_TEMPLATE,
+    )
+    response = await parallel_refine.aget_response("query", TEXT_CHUNKS)
+    assert response == "|".join(TEXT_CHUNKS)
+    assert llm.max_in_flight == len(TEXT_CHUNKS)
+
+
+def test_parallel_refine_single_chunk(service_context: ServiceContext) -> None:
+    parallel_refine = ParallelRefine(
+        service_context=service_context,
+        text_qa_template=TEXT_QA_TEMPLATE,
+        refine_template=REFINE_TEMPLATE,
+    )
+    assert parallel_refine.get_response("query", TEXT_CHUNKS[:1]) == TEXT_CHUNKS[0]
+    assert parallel_refine.get_response("query", []) == "Empty Response"
+
+
+def test_parallel_refine_streaming(service_context: ServiceContext) -> None:
+    parallel_refine = ParallelRefine(
+        service_context=service_context,
+        text_qa_template=TEXT_QA_TEMPLATE,
+        refine_template=REFINE_TEMPLATE,
+        streaming=True,
+    )
+    response_gen = parallel_refine.get_response("query", TEXT_CHUNKS)
+    assert isinstance(response_gen, Generator)
+    assert "".join(response_gen) == "|".join(TEXT_CHUNKS)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    "response_mode", [ResponseMode.COMPACT, ResponseMode.PARALLEL_REFINE]
+)
+async def test_async_streaming(
+    service_context: ServiceContext, response_mode: ResponseMode
+) -> None:
+    synthesizer = get_response_synthesizer(
+        service_context=service_context,
+        text_qa_template=TEXT_QA_TEMPLATE,
+        refine_template=REFINE_TEMPLATE,
+        response_mode=response_mode,
+        streaming=True,
+    )
+    nodes = [NodeWithScore(node=TextNode(text=text)) for text in TEXT_CHUNKS]
+    response = await synthesizer.asynthesize("query", nodes)
+    assert isinstance(response, AsyncStreamingResponse)
+    assert len(response.source_nodes) == len(TEXT_CHUNKS)
+
+    final_response = await response.aget_response()
+    assert final_response.response == "|".join(TEXT_CHUNKS)
@@ -1,11 +1,14 @@
 """Test docstore."""
 
 
+import asyncio
 from pathlib import Path
+from typing import Any, List, Optional
 
 import pytest
-from llama_index.schema import Document, TextNode
+from llama_index.schema import Document, NodeRelationship, RelatedNodeInfo, TextNode
 from llama_index.storage.docstore import SimpleDocumentStore
+from llama_index.storage.docstore.types import FileFingerprint
 from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
 
 
@@ -47,6 +50,86 @@ def test_docstore_persist(tmp_path: Path) -> None:
     assert gd2 == node
 
 
+def test_docstore_persist_wal(tmp_path: Path) -> None:
+    """Test docstore persists inserts and deletes through a write-ahead log."""
+    persist_path = str(tmp_path / "docstore.json")
+    doc = Document(text="hello world", id_="d1", metadata={"foo": "bar"})
+    node = TextNode(text="my node", id_="d2", metadata={"node": "info"})
+
+    docstore = SimpleDocumentStore(SimpleKVStore(use_wal=True))
+    docstore.add_documents([doc])
+    docstore.persist(persist_path)
+
+    docstore = SimpleDocumentStore.from_persist_path(persist_path)
+    docstore.add_documents([node])
+    docstore.delete_document("d1")
+    docstore.persist(persist_path)
+    assert Path(f"{persist_path}.wal").read_text()
+
+    new_docstore = SimpleDocumentStore.from_persist_path(persist_path)
+    assert new_docstore.docs == {"d2": node}
+
+
+def test_docstore_file_manifest(tmp_path: Path) -> None:
+    persist_path = str(tmp_path / "docstore.json")
+    docstore = SimpleDocumentStore()
+    fingerprints = {
+        "a.txt": FileFingerprint(mtime=1.5, size=3, hash="h1", doc_ids=["a.txt"]),
+        "b.pdf": FileFingerprint(
+            mtime=2.5, size=4, hash="h2", doc_ids=["b.pdf_part_0", "b.pdf_part_1"]
+        ),
+    }
+    docstore.set_file_fingerprints(fingerprints)
+    docstore.persist(persist_path)
+
+    new_docstore = SimpleDocumentStore.from_persist_path(persist_path)
+    assert new_docstore.get_file_manifest() == fingerprints
+    # the manifest is not part of the documents
+    assert new_docstore.docs == {}
+
+    new_docstore.delete_file_fingerprints(["a.txt"])
+    assert list(new_docstore.get_file_manifest()) == ["b.pdf"]
+
+
+def test_docstore_iter_docs() -> None:
+    """Test docstore iterates over documents lazily."""
+    nodes = [TextNode(text=f"node {i}", id_=f"n{i}") for i in range(3)]
+    docstore = SimpleDocumentStore()
+    docstore.add_documents(nodes)
+
+    docs_iter = docstore.iter_docs()
+    assert next(docs_iter) == nodes[0]
+    # nodes deleted during iteration are skipped
+    docstore.delete_document("n1")
+    assert list(docs_iter) == [nodes[2]]
+
+
+def test_docstore_node_cache() -> None:
+    """Test docstore caches deserialized nodes and invalidates them on writes."""
+    nodes = [TextNode(text=f"node {i}", id_=f"n{i}") for i in range(3)]
+    docstore = SimpleDocumentStore(node_cache_size=2)
+    docstore.add_documents(nodes)
+
+    node = docstore.get_document("n0")
+    node_1 = docstore.get_document("n1")
+    cached_nodes = docstore.get_nodes(["n1", "n0"])
+    assert cached_nodes[0] is node_1
+    assert cached_nodes[1] is node
+    assert docstore.get_document("n0") is node
+    # n2 evicts the least recently used n1
+    docstore.get_document("n2")
+    assert docstore.get_document("n0") is node
+    assert docstore.get_document("n1") is not node_1
+
+    updated_node = TextNode(text="updated", id_="n2")
+    docstore.add_documents([updated_node])
+    assert docstore.get_document("n2") == updated_node
+    assert docstore.docs == {"n0": nodes[0], "n1": nodes[1], "n2": updated_node}
+
+    docstore.delete_document("n2")
+    assert docstore.get_document("n2", raise_error=False) is None
+
+
 def test_docstore_dict() -> None:
     doc = Document(text="hello world", id_="d1", metadata={"foo": "bar"})
     node = TextNode(text="my node", id_="d2", metadata={"node": "info"})
@@ -62,3 +145,93 @@ def test_docstore_dict() -> None:
     assert gd1 == doc
     gd2 = new_docstore.get_document("d2")
     assert gd2 == node
+
+
+class CountingKVStore(SimpleKVStore):
+    """Simple kvstore counting single-key and batched calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.num_calls = 0
+
+    def put(self, *args: Any, **kwargs: Any) -> None:
+        self.num_calls += 1
+        super().put(*args, **kwargs)
+
+    def put_all(self, *args: Any, **kwargs: Any) -> None:
+        self.num_calls += 1
+        super().put_all(*args, **kwargs)
+
+    def get(self, *args: Any, **kwargs: Any) -> Optional[dict]:
+        self.num_calls += 1
+        return super().get(*args, **kwargs)
+
+    def get_many(self, *args: Any, **kwargs: Any) -> List[Optional[dict]]:
+        self.num_calls += 1
+        return super().get_many(*args, **kwargs)
+
+
+def test_docstore_batches_kvstore_calls() -> None:
+    kvstore = CountingKVStore()
+    docstore = SimpleDocumentStore(simple_kvstore=kvstore)
+    nodes = [
+        TextNode(
+            text=f"node {i}",
+            id_=f"n{i}",
+            relationships={
+                NodeRelationship.SOURCE: RelatedNodeInfo(node_id=f"doc{i % 2}")
+            },
+        )
+        for i in range(10)
+    ]
+
+    docstore.add_documents(nodes)
+    # one read of the ref doc infos, one write per collection
+    assert kvstore.num_calls == 4
+
+    ref_doc_info = docstore.get_ref_doc_info("doc1")
+    assert ref_doc_info is not None
+    assert ref_doc_info.node_ids == ["n1", "n3", "n5", "n7", "n9"]
+    assert docstore.get_document_hash("n2") == nodes[2].hash
+
+    kvstore.num_calls = 0
+    assert docstore.get_nodes(["n3", "n0"]) == [nodes[3], nodes[0]]
+    assert kvstore.num_calls == 1
+    with pytest.raises(ValueError, match="n42 not found"):
+        docstore.get_nodes(["n1", "n42"])
+
+    with pytest.raises(ValueError, match="already exists"):
+        docstore.add_documents(nodes[:1], allow_update=False)
+
+    docstore.delete_ref_doc("doc0")
+    assert set(docstore.docs) == {"n1", "n3", "n5", "n7", "n9"}
+    assert docstore.get_document_hash("n2") is None
+
+
+def test_docstore_async(simple_docstore: SimpleDocumentStore) -> None:
+    nodes = [
+        TextNode(
+            text=f"node {i}",
+            id_=f"n{i}",
+            relationships={NodeRelationship.SOURCE: RelatedNodeInfo(node_id="doc")},
+        )
+        for i in range(3)
+    ]
+
+    async def _run() -> None:
+        await simple_docstore.aadd_documents(nodes)
+        assert await simple_docstore.aget_nodes(["n2", "n0"]) == [nodes[2], nodes[0]]
+        assert await simple_docstore.adocument_exists("n1")
+        assert await simple_docstore.aget_document_hash("n1") == nodes[1].hash
+
+        ref_doc_info = await simple_docstore.aget_ref_doc_info("doc")
+        assert ref_doc_info is not None
+        assert ref_doc_info.node_ids == ["n0", "n1", "n2"]
+
+        await simple_docstore.adelete_document("n1")
+        assert not await simple_docstore.adocument_exists("n1")
+        await simple_docstore.adelete_ref_doc("doc")
+        assert await simple_docstore.aget_ref_doc_info("doc") is None
+
+    asyncio.run(_run())
+    assert simple_docstore.docs == {}
@@ -0,0 +1,89 @@
+"""Test docstore serialization utils."""
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+from llama_index.schema import (
+    BaseNode,
+    Document,
+    ImageNode,
+    IndexNode,
+    NodeRelationship,
+    ObjectType,
+    RelatedNodeInfo,
+    TextNode,
+)
+from llama_index.storage.docstore.utils import doc_to_json, json_to_doc
+from llama_index.storage.kvstore import simple_kvstore
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+
+
+def _nodes() -> List[BaseNode]:
+    relationships = {
+        NodeRelationship.SOURCE: RelatedNodeInfo(
+            node_id="doc", node_type=ObjectType.DOCUMENT, metadata={"a": 1}
+        ),
+        NodeRelationship.CHILD: [
+            RelatedNodeInfo(node_id="child_1"),
+            RelatedNodeInfo(node_id="child_2", hash="hash"),
+        ],
+    }
+    return [
+        Document(text="document", id_="d1", metadata={"foo": "bar"}),
+        TextNode(
+            text="text",
+            id_="n1",
+            embedding=[0.1, 0.2],
+            excluded_llm_metadata_keys=["foo"],
+            metadata={"foo": "bar"},
+            relationships=relationships,
+        ),
+        ImageNode(text="image", id_="n2", image="aW1hZ2U="),
+        IndexNode(text="index", id_="n3", index_id="index"),
+    ]
+
+
+@pytest.mark.parametrize("round_trip", [False, True])
+def test_json_to_doc_without_validation(round_trip: bool) -> None:
+    for node in _nodes():
+        node_json = doc_to_json(node)
+        if round_trip:
+            node_json = json.loads(json.dumps(node_json))
+
+        trusted_node = json_to_doc(node_json, validate=False)
+        assert type(trusted_node) is type(node)
+        assert trusted_node == json_to_doc(node_json) == node
+        assert trusted_node.hash == node.hash
+        # the node does not share containers with the stored data
+        trusted_node.metadata["new"] = "val"
+        assert "new" not in node_json["__data__"]["metadata"]
+
+
+def test_json_to_doc_validates_data_without_hash() -> None:
+    node = TextNode(text="text", metadata={"foo": "bar"})
+    node_json = doc_to_json(node)
+    node_json["__data__"]["hash"] = ""
+    assert json_to_doc(node_json, validate=False).hash == node.hash
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_kvstore_codecs_are_compatible(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if use_orjson and not simple_kvstore.ORJSON_INSTALLED:
+        pytest.skip("orjson is not installed")
+
+    persist_path = str(tmp_path / "kvstore.json")
+    kvstore = SimpleKVStore()
+    kvstore.put_all([(node.node_id, doc_to_json(node)) for node in _nodes()])
+
+    monkeypatch.setattr(simple_kvstore, "ORJSON_INSTALLED", use_orjson)
+    kvstore.persist(persist_path)
+    monkeypatch.setattr(simple_kvstore, "ORJSON_INSTALLED", not use_orjson)
+    loaded_kvstore = SimpleKVStore.from_persist_path(persist_path)
+
+    for node in _nodes():
+        node_json = loaded_kvstore.get(node.node_id)
+        assert node_json is not None
+        assert json_to_doc(node_json, validate=False) == node
@@ -1,23 +1,35 @@
 import uuid
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from unittest.mock import Mock
 
 
+def _matches(data: dict, filter: Optional[dict]) -> bool:
+    if filter is None:
+        return True
+    for key, val in filter.items():
+        if isinstance(val, dict) and "$in" in val:
+            if data[key] not in val["$in"]:
+                return False
+        elif data[key] != val:
+            return False
+    return True
+
+
 class MockMongoCollection:
     def __init__(self) -> None:
         self._data: Dict[str, dict] = {}
 
     def find_one(self, filter: dict) -> Optional[dict]:
         for data in self._data.values():
-            if filter is None or all(data[key] == val for key, val in filter.items()):
+            if _matches(data, filter):
                 return data.copy()
         return None
 
     def find(self, filter: Optional[dict] = None) -> List[dict]:
         data_list = []
         for data in self._data.values():
-            if filter is None or all(data[key] == val for key, val in filter.items()):
+            if _matches(data, filter):
                 data_list.append(data.copy())
         return data_list
 
@@ -30,6 +42,15 @@ class MockMongoCollection:
         delete_result.deleted_count = 1 if matched else 0
         return delete_result
 
+    def delete_many(self, filter: dict) -> Any:
+        matched = self.find(filter)
+        for data in matched:
+            del self._data[data["_id"]]
+
+        delete_result = Mock()
+        delete_result.deleted_count = len(matched)
+        return delete_result
+
     def replace_one(self, filter: dict, obj: dict, upsert: bool = False) -> Any:
         matched = self.find_one(filter)
         if matched is not None:
@@ -39,6 +60,13 @@ class MockMongoCollection:
 
         return Mock()
 
+    def bulk_write(self, requests: List[Any]) -> Any:
+        # only ReplaceOne requests are used by MongoDBKVStore
+        for request in requests:
+            self.replace_one(request._filter, request._doc, upsert=request._upsert)
+
+        return Mock()
+
     def insert_one(self, obj: dict, _id: Optional[str] = None) -> Any:
         _id = _id or obj.get("_id", None) or str(uuid.uuid4())
         obj = obj.copy()
@@ -84,3 +112,51 @@ class MockMongoClient:
     def __getitem__(self, db: str) -> MockMongoDB:
         del db
         return self._db
+
+
+class MockAsyncMongoCollection:
+    """Motor-like async view over a MockMongoCollection."""
+
+    def __init__(self, collection: MockMongoCollection) -> None:
+        self._collection = collection
+
+    async def find_one(self, filter: dict) -> Optional[dict]:
+        return self._collection.find_one(filter)
+
+    async def find(self, filter: Optional[dict] = None) -> AsyncIterator[dict]:
+        for data in self._collection.find(filter):
+            yield data
+
+    async def delete_one(self, filter: dict) -> Any:
+        return self._collection.delete_one(filter)
+
+    async def delete_many(self, filter: dict) -> Any:
+        return self._collection.delete_many(filter)
+
+    async def replace_one(self, filter: dict, obj: dict, upsert: bool = False) -> Any:
+        return self._collection.replace_one(filter, obj, upsert=upsert)
+
+    async def bulk_write(self, requests: List[Any]) -> Any:
+        return self._collection.bulk_write(requests)
+
+
+class MockAsyncMongoDB:
+    def __init__(self, db: MockMongoDB) -> None:
+        self._db = db
+
+    def __getitem__(self, collection: str) -> MockAsyncMongoCollection:
+        return MockAsyncMongoCollection(self._db[collection])
+
+
+class MockAsyncMongoClient:
+    """Motor-like async client sharing the data of a MockMongoClient."""
+
+    def __init__(self, client: MockMongoClient) -> None:
+        self._client = client
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+    def __getitem__(self, db: str) -> MockAsyncMongoDB:
+        return MockAsyncMongoDB(self._client[db])
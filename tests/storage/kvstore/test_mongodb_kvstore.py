@@ -1,5 +1,9 @@
+import asyncio
+
 import pytest
+from llama_index.storage.kvstore import mongodb_kvstore
 from llama_index.storage.kvstore.mongodb_kvstore import MongoDBKVStore
+from tests.storage.kvstore.mock_mongodb import MockAsyncMongoClient, MockMongoClient
 
 try:
     from pymongo import MongoClient
@@ -25,3 +29,98 @@ def test_kvstore_basic(mongo_kvstore: MongoDBKVStore) -> None:
 
     blob = mongo_kvstore.get(test_key, collection="non_existent")
     assert blob is None
+
+
+@pytest.mark.skipif(MongoClient is None, reason="pymongo not installed")
+def test_kvstore_batch_ops(mongo_kvstore: MongoDBKVStore) -> None:
+    mongo_kvstore.put_all(
+        [("a", {"val": 1}), ("b", {"val": 2}), ("c", {"val": 3})], batch_size=2
+    )
+    mongo_kvstore.put_all([("a", {"val": 4})])
+    assert mongo_kvstore.get_many(["c", "missing", "a"]) == [
+        {"val": 3},
+        None,
+        {"val": 4},
+    ]
+
+    assert mongo_kvstore.delete_many(["a", "missing", "c"]) == 2
+    assert mongo_kvstore.get_all() == {"b": {"val": 2}}
+
+
+@pytest.mark.skipif(MongoClient is None, reason="pymongo not installed")
+def test_kvstore_async_ops(mongo_client: MockMongoClient) -> None:
+    mongo_kvstore = MongoDBKVStore(
+        mongo_client=mongo_client,
+        async_mongo_client=MockAsyncMongoClient(mongo_client),
+    )
+
+    async def _run() -> None:
+        await mongo_kvstore.aput("a", {"val": 1})
+        await mongo_kvstore.aput_all([("b", {"val": 2}), ("c", {"val": 3})])
+        assert await mongo_kvstore.aget("a") == {"val": 1}
+        assert await mongo_kvstore.aget("missing") is None
+        assert await mongo_kvstore.aget_many(["c", "missing", "a"]) == [
+            {"val": 3},
+            None,
+            {"val": 1},
+        ]
+        assert await mongo_kvstore.adelete("a")
+        assert await mongo_kvstore.adelete_many(["b", "missing"]) == 1
+        assert await mongo_kvstore.aget_all() == {"c": {"val": 3}}
+
+    asyncio.run(_run())
+    # async writes are visible to the sync client
+    assert mongo_kvstore.get_all() == {"c": {"val": 3}}
+
+
+@pytest.mark.skipif(MongoClient is None, reason="pymongo not installed")
+def test_kvstore_async_client_per_event_loop(
+    mongo_client: MockMongoClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async_clients = []
+
+    class LoopBoundMockAsyncMongoClient(MockAsyncMongoClient):
+        def __init__(self, uri: str) -> None:
+            super().__init__(mongo_client)
+            self.loop = asyncio.get_running_loop()
+            async_clients.append(self)
+
+    monkeypatch.setattr(
+        mongodb_kvstore,
+        "_get_async_mongo_client_cls",
+        lambda: LoopBoundMockAsyncMongoClient,
+    )
+    mongo_kvstore = MongoDBKVStore(mongo_client=mongo_client, uri="mongodb://test")
+
+    async def _run(val: int) -> None:
+        await mongo_kvstore.aput("a", {"val": val})
+        assert await mongo_kvstore.aget("a") == {"val": val}
+
+    # each event loop gets its own motor client
+    asyncio.run(_run(1))
+    asyncio.run(_run(2))
+    assert len(async_clients) == 2
+    assert async_clients[0].loop is not async_clients[1].loop
+    # the client of the first, closed event loop is closed with it
+    assert async_clients[0].closed
+    assert not async_clients[1].closed
+
+    async def _run_and_close(val: int) -> None:
+        await _run(val)
+        await mongo_kvstore.aclose()
+
+    asyncio.run(_run_and_close(3))
+    assert len(async_clients) == 3
+    assert async_clients[2].closed
+
+
+@pytest.mark.skipif(MongoClient is None, reason="pymongo not installed")
+def test_kvstore_async_ops_warn_without_async_client(
+    mongo_kvstore: MongoDBKVStore, caplog: pytest.LogCaptureFixture
+) -> None:
+    async def _run() -> None:
+        await mongo_kvstore.aput("a", {"val": 1})
+        assert await mongo_kvstore.aget("a") == {"val": 1}
+
+    asyncio.run(_run())
+    assert "block the event loop" in caplog.text
@@ -1,7 +1,7 @@
 from pathlib import Path
 
 import pytest
-from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore
+from llama_index.storage.kvstore.simple_kvstore import SimpleKVStore, get_wal_path
 
 
 @pytest.fixture()
@@ -36,3 +36,132 @@ def test_kvstore_dict(kvstore_with_data: SimpleKVStore) -> None:
     save_dict = kvstore_with_data.to_dict()
     loaded_kvstore = SimpleKVStore.from_dict(save_dict)
     assert len(loaded_kvstore.get_all()) == 1
+
+
+def test_kvstore_batch_ops(simple_kvstore: SimpleKVStore) -> None:
+    """Test kvstore put_all, get_many and delete_many."""
+    simple_kvstore.put_all([("a", {"val": 1}), ("b", {"val": 2}), ("c", {"val": 3})])
+    assert simple_kvstore.get_many(["c", "missing", "a"]) == [
+        {"val": 3},
+        None,
+        {"val": 1},
+    ]
+    assert simple_kvstore.get_many(["a"], collection="non_existent") == [None]
+
+    assert simple_kvstore.delete_many(["a", "missing", "c"]) == 2
+    assert simple_kvstore.get_all() == {"b": {"val": 2}}
+
+
+def test_kvstore_wal_persist(tmp_path: Path) -> None:
+    """Test kvstore persists changes to a write-ahead log."""
+    testpath = str(tmp_path / "kvstore.json")
+    kvstore = SimpleKVStore(use_wal=True)
+    kvstore.put_all([("a", {"val": 1}), ("b", {"val": 2}), ("c", {"val": 3})])
+    kvstore.persist(testpath)
+    snapshot = Path(testpath).read_text()
+    # the log only names the snapshot it extends
+    assert len(Path(get_wal_path(testpath)).read_text().splitlines()) == 1
+
+    kvstore.put("a", {"val": 4})
+    kvstore.delete("b")
+    kvstore.put("d", {"val": 5}, collection="other")
+    kvstore.persist(testpath)
+    # only the changes are written
+    assert Path(testpath).read_text() == snapshot
+    assert len(Path(get_wal_path(testpath)).read_text().splitlines()) == 4
+
+    loaded_kvstore = SimpleKVStore.from_persist_path(testpath)
+    assert loaded_kvstore.use_wal
+    assert loaded_kvstore.to_dict() == kvstore.to_dict()
+
+    # a store loaded without the log folds it into a new snapshot
+    loaded_kvstore = SimpleKVStore.from_persist_path(testpath, use_wal=False)
+    loaded_kvstore.persist(testpath)
+    assert not Path(get_wal_path(testpath)).exists()
+    assert SimpleKVStore.from_persist_path(testpath).to_dict() == kvstore.to_dict()
+
+
+def test_kvstore_wal_compaction(tmp_path: Path) -> None:
+    """Test the write-ahead log is compacted into a snapshot."""
+    testpath = str(tmp_path / "kvstore.json")
+    kvstore = SimpleKVStore(use_wal=True, wal_compaction_threshold=4)
+    kvstore.put_all([(str(i), {"val": i}) for i in range(3)])
+    kvstore.persist(testpath)
+
+    for i in range(4):
+        kvstore.put("0", {"val": i})
+        kvstore.persist(testpath)
+    assert len(Path(get_wal_path(testpath)).read_text().splitlines()) == 5
+
+    kvstore.put("1", {"val": 10})
+    kvstore.persist(testpath)
+    assert len(Path(get_wal_path(testpath)).read_text().splitlines()) == 1
+    assert not Path(f"{testpath}.tmp").exists()
+    assert SimpleKVStore.from_persist_path(testpath).to_dict() == kvstore.to_dict()
+
+
+def test_kvstore_wal_ignores_truncated_record(tmp_path: Path) -> None:
+    """Test a record cut off by a crash while appending is ignored."""
+    testpath = str(tmp_path / "kvstore.json")
+    kvstore = SimpleKVStore(use_wal=True)
+    kvstore.put("a", {"val": 1})
+    kvstore.persist(testpath)
+    kvstore.put("b", {"val": 2})
+    kvstore.persist(testpath)
+
+    with open(get_wal_path(testpath), "a") as f:
+        f.write('{"collection": "data", "key": "c", "va')
+
+    loaded_kvstore = SimpleKVStore.from_persist_path(testpath)
+    assert loaded_kvstore.get_all() == {"a": {"val": 1}, "b": {"val": 2}}
+
+    # the next persist does not append after the truncated record
+    loaded_kvstore.put("d", {"val": 4})
+    loaded_kvstore.persist(testpath)
+    loaded_kvstore.put("e", {"val": 5})
+    loaded_kvstore.persist(testpath)
+    reloaded_kvstore = SimpleKVStore.from_persist_path(testpath)
+    assert reloaded_kvstore.to_dict() == loaded_kvstore.to_dict()
+
+
+def test_kvstore_wal_ignores_stale_log(tmp_path: Path) -> None:
+    """Test a log left behind by a crash after writing a snapshot is ignored."""
+    testpath = str(tmp_path / "kvstore.json")
+    kvstore = SimpleKVStore(use_wal=True, wal_compaction_threshold=2)
+    kvstore.put_all([("k", {"val": 1}), ("a", {"val": 0})])
+    kvstore.persist(testpath)
+    kvstore.put("k", {"val": 2})
+    kvstore.delete("a")
+    kvstore.persist(testpath)
+    stale_wal = Path(get_wal_path(testpath)).read_bytes()
+
+    # compact, then restore the log as a crash before resetting it leaves it
+    kvstore.put("k", {"val": 3})
+    kvstore.put("a", {"val": 4})
+    kvstore.persist(testpath)
+    Path(get_wal_path(testpath)).write_bytes(stale_wal)
+
+    loaded_kvstore = SimpleKVStore.from_persist_path(testpath)
+    assert loaded_kvstore.get_all() == {"k": {"val": 3}, "a": {"val": 4}}
+
+    # the stale log is replaced by a new snapshot on the next persist
+    loaded_kvstore.put("c", {"val": 4})
+    loaded_kvstore.persist(testpath)
+    reloaded_kvstore = SimpleKVStore.from_persist_path(testpath)
+    assert reloaded_kvstore.to_dict() == loaded_kvstore.to_dict()
+
+
+def test_kvstore_get_all_view(simple_kvstore: SimpleKVStore) -> None:
+    """Test the read-only view shares data with the store."""
+    view = simple_kvstore.get_all_view()
+    assert len(view) == 0
+
+    simple_kvstore.put("a", {"val": 1})
+    assert dict(view) == {"a": {"val": 1}}
+    assert "a" in view
+    assert view["a"] is not simple_kvstore.get("a")
+    with pytest.raises(TypeError):
+        view["a"]["val"] = 2  # type: ignore[index]
+
+    simple_kvstore.delete("a")
+    assert "a" not in view
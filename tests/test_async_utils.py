@@ -0,0 +1,145 @@
+"""Test async utils."""
+import asyncio
+import time
+from functools import partial
+from typing import List
+
+import pytest
+from llama_index.async_utils import AsyncExecutor, RateLimiter, run_async_tasks
+
+
+class InFlightCounter:
+    """Counts the tasks running at a time."""
+
+    def __init__(self) -> None:
+        self.num_in_flight = 0
+        self.max_in_flight = 0
+
+    async def arun(self, value: int, delay: float = 0.01) -> int:
+        self.num_in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.num_in_flight)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.num_in_flight -= 1
+        return value
+
+
+@pytest.mark.asyncio()
+async def test_executor_max_in_flight() -> None:
+    counter = InFlightCounter()
+    executor = AsyncExecutor(max_in_flight=3)
+    results = await executor.gather([counter.arun(i) for i in range(10)])
+    assert results == list(range(10))
+    assert counter.max_in_flight == 3
+
+    counter = InFlightCounter()
+    executor = AsyncExecutor(max_in_flight=None)
+    await executor.gather([counter.arun(i) for i in range(10)])
+    assert counter.max_in_flight == 10
+
+
+@pytest.mark.asyncio()
+async def test_executor_nested_tasks() -> None:
+    executor = AsyncExecutor(max_in_flight=1)
+
+    async def _aouter(value: int) -> List[int]:
+        # the parent gives its slot back while the nested tasks run
+        results = await executor.gather(
+            [asyncio.sleep(0, value), asyncio.sleep(0, value + 1)]
+        )
+        return [*results, await executor.arun(asyncio.sleep, 0, value + 2)]
+
+    results = await asyncio.wait_for(
+        executor.gather([_aouter(0), _aouter(3)]), timeout=5
+    )
+    assert results == [[0, 1, 2], [3, 4, 5]]
+
+
+@pytest.mark.asyncio()
+async def test_executor_nested_max_in_flight() -> None:
+    counter = InFlightCounter()
+    executor = AsyncExecutor(max_in_flight=2)
+
+    async def _aouter(value: int) -> List[int]:
+        return await executor.gather([counter.arun(value) for _ in range(20)])
+
+    results = await asyncio.wait_for(
+        executor.gather([_aouter(0), _aouter(1)]), timeout=5
+    )
+    assert results == [[0] * 20, [1] * 20]
+    assert counter.max_in_flight == 2
+
+
+@pytest.mark.asyncio()
+async def test_executor_retries() -> None:
+    num_calls = 0
+
+    async def _aflaky(num_failures: int) -> str:
+        nonlocal num_calls
+        num_calls += 1
+        if num_calls <= num_failures:
+            raise ConnectionError("rate limited")
+        return "done"
+
+    executor = AsyncExecutor(max_retries=2, retry_delay=0.001)
+    assert await executor.arun(_aflaky, 2) == "done"
+    assert num_calls == 3
+
+    num_calls = 0
+    with pytest.raises(ConnectionError):
+        await executor.arun(_aflaky, 3)
+    assert num_calls == 3
+
+    # only the given exceptions are retried
+    num_calls = 0
+    executor = AsyncExecutor(max_retries=2, retry_on=(TimeoutError,))
+    with pytest.raises(ConnectionError):
+        await executor.arun(_aflaky, 1)
+    assert num_calls == 1
+
+
+@pytest.mark.asyncio()
+async def test_executor_gather_cancels_on_failure() -> None:
+    cancelled: List[int] = []
+
+    async def _aslow(value: int) -> int:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(value)
+            raise
+        return value
+
+    async def _afail() -> int:
+        raise ValueError("failed")
+
+    executor = AsyncExecutor(max_in_flight=None)
+    with pytest.raises(ValueError):
+        await executor.gather([_aslow(0), _afail(), partial(_aslow, 1)])
+    assert sorted(cancelled) == [0, 1]
+
+
+@pytest.mark.asyncio()
+async def test_rate_limiter() -> None:
+    rate_limiter = RateLimiter(requests_per_second=100, max_burst=2)
+    executor = AsyncExecutor(rate_limiter=rate_limiter)
+
+    start = time.monotonic()
+    await executor.gather([asyncio.sleep(0) for _ in range(6)])
+    # the first 2 requests use the burst, the other 4 wait 10ms each
+    assert time.monotonic() - start >= 0.035
+
+    with pytest.raises(ValueError):
+        await rate_limiter.acquire(3)
+
+
+def test_run_async_tasks_with_executor() -> None:
+    counter = InFlightCounter()
+    executor = AsyncExecutor(max_in_flight=2)
+    tasks = [partial(counter.arun, i) for i in range(5)]
+    assert run_async_tasks(tasks, executor=executor) == list(range(5))
+    assert counter.max_in_flight == 2
+
+    # the executor can be used across event loops
+    assert run_async_tasks([counter.arun(5)], executor=executor) == [5]
@@ -1,5 +1,7 @@
+import pickle
+
 import pytest
-from llama_index.schema import NodeWithScore, TextNode
+from llama_index.schema import MetadataMode, NodeWithScore, TextNode
 
 
 @pytest.fixture()
@@ -28,3 +30,50 @@ def test_node_with_score_passthrough(node_with_score: NodeWithScore) -> None:
     _ = node_with_score.get_text()
     _ = node_with_score.get_content()
     _ = node_with_score.get_embedding()
+
+
+def test_text_node_content_is_rerendered_on_changes(text_node: TextNode) -> None:
+    text_node.excluded_llm_metadata_keys = ["foo"]
+    assert text_node.get_content(MetadataMode.ALL) == "foo: bar\n\nhello world"
+    assert text_node.get_content(MetadataMode.LLM) == "hello world"
+    assert text_node.get_content(MetadataMode.ALL) is text_node.get_content(
+        MetadataMode.ALL
+    )
+
+    text_node.metadata["baz"] = 1
+    assert text_node.get_metadata_str() == "foo: bar\nbaz: 1"
+    assert text_node.get_content(MetadataMode.LLM) == "baz: 1\n\nhello world"
+
+    text_node.metadata["baz"] = 2
+    text_node.excluded_llm_metadata_keys.append("baz")
+    assert text_node.get_content(MetadataMode.LLM) == "hello world"
+
+    text_node.set_content("new text")
+    text_node.metadata_template = "{key}={value}"
+    text_node.metadata_seperator = ", "
+    assert text_node.get_content(MetadataMode.ALL) == "foo=bar, baz=2\n\nnew text"
+
+    text_node.text_template = "{content}"
+    assert text_node.get_content(MetadataMode.ALL) == "new text"
+
+    text_node.metadata = {}
+    assert text_node.get_content(MetadataMode.ALL) == "new text"
+
+
+def test_text_node_content_with_mutable_metadata(text_node: TextNode) -> None:
+    text_node.metadata["tags"] = ["x"]
+    assert text_node.get_metadata_str() == "foo: bar\ntags: ['x']"
+
+    # changes inside a mutable value are picked up
+    text_node.metadata["tags"].append("y")
+    assert text_node.get_metadata_str() == "foo: bar\ntags: ['x', 'y']"
+    assert text_node.get_content(MetadataMode.ALL) == (
+        "foo: bar\ntags: ['x', 'y']\n\nhello world"
+    )
+
+
+def test_text_node_content_after_pickling(text_node: TextNode) -> None:
+    content = text_node.get_content(MetadataMode.ALL)
+    node = pickle.loads(pickle.dumps(text_node))
+    assert node.get_content(MetadataMode.ALL) == content
+    assert node.copy().get_content(MetadataMode.ALL) == content
@@ -1,6 +1,6 @@
 """Test utils."""
 
-from typing import Optional, Type, Union
+from typing import List, Optional, Type, Union
 
 import pytest
 from _pytest.capture import CaptureFixture
@@ -8,7 +8,10 @@ from llama_index.utils import (
     _ANSI_COLORS,
     _LLAMA_INDEX_COLORS,
     ErrorToRetry,
+    TokenizerService,
     _get_colored_text,
+    count_tokens,
+    count_tokens_many,
     get_color_mapping,
     globals_helper,
     iter_batch,
@@ -28,6 +31,65 @@ def test_tokenizer() -> None:
     assert len(tokenizer(text)) == 4
 
 
+def test_tokenizer_service_caches_counts() -> None:
+    tokenized_texts: List[str] = []
+
+    def tokenizer(text: str) -> List[str]:
+        tokenized_texts.append(text)
+        return text.split()
+
+    service = TokenizerService(tokenizer, cache_size=2, max_cached_text_length=20)
+    assert service.count_tokens("hello world") == 2
+    assert service.count_tokens("hello world") == 2
+    assert tokenized_texts == ["hello world"]
+    assert (service.cache_hits, service.cache_misses) == (1, 1)
+
+    # least recently used counts are evicted
+    service.count_tokens("foo")
+    service.count_tokens("bar baz")
+    service.count_tokens("hello world")
+    assert tokenized_texts == ["hello world", "foo", "bar baz", "hello world"]
+
+    # long texts are not cached
+    long_text = "lorem ipsum " * 10
+    assert service.count_tokens(long_text) == service.count_tokens(long_text) == 20
+    assert tokenized_texts[-2:] == [long_text, long_text]
+
+
+def test_count_tokens_many() -> None:
+    texts = ["hello world foo bar", "", "hello world foo bar", "hello"]
+    assert count_tokens_many(texts) == [count_tokens(text) for text in texts]
+    assert count_tokens_many(texts) == [4, 0, 4, 1]
+
+    batches: List[List[str]] = []
+
+    def batch_tokenizer(texts: List[str], num_threads: int) -> List[List[str]]:
+        batches.append(texts)
+        return [text.split() for text in texts]
+
+    service = TokenizerService(str.split, batch_tokenizer=batch_tokenizer)
+    service.count_tokens("hello")
+    assert service.count_tokens_many(texts, num_threads=2) == [4, 0, 4, 1]
+    # only unique texts missing from the cache are tokenized
+    assert batches == [["hello world foo bar", ""]]
+
+
+def test_get_tokenizer_service() -> None:
+    assert globals_helper.get_tokenizer_service() is globals_helper.tokenizer_service
+    assert (
+        globals_helper.get_tokenizer_service(globals_helper.tokenizer)
+        is globals_helper.tokenizer_service
+    )
+
+    def tokenizer(text: str) -> List[str]:
+        return text.split()
+
+    service = globals_helper.get_tokenizer_service(tokenizer)
+    assert globals_helper.get_tokenizer_service(tokenizer) is service
+    assert globals_helper.get_tokenizer_service(service) is service
+    assert count_tokens("hello world", tokenizer=tokenizer) == 2
+
+
 call_count = 0
 
 
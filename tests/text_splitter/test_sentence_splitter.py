@@ -1,3 +1,5 @@
+from typing import List
+
 import tiktoken
 from llama_index.text_splitter import SentenceSplitter
 
@@ -124,3 +126,27 @@ def test_split_texts_with_metadata(english_text: str) -> None:
         [english_text, english_text], [metadata_str, metadata_str]
     )
     assert len(chunks) == 8
+
+
+def test_tokenizes_each_split_once() -> None:
+    """Test that token sizes are reused while splitting and merging."""
+    tokenized_texts: List[str] = []
+    tokenizer = tiktoken.get_encoding("gpt2")
+
+    def counting_tokenizer(text: str) -> List[int]:
+        tokenized_texts.append(text)
+        return tokenizer.encode(text)
+
+    splitter = SentenceSplitter(
+        chunk_size=20, chunk_overlap=5, tokenizer=counting_tokenizer
+    )
+    paragraphs = [
+        " ".join(f"word{i}_{j}" for j in range(12)) + f". Sentence {i}, clause {i}."
+        for i in range(4)
+    ]
+    chunks = splitter.split_text("\n\n\n".join(paragraphs))
+
+    assert len(chunks) > len(paragraphs)
+    # all non-whitespace splits are distinct, so none should be tokenized twice
+    non_whitespace_texts = [text for text in tokenized_texts if text.strip()]
+    assert len(non_whitespace_texts) == len(set(non_whitespace_texts))
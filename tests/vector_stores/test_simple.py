@@ -1,13 +1,24 @@
+import json
 import unittest
-from typing import List
+from pathlib import Path
+from typing import Any, List, cast
 
+import numpy as np
+import pytest
 from llama_index.schema import NodeRelationship, RelatedNodeInfo, TextNode
 from llama_index.vector_stores import SimpleVectorStore
+from llama_index.vector_stores.simple import (
+    DEFAULT_MATRIX_CAPACITY,
+    IVF_MIN_POINTS_PER_LIST,
+    EmbeddingMatrix,
+)
 from llama_index.vector_stores.types import (
     ExactMatchFilter,
     MetadataFilters,
     VectorStoreQuery,
+    VectorStoreQueryMode,
 )
+from pytest_mock import MockerFixture
 
 _NODE_ID_WEIGHT_1_RANK_A = "AF3BE6C4-5F43-4D74-B075-6B0E07900DE8"
 _NODE_ID_WEIGHT_2_RANK_C = "7D9CD555-846C-445C-A9DD-F8924A01411D"
@@ -148,3 +159,307 @@ class SimpleVectorStoreTest(unittest.TestCase):
             result.ids,
             [_NODE_ID_WEIGHT_3_RANK_C, _NODE_ID_WEIGHT_1_RANK_A],
         )
+
+    def test_matrix_query_matches_dict_query(self) -> None:
+        dict_store = SimpleVectorStore()
+        matrix_store = SimpleVectorStore(use_matrix=True)
+        dict_store.add(_node_embeddings_for_test())
+        matrix_store.add(_node_embeddings_for_test())
+
+        query = VectorStoreQuery(query_embedding=[1.0, 0.5], similarity_top_k=3)
+        dict_result = dict_store.query(query)
+        matrix_result = matrix_store.query(query)
+        self.assertEqual(matrix_result.ids, dict_result.ids)
+        assert matrix_result.similarities is not None
+        assert dict_result.similarities is not None
+        for matrix_sim, dict_sim in zip(
+            matrix_result.similarities, dict_result.similarities
+        ):
+            self.assertAlmostEqual(matrix_sim, dict_sim, places=5)
+
+    def test_matrix_query_with_filters_and_node_ids(self) -> None:
+        simple_vector_store = SimpleVectorStore(use_matrix=True)
+        simple_vector_store.add(_node_embeddings_for_test())
+
+        filters = MetadataFilters(filters=[ExactMatchFilter(key="rank", value="c")])
+        query = VectorStoreQuery(
+            query_embedding=[1.0, 1.0], filters=filters, similarity_top_k=3
+        )
+        result = simple_vector_store.query(query)
+        self.assertEqual(
+            result.ids, [_NODE_ID_WEIGHT_3_RANK_C, _NODE_ID_WEIGHT_2_RANK_C]
+        )
+
+        query = VectorStoreQuery(
+            query_embedding=[1.0, 1.0],
+            filters=filters,
+            similarity_top_k=3,
+            node_ids=[_NODE_ID_WEIGHT_2_RANK_C, _NODE_ID_WEIGHT_1_RANK_A],
+        )
+        result = simple_vector_store.query(query)
+        self.assertEqual(result.ids, [_NODE_ID_WEIGHT_2_RANK_C])
+
+    def test_matrix_delete_and_persist_round_trip(self) -> None:
+        simple_vector_store = SimpleVectorStore(use_matrix=True)
+        simple_vector_store.add(_node_embeddings_for_test())
+
+        simple_vector_store.delete("test-1")
+        query = VectorStoreQuery(query_embedding=[1.0, 1.0], similarity_top_k=3)
+        result = simple_vector_store.query(query)
+        self.assertEqual(
+            result.ids,
+            [_NODE_ID_WEIGHT_3_RANK_C, _NODE_ID_WEIGHT_1_RANK_A],
+        )
+
+        loaded_store = SimpleVectorStore.from_dict(simple_vector_store.to_dict())
+        self.assertFalse(loaded_store.use_matrix)
+        self.assertEqual(loaded_store.get(_NODE_ID_WEIGHT_3_RANK_C), [1.0, 1.0])
+        self.assertEqual(loaded_store.query(query).ids, result.ids)
+
+
+def test_embedding_matrix_growth_and_compaction() -> None:
+    matrix = EmbeddingMatrix(capacity=2)
+    ids = [f"node-{i}" for i in range(DEFAULT_MATRIX_CAPACITY * 2)]
+    matrix.add_many(ids, [[float(i), 1.0] for i in range(len(ids))])
+    assert len(matrix) == len(ids)
+
+    matrix.delete_many(ids[: int(len(ids) * 0.75)])
+    # tombstones exceeded the compaction ratio, so rows were reclaimed
+    assert matrix.num_tombstones == 0
+    assert matrix.num_rows == len(matrix) == len(ids) // 4
+    assert list(matrix) == ids[int(len(ids) * 0.75) :]
+
+    first_live_id = ids[int(len(ids) * 0.75)]
+    assert matrix[first_live_id] == [float(int(len(ids) * 0.75)), 1.0]
+    _, top_ids = matrix.top_k([0.0, 1.0], similarity_top_k=1)
+    assert top_ids == [first_live_id]
+
+
+def test_query_batch_matches_query() -> None:
+    dict_store = SimpleVectorStore()
+    matrix_store = SimpleVectorStore(use_matrix=True)
+    dict_store.add(_node_embeddings_for_test())
+    matrix_store.add(_node_embeddings_for_test())
+
+    queries = [
+        VectorStoreQuery(query_embedding=[1.0, 0.1], similarity_top_k=2),
+        VectorStoreQuery(query_embedding=[0.1, 1.0], similarity_top_k=3),
+        VectorStoreQuery(
+            query_embedding=[1.0, 1.0],
+            filters=MetadataFilters(filters=[ExactMatchFilter(key="rank", value="c")]),
+            similarity_top_k=3,
+        ),
+    ]
+    expected_ids = [dict_store.query(query).ids for query in queries]
+    assert [result.ids for result in dict_store.query_batch(queries)] == expected_ids
+    assert [result.ids for result in matrix_store.query_batch(queries)] == expected_ids
+
+
+def _random_nodes(num_nodes: int, dim: int = 16, seed: int = 0) -> List[TextNode]:
+    rng = np.random.default_rng(seed)
+    return [
+        TextNode(
+            text="lorem ipsum",
+            id_=f"node-{i}",
+            embedding=embedding.tolist(),
+            relationships={
+                NodeRelationship.SOURCE: RelatedNodeInfo(node_id=f"doc-{i % 10}")
+            },
+        )
+        for i, embedding in enumerate(rng.normal(size=(num_nodes, dim)))
+    ]
+
+
+def test_ivf_index_trains_incrementally_and_matches_exact_search() -> None:
+    nlist = 4
+    store = SimpleVectorStore(ivf_nlist=nlist, ivf_nprobe=nlist)
+    nodes = _random_nodes(nlist * IVF_MIN_POINTS_PER_LIST * 2)
+    matrix = cast(EmbeddingMatrix, store._data.embedding_dict)
+    assert matrix.ivf_index is not None
+
+    half = len(nodes) // 2
+    store.add(nodes[: half - 1])
+    assert not matrix.ivf_index.is_trained
+    store.add(nodes[half - 1 :])
+    assert matrix.ivf_index.is_trained
+
+    query_embedding = nodes[0].get_embedding()
+    query = VectorStoreQuery(query_embedding=query_embedding, similarity_top_k=5)
+    # probing every list is exact search
+    exact_ids = matrix.top_k(query_embedding, 5, exact=True)[1]
+    assert store.query(query).ids == exact_ids
+    assert store.query(query).ids[0] == "node-0"
+    # probing a single list only scores a subset of the rows
+    assert len(matrix.ivf_index.search_rows(np.array(query_embedding), 1)) < len(nodes)
+
+    store.delete("doc-0")
+    result = store.query(query)
+    assert result.ids is not None
+    assert "node-0" not in result.ids
+    assert result.ids == matrix.top_k(query_embedding, 5, exact=True)[1]
+
+
+def test_ivf_index_training_normalizes_bounded_batches(
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("llama_index.vector_stores.simple.IVF_MAX_POINTS_PER_LIST", 40)
+    mocker.patch("llama_index.vector_stores.simple.IVF_ADD_BATCH_SIZE", 50)
+    normalized_rows = mocker.spy(EmbeddingMatrix, "_normalized_rows")
+    nlist = 2
+    store = SimpleVectorStore(ivf_nlist=nlist, ivf_nprobe=nlist)
+    nodes = _random_nodes(200)
+    store.add(nodes)
+
+    matrix = cast(EmbeddingMatrix, store._data.embedding_dict)
+    assert matrix.ivf_index is not None
+    assert matrix.ivf_index.is_trained
+    # only the sample is normalized for training, then rows are added in batches
+    assert [len(call.args[1]) for call in normalized_rows.call_args_list] == [
+        80,
+        50,
+        50,
+        50,
+        50,
+    ]
+
+    query_embedding = nodes[0].get_embedding()
+    exact_ids = matrix.top_k(query_embedding, 5, exact=True)[1]
+    assert matrix.top_k(query_embedding, 5)[1] == exact_ids
+
+
+def test_ivf_index_persist_round_trip() -> None:
+    nlist = 4
+    store = SimpleVectorStore(ivf_nlist=nlist, ivf_nprobe=2)
+    nodes = _random_nodes(nlist * IVF_MIN_POINTS_PER_LIST)
+    store.add(nodes)
+
+    loaded_store = SimpleVectorStore.from_dict(json.loads(json.dumps(store.to_dict())))
+    loaded_matrix = cast(EmbeddingMatrix, loaded_store._data.embedding_dict)
+    assert loaded_matrix.ivf_index is not None
+    assert loaded_matrix.ivf_index.is_trained
+    assert loaded_matrix.ivf_index.nprobe == 2
+
+    for node in nodes[:10]:
+        query = VectorStoreQuery(
+            query_embedding=node.get_embedding(), similarity_top_k=3
+        )
+        assert loaded_store.query(query).ids == store.query(query).ids
+
+
+def test_binary_persist_round_trip(tmp_path: Path, mocker: MockerFixture) -> None:
+    nlist = 4
+    store = SimpleVectorStore(ivf_nlist=nlist, ivf_nprobe=2, binary_persist=True)
+    nodes = _random_nodes(nlist * IVF_MIN_POINTS_PER_LIST)
+    store.add(nodes)
+    store.delete("doc-1")
+
+    persist_path = str(tmp_path / "vector_store.json")
+    store.persist(persist_path)
+    assert (tmp_path / "vector_store.embeddings.npy").exists()
+    assert (tmp_path / "vector_store.inv_norms.npy").exists()
+    with open(persist_path) as f:
+        assert json.load(f)["embedding_dict"] == {}
+
+    # the persisted lists are restored without reading the embeddings
+    mocker.spy(EmbeddingMatrix, "_normalized_rows")
+    loaded_store = SimpleVectorStore.from_persist_path(persist_path)
+    assert EmbeddingMatrix._normalized_rows.call_count == 0  # type: ignore
+    loaded_matrix = cast(EmbeddingMatrix, loaded_store._data.embedding_dict)
+    assert isinstance(loaded_matrix._embeddings, np.memmap)
+    assert loaded_matrix.ivf_index is not None
+    assert loaded_matrix.ivf_index.is_trained
+    assert "node-1" not in loaded_matrix
+    assert loaded_store.get("node-2") == store.get("node-2")
+
+    for node in nodes[:10]:
+        query = VectorStoreQuery(
+            query_embedding=node.get_embedding(), similarity_top_k=3
+        )
+        assert loaded_store.query(query).ids == store.query(query).ids
+
+    # adding grows the matrix out of the mapping, persisting over it is safe
+    new_node = _random_nodes(1, seed=1)[0]
+    new_node.id_ = "new-node"
+    loaded_store.add([new_node])
+    loaded_store.persist(persist_path)
+    reloaded_store = SimpleVectorStore.from_persist_path(persist_path, mmap=False)
+    reloaded_matrix = cast(EmbeddingMatrix, reloaded_store._data.embedding_dict)
+    assert len(reloaded_matrix) == len(loaded_matrix)
+    assert reloaded_store.get("new-node") == loaded_store.get("new-node")
+
+
+@pytest.mark.parametrize("use_matrix", [False, True])
+def test_metadata_index_filters_and_doc_ids(use_matrix: bool) -> None:
+    store = SimpleVectorStore(use_matrix=use_matrix)
+    store.add(_node_embeddings_for_test())
+    query_embedding = [1.0, 0.5]
+
+    def query_ids(**kwargs: Any) -> List[str]:
+        query = VectorStoreQuery(
+            query_embedding=query_embedding, similarity_top_k=3, **kwargs
+        )
+        return cast(List[str], store.query(query).ids)
+
+    rank_c = MetadataFilters(filters=[ExactMatchFilter(key="rank", value="c")])
+    assert query_ids(filters=rank_c) == [
+        _NODE_ID_WEIGHT_3_RANK_C,
+        _NODE_ID_WEIGHT_2_RANK_C,
+    ]
+    assert query_ids(doc_ids=["test-0", "test-1"]) == [
+        _NODE_ID_WEIGHT_1_RANK_A,
+        _NODE_ID_WEIGHT_2_RANK_C,
+    ]
+    assert query_ids(filters=rank_c, doc_ids=["test-0", "test-1"]) == [
+        _NODE_ID_WEIGHT_2_RANK_C
+    ]
+
+    # re-adding a node replaces its postings
+    node = _node_embeddings_for_test()[0]
+    node.metadata = {"rank": ["b", "c"]}
+    store.add([node])
+    assert set(query_ids(filters=rank_c)) == {
+        _NODE_ID_WEIGHT_1_RANK_A,
+        _NODE_ID_WEIGHT_2_RANK_C,
+        _NODE_ID_WEIGHT_3_RANK_C,
+    }
+    weight_1 = MetadataFilters(filters=[ExactMatchFilter(key="weight", value=1.0)])
+    assert query_ids(filters=weight_1) == []
+
+    store.delete("test-1")
+    assert query_ids(doc_ids=["test-0", "test-1"]) == [_NODE_ID_WEIGHT_1_RANK_A]
+    assert _NODE_ID_WEIGHT_2_RANK_C not in query_ids(filters=rank_c)
+    assert len(store.metadata_index) == 2
+
+
+def test_metadata_index_is_built_from_persisted_data() -> None:
+    store = SimpleVectorStore()
+    store.add(_node_embeddings_for_test())
+    loaded_store = SimpleVectorStore.from_dict(json.loads(json.dumps(store.to_dict())))
+
+    rank_c = MetadataFilters(filters=[ExactMatchFilter(key="rank", value="c")])
+    assert loaded_store.metadata_index.filter_node_ids(rank_c) == {
+        _NODE_ID_WEIGHT_2_RANK_C,
+        _NODE_ID_WEIGHT_3_RANK_C,
+    }
+    loaded_store.delete("test-2")
+    assert loaded_store.metadata_index.filter_node_ids(rank_c) == {
+        _NODE_ID_WEIGHT_2_RANK_C
+    }
+
+
+def test_matrix_mmr_query_matches_dict_query() -> None:
+    nodes = _random_nodes(50)
+    dict_store = SimpleVectorStore()
+    dict_store.add(nodes)
+    matrix_store = SimpleVectorStore(use_matrix=True)
+    matrix_store.add(nodes)
+
+    query = VectorStoreQuery(
+        query_embedding=nodes[0].get_embedding(),
+        similarity_top_k=5,
+        mode=VectorStoreQueryMode.MMR,
+    )
+    for kwargs in [{}, {"mmr_prefetch_k": 10}]:
+        dict_result = dict_store.query(query, mmr_threshold=0.3, **kwargs)
+        matrix_result = matrix_store.query(query, mmr_threshold=0.3, **kwargs)
+        assert matrix_result.ids == dict_result.ids